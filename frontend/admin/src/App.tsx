@@ -24,6 +24,7 @@ import {
     Settings,
     ShieldCheck,
     SlidersHorizontal,
+    Timer,
     Trash2,
     TrendingUp,
 } from 'lucide-react';
@@ -65,9 +66,10 @@ import {
     sendTestNotification,
     syncProducts,
 } from '@/api/operators';
+import { fetchChatLatency } from '@/api/metrics';
 import { useMetrics } from '@/hooks/useMetrics';
 import { getAppRouteMode } from '@/routes';
-import type { Period } from '@/types/metrics';
+import type { ChatLatencyResponse, LatencyWindow, Period } from '@/types/metrics';
 import type {
     AdminActionAuditRead,
     AdminBotRulePreviewResponse,
@@ -98,6 +100,8 @@ const PERIODS: { label: string; value: Period }[] = [
     { label: 'Все', value: 'all_time' },
 ];
 
+const LATENCY_WINDOWS: LatencyWindow[] = ['5m', '15m', '1h', '24h'];
+
 const NAV_ITEMS = [
     { id: 'overview', label: 'Обзор', icon: BarChart3 },
     { id: 'conversations', label: 'Клиенты и диалоги', icon: MessageCircle },
@@ -432,10 +436,110 @@ function OverviewView({
             </div>
 
             <OverviewActionPanel data={data} refetch={refetch} />
+            <ChatLatencyPanel />
         </section>
     );
 }
 
+function ChatLatencyPanel() {
+    const [latencyWindow, setLatencyWindow] = useState<LatencyWindow>('1h');
+    const [latency, setLatency] = useState<ChatLatencyResponse | null>(null);
+    const [loading, setLoading] = useState(true);
+    const [error, setError] = useState<string | null>(null);
+
+    const load = useCallback(async () => {
+        setLoading(true);
+        setError(null);
+        try {
+            setLatency(await fetchChatLatency(latencyWindow));
+        } catch (err) {
+            setError(errorMessage(err));
+        } finally {
+            setLoading(false);
+        }
+    }, [latencyWindow]);
+
+    useEffect(() => {
+        void load();
+    }, [load]);
+
+    const breached = latency?.phases.filter((phase) => phase.breached) ?? [];
+
+    return (
+        <Panel
+            title="Задержка ответа"
+            subtitle="p50 / p95 / p99 по фазам хода, объединено по всем воркерам. Значения — верхняя граница гистограммного бакета."
+            icon={Timer}
+            action={
+                <div className="flex items-center gap-2">
+                    <div className="flex rounded-md border border-[#c6c6cd] bg-white p-0.5">
+                        {LATENCY_WINDOWS.map((option) => (
+                            <button
+                                key={option}
+                                type="button"
+                                onClick={() => setLatencyWindow(option)}
+                                className={cx(
+                                    'rounded px-2.5 py-1 text-xs font-medium',
+                                    option === latencyWindow ? 'bg-[#0058be] text-white' : 'text-[#3f465c] hover:bg-[#f2f4f7]',
+                                )}
+                            >
+                                {option}
+                            </button>
+                        ))}
+                    </div>
+                    <RefreshButton loading={loading} onClick={() => void load()} />
+                </div>
+            }
+        >
+            {error && <StateLine text={error} tone="red" />}
+            {!error && latency && latency.phases.length === 0 && <StateLine text="Нет завершённых ходов за это окно." />}
+            {latency && latency.phases.length > 0 && (
+                <>
+                    <div className="mb-3">
+                        {breached.length > 0 ? (
+                            <Badge label={`SLO нарушен: ${breached.map((phase) => phase.phase).join(', ')}`} tone="amber" />
+                        ) : (
+                            <Badge label="SLO в норме" tone="green" />
+                        )}
+                    </div>
+                    <div className="overflow-x-auto">
+                        <table className="min-w-full divide-y divide-[#e5eeff] text-sm">
+                            <thead className="bg-[#f8f9ff] text-left text-xs uppercase text-[#45464d]">
+                                <tr>
+                                    <th className="px-4 py-3">Фаза</th>
+                                    <th className="px-4 py-3 text-right">Ходов</th>
+                                    <th className="px-4 py-3 text-right">p50</th>
+                                    <th className="px-4 py-3 text-right">p95</th>
+                                    <th className="px-4 py-3 text-right">p99</th>
+                                    <th className="px-4 py-3 text-right">SLO p95</th>
+                                </tr>
+                            </thead>
+                            <tbody className="divide-y divide-[#e5eeff] bg-white">
+                                {latency.phases.map((phase) => (
+                                    <tr key={phase.phase} className={phase.breached ? 'bg-[#fff7ed]' : undefined}>
+                                        <td className="px-4 py-3 font-medium text-[#0b1c30]">{phase.phase}</td>
+                                        <td className="px-4 py-3 text-right text-[#45464d]">{phase.count}</td>
+                                        <td className="px-4 py-3 text-right">{formatLatencyMs(phase.p50_ms)}</td>
+                                        <td className="px-4 py-3 text-right font-medium">{formatLatencyMs(phase.p95_ms)}</td>
+                                        <td className="px-4 py-3 text-right">{formatLatencyMs(phase.p99_ms)}</td>
+                                        <td className="px-4 py-3 text-right text-[#45464d]">{formatLatencyMs(phase.slo_p95_ms)}</td>
+                                    </tr>
+                                ))}
+                            </tbody>
+                        </table>
+                    </div>
+                </>
+            )}
+        </Panel>
+    );
+}
+
+function formatLatencyMs(value: number | null): string {
+    if (value === null) return '—';
+    if (value >= 1000) return `${(value / 1000).toFixed(1)} s`;
+    return `${Math.round(value)} ms`;
+}
+
 function SupportView() {
     return (
         <section className="space-y-5 p-6">
@@ -886,7 +990,7 @@ function KnowledgeBaseView() {
                         >
                             <div className="flex items-center justify-between gap-2">
                                 <p className="truncate text-sm font-semibold text-[#0b1c30]">{entry.title}</p>
-                                <Badge label={entry.has_embedding ? 'Indexed' : 'No index'} tone={entry.has_embedding ? 'green' : 'amber'} />
+                                <Badge label={entry.embedding_pending ? 'Indexing' : entry.has_embedding ? 'Indexed' : 'No index'} tone={entry.has_embedding && !entry.embedding_pending ? 'green' : 'amber'} />
                             </div>
                             <p className="mt-1 line-clamp-2 text-sm text-[#45464d]">{entry.content}</p>
                             <p className="mt-2 text-xs text-[#45464d]">{entry.source} · {entry.language} · {entry.category || '—'}</p>
@@ -1,5 +1,6 @@
 import type {
     AdminActionAuditRead,
+    AdminActionResult,
     AdminBotRulePreviewRequest,
     AdminBotRulePreviewResponse,
     AdminBotRuleRead,
@@ -11,6 +12,7 @@ import type {
     AdminKnowledgeBaseCandidateReject,
     AdminKnowledgeBasePreview,
     AdminKnowledgeBaseRead,
+    AdminKnowledgeBaseReindexStatus,
     AdminKnowledgeBaseWrite,
     PaginatedResponse,
 } from '@/types/crm';
@@ -140,6 +142,17 @@ export function reindexKnowledgeBaseEntry(entryId: string): Promise<AdminKnowled
     });
 }
 
+export function reindexKnowledgeBase(force = false): Promise<AdminActionResult> {
+    return requestJson(`/knowledge-base/reindex?force=${force}`, {
+        method: 'POST',
+        body: JSON.stringify({}),
+    });
+}
+
+export function fetchKnowledgeBaseReindexStatus(): Promise<AdminKnowledgeBaseReindexStatus> {
+    return requestJson('/knowledge-base/reindex/status');
+}
+
 export function fetchKnowledgeBaseCandidates(
     params: URLSearchParams,
 ): Promise<PaginatedResponse<AdminKnowledgeBaseCandidate>> {
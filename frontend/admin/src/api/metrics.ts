@@ -1,4 +1,10 @@
-import type { DashboardMetrics, Period, TimeseriesResponse } from '@/types/metrics';
+import type {
+    ChatLatencyResponse,
+    DashboardMetrics,
+    LatencyWindow,
+    Period,
+    TimeseriesResponse,
+} from '@/types/metrics';
 
 const API_BASE = '/api/v1/admin';
 
@@ -17,3 +23,11 @@ export async function fetchTimeseries(period: Period = 'all_time'): Promise<Time
     }
     return res.json();
 }
+
+export async function fetchChatLatency(window: LatencyWindow = '1h'): Promise<ChatLatencyResponse> {
+    const res = await fetch(`${API_BASE}/dashboard/latency/?window=${window}`);
+    if (!res.ok) {
+        throw new Error(`Failed to fetch chat latency: ${res.status} ${res.statusText}`);
+    }
+    return res.json();
+}
@@ -4,6 +4,8 @@ export interface PaginatedResponse<T> {
     page: number;
     page_size: number;
     pages: number;
+    next_cursor?: string | null;
+    total_is_estimate?: boolean;
 }
 
 export interface AdminCustomerListItem {
@@ -169,6 +171,7 @@ export interface AdminKnowledgeBaseRead {
     language: string;
     category: string | null;
     has_embedding: boolean;
+    embedding_pending: boolean;
     is_auto_generated: boolean;
     original_question: string | null;
     manager_draft: string | null;
@@ -178,6 +181,25 @@ export interface AdminKnowledgeBaseRead {
     deleted_by: string | null;
 }
 
+export interface AdminActionResult {
+    ok: boolean;
+    status: string;
+    entity_id: string | null;
+    detail: string | null;
+}
+
+export interface AdminKnowledgeBaseReindexStatus {
+    status: 'idle' | 'running' | 'done' | 'failed';
+    total: number;
+    scanned: number;
+    embedded: number;
+    unchanged: number;
+    pending: number;
+    started_at: string | null;
+    finished_at: string | null;
+    error: string | null;
+}
+
 export interface AdminKnowledgeBaseWrite {
     source: string;
     title: string;
@@ -68,3 +68,21 @@ export interface TimeseriesResponse {
     period: string;
     points: TimeseriesPoint[];
 }
+
+export type LatencyWindow = '5m' | '15m' | '1h' | '24h';
+
+export interface ChatLatencyPhase {
+    phase: string;
+    count: number;
+    p50_ms: number | null;
+    p95_ms: number | null;
+    p99_ms: number | null;
+    slo_p95_ms: number | null;
+    breached: boolean;
+}
+
+export interface ChatLatencyResponse {
+    window: LatencyWindow;
+    generated_at: string;
+    phases: ChatLatencyPhase[];
+}
@@ -0,0 +1,36 @@
+"""Add the knowledge-base embedding-input hash for background reindexing.
+
+Revision ID: 2026_10_19_kb_embedding_hash
+Revises: 2026_10_19_list_keyset_indexes
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_19_kb_embedding_hash"
+down_revision: str | None = "2026_10_19_list_keyset_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "knowledge_base",
+        sa.Column("embedding_hash", sa.String(length=64), nullable=True),
+    )
+    # Entries that already have a vector were embedded from their current
+    # content, so the first reindex run does not re-embed them.
+    op.execute(
+        """
+        UPDATE knowledge_base
+        SET embedding_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')
+        WHERE embedding IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("knowledge_base", "embedding_hash")
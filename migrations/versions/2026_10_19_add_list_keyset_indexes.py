@@ -0,0 +1,71 @@
+"""Add composite sort-key indexes for keyset-paginated list APIs.
+
+Revision ID: 2026_10_19_list_keyset_indexes
+Revises: 2026_10_19_product_neighbors
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_19_list_keyset_indexes"
+down_revision: str | None = "2026_10_19_product_neighbors"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Each list orders by (sort column DESC, id DESC); a backward scan of
+    # these indexes serves both the first page and every cursor page.
+    op.create_index(
+        "ix_conversations_updated_at_id",
+        "conversations",
+        ["updated_at", "id"],
+    )
+    op.create_index(
+        "ix_products_active_updated_at_id",
+        "products",
+        ["updated_at", "id"],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_knowledge_base_created_at_id",
+        "knowledge_base",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_knowledge_base_candidates_status_created_at_id",
+        "knowledge_base_candidates",
+        ["status", "created_at", "id"],
+    )
+    # Supersedes the single-column created_at index.
+    op.create_index(
+        "ix_admin_action_audits_created_at_id",
+        "admin_action_audits",
+        ["created_at", "id"],
+    )
+    op.drop_index(
+        "ix_admin_action_audits_created_at",
+        table_name="admin_action_audits",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_admin_action_audits_created_at",
+        "admin_action_audits",
+        ["created_at"],
+    )
+    op.drop_index(
+        "ix_admin_action_audits_created_at_id",
+        table_name="admin_action_audits",
+    )
+    op.drop_index(
+        "ix_knowledge_base_candidates_status_created_at_id",
+        table_name="knowledge_base_candidates",
+    )
+    op.drop_index("ix_knowledge_base_created_at_id", table_name="knowledge_base")
+    op.drop_index("ix_products_active_updated_at_id", table_name="products")
+    op.drop_index("ix_conversations_updated_at_id", table_name="conversations")
@@ -0,0 +1,42 @@
+"""Add the precomputed product_neighbors recommendation table.
+
+Revision ID: 2026_10_19_product_neighbors
+Revises: 2026_10_19_product_sync_hashes
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_19_product_neighbors"
+down_revision: str | None = "2026_10_19_product_sync_hashes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Empty until the first `refresh_product_neighbors` run; recommendations
+    # fall back to live queries for products without rows.
+    op.create_table(
+        "product_neighbors",
+        sa.Column("product_id", sa.Uuid(), nullable=False),
+        sa.Column("relation_type", sa.String(length=20), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("neighbor_id", sa.Uuid(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["neighbor_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("product_id", "relation_type", "rank"),
+    )
+    op.create_index(
+        "ix_product_neighbors_neighbor_id",
+        "product_neighbors",
+        ["neighbor_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_neighbors_neighbor_id", table_name="product_neighbors")
+    op.drop_table("product_neighbors")
@@ -0,0 +1,51 @@
+"""Add product content and embedding-input hashes for change detection.
+
+Revision ID: 2026_10_19_product_sync_hashes
+Revises: 2026_06_04_customer_memory
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_19_product_sync_hashes"
+down_revision: str | None = "2026_06_04_customer_memory"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "products",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "products",
+        sa.Column("embedding_hash", sa.String(length=64), nullable=True),
+    )
+    # Backfill the embedding hash with the same text `product_embedding_text`
+    # builds, so the first hashed sync does not re-embed the whole catalog.
+    # The content hash stays NULL: that sync rewrites each row once.
+    op.execute(
+        """
+        UPDATE products
+        SET embedding_hash = encode(
+            sha256(
+                convert_to(
+                    name_en || ' | ' || coalesce(category, '')
+                    || ' | ' || coalesce(description_en, ''),
+                    'UTF8'
+                )
+            ),
+            'hex'
+        )
+        WHERE embedding IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("products", "embedding_hash")
+    op.drop_column("products", "content_hash")
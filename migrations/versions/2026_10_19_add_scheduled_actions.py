@@ -0,0 +1,73 @@
+"""Add the scheduled_actions due-time table for follow-up crons.
+
+Revision ID: 2026_10_19_scheduled_actions
+Revises: 2026_10_19_conv_metadata_jsonb
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2026_10_19_scheduled_actions"
+down_revision: str | None = "2026_10_19_conv_metadata_jsonb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Filled from conversation metadata by `reconcile_scheduled_actions`,
+    # which also runs at worker startup.
+    op.create_table(
+        "scheduled_actions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("conversation_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sa.String(length=40), nullable=False),
+        sa.Column("due_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("state", sa.String(length=20), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"], ["conversations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "conversation_id",
+            "kind",
+            name="uq_scheduled_actions_conversation_id_kind",
+        ),
+    )
+    op.create_index(
+        "ix_scheduled_actions_kind_due_at",
+        "scheduled_actions",
+        ["kind", "due_at"],
+        postgresql_where=sa.text("state IN ('pending', 'claimed')"),
+    )
+    # The claimed batch's last customer message is looked up per conversation.
+    op.create_index(
+        "ix_messages_user_conversation_id_created_at",
+        "messages",
+        ["conversation_id", "created_at"],
+        postgresql_where=sa.text("role = 'user'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_messages_user_conversation_id_created_at",
+        table_name="messages",
+    )
+    op.drop_index("ix_scheduled_actions_kind_due_at", table_name="scheduled_actions")
+    op.drop_table("scheduled_actions")
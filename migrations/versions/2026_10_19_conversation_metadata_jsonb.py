@@ -0,0 +1,39 @@
+"""Store conversation metadata as JSONB for per-key write-back.
+
+Revision ID: 2026_10_19_conv_metadata_jsonb
+Revises: 2026_10_19_kb_embedding_hash
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "2026_10_19_conv_metadata_jsonb"
+down_revision: str | None = "2026_10_19_kb_embedding_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "conversations",
+        "metadata",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="metadata::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "conversations",
+        "metadata",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="metadata::json",
+    )
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Aggregate the sampled turn profiles a worker wrote, per function."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from src.services.turn_profiler import merge_folded_stacks, summarize_turn_profiles
+
+
+def load_profiles(directory: Path) -> list[dict[str, Any]]:
+    profiles = []
+    for path in sorted(directory.glob("turn-*.json")):
+        try:
+            profiles.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            print(f"skipping unreadable profile {path.name}", file=sys.stderr)
+    return profiles
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Sum the turn profiles written with WORKER_PROFILE_SAMPLE_RATE per "
+            "function, and optionally merge them into one folded flamegraph."
+        )
+    )
+    parser.add_argument(
+        "directory",
+        type=Path,
+        help="the worker's WORKER_PROFILE_DIR",
+    )
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument(
+        "--folded",
+        type=Path,
+        default=None,
+        help="also write the merged stacks here, for flamegraph.pl or speedscope",
+    )
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.directory)
+    print(
+        json.dumps(
+            summarize_turn_profiles(profiles, top=args.top), indent=2, sort_keys=True
+        )
+    )
+    if args.folded is not None:
+        args.folded.write_text("\n".join(merge_folded_stacks(profiles)) + "\n")
+    return 0 if profiles else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Compare legacy and compact queue payloads: size and parse time.
+
+Encodes representative inbound Wazzup messages as the queued JSON document and
+as the msgpack envelope, and representative ARQ jobs and kept results with
+pickle and with the msgpack job serializer. Reports the stored bytes of each
+and the time to parse a claimed batch back. This is a controlled local
+harness: the byte counts are value sizes, not Redis ``MEMORY USAGE`` (which
+adds per-key and per-element overhead), and timings are in-process only.
+
+Usage::
+
+    uv run python -m scripts.benchmark_queue_payloads --batch-size 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Callable
+from statistics import median
+from time import perf_counter
+from typing import Any
+from unittest.mock import patch
+
+from arq.jobs import deserialize_job, serialize_job, serialize_result
+
+from src.core import queues
+from src.core.queues import deserialize_job_payload, serialize_job_payload
+from src.schemas.webhook import WazzupIncomingMessage
+from src.services import inbound_batch
+from src.services.inbound_batch import decode_inbound_message, encode_inbound_message
+
+
+def _message(index: int) -> WazzupIncomingMessage:
+    # Shape of a real Wazzup v3 inbound message, extra fields included.
+    return WazzupIncomingMessage.model_validate(
+        {
+            "messageId": f"8f0c2d7e-4b1a-4a7e-9d55-{index:012d}",
+            "chatId": "971551220665",
+            "chatType": "whatsapp",
+            "channelId": "b49b1b9d-757f-4104-b56d-8f43d62cc515",
+            "text": "Hello, do you have ergonomic office chairs in black?",
+            "type": "text",
+            "status": "inbound",
+            "dateTime": "2026-10-19T09:30:00.000",
+            "authorType": "client",
+            "isEcho": False,
+            "contact": {
+                "name": "Customer",
+                "avatarUri": "https://store.wazzup24.com/avatars/placeholder.jpg",
+                "username": None,
+                "phone": "971551220665",
+            },
+        }
+    )
+
+
+def _jobs() -> list[tuple[str, tuple[Any, ...], dict[str, Any], Any]]:
+    return [
+        (
+            "process_incoming_batch",
+            (),
+            {"batch_ref": "ib1_49cc179594fa3f5bdf8453aa"},
+            None,
+        ),
+        (
+            "deliver_product_media",
+            ("2b0b4f7c-8d57-4a0c-9a55-2a9a3d7f5c10", "971551220665"),
+            {
+                "channel_id": "b49b1b9d-757f-4104-b56d-8f43d62cc515",
+                "source_message_id": "8f0c2d7e-4b1a-4a7e-9d55-000000000001",
+                "follow_up_suppressed": False,
+                "media_items": [
+                    {
+                        "url": f"https://noor.example/api/v1/public-media/{index}",
+                        "caption": "Ergonomic office chair, black",
+                        "product_key": f"SKU-{index}",
+                        "zoho_item_id": f"41200000{index:04d}",
+                        "reference_tokens": [f"sku-{index}"],
+                    }
+                    for index in range(3)
+                ],
+            },
+            None,
+        ),
+        (
+            "run_daily_summary",
+            (),
+            {},
+            RuntimeError("daily summary query timed out"),
+        ),
+    ]
+
+
+def _timed(samples: int, call: Callable[[], object]) -> float:
+    durations = []
+    for _ in range(samples):
+        started_at = perf_counter()
+        call()
+        durations.append((perf_counter() - started_at) * 1_000_000)
+    return round(median(durations), 3)
+
+
+def _inbound(args: argparse.Namespace) -> dict[str, Any]:
+    messages = [_message(index) for index in range(args.batch_size)]
+    encoded: dict[bool, list[bytes]] = {}
+    for compact in (False, True):
+        with patch.object(inbound_batch.settings, "compact_queue_payloads", compact):
+            encoded[compact] = [encode_inbound_message(m) for m in messages]
+    legacy, compact_batch = encoded[False], encoded[True]
+    return {
+        "bytes_per_message": {
+            "json": round(sum(map(len, legacy)) / len(legacy), 1),
+            "msgpack_envelope": round(
+                sum(map(len, compact_batch)) / len(compact_batch), 1
+            ),
+        },
+        "parse_batch_us_p50": {
+            "json": _timed(
+                args.samples, lambda: [decode_inbound_message(raw) for raw in legacy]
+            ),
+            "msgpack_envelope": _timed(
+                args.samples,
+                lambda: [decode_inbound_message(raw) for raw in compact_batch],
+            ),
+        },
+    }
+
+
+def _arq(args: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {}
+    for function, job_args, kwargs, result in _jobs():
+        sizes: dict[str, Any] = {}
+        for label, compact in (("pickle", False), ("msgpack", True)):
+            with patch.object(queues.settings, "compact_queue_payloads", compact):
+                job = serialize_job(
+                    function, job_args, kwargs, 1, 0, serializer=serialize_job_payload
+                )
+                kept = serialize_result(
+                    function,
+                    job_args,
+                    kwargs,
+                    1,
+                    0,
+                    result is None,
+                    result,
+                    0,
+                    0,
+                    "ref",
+                    "arq:queue",
+                    "job-id",
+                    serializer=serialize_job_payload,
+                )
+            sizes[f"{label}_job_bytes"] = len(job)
+            sizes[f"{label}_result_bytes"] = len(kept or b"")
+            sizes[f"{label}_deserialize_us_p50"] = _timed(
+                args.samples,
+                lambda job=job: deserialize_job(
+                    job, deserializer=deserialize_job_payload
+                ),
+            )
+        report[function] = sizes
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=201)
+    parser.add_argument("--batch-size", type=int, default=20)
+    args = parser.parse_args()
+    if args.samples < 1 or args.batch_size < 1:
+        parser.error("--samples and --batch-size must be positive")
+    report = {
+        "evidence_kind": "controlled_local_payload_encoding",
+        "samples": args.samples,
+        "inbound_batch_size": args.batch_size,
+        "inbound_queue": _inbound(args),
+        "arq_jobs": _arq(args),
+        "does_not_prove": "Redis MEMORY USAGE, network time, or production latency",
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Measure Wazzup webhook acknowledgement latency by payload size.
+
+The current handler runs for real, through FastAPI, against in-process
+Redis and ARQ stand-ins that sleep one configured round trip per call. The
+previous ingress (one ``RPUSH`` and one enqueue per message, and statuses
+committed inside the request) is replayed against the same stand-ins without
+the HTTP layer, so its figures flatter it slightly. This is a controlled
+timing harness: it counts round trips on the request path and
+must not be interpreted as live Redis, database or Wazzup latency.
+
+Usage::
+
+    uv run python -m scripts.benchmark_webhook_ingress --sizes 1 20 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from statistics import median
+from time import perf_counter
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+from fastapi import FastAPI
+
+from src.api.v1 import webhook
+
+_CHANNEL_ID = "benchmark-channel"
+
+
+class _RoundTrips:
+    """Redis and ARQ stand-ins whose every call costs one round trip."""
+
+    def __init__(self, rtt_ms: float, enqueue_round_trips: int) -> None:
+        self._rtt = rtt_ms / 1000.0
+        self._enqueue_round_trips = enqueue_round_trips
+
+    async def eval(self, *args: Any) -> int:
+        await asyncio.sleep(self._rtt)
+        return 1
+
+    async def rpush(self, *args: Any) -> int:
+        await asyncio.sleep(self._rtt)
+        return 1
+
+    async def enqueue_job(self, *args: Any, **kwargs: Any) -> None:
+        # ARQ checks for an existing job, then writes it in MULTI/EXEC.
+        await asyncio.sleep(self._rtt * self._enqueue_round_trips)
+
+
+class _Session:
+    def __init__(self, db_ms: float) -> None:
+        self._db = db_ms / 1000.0
+
+    async def __aenter__(self) -> _Session:
+        return self
+
+    async def __aexit__(self, *exc: object) -> bool:
+        return False
+
+    async def commit(self) -> None:
+        await asyncio.sleep(self._db)
+
+
+def _payload(messages: int, chats: int) -> dict[str, Any]:
+    return {
+        "messages": [
+            {
+                "messageId": f"in-{index}",
+                "channelId": _CHANNEL_ID,
+                "chatId": f"97150000{index % chats:04d}",
+                "chatType": "whatsapp",
+                "type": "text",
+                "text": "Do you deliver to Sharjah?",
+                "dateTime": "2026-10-19T09:30:00.000Z",
+                "status": "inbound",
+            }
+            for index in range(messages)
+        ],
+        "statuses": [
+            {
+                "messageId": f"out-{index}",
+                "timestamp": "2026-10-19T09:30:00.000Z",
+                "status": "delivered",
+            }
+            for index in range(messages)
+        ],
+    }
+
+
+async def _legacy_ack(
+    payload: dict[str, Any],
+    round_trips: _RoundTrips,
+    db_ms: float,
+) -> float:
+    started_at = perf_counter()
+    # One session with two status queries and a commit.
+    await asyncio.sleep(db_ms / 1000.0 * 3)
+    for _message in payload["messages"]:
+        await round_trips.rpush()
+        await round_trips.enqueue_job()
+    return (perf_counter() - started_at) * 1000.0
+
+
+async def _current_ack(client: httpx.AsyncClient, payload: dict[str, Any]) -> float:
+    started_at = perf_counter()
+    response = await client.post("/api/v1/webhook/wazzup", json=payload)
+    elapsed = (perf_counter() - started_at) * 1000.0
+    response.raise_for_status()
+    return elapsed
+
+
+async def _benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    round_trips = _RoundTrips(args.redis_rtt_ms, args.enqueue_round_trips)
+    app = FastAPI()
+    app.include_router(webhook.router, prefix="/api/v1/webhook")
+    app.state.redis = round_trips
+    app.state.arq_pool = round_trips
+    results: dict[str, Any] = {}
+    with (
+        patch.object(webhook.settings, "wazzup_channel_id", _CHANNEL_ID),
+        patch.object(webhook, "_parse_allowed_networks", return_value=[]),
+        patch.object(webhook, "async_session_factory", lambda: _Session(args.db_ms)),
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            for size in args.sizes:
+                payload = _payload(size, min(size, args.chats))
+                legacy = [
+                    await _legacy_ack(payload, round_trips, args.db_ms)
+                    for _ in range(args.samples)
+                ]
+                current = [
+                    await _current_ack(client, payload) for _ in range(args.samples)
+                ]
+                results[str(size)] = {
+                    "legacy_p50_ms": round(median(legacy), 3),
+                    "current_p50_ms": round(median(current), 3),
+                    "p50_reduction_ms": round(median(legacy) - median(current), 3),
+                }
+    return {
+        "evidence_kind": "controlled_local_webhook_ingress",
+        "samples_per_variant": args.samples,
+        "chats_per_payload": args.chats,
+        "statuses_per_payload": "same as messages",
+        "configured_round_trip_ms": {
+            "redis": args.redis_rtt_ms,
+            "enqueue_round_trips": args.enqueue_round_trips,
+            "database": args.db_ms,
+        },
+        "ack_latency_by_messages_per_payload": results,
+        "does_not_prove": (
+            "live Redis, database, Wazzup retry behaviour, or production latency"
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=9)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 20, 100])
+    parser.add_argument("--chats", type=int, default=5)
+    parser.add_argument("--redis-rtt-ms", type=float, default=0.5)
+    parser.add_argument("--enqueue-round-trips", type=int, default=2)
+    parser.add_argument("--db-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    if args.samples < 1 or args.chats < 1 or any(size < 1 for size in args.sizes):
+        parser.error("--samples, --chats and --sizes must be positive")
+    if args.redis_rtt_ms < 0 or args.db_ms < 0 or args.enqueue_round_trips < 0:
+        parser.error("round trip durations must be non-negative")
+    logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
+    print(json.dumps(asyncio.run(_benchmark(args)), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
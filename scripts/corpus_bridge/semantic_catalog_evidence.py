@@ -59,7 +59,7 @@ PINNED_PGVECTOR_EXTENSION = "0.8.5"
 # one. This pin fails in the same commit as the edit, and
 # `stale-evidence` names what has to be re-produced before the next round.
 PINNED_RETRIEVAL_CONTRACT_SHA = (
-    "29123d5fb9d3a8bc4dabce9585e333f5e51305e75044b47270d9b51c0c6a3da1"
+    "80cb49606709573af5480f88df8f1ee9e2b47c6ea73f6ed9aec58dba575d977b"
 )
 PINNED_QRELS_SHA256: dict[str, str] = {
     "openings-20": ("cddfb117c4d304ba26ac7f8e1a50e298280c4c209dbea89f1bdacc7cbd16a79b"),
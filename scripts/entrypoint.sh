@@ -10,6 +10,14 @@ case "${1:-web}" in
     echo "Starting ARQ worker..."
     exec arq src.worker.WorkerSettings
     ;;
+  worker-realtime)
+    echo "Starting ARQ realtime worker..."
+    exec arq src.worker.RealtimeWorkerSettings
+    ;;
+  worker-interactive)
+    echo "Starting ARQ interactive worker..."
+    exec arq src.worker.InteractiveWorkerSettings
+    ;;
   web|"")
     echo "Running Alembic migrations..."
 
@@ -57,7 +65,7 @@ with engine.begin() as conn:
     ;;
   *)
     echo "Unknown command: $1"
-    echo "Usage: entrypoint.sh [web|worker|test]"
+    echo "Usage: entrypoint.sh [web|worker|worker-realtime|worker-interactive|test]"
     exit 1
     ;;
 esac
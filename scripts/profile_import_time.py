@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Profile the cold import of a process entry point with ``-X importtime``.
+
+Imports the module in a fresh interpreter, prints the slowest imports by
+cumulative time and fails when the import exceeds its budget or loads a
+module that entry point must not load:
+
+    python scripts/profile_import_time.py src.main --budget-ms 6000 \\
+        --forbid torch --forbid pydantic_ai
+
+With ``--entry api`` or ``--entry worker`` the budgets and forbidden modules
+guarded by tests/test_import_time_budget.py are applied.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent> *)(?P<name>\S+)$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EntryBudget:
+    module: str
+    budget_ms: int
+    forbidden: tuple[str, ...]
+
+
+# The API never embeds or runs a model in-request: torch, the LLM SDKs and
+# the dialogue engine load on first use, in the worker. The worker needs the
+# engine at import, but the embedding model only once `startup` warms it.
+ENTRY_BUDGETS: dict[str, EntryBudget] = {
+    "api": EntryBudget(
+        module="src.main",
+        budget_ms=6000,
+        forbidden=(
+            "torch",
+            "sentence_transformers",
+            "transformers",
+            "pydantic_ai",
+            "openai",
+            "langgraph",
+            "src.llm.engine",
+        ),
+    ),
+    "worker": EntryBudget(
+        module="src.worker",
+        budget_ms=8000,
+        forbidden=("torch", "sentence_transformers", "transformers"),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRecord:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(slots=True)
+class ImportProfile:
+    module: str
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        top = [record for record in self.records if record.name == self.module]
+        return top[-1].cumulative_us / 1000 if top else 0.0
+
+    def loaded(self, module: str) -> bool:
+        return any(record.name == module for record in self.records)
+
+    def slowest(self, count: int) -> list[ImportRecord]:
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:count]
+
+    def import_chain(self, module: str) -> list[str]:
+        """The first import path that pulled ``module`` in, outermost last.
+
+        ``-X importtime`` reports a module after everything it imported, one
+        indent level deeper, so the importer is the next shallower record.
+        """
+        for index, record in enumerate(self.records):
+            if record.name != module:
+                continue
+            chain, depth = [module], record.depth
+            for parent in self.records[index + 1 :]:
+                if parent.depth < depth:
+                    chain.append(parent.name)
+                    depth = parent.depth
+            return chain
+        return []
+
+
+def parse_importtime(module: str, stderr: str) -> ImportProfile:
+    profile = ImportProfile(module=module)
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        profile.records.append(
+            ImportRecord(
+                name=match["name"],
+                self_us=int(match["self"]),
+                cumulative_us=int(match["cumulative"]),
+                depth=len(match["indent"]) // 2,
+            )
+        )
+    return profile
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import ``module`` in a fresh interpreter and collect its import times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{completed.stderr[-2000:]}")
+    return parse_importtime(module, completed.stderr)
+
+
+def budget_violations(
+    profile: ImportProfile,
+    *,
+    budget_ms: int | None,
+    forbidden: tuple[str, ...],
+) -> list[str]:
+    violations = [
+        f"{name} is imported via {' <- '.join(profile.import_chain(name))}"
+        for name in forbidden
+        if profile.loaded(name)
+    ]
+    if budget_ms is not None and profile.total_ms > budget_ms:
+        violations.append(
+            f"{profile.module} took {profile.total_ms:.0f} ms, budget {budget_ms} ms"
+        )
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Profile a cold import and enforce an import-time budget."
+    )
+    parser.add_argument("module", nargs="?", help="module to import, e.g. src.main")
+    parser.add_argument(
+        "--entry",
+        choices=sorted(ENTRY_BUDGETS),
+        help="apply the budget and forbidden modules of a process entry point",
+    )
+    parser.add_argument("--budget-ms", type=int, default=None)
+    parser.add_argument("--forbid", action="append", default=[])
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args()
+
+    entry = ENTRY_BUDGETS[args.entry] if args.entry else None
+    module = args.module or (entry.module if entry else None)
+    if module is None:
+        parser.error("give a module or --entry")
+    budget_ms = args.budget_ms or (entry.budget_ms if entry else None)
+    forbidden = tuple(args.forbid) + (entry.forbidden if entry else ())
+
+    profile = profile_import(module)
+    violations = budget_violations(profile, budget_ms=budget_ms, forbidden=forbidden)
+    slowest = profile.slowest(args.top)
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "module": module,
+                    "total_ms": round(profile.total_ms, 1),
+                    "budget_ms": budget_ms,
+                    "slowest": [
+                        {
+                            "name": record.name,
+                            "cumulative_ms": round(record.cumulative_us / 1000, 1),
+                            "self_ms": round(record.self_us / 1000, 1),
+                        }
+                        for record in slowest
+                    ],
+                    "violations": violations,
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(f"{module}: {profile.total_ms:.0f} ms ({len(profile.records)} modules)")
+        for record in slowest:
+            print(
+                f"{record.cumulative_us / 1000:10.1f} ms "
+                f"{record.self_us / 1000:8.1f} ms  {'  ' * record.depth}{record.name}"
+            )
+        for violation in violations:
+            print(f"BUDGET: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,645 @@
+"""Replay the model-battle conversations through the real inbound pipeline.
+
+Unlike ``scripts/load_test_conversations.py``, which only sleeps, this drives
+``process_incoming_batch`` -> ``_process_batch_inner`` ->
+``process_message_impl`` against a local, migrated Postgres and Redis
+(``settings.database_url`` / ``settings.redis_url``). Wazzup, Zoho Inventory,
+Zoho CRM and OpenRouter are served by a fake provider process the harness
+starts itself, so nothing leaves the machine:
+
+    uv run alembic upgrade head
+    uv run python -m scripts.replay_load_test --concurrency 8 --rounds 3
+
+The fake OpenRouter endpoint answers every completion deterministically: a
+recorded reply for the conversation the request belongs to (``--replies``,
+JSON ``{case_id: reply}`` where a reply is a text or a list of steps, each a
+text or ``{"tool": name, "arguments": {...}}``), a schema-shaped tool call for
+structured-output agents, or a fixed default text, after ``--llm-latency-ms``.
+
+The report gives per-phase ``ChatLatencyTrace`` percentiles, SQL statements
+and DB time per turn, calls per fake provider and the process CPU time, so a
+performance change can be compared offline, run against run. With
+``--max-queries-per-turn`` a turn running more SQL statements fails the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI, Request
+from scripts.model_battle_cases import CORE_HARD_CASES, SALES_CASES
+
+from src.core.config import settings
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MAX_CONCURRENCY = 64
+MAX_ROUNDS = 50
+DEFAULT_REPLY = (
+    "Thank you for your message. I will check the catalog and come back with "
+    "verified options shortly."
+)
+FAKE_CHANNEL_ID = "replay-load-test-channel"
+FAKE_CHANNEL_PHONE = "971500000000"
+_FAKE_TOKEN = "replay-load-test-token"
+_STARTUP_TIMEOUT_SECONDS = 30.0
+
+type ReplyStep = str | dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayConversation:
+    case_id: str
+    turns: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayConfig:
+    concurrency: int = 4
+    rounds: int = 1
+    llm_latency_ms: float = 800.0
+    provider_latency_ms: float = 50.0
+    cases: tuple[str, ...] = ()
+    replies_path: Path | None = None
+    port: int = 0
+    max_queries_per_turn: int | None = None
+
+
+@dataclass(slots=True)
+class TurnResult:
+    case_id: str
+    wall_ms: float
+    queries: int
+    db_ms: float
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _ProviderStats:
+    calls: Counter[str] = field(default_factory=Counter)
+
+
+def validate_config(config: ReplayConfig) -> None:
+    if not 1 <= config.concurrency <= MAX_CONCURRENCY:
+        raise ValueError(
+            f"concurrency must be between 1 and {MAX_CONCURRENCY}; "
+            f"got {config.concurrency}"
+        )
+    if not 1 <= config.rounds <= MAX_ROUNDS:
+        raise ValueError(
+            f"rounds must be between 1 and {MAX_ROUNDS}; got {config.rounds}"
+        )
+    if config.llm_latency_ms < 0 or config.provider_latency_ms < 0:
+        raise ValueError("latencies must be non-negative")
+    if config.max_queries_per_turn is not None and config.max_queries_per_turn < 0:
+        raise ValueError("max queries per turn must be non-negative")
+    known = {conversation.case_id for conversation in replay_conversations()}
+    if unknown := sorted(set(config.cases) - known):
+        raise ValueError(f"unknown cases: {', '.join(unknown)}")
+
+
+def replay_conversations(
+    case_ids: Sequence[str] = (),
+) -> tuple[ReplayConversation, ...]:
+    """The customer side of every sales case, earlier turns first."""
+    conversations = tuple(
+        ReplayConversation(
+            case_id=case.case_id,
+            turns=(
+                *(
+                    turn["content"]
+                    for turn in case.conversation
+                    if turn.get("role") == "user"
+                ),
+                case.user_prompt,
+            ),
+        )
+        for case in (*SALES_CASES, *CORE_HARD_CASES)
+    )
+    if not case_ids:
+        return conversations
+    return tuple(
+        conversation
+        for conversation in conversations
+        if conversation.case_id in set(case_ids)
+    )
+
+
+def load_recorded_replies(path: Path | None) -> dict[str, list[ReplyStep]]:
+    if path is None:
+        return {}
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        raise ValueError("replies must be a JSON object keyed by case id")
+    return {
+        str(case_id): list(reply) if isinstance(reply, list) else [reply]
+        for case_id, reply in raw.items()
+    }
+
+
+def _message_text(message: Mapping[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) for part in content if isinstance(part, dict)
+        )
+    return ""
+
+
+def _schema_instance(schema: Any, defs: Mapping[str, Any]) -> Any:
+    """The smallest value a JSON schema accepts, for structured-output agents."""
+    if not isinstance(schema, dict):
+        return None
+    if ref := schema.get("$ref"):
+        return _schema_instance(defs.get(str(ref).rsplit("/", 1)[-1]), defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    for key in ("anyOf", "oneOf", "allOf"):
+        if options := schema.get(key):
+            return _schema_instance(options[0], defs)
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((item for item in kind if item != "null"), "null")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {
+            name: _schema_instance(properties.get(name), defs)
+            for name in schema.get("required", [])
+        }
+    return {
+        "array": [],
+        "string": "",
+        "integer": 0,
+        "number": 0,
+        "boolean": False,
+    }.get(str(kind))
+
+
+def _tool_call(name: str, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "id": f"call_{uuid.uuid4().hex[:12]}",
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps(dict(arguments))},
+    }
+
+
+def _reply_step(
+    body: Mapping[str, Any],
+    conversations: Sequence[ReplayConversation],
+    replies: Mapping[str, Sequence[ReplyStep]],
+) -> ReplyStep | None:
+    """The recorded step for this request: case by customer text, step by tools."""
+    messages = [m for m in body.get("messages", []) if isinstance(m, dict)]
+    last_user = max(
+        (index for index, m in enumerate(messages) if m.get("role") == "user"),
+        default=None,
+    )
+    if last_user is None:
+        return None
+    text = _message_text(messages[last_user])
+    case_id = next(
+        (
+            conversation.case_id
+            for conversation in conversations
+            if any(turn in text for turn in conversation.turns)
+        ),
+        None,
+    )
+    steps = replies.get(case_id or "", ())
+    tool_results = sum(1 for m in messages[last_user:] if m.get("role") == "tool")
+    return steps[tool_results] if tool_results < len(steps) else None
+
+
+def fake_chat_completion(
+    body: Mapping[str, Any],
+    conversations: Sequence[ReplayConversation],
+    replies: Mapping[str, Sequence[ReplyStep]],
+) -> dict[str, Any]:
+    """Build the OpenAI-format completion the fake OpenRouter endpoint returns."""
+    step = _reply_step(body, conversations, replies)
+    tools = [
+        tool.get("function", {})
+        for tool in body.get("tools") or []
+        if isinstance(tool, dict)
+    ]
+    output_tool = next(
+        (
+            tool
+            for tool in tools
+            if str(tool.get("name", "")).startswith("final_result")
+        ),
+        None,
+    )
+    response_format = body.get("response_format") or {}
+    content: str | None = None
+    tool_calls: list[dict[str, Any]] = []
+    if isinstance(step, dict):
+        tool_calls.append(_tool_call(str(step["tool"]), step.get("arguments", {})))
+    elif output_tool is not None:
+        parameters = output_tool.get("parameters", {})
+        tool_calls.append(
+            _tool_call(
+                str(output_tool["name"]),
+                _schema_instance(parameters, parameters.get("$defs", {})) or {},
+            )
+        )
+    elif response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        content = json.dumps(_schema_instance(schema, schema.get("$defs", {})))
+    else:
+        content = step if isinstance(step, str) else DEFAULT_REPLY
+
+    prompt_tokens = sum(len(_message_text(m)) for m in body.get("messages", [])) // 4
+    completion_tokens = len(content or "") // 4 + 8 * len(tool_calls)
+    message: dict[str, Any] = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+    return {
+        "id": f"gen-replay-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": str(body.get("model", "replay/fake")),
+        "provider": "replay",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+                "message": message,
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cost": 0.0,
+        },
+    }
+
+
+def build_fake_provider_app(
+    conversations: Sequence[ReplayConversation],
+    replies: Mapping[str, Sequence[ReplyStep]],
+    *,
+    llm_latency_ms: float,
+    provider_latency_ms: float,
+) -> FastAPI:
+    """One ASGI app standing in for OpenRouter, Wazzup and both Zoho APIs."""
+    app = FastAPI()
+    stats = _ProviderStats()
+
+    async def provider_call(name: str) -> None:
+        stats.calls[name] += 1
+        await asyncio.sleep(provider_latency_ms / 1000)
+
+    @app.get("/health")
+    async def health() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/stats")
+    async def provider_stats() -> dict[str, int]:
+        return dict(sorted(stats.calls.items()))
+
+    @app.post("/openrouter/chat/completions")
+    async def chat_completions(request: Request) -> dict[str, Any]:
+        stats.calls["openrouter"] += 1
+        await asyncio.sleep(llm_latency_ms / 1000)
+        return fake_chat_completion(await request.json(), conversations, replies)
+
+    @app.get("/wazzup/channels")
+    async def wazzup_channels() -> list[dict[str, str]]:
+        await provider_call("wazzup")
+        return [{"channelId": FAKE_CHANNEL_ID, "plainId": FAKE_CHANNEL_PHONE}]
+
+    @app.post("/wazzup/message")
+    async def wazzup_message() -> dict[str, str]:
+        await provider_call("wazzup")
+        return {"messageId": str(uuid.uuid4())}
+
+    @app.api_route("/wazzup/{path:path}", methods=["GET", "POST", "PATCH"])
+    async def wazzup_other(path: str) -> dict[str, Any]:
+        await provider_call("wazzup")
+        return {}
+
+    @app.api_route("/zoho-inventory/{path:path}", methods=["GET", "POST", "PUT"])
+    async def zoho_inventory(path: str) -> dict[str, Any]:
+        await provider_call("zoho_inventory")
+        return {"code": 0, "message": "success", "items": [], "page_context": {}}
+
+    @app.api_route("/zoho-crm/{path:path}", methods=["GET", "POST", "PUT"])
+    async def zoho_crm(path: str) -> dict[str, Any]:
+        await provider_call("zoho_crm")
+        return {"data": []}
+
+    return app
+
+
+def point_settings_at_fakes(base_url: str) -> None:
+    """Send every provider call the turn makes to the fake provider process.
+
+    Must run before the pipeline is imported: the chat models read the
+    OpenRouter base URL when they are built.
+    """
+    settings.openrouter_base_url = f"{base_url}/openrouter"
+    settings.wazzup_api_url = f"{base_url}/wazzup"
+    settings.zoho_inventory_api_url = f"{base_url}/zoho-inventory"
+    settings.zoho_crm_api_url = f"{base_url}/zoho-crm"
+    settings.zoho_crm_accounts_url = f"{base_url}/zoho-crm"
+    settings.wazzup_channel_id = FAKE_CHANNEL_ID
+    settings.openrouter_api_key = _FAKE_TOKEN
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _start_fake_providers(config: ReplayConfig, port: int) -> subprocess.Popen[bytes]:
+    """Serve the fakes from a child process, outside the measured CPU time."""
+    command = [
+        sys.executable,
+        "-m",
+        "scripts.replay_load_test",
+        "--serve-fakes",
+        "--port",
+        str(port),
+        "--llm-latency-ms",
+        str(config.llm_latency_ms),
+        "--provider-latency-ms",
+        str(config.provider_latency_ms),
+    ]
+    if config.replies_path is not None:
+        command.extend(["--replies", str(config.replies_path)])
+    return subprocess.Popen(command, cwd=REPO_ROOT)
+
+
+async def _wait_until_serving(base_url: str) -> None:
+    import httpx
+
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                if (await client.get(f"{base_url}/health")).is_success:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("fake providers did not start")
+            await asyncio.sleep(0.2)
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round((len(ordered) - 1) * percentile)))
+    return round(ordered[index], 3)
+
+
+def _metric(values: Sequence[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "p50": _percentile(values, 0.50),
+        "p95": _percentile(values, 0.95),
+        "max": round(max(values), 3),
+    }
+
+
+def _inbound_message(chat_id: str, text: str) -> str:
+    return json.dumps(
+        {
+            "messageId": str(uuid.uuid4()),
+            "chatId": chat_id,
+            "chatType": "whatsapp",
+            "channelId": FAKE_CHANNEL_ID,
+            "type": "text",
+            "status": "inbound",
+            "authorType": "client",
+            "text": text,
+            "dateTime": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3],
+        }
+    )
+
+
+async def run_replay(config: ReplayConfig, base_url: str) -> dict[str, Any]:
+    """Replay the selected conversations ``rounds`` times, ``concurrency`` at once."""
+    import httpx
+    from arq import create_pool
+    from arq.connections import RedisSettings
+
+    point_settings_at_fakes(base_url)
+
+    from src.core.database import engine, instrument_query_stats, track_queries
+    from src.core.queues import deserialize_job_payload, serialize_job_payload
+    from src.services.chat import process_incoming_batch
+    from src.services.chat_latency import summarize_chat_latency
+    from src.services.inbound_batch import inbound_chat_reference, inbound_queue_key
+    from src.services.latency_slo import chat_latency_recorder
+
+    conversations = replay_conversations(config.cases)
+    pool = await create_pool(
+        RedisSettings.from_dsn(settings.redis_url),
+        job_serializer=serialize_job_payload,
+        job_deserializer=deserialize_job_payload,
+    )
+    await pool.set("zoho:access_token", _FAKE_TOKEN)
+    await pool.set("zoho_crm:access_token", _FAKE_TOKEN)
+
+    samples: list[dict[str, Any]] = []
+    record_latency = chat_latency_recorder.record
+
+    def keep_sample(snapshot: Mapping[str, Any]) -> None:
+        samples.append(dict(snapshot))
+        record_latency(snapshot)
+
+    chat_latency_recorder.record = keep_sample  # type: ignore[method-assign]
+
+    instrument_query_stats(engine)
+
+    run_tag = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(config.concurrency)
+    results: list[TurnResult] = []
+
+    async def replay(index: int, conversation: ReplayConversation) -> None:
+        chat_id = f"replay-{run_tag}-{index:05d}"
+        batch_ref = inbound_chat_reference(chat_id)
+        async with semaphore:
+            for text in conversation.turns:
+                started = time.perf_counter()
+                error: str | None = None
+                with track_queries() as stats:
+                    try:
+                        await pool.rpush(
+                            inbound_queue_key(batch_ref),
+                            _inbound_message(chat_id, text),
+                        )
+                        await process_incoming_batch(
+                            {"redis": pool, "job_try": 1}, batch_ref
+                        )
+                    except Exception as exc:
+                        error = type(exc).__name__
+                assert stats is not None
+                results.append(
+                    TurnResult(
+                        case_id=conversation.case_id,
+                        wall_ms=round((time.perf_counter() - started) * 1000, 3),
+                        queries=stats.count,
+                        db_ms=round(stats.total_ms, 3),
+                        error=error,
+                    )
+                )
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                replay(round_index * len(conversations) + offset, conversation)
+                for round_index in range(config.rounds)
+                for offset, conversation in enumerate(conversations)
+            )
+        )
+    finally:
+        chat_latency_recorder.record = record_latency  # type: ignore[method-assign]
+        await pool.aclose()
+    wall_ms = (time.perf_counter() - wall_started) * 1000
+    cpu_ms = (time.process_time() - cpu_started) * 1000
+
+    async with httpx.AsyncClient() as client:
+        provider_calls = (await client.get(f"{base_url}/stats")).json()
+
+    turns = len(results)
+    errors = Counter(result.error for result in results if result.error)
+    return {
+        "mode": "replay",
+        "conversations": len(conversations) * config.rounds,
+        "turns": turns,
+        "failed": sum(errors.values()),
+        "errors": dict(sorted(errors.items())),
+        "concurrency": config.concurrency,
+        "rounds": config.rounds,
+        "llm_latency_ms": config.llm_latency_ms,
+        "provider_latency_ms": config.provider_latency_ms,
+        "wall_ms": round(wall_ms, 3),
+        "turns_per_second": round(turns / (wall_ms / 1000), 3) if wall_ms else 0.0,
+        "cpu_ms": round(cpu_ms, 3),
+        "cpu_ms_per_turn": round(cpu_ms / turns, 3) if turns else 0.0,
+        "turn_ms": _metric([result.wall_ms for result in results]),
+        "db_queries": {
+            "total": sum(result.queries for result in results),
+            "per_turn": _metric([float(result.queries) for result in results]),
+            "db_ms_per_turn": _metric([result.db_ms for result in results]),
+            "budget": config.max_queries_per_turn,
+            "turns_over_budget": sum(
+                config.max_queries_per_turn is not None
+                and result.queries > config.max_queries_per_turn
+                for result in results
+            ),
+        },
+        "provider_calls": provider_calls,
+        "latency": summarize_chat_latency(samples),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> tuple[ReplayConfig, bool]:
+    parser = argparse.ArgumentParser(
+        description="Replay the model-battle conversations through the real "
+        "inbound pipeline against fake providers."
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0)
+    parser.add_argument("--provider-latency-ms", type=float, default=50.0)
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        help="replay only this case id; repeatable",
+    )
+    parser.add_argument("--replies", type=Path, default=None)
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument(
+        "--max-queries-per-turn",
+        type=int,
+        default=None,
+        help="fail the run when a turn runs more SQL statements than this",
+    )
+    parser.add_argument(
+        "--serve-fakes",
+        action="store_true",
+        help="only serve the fake providers (used by the harness itself)",
+    )
+    args = parser.parse_args(argv)
+    config = ReplayConfig(
+        concurrency=args.concurrency,
+        rounds=args.rounds,
+        llm_latency_ms=args.llm_latency_ms,
+        provider_latency_ms=args.provider_latency_ms,
+        cases=tuple(args.case),
+        replies_path=args.replies,
+        port=args.port,
+        max_queries_per_turn=args.max_queries_per_turn,
+    )
+    validate_config(config)
+    return config, args.serve_fakes
+
+
+def serve_fakes(config: ReplayConfig) -> None:
+    import uvicorn
+
+    app = build_fake_provider_app(
+        replay_conversations(),
+        load_recorded_replies(config.replies_path),
+        llm_latency_ms=config.llm_latency_ms,
+        provider_latency_ms=config.provider_latency_ms,
+    )
+    uvicorn.run(app, host="127.0.0.1", port=config.port, log_level="warning")
+
+
+async def async_main(argv: list[str] | None = None) -> int:
+    try:
+        config, _serve = parse_args(argv)
+    except ValueError as exc:
+        print(f"Invalid replay config: {exc}", file=sys.stderr)
+        return 2
+
+    port = config.port or _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    fakes = _start_fake_providers(config, port)
+    try:
+        await _wait_until_serving(base_url)
+        result = await run_replay(config, base_url)
+    finally:
+        fakes.terminate()
+        fakes.wait(timeout=10)
+    print(json.dumps(result, indent=2, sort_keys=True))
+    over_budget = result["db_queries"]["turns_over_budget"]
+    return 1 if result["failed"] or over_budget else 0
+
+
+def main() -> None:
+    if "--serve-fakes" in sys.argv[1:]:
+        config, _serve = parse_args()
+        serve_fakes(config)
+        return
+    raise SystemExit(asyncio.run(async_main()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,8 @@
+import logging
+from typing import Any
+
 from sqladmin import Admin, ModelView
+from starlette.requests import Request
 
 from src.models.admin_action_audit import AdminActionAudit
 from src.models.conversation import Conversation
@@ -16,6 +20,10 @@ from src.models.quality_review import QualityReview
 from src.models.referral import Referral
 from src.models.system_config import SystemConfig
 from src.models.system_prompt import SystemPrompt
+from src.services.product_neighbors import rebuild_cross_sell_neighbors
+from src.services.recommendations import CROSS_SELL_RULES_KEY
+
+logger = logging.getLogger(__name__)
 
 
 class ReadOnlyModelView(ModelView):
@@ -153,6 +161,17 @@ class SystemConfigAdmin(ModelView, model=SystemConfig):
     name_plural = "Системные настройки"
     icon = "fa-solid fa-gear"
 
+    async def after_model_change(
+        self, data: dict[str, Any], model: Any, is_created: bool, request: Request
+    ) -> None:
+        # Precomputed cross-sell picks follow the rules they were built from.
+        if model.key != CROSS_SELL_RULES_KEY:
+            return
+        try:
+            await rebuild_cross_sell_neighbors()
+        except Exception:
+            logger.exception("Cross-sell rebuild after a rules edit failed")
+
 
 class MetricsSnapshotAdmin(ReadOnlyModelView, model=MetricsSnapshot):
     column_list = [
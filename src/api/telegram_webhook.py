@@ -9,6 +9,12 @@ The full flow uses a two-step interaction:
 1. Manager clicks a button → bot asks for the answer text.
 2. Manager types the answer → bot adapts it, sends it, and optionally saves to FAQ.
 
+The webhook itself only validates the update and queues the slow part: the
+reply adaptation (an LLM call), customer delivery, DB writes, button presses
+and `/reset` run in the `run_telegram_action` ARQ job, which reports back to
+the manager chat. Telegram therefore always gets its 200 at once and never
+redelivers an update because OpenRouter or Wazzup was slow.
+
 NOTE: This requires setting up the Telegram webhook externally
 (the runtime now syncs `setWebhook(secret_token=...)` on startup).
 """
@@ -30,6 +36,7 @@ from sqlalchemy import select
 
 from src.core.config import settings
 from src.core.database import async_session_factory
+from src.core.queues import enqueue_routed_job
 from src.core.redis import redis_client
 from src.integrations.notifications.telegram import TelegramClient
 from src.integrations.notifications.telegram_webhook import (
@@ -48,6 +55,7 @@ from src.services.outbound_audit import (
     send_wazzup_media_with_audit,
     send_wazzup_text_with_audit,
 )
+from src.services.scheduled_actions import sync_scheduled_actions
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +88,7 @@ _ADMIN_LOGIN_COMMAND_RE = re.compile(
     r"^(?:/admin(?:@[A-Za-z0-9_]+)?|/start(?:@[A-Za-z0-9_]+)?\s+admin)\s*$"
 )
 _RESET_COMMAND_RE = re.compile(r"^/reset(?:@[A-Za-z0-9_]+)?(?:\s+(?P<phone>.+))?$")
+_ACTION_JOB_ID_PREFIX = "telegram_action:"
 
 
 def _get_telegram_client() -> TelegramClient:
@@ -157,11 +166,17 @@ async def telegram_webhook(
         raise HTTPException(status_code=403, detail="Invalid webhook secret")
 
     data: dict[str, Any] = await request.json()
+    arq_pool = request.app.state.arq_pool
 
     # Handle callback_query (button press from escalation alert)
     callback_query = data.get("callback_query")
     if callback_query:
-        await _handle_callback_query(callback_query)
+        await _enqueue_telegram_action(
+            arq_pool,
+            "callback_query",
+            callback_query,
+            job_key=f"callback:{callback_query.get('id')}",
+        )
         return {"status": "ok"}
 
     # Handle text message (manager's reply after clicking a button)
@@ -169,14 +184,79 @@ async def telegram_webhook(
     if message and message.get("text"):
         if await _handle_admin_login_command_if_present(message):
             return {"status": "ok"}
-        if await _handle_reset_command_if_present(message):
+        if _RESET_COMMAND_RE.match(str(message["text"]).strip()):
+            await _enqueue_telegram_action(
+                arq_pool,
+                "reset_command",
+                message,
+                job_key=_message_job_key("reset", message),
+            )
             return {"status": "ok"}
-        await _handle_manager_reply(message)
+        await _accept_manager_reply(message, arq_pool)
         return {"status": "ok"}
 
     return {"status": "ignored"}
 
 
+def _message_job_key(kind: str, message: dict[str, Any]) -> str:
+    chat_id = (message.get("chat") or {}).get("id")
+    return f"{kind}:{chat_id}:{message.get('message_id')}"
+
+
+async def _enqueue_telegram_action(
+    arq_pool: Any,
+    kind: str,
+    payload: dict[str, Any],
+    *,
+    job_key: str,
+) -> None:
+    """Queue `run_telegram_action` once per Telegram update.
+
+    The job id is derived from Telegram's ids, so an update Telegram
+    redelivers while the first copy is queued, running, or kept as a result
+    is not queued again.
+    """
+    await enqueue_routed_job(
+        arq_pool,
+        "run_telegram_action",
+        kind,
+        payload,
+        _job_id=f"{_ACTION_JOB_ID_PREFIX}{job_key}",
+    )
+
+
+async def run_telegram_action(
+    ctx: dict[str, Any],
+    kind: str,
+    payload: dict[str, Any],
+) -> str:
+    """ARQ job: the slow part of a Telegram update queued by the webhook.
+
+    Outcomes, including failures, are reported to the manager chat.
+    """
+    del ctx
+    try:
+        if kind == "manager_reply":
+            await _process_manager_reply(payload["message"], payload["pending"])
+        elif kind == "callback_query":
+            await _handle_callback_query(payload)
+        elif kind == "reset_command":
+            await _handle_reset_command_if_present(payload)
+        else:
+            logger.warning("Ignoring unknown Telegram action %s", kind)
+            return "ignored"
+    except Exception:
+        logger.exception("Telegram action %s failed", kind)
+        chat = (payload.get("message") or payload).get("chat") or {}
+        if chat.get("id") is not None:
+            await _get_telegram_client().send_message(
+                "❌ Error while processing the action. Please try again.",
+                chat_id=str(chat["id"]),
+            )
+        return "failed"
+    return "ok"
+
+
 async def _handle_callback_query(callback_query: dict[str, Any]) -> None:
     """Process inline keyboard button press."""
     client = _get_telegram_client()
@@ -493,12 +573,15 @@ async def _handle_reset_callback(
     )
 
 
-async def _handle_manager_reply(message: dict[str, Any]) -> None:
-    """Process the manager's text reply after they clicked a button."""
+async def _accept_manager_reply(message: dict[str, Any], arq_pool: Any) -> None:
+    """Claim the pending draft context for a manager's text and queue delivery.
+
+    The context is deleted only after the job is queued, so a failed enqueue
+    leaves it in place for Telegram's redelivery of the same update.
+    """
     chat_id = message["chat"]["id"]
-    draft = message["text"]
 
-    # Retrieve and delete pending context from Redis
+    # Retrieve pending context from Redis
     redis_key = f"{_PENDING_KEY_PREFIX}{chat_id}"
     pending_raw = await redis_client.get(redis_key)
     if not pending_raw:
@@ -515,9 +598,23 @@ async def _handle_manager_reply(message: dict[str, Any]) -> None:
                 chat_id=str(chat_id),
             )
         return
+
+    await _enqueue_telegram_action(
+        arq_pool,
+        "manager_reply",
+        {"message": message, "pending": json.loads(pending_raw)},
+        job_key=_message_job_key("reply", message),
+    )
     await redis_client.delete(redis_key, f"{_PROMPTED_KEY_PREFIX}{chat_id}")
 
-    pending = json.loads(pending_raw)
+
+async def _process_manager_reply(
+    message: dict[str, Any],
+    pending: dict[str, Any],
+) -> None:
+    """Adapt the manager's reply, deliver it, and prepare the FAQ candidate."""
+    chat_id = message["chat"]["id"]
+    draft = message["text"]
     question = pending["question"]
     mode = pending["mode"]
     conv_id = pending["conversation_id"]
@@ -575,6 +672,13 @@ async def _handle_manager_reply(message: dict[str, Any]) -> None:
                             "private",
                         ),
                     )
+                    if send_result.skipped:
+                        # A rerun of this job: the customer already has it.
+                        await client.send_message(
+                            "ℹ️ This reply was already sent to the customer.",
+                            chat_id=str(chat_id),
+                        )
+                        return
                     msg = Message(
                         conversation_id=uuid.UUID(conv_id),
                         role="assistant",
@@ -993,6 +1097,7 @@ async def _handle_order_decision(
                     sale_order_number=sale_order_number,
                     decided_at=datetime.now(UTC).isoformat(),
                 )
+                await sync_scheduled_actions(db, decision_conv)
             else:
                 logger.warning(
                     "Conversation %s disappeared before order decision metadata write",
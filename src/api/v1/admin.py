@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import uuid
+from dataclasses import asdict
+from datetime import UTC, datetime
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
@@ -34,6 +36,8 @@ from src.quality.config import (
     save_ai_quality_controls_config,
 )
 from src.schemas import (
+    ChatLatencyPhaseRead,
+    ChatLatencyResponse,
     ClientSelfTestSubmitRequest,
     ClientSelfTestSubmitResponse,
     DashboardMetricsResponse,
@@ -64,6 +68,11 @@ from src.services.followup import (
     merge_payment_reminder_controls_update,
     save_payment_reminder_controls_config,
 )
+from src.services.latency_slo import (
+    LatencyWindow,
+    read_latency_window,
+    summarize_latency_window,
+)
 from src.services.notifications import send_telegram_message
 from src.services.referrals import (
     ReferralPolicyResponse,
@@ -208,6 +217,38 @@ async def get_dashboard_timeseries(
     return await calculate_timeseries(db, period)
 
 
+@router.get("/dashboard/latency/", response_model=ChatLatencyResponse)
+async def get_dashboard_latency(
+    redis: Annotated[Redis, Depends(get_redis)],
+    window: LatencyWindow = "1h",
+) -> ChatLatencyResponse:
+    """Get chat latency p50/p95/p99 per phase over a rolling window.
+
+    Query params:
+        window: 5m | 15m | 1h | 24h (default: 1h)
+    """
+    from src.services.runtime_monitoring import (
+        PhaseLatencyMetrics,
+        RuntimeThresholds,
+        chat_latency_slo_breached,
+    )
+
+    generated_at = datetime.now(UTC)
+    thresholds = RuntimeThresholds()
+    histograms = await read_latency_window(redis, window, now=generated_at.timestamp())
+    phases = []
+    for summary in summarize_latency_window(histograms):
+        metrics = PhaseLatencyMetrics.model_validate(asdict(summary))
+        phases.append(
+            ChatLatencyPhaseRead(
+                **metrics.model_dump(),
+                slo_p95_ms=thresholds.chat_latency_p95_ms.get(summary.phase),
+                breached=chat_latency_slo_breached(metrics, thresholds),
+            )
+        )
+    return ChatLatencyResponse(window=window, generated_at=generated_at, phases=phases)
+
+
 @router.get("/feedback/recent", response_model=list[RecentFeedbackRead])
 async def get_admin_recent_feedback(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -49,6 +49,7 @@ async def get_customers(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     search: str | None = None,
     status: str | None = None,
     stage: str | None = None,
@@ -63,6 +64,7 @@ async def get_customers(
         db=db,
         page=page,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         status=status,
         stage=stage,
@@ -83,6 +85,7 @@ async def get_conversations(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     search: str | None = None,
     phone: str | None = None,
     status: str | None = None,
@@ -98,6 +101,7 @@ async def get_conversations(
         db=db,
         page=page,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         phone=phone,
         status=status,
@@ -246,6 +250,7 @@ async def get_audit(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     action: str | None = None,
     entity_type: str | None = None,
     entity_id: str | None = None,
@@ -256,6 +261,7 @@ async def get_audit(
         db=db,
         page=page,
         page_size=page_size,
+        cursor=cursor,
         action=action,
         entity_type=entity_type,
         entity_id=entity_id,
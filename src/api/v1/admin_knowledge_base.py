@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
+from src.api.deps import get_redis
 from src.api.v1.admin import require_admin_session
 from src.core.database import get_db
 from src.schemas.admin import (
@@ -16,6 +19,7 @@ from src.schemas.admin import (
     AdminKnowledgeBaseCandidateReject,
     AdminKnowledgeBasePreview,
     AdminKnowledgeBaseRead,
+    AdminKnowledgeBaseReindexStatus,
     AdminKnowledgeBaseUpdate,
     AdminKnowledgeBaseWrite,
 )
@@ -25,6 +29,7 @@ from src.services.admin_knowledge_base import (
     create_admin_kb_candidate,
     create_admin_kb_entry,
     get_admin_kb_entry,
+    get_admin_kb_reindex_status,
     list_admin_kb_candidates,
     list_admin_kb_entries,
     preview_admin_kb_entry,
@@ -34,17 +39,33 @@ from src.services.admin_knowledge_base import (
     soft_delete_admin_kb_entry,
     update_admin_kb_entry,
 )
+from src.services.knowledge_base_index import request_kb_reindex
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(dependencies=[Depends(require_admin_session)])
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+async def _queue_reindex(request: Request) -> None:
+    """Queue embedding of a saved entry without failing the save.
+
+    An entry whose job could not be queued stays pending until the next
+    reindex run, at the latest the hourly cron.
+    """
+    try:
+        await request_kb_reindex(request.app.state.arq_pool)
+    except Exception:
+        logger.warning("Could not queue the knowledge-base reindex", exc_info=True)
+
+
 @router.get("/entries", response_model=PaginatedResponse[AdminKnowledgeBaseRead])
 async def get_entries(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     search: str | None = None,
     source: str | None = None,
     category: str | None = None,
@@ -55,6 +76,7 @@ async def get_entries(
         db=db,
         page=page,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         source=source,
         category=category,
@@ -85,7 +107,9 @@ async def post_entry(
     db: DbSession,
     request: Request,
 ) -> AdminKnowledgeBaseRead:
-    return await create_admin_kb_entry(db=db, body=body, request=request)
+    entry = await create_admin_kb_entry(db=db, body=body, request=request)
+    await _queue_reindex(request)
+    return entry
 
 
 @router.patch("/entries/{entry_id}", response_model=AdminKnowledgeBaseRead)
@@ -95,12 +119,15 @@ async def patch_entry(
     db: DbSession,
     request: Request,
 ) -> AdminKnowledgeBaseRead:
-    return await update_admin_kb_entry(
+    entry = await update_admin_kb_entry(
         db=db,
         entry_id=entry_id,
         body=body,
         request=request,
     )
+    if entry.embedding_pending:
+        await _queue_reindex(request)
+    return entry
 
 
 @router.delete("/entries/{entry_id}", response_model=AdminKnowledgeBaseRead)
@@ -122,19 +149,40 @@ async def post_entry_reindex(
     db: DbSession,
     request: Request,
 ) -> AdminKnowledgeBaseRead:
-    return await reindex_admin_kb_entry(
+    entry = await reindex_admin_kb_entry(
         db=db,
         entry_id=entry_id,
         request=request,
     )
+    await _queue_reindex(request)
+    return entry
 
 
 @router.post("/reindex", response_model=AdminActionResult)
 async def post_reindex_all(
     db: DbSession,
     request: Request,
+    force: bool = False,
 ) -> AdminActionResult:
-    return await reindex_admin_kb_entries(db=db, request=request)
+    """Queue a background reindex; ``force`` re-embeds unchanged entries too."""
+    result = await reindex_admin_kb_entries(db=db, force=force, request=request)
+    if result.status == "queued":
+        try:
+            await request_kb_reindex(request.app.state.arq_pool, force=force)
+        except Exception as exc:
+            logger.error("Error queueing knowledge-base reindex: %s", exc)
+            raise HTTPException(
+                status_code=500, detail="Could not enqueue reindex job"
+            ) from exc
+    return result
+
+
+@router.get("/reindex/status", response_model=AdminKnowledgeBaseReindexStatus)
+async def get_reindex_status(
+    db: DbSession,
+    redis: Annotated[Redis, Depends(get_redis)],
+) -> AdminKnowledgeBaseReindexStatus:
+    return await get_admin_kb_reindex_status(db=db, redis=redis)
 
 
 @router.get(
@@ -146,12 +194,14 @@ async def get_candidates(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     status: str | None = "needs_confirmation",
 ) -> PaginatedResponse[AdminKnowledgeBaseCandidate]:
     return await list_admin_kb_candidates(
         db=db,
         page=page,
         page_size=page_size,
+        cursor=cursor,
         status=status,
     )
 
@@ -179,11 +229,13 @@ async def post_candidate_approve(
     db: DbSession,
     request: Request,
 ) -> AdminKnowledgeBaseRead:
-    return await approve_admin_kb_candidate(
+    entry = await approve_admin_kb_candidate(
         db=db,
         candidate_id=candidate_id,
         request=request,
     )
+    await _queue_reindex(request)
+    return entry
 
 
 @router.post(
@@ -5,11 +5,13 @@ from datetime import UTC, datetime
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.core.database import get_db
+from src.core.pagination import count_total, keyset_page, split_page
 from src.models.conversation import Conversation
 from src.schemas import (
     ConversationDetail,
@@ -32,43 +34,58 @@ async def list_conversations(
     db: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     status: ConversationStatus | None = None,
     phone: str | None = None,
     phone_match: PhoneMatch = Query("exact"),
     language: Language | None = None,
 ) -> PaginatedResponse[ConversationRead]:
-    """List conversations with optional filters."""
-    # Build query
-    stmt = select(Conversation)
+    """List conversations with optional filters, newest first.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page
+    without OFFSET (see `src.core.pagination`).
+    """
+    # Build filters
+    filters: list[ColumnElement[bool]] = []
     if status is not None:
-        stmt = stmt.where(Conversation.status == status.value)
+        filters.append(Conversation.status == status.value)
     if language is not None:
-        stmt = stmt.where(Conversation.language == language.value)
+        filters.append(Conversation.language == language.value)
     if phone is not None:
         if phone_match == "fuzzy":
-            stmt = stmt.where(Conversation.phone.ilike(f"%{phone}%"))
+            filters.append(Conversation.phone.ilike(f"%{phone}%"))
         else:
-            stmt = stmt.where(Conversation.phone == phone)
+            filters.append(Conversation.phone == phone)
 
     # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar_one_or_none() or 0
+    total, total_is_estimate = await count_total(
+        db, select(Conversation.id).where(*filters), cursor=cursor
+    )
 
     # Apply pagination and sorting
-    stmt = stmt.order_by(Conversation.updated_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = keyset_page(
+        select(Conversation).where(*filters),
+        Conversation.updated_at,
+        Conversation.id,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+    )
 
     # Execute query
     result = await db.execute(stmt)
-    items = result.scalars().all()
+    items, next_cursor = split_page(
+        result.scalars().all(), page_size, lambda row: (row.updated_at, row.id)
+    )
 
     return PaginatedResponse[ConversationRead](
-        items=list(items),
+        items=items,
         total=total,
         page=page,
         page_size=page_size,
         pages=(total + page_size - 1) // page_size if total > 0 else 0,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
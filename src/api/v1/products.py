@@ -5,12 +5,15 @@ import math
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.api.v1.admin import require_admin_session
 from src.core.config import settings
 from src.core.database import get_db
+from src.core.pagination import count_total, keyset_page, split_page
+from src.core.queues import enqueue_routed_job
 from src.models.product import Product
 from src.rag.embeddings import EmbeddingEngine
 from src.rag.pipeline import search_products as rag_search_products
@@ -38,25 +41,36 @@ async def list_products(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     category: str | None = None,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedResponse[ProductRead]:
-    """List products with optional category filter."""
-    stmt = select(Product).where(Product.is_active.is_(True))
-    count_stmt = (
-        select(func.count()).select_from(Product).where(Product.is_active.is_(True))
-    )
+    """List active products, most recently updated first.
 
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page
+    without OFFSET (see `src.core.pagination`).
+    """
+    filters: list[ColumnElement[bool]] = [Product.is_active.is_(True)]
     if category:
-        stmt = stmt.where(Product.category == category)
-        count_stmt = count_stmt.where(Product.category == category)
+        filters.append(Product.category == category)
 
     # Get total
-    total = await db.scalar(count_stmt) or 0
+    total, total_is_estimate = await count_total(
+        db, select(Product.id).where(*filters), cursor=cursor
+    )
 
     # Get paginated data
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = keyset_page(
+        select(Product).where(*filters),
+        Product.updated_at,
+        Product.id,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+    )
     result = await db.execute(stmt)
-    products = result.scalars().all()
+    products, next_cursor = split_page(
+        result.scalars().all(), page_size, lambda row: (row.updated_at, row.id)
+    )
 
     return PaginatedResponse(
         items=[ProductRead.model_validate(p) for p in products],
@@ -64,6 +78,8 @@ async def list_products(
         page=page,
         page_size=page_size,
         pages=math.ceil(total / page_size) if total > 0 else 1,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -106,7 +122,7 @@ async def sync_products(
 
     try:
         pool = request.app.state.arq_pool
-        await pool.enqueue_job(job_name)
+        await enqueue_routed_job(pool, job_name)
 
         return ProductSyncResponse(synced=0, created=0, updated=0, errors=0)
     except Exception as e:
@@ -120,7 +136,7 @@ async def get_similar(
     limit: int = Query(5, ge=1, le=20),
     db: AsyncSession = Depends(get_db),
 ) -> list[dict[str, object]]:
-    """Get similar products via pgvector cosine similarity."""
+    """Get similar products, precomputed or via live pgvector similarity."""
     from src.services.recommendations import get_similar_products
 
     items = await get_similar_products(db, product_id, limit=limit)
@@ -141,5 +157,7 @@ async def get_cross_sell_products(
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    items = await get_cross_sell(db, product.category or "", limit=limit)
+    items = await get_cross_sell(
+        db, product.category or "", limit=limit, product_id=product_id
+    )
     return [item.model_dump() for item in items]
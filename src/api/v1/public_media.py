@@ -7,10 +7,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from src.api.deps import get_redis
 from src.integrations.inventory.zoho_inventory import ZohoInventoryClient
-from src.services.public_media import verify_signed_product_image_token
+from src.services.public_media import (
+    PRODUCT_MEDIA_TOKEN_TTL_SECONDS,
+    cached_product_image,
+    verify_signed_product_image_token,
+)
 
 router = APIRouter()
-PRODUCT_MEDIA_TOKEN_TTL_SECONDS = 300
 
 
 async def get_inventory_client(
@@ -25,6 +28,7 @@ async def get_product_image(
     zoho_item_id: str,
     token: str = Query(..., min_length=1),
     inventory: ZohoInventoryClient = Depends(get_inventory_client),
+    redis: aioredis.Redis = Depends(get_redis),
 ) -> Response:
     if not verify_signed_product_image_token(
         token=token,
@@ -33,7 +37,9 @@ async def get_product_image(
     ):
         raise HTTPException(status_code=403, detail="Invalid or expired media token")
 
-    image_result = await inventory.get_item_image(zoho_item_id)
+    image_result = await cached_product_image(redis, zoho_item_id)
+    if image_result is None:
+        image_result = await inventory.get_item_image(zoho_item_id)
     if image_result is None:
         raise HTTPException(status_code=404, detail="Media not found")
 
@@ -9,11 +9,9 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic_ai import UnexpectedModelBehavior
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
-from src.quality.evaluator import evaluate_conversation
 from src.quality.service import conversation_already_reviewed, get_reviews, save_review
 from src.schemas import (
     PaginatedResponse,
@@ -65,6 +63,10 @@ async def create_review(
 
     If the conversation has already been reviewed, raises 409 Conflict.
     """
+    from pydantic_ai import UnexpectedModelBehavior
+
+    from src.quality.evaluator import evaluate_conversation
+
     already = await conversation_already_reviewed(db, body.conversation_id)
     if already:
         raise HTTPException(
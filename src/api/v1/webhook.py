@@ -1,10 +1,23 @@
+"""Wazzup webhook ingress.
+
+The handler only validates the payload and hands it off, so Wazzup gets its
+200 before any processing starts. Inbound messages are grouped per chat and
+appended to every chat's inbound list by one Redis script call, then one
+``process_incoming_batch`` job is enqueued per chat. Delivery and read
+statuses are queued as one `persist_wazzup_statuses` job per payload instead
+of being written to the database inside the request; they are only written
+inline when that job cannot be queued.
+"""
+
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import time
 from datetime import UTC, datetime
 from functools import lru_cache
+from typing import Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
@@ -12,8 +25,13 @@ from pydantic import ValidationError
 
 from src.core.config import settings
 from src.core.database import async_session_factory
+from src.core.queues import enqueue_routed_job
 from src.schemas import WazzupWebhookPayload
-from src.services.inbound_batch import inbound_chat_reference, inbound_queue_key
+from src.services.inbound_batch import (
+    encode_inbound_message,
+    inbound_chat_reference,
+    inbound_queue_key,
+)
 from src.services.outbound_audit import update_wazzup_statuses
 from src.services.proposal_followup import apply_proposal_read_statuses
 
@@ -22,6 +40,16 @@ logger = logging.getLogger("uvicorn.error")
 
 router = APIRouter()
 _OUTBOUND_MESSAGE_STATUSES = frozenset({"sent", "delivered", "read", "error", "edited"})
+# ARGV holds, for each key in turn, its message count followed by its messages.
+_PUSH_INBOUND_SCRIPT = """
+local index = 1
+for _, key in ipairs(KEYS) do
+    local count = tonumber(ARGV[index])
+    redis.call("rpush", key, unpack(ARGV, index + 1, index + count))
+    index = index + count + 1
+end
+return #KEYS
+"""
 
 
 @lru_cache(maxsize=1)
@@ -202,21 +230,7 @@ async def handle_wazzup_webhook(request: Request) -> JSONResponse:
     status_candidates.extend(_status_updates_from_messages(raw_body.get("messages")))
     statuses = _deduplicate_status_updates(status_candidates)
     if statuses:
-        try:
-            async with async_session_factory() as db:
-                updated_rows = await update_wazzup_statuses(db, statuses)
-                proposal_read_updates = await apply_proposal_read_statuses(
-                    db,
-                    statuses,
-                )
-                await db.commit()
-            logger.info(
-                "Wazzup webhook: updated %d outbound status rows and %d proposal read states",
-                updated_rows,
-                proposal_read_updates,
-            )
-        except Exception:
-            logger.exception("Wazzup webhook: failed to persist status updates")
+        await _enqueue_status_updates(request.app.state.arq_pool, statuses)
 
     # Parse and process messages
     raw_messages = raw_body.get("messages", [])
@@ -250,9 +264,7 @@ async def handle_wazzup_webhook(request: Request) -> JSONResponse:
         # Still return 200 so Wazzup doesn't retry
         return JSONResponse({"ok": True}, status_code=200)
 
-    redis = request.app.state.redis
-    arq_pool = request.app.state.arq_pool
-
+    batches: dict[str, list[bytes]] = {}
     for msg in payload.messages:
         # Filter out status-only updates
         if msg.status and msg.status != "inbound":
@@ -295,19 +307,86 @@ async def handle_wazzup_webhook(request: Request) -> JSONResponse:
             # Client message — standard flow
             logger.info("Accepted client message: message_type=%s", msg.type)
 
-        # Push to Redis list
-        batch_ref = inbound_chat_reference(msg.chatId)
-        await redis.rpush(inbound_queue_key(batch_ref), msg.model_dump_json())
-
-        # Enqueue job with a 5-second defer to allow batching
-        # Use time-windowed job ID: same window = dedup, new window = new job
-        window = int(time.time()) // 10  # 10-second windows
-        job_id = f"wazzup_batch_{batch_ref}_{window}"
-        await arq_pool.enqueue_job(
-            "process_incoming_batch",
-            batch_ref=batch_ref,
-            _job_id=job_id,
-            _defer_by=5,
+        batches.setdefault(inbound_chat_reference(msg.chatId), []).append(
+            encode_inbound_message(msg)
+        )
+
+    if batches:
+        await _push_inbound_batches(
+            request.app.state.redis,
+            request.app.state.arq_pool,
+            batches,
         )
 
     return JSONResponse({"ok": True}, status_code=200)
+
+
+async def _push_inbound_batches(
+    redis: Any,
+    arq_pool: Any,
+    batches: dict[str, list[bytes]],
+) -> None:
+    """Append each chat's messages to its list, then queue one job per chat."""
+    keys = [inbound_queue_key(batch_ref) for batch_ref in batches]
+    args: list[bytes | int] = []
+    for messages in batches.values():
+        args.append(len(messages))
+        args.extend(messages)
+    await redis.eval(_PUSH_INBOUND_SCRIPT, len(keys), *keys, *args)
+
+    # Enqueue each job with a 5-second defer to allow batching.
+    # Use time-windowed job ID: same window = dedup, new window = new job
+    window = int(time.time()) // 10  # 10-second windows
+    await asyncio.gather(
+        *(
+            enqueue_routed_job(
+                arq_pool,
+                "process_incoming_batch",
+                batch_ref=batch_ref,
+                _job_id=f"wazzup_batch_{batch_ref}_{window}",
+                _defer_by=5,
+            )
+            for batch_ref in batches
+        )
+    )
+
+
+async def _enqueue_status_updates(
+    arq_pool: Any,
+    statuses: list[dict[str, object]],
+) -> None:
+    """Queue the statuses of one payload, or write them now if that fails."""
+    try:
+        await enqueue_routed_job(arq_pool, "persist_wazzup_statuses", statuses)
+        return
+    except Exception:
+        logger.warning(
+            "Wazzup webhook: could not queue %d status updates; writing inline",
+            len(statuses),
+            exc_info=True,
+        )
+    try:
+        await _persist_status_updates(statuses)
+    except Exception:
+        logger.exception("Wazzup webhook: failed to persist status updates")
+
+
+async def _persist_status_updates(statuses: list[dict[str, object]]) -> None:
+    async with async_session_factory() as db:
+        updated_rows = await update_wazzup_statuses(db, statuses)
+        proposal_read_updates = await apply_proposal_read_statuses(db, statuses)
+        await db.commit()
+    logger.info(
+        "Wazzup webhook: updated %d outbound status rows and %d proposal read states",
+        updated_rows,
+        proposal_read_updates,
+    )
+
+
+async def persist_wazzup_statuses(
+    ctx: dict[str, Any],
+    statuses: list[dict[str, object]],
+) -> None:
+    """ARQ job: write the delivery and read statuses of one webhook payload."""
+    del ctx
+    await _persist_status_updates(statuses)
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import functools
+import json
+import logging
+import re
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -10,6 +22,8 @@ from sqlalchemy.ext.asyncio import (
 
 from src.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.app_debug,
@@ -33,3 +47,201 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
         except Exception:
             await session.rollback()
             raise
+
+
+# --- SQL profiling -----------------------------------------------------------
+#
+# Opt-in (``DB_QUERY_STATS_ENABLED``): cursor events on the engine add every
+# statement's duration to the `QueryStats` of each enclosing `track_queries`
+# block. Statements are kept only in normalized form -- bind markers and
+# literals replaced by ``?`` -- so the stats are safe to log.
+
+_MAX_STATEMENT_CHARS = 300
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_MARKER = re.compile(r"\$\d+(?:::[\w\[\]]+)?|%\(\w+\)s")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_MARKER_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse a SQL statement to its shape, without any values."""
+    text = _STRING_LITERAL.sub("?", statement)
+    text = _BIND_MARKER.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _MARKER_LIST.sub("(?, ...)", text)
+    if len(text) > _MAX_STATEMENT_CHARS:
+        text = text[: _MAX_STATEMENT_CHARS - 3] + "..."
+    return text
+
+
+@dataclass(slots=True)
+class StatementStats:
+    statement: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """SQL statements run inside one `track_queries` block."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    _statements: dict[str, StatementStats] = field(default_factory=dict, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        normalized = normalize_statement(statement)
+        stats = self._statements.get(normalized)
+        if stats is None:
+            stats = self._statements[normalized] = StatementStats(normalized)
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def slowest(self, count: int) -> list[StatementStats]:
+        """The ``count`` statements that took the most time in total."""
+        return sorted(
+            self._statements.values(), key=lambda s: s.total_ms, reverse=True
+        )[:count]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "queries": self.count,
+            "time_ms": round(self.total_ms, 3),
+            "slowest": [
+                {
+                    "statement": stats.statement,
+                    "calls": stats.calls,
+                    "total_ms": round(stats.total_ms, 3),
+                    "max_ms": round(stats.max_ms, 3),
+                }
+                for stats in self.slowest(settings.db_query_stats_top_n)
+            ],
+        }
+
+
+_active_query_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "active_query_stats", default=()
+)
+_instrumented_engines: set[int] = set()
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    # Kept on the statement's own context: a statement that raises never
+    # reaches after_cursor_execute, and its start time goes with it.
+    if _active_query_stats.get() and context is not None:
+        context._query_started_at = perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    active = _active_query_stats.get()
+    started = getattr(context, "_query_started_at", None)
+    if not active or started is None:
+        return
+    elapsed_ms = (perf_counter() - started) * 1000
+    for stats in active:
+        stats.record(statement, elapsed_ms)
+
+
+def instrument_query_stats(target: AsyncEngine | Engine) -> None:
+    """Attach the profiling listeners to ``target``; safe to call twice."""
+    sync_engine = target.sync_engine if isinstance(target, AsyncEngine) else target
+    if id(sync_engine) in _instrumented_engines:
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    _instrumented_engines.add(id(sync_engine))
+
+
+if settings.db_query_stats_enabled:
+    instrument_query_stats(engine)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats | None]:
+    """Collect the SQL run in this block; ``None`` when profiling is off."""
+    if not _instrumented_engines:
+        yield None
+        return
+    stats = QueryStats()
+    token = _active_query_stats.set((*_active_query_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_query_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    """The stats of the innermost `track_queries` block around the caller."""
+    active = _active_query_stats.get()
+    return active[-1] if active else None
+
+
+def query_budget_warnings(
+    stats: QueryStats | None,
+    *,
+    max_queries: int | None = None,
+) -> list[str]:
+    """Why ``stats`` breaks the query budget; empty when it does not."""
+    if stats is None:
+        return []
+    warnings = []
+    if max_queries is not None and stats.count > max_queries:
+        warnings.append(f"{stats.count} SQL queries, budget {max_queries}")
+    warnings.extend(
+        f"{slow.max_ms:.0f} ms for {slow.statement}"
+        for slow in stats.slowest(settings.db_query_stats_top_n)
+        if slow.max_ms > settings.db_slow_query_ms
+    )
+    return warnings
+
+
+def log_query_budget(
+    scope: str,
+    stats: QueryStats | None,
+    *,
+    max_queries: int | None = None,
+) -> None:
+    for warning in query_budget_warnings(stats, max_queries=max_queries):
+        logger.warning("SQL budget exceeded in %s: %s", scope, warning)
+
+
+def profile_job_queries[**P, R](
+    job: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Log the SQL profile of an ARQ job when profiling is on."""
+
+    @functools.wraps(job)
+    async def profiled(*args: P.args, **kwargs: P.kwargs) -> R:
+        with track_queries() as stats:
+            try:
+                return await job(*args, **kwargs)
+            finally:
+                if stats is not None:
+                    logger.info(
+                        "SQL profile of %s: %s",
+                        job.__name__,
+                        json.dumps(stats.snapshot(), separators=(",", ":")),
+                    )
+                    log_query_budget(job.__name__, stats)
+
+    return profiled
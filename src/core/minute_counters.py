@@ -0,0 +1,105 @@
+"""Per-minute Redis hash counters, merged across processes.
+
+Each process adds to the hash of the current minute,
+``<prefix>:m:<epoch minute>``, which expires after
+``MINUTE_COUNTER_TTL_SECONDS``. A window is read back as the hashes of its
+minutes in one script call, so reading costs the same however many workers
+wrote to it. Callers decide how a window's fields combine.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+MINUTE_COUNTER_TTL_SECONDS = 2 * 60 * 60
+# ARGV: TTL, the number of counted fields, then field/amount pairs to add
+# followed by field/value pairs that only ever raise the stored value.
+_RECORD_SCRIPT = """
+local index = 3
+for _ = 1, tonumber(ARGV[2]) do
+    redis.call("hincrby", KEYS[1], ARGV[index], ARGV[index + 1])
+    index = index + 2
+end
+while index < #ARGV do
+    local stored = tonumber(redis.call("hget", KEYS[1], ARGV[index]) or "0")
+    if tonumber(ARGV[index + 1]) > stored then
+        redis.call("hset", KEYS[1], ARGV[index], ARGV[index + 1])
+    end
+    index = index + 2
+end
+redis.call("expire", KEYS[1], ARGV[1])
+return 1
+"""
+_READ_HASHES_SCRIPT = """
+local hashes = {}
+for index, key in ipairs(KEYS) do
+    hashes[index] = redis.call("hgetall", key)
+end
+return hashes
+"""
+
+
+def decode_text(value: Any) -> str:
+    """A Redis reply as text, from a decoding or a raw client alike."""
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _current_minute(now: float | None) -> int:
+    return int((now if now is not None else time.time()) // 60)
+
+
+def minute_counter_key(prefix: str, minute: int) -> str:
+    return f"{prefix}:m:{minute}"
+
+
+async def record_minute_counters(
+    redis: Any,
+    prefix: str,
+    counts: Mapping[str, int],
+    maxima: Mapping[str, int] | None = None,
+    *,
+    now: float | None = None,
+) -> None:
+    """Add ``counts`` to the current minute and raise its ``maxima`` fields."""
+    args: list[str | int] = [MINUTE_COUNTER_TTL_SECONDS, len(counts)]
+    for field, value in [*counts.items(), *(maxima or {}).items()]:
+        args.extend((field, value))
+    await redis.eval(
+        _RECORD_SCRIPT,
+        1,
+        minute_counter_key(prefix, _current_minute(now)),
+        *args,
+    )
+
+
+async def read_hashes(redis: Any, keys: Sequence[str]) -> list[dict[str, int]]:
+    """The integer fields of each of ``keys``, in order; missing keys are empty."""
+    raw = await redis.eval(_READ_HASHES_SCRIPT, len(keys), *keys)
+    hashes = [
+        {
+            decode_text(flat[index]): int(decode_text(flat[index + 1]))
+            for index in range(0, len(flat or []) - 1, 2)
+        }
+        for flat in raw or []
+    ]
+    return hashes + [{} for _ in range(len(keys) - len(hashes))]
+
+
+async def read_minute_window(
+    redis: Any,
+    prefix: str,
+    *,
+    minutes: int,
+    now: float | None = None,
+) -> list[dict[str, int]]:
+    """The counters of the last ``minutes`` minutes, oldest first."""
+    current = _current_minute(now)
+    return await read_hashes(
+        redis,
+        [
+            minute_counter_key(prefix, minute)
+            for minute in range(current - minutes + 1, current + 1)
+        ],
+    )
@@ -0,0 +1,133 @@
+"""ARQ queue names, job-class routing and job serialization.
+
+Customer-facing inbound batches must never wait behind the catalog sync or an
+hourly quality run. Jobs are therefore grouped into three classes, each with
+its own named queue and worker pool:
+
+* ``realtime`` — inbound customer turns (`process_incoming_batch`).
+* ``interactive`` — short side effects triggered by a turn or an operator.
+* ``batch`` — cron and bulk work: catalog sync, quality, reports, followups.
+
+The batch class keeps ARQ's default queue name, so jobs queued before the
+split was enabled, and anything enqueued without routing, still drain.
+Routing only takes effect when ``settings.arq_split_queues`` is enabled;
+otherwise every class resolves to the default queue and the single
+`src.worker.WorkerSettings` process keeps serving all of them.
+
+ARQ pickles jobs and their kept results by default. With
+``settings.compact_queue_payloads`` enabled, `serialize_job_payload` writes
+them as msgpack instead. A kept result then drops the job's arguments, which
+ARQ otherwise copies into it (chat ids and Telegram payloads included), and
+keeps an exception as its type and message rather than a pickled traceback.
+`deserialize_job_payload` reads both, since a pickle always starts with its
+protocol opcode, which no msgpack map does; so jobs queued before the switch
+still run.
+"""
+
+from __future__ import annotations
+
+import pickle
+from enum import StrEnum
+from typing import Any
+
+import ormsgpack
+from arq.constants import default_queue_name
+
+from src.core.config import settings
+
+
+class JobClass(StrEnum):
+    REALTIME = "realtime"
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+REALTIME_QUEUE = "arq:queue:realtime"
+INTERACTIVE_QUEUE = "arq:queue:interactive"
+BATCH_QUEUE = default_queue_name
+
+_QUEUE_BY_CLASS: dict[JobClass, str] = {
+    JobClass.REALTIME: REALTIME_QUEUE,
+    JobClass.INTERACTIVE: INTERACTIVE_QUEUE,
+    JobClass.BATCH: BATCH_QUEUE,
+}
+
+_PICKLE_PROTOCOL_OPCODE = b"\x80"
+
+# Jobs not listed here are batch work.
+JOB_CLASSES: dict[str, JobClass] = {
+    "process_incoming_batch": JobClass.REALTIME,
+    "deliver_product_media": JobClass.INTERACTIVE,
+    "persist_wazzup_statuses": JobClass.INTERACTIVE,
+    "refresh_conversation_summary": JobClass.INTERACTIVE,
+    "run_telegram_action": JobClass.INTERACTIVE,
+}
+
+
+def job_class_for(function: str) -> JobClass:
+    """Return the routing class of an ARQ job function name."""
+    return JOB_CLASSES.get(function, JobClass.BATCH)
+
+
+def queue_name_for_class(job_class: JobClass) -> str:
+    """Return the queue a job class is served from under the current topology."""
+    if not settings.arq_split_queues:
+        return default_queue_name
+    return _QUEUE_BY_CLASS[job_class]
+
+
+def queue_name_for_job(function: str) -> str:
+    """Return the queue an ARQ job function should be enqueued on."""
+    return queue_name_for_class(job_class_for(function))
+
+
+def active_queue_names() -> dict[JobClass, str]:
+    """Return the distinct queues that currently receive work, keyed by class."""
+    if not settings.arq_split_queues:
+        return {JobClass.BATCH: default_queue_name}
+    return dict(_QUEUE_BY_CLASS)
+
+
+async def enqueue_routed_job(
+    pool: Any,
+    function: str,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Enqueue ``function`` on the queue of its job class.
+
+    ``pool`` is an ARQ pool: ``app.state.arq_pool`` in the API process or
+    ``ctx["redis"]`` inside a job. The latter defaults to the queue of the
+    worker running the job, which is why enqueue sites must route explicitly.
+    """
+    return await pool.enqueue_job(
+        function,
+        *args,
+        _queue_name=queue_name_for_job(function),
+        **kwargs,
+    )
+
+
+def _describe_exception(value: Any) -> str:
+    if isinstance(value, BaseException):
+        return f"{type(value).__name__}: {value}"
+    raise TypeError(f"{type(value).__name__} is not msgpack serializable")
+
+
+def serialize_job_payload(data: dict[str, Any]) -> bytes:
+    """ARQ ``job_serializer`` for job definitions and kept results."""
+    if not settings.compact_queue_payloads:
+        return pickle.dumps(data)
+    if "s" in data:
+        # A kept result; ARQ's job log line still shows the arguments.
+        data = {**data, "a": (), "k": {}}
+    return ormsgpack.packb(data, default=_describe_exception)
+
+
+def deserialize_job_payload(raw: bytes) -> dict[str, Any]:
+    """ARQ ``job_deserializer`` accepting msgpack and legacy pickle payloads."""
+    if raw[:1] == _PICKLE_PROTOCOL_OPCODE:
+        data: dict[str, Any] = pickle.loads(raw)
+    else:
+        data = ormsgpack.unpackb(raw)
+    return data
@@ -1,20 +1,126 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any
 
 import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from src.core.config import settings
 
-redis_client: aioredis.Redis = aioredis.from_url(  # type: ignore[no-untyped-call]
+
+@dataclass(frozen=True, slots=True)
+class RedisPoolStats:
+    """Connection-pool occupancy and checkout waits since the last reset."""
+
+    max_connections: int
+    in_use: int
+    acquisitions: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+
+
+class InstrumentedConnectionPool(aioredis.BlockingConnectionPool):
+    """Blocking pool that records how often and how long checkouts wait.
+
+    A checkout only counts as a wait when every connection was in use at the
+    time of the request; a checkout that gives up after ``timeout`` seconds is
+    counted as a timeout.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._acquisitions = 0
+        self._waits = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._timeouts = 0
+
+    async def get_connection(
+        self, command_name: Any = None, *keys: Any, **options: Any
+    ) -> Any:
+        del command_name, keys, options
+        must_wait = not self.can_get_connection()
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection()
+        except RedisConnectionError as exc:
+            if isinstance(exc.__cause__, asyncio.TimeoutError):
+                self._timeouts += 1
+            raise
+        finally:
+            if must_wait:
+                waited = time.perf_counter() - started
+                self._waits += 1
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+        self._acquisitions += 1
+        return connection
+
+    def stats(self, *, reset: bool = False) -> RedisPoolStats:
+        """Return the counters, optionally starting a new window."""
+        snapshot = RedisPoolStats(
+            max_connections=self.max_connections,
+            in_use=len(self._in_use_connections),
+            acquisitions=self._acquisitions,
+            waits=self._waits,
+            wait_seconds_total=round(self._wait_seconds_total, 6),
+            wait_seconds_max=round(self._wait_seconds_max, 6),
+            timeouts=self._timeouts,
+        )
+        if reset:
+            self._reset_counters()
+        return snapshot
+
+
+def redis_pool_size(max_jobs: int | None = None) -> int:
+    """Size the shared pool for the busiest worker process that may import it.
+
+    Each concurrently running ARQ job can hold a few connections at once (the
+    inbound lock, a typing refresh, cache reads), so the pool scales with
+    ``max_jobs`` and never drops below the configured floor that the API
+    process relies on.
+    """
+    if max_jobs is None:
+        max_jobs = settings.arq_batch_max_jobs
+        if settings.arq_split_queues:
+            max_jobs = max(
+                max_jobs,
+                settings.arq_realtime_max_jobs,
+                settings.arq_interactive_max_jobs,
+            )
+    return max(
+        settings.redis_pool_min_connections,
+        settings.redis_pool_connections_per_job * max_jobs,
+    )
+
+
+redis_pool = InstrumentedConnectionPool.from_url(
     settings.redis_url,
     decode_responses=True,
     # Connection pool settings: prevent exhaustion under load & hang prevention.
-    max_connections=20,
+    # Checkouts beyond the pool size wait up to the pool timeout instead of
+    # failing immediately, and those waits are reported by `redis_pool_stats`.
+    max_connections=redis_pool_size(),
+    timeout=settings.redis_pool_timeout_seconds,
     socket_timeout=5.0,
     socket_connect_timeout=5.0,
     retry_on_timeout=True,
 )
+redis_client: aioredis.Redis = aioredis.Redis.from_pool(redis_pool)
+
+
+def redis_pool_stats(*, reset: bool = False) -> RedisPoolStats:
+    """Pool-wait metrics of this process's shared Redis client."""
+    return redis_pool.stats(reset=reset)
 
 
 async def get_redis() -> AsyncGenerator[aioredis.Redis]:
@@ -1,3 +1,3 @@
-from src.integrations.catalog.treejar_catalog import TreejarCatalogClient
+from src.integrations.catalog.treejar_catalog import CatalogPage, TreejarCatalogClient
 
-__all__ = ["TreejarCatalogClient"]
+__all__ = ["CatalogPage", "TreejarCatalogClient"]
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
@@ -12,6 +14,40 @@ from src.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CatalogPage:
+    """One hydrated page of a category listing.
+
+    ``is_last`` marks the final page of its category, so a consumer knows
+    every product of ``slug`` has been delivered once it has seen it.
+    """
+
+    slug: str
+    offset: int
+    products: list[dict[str, Any]]
+    is_last: bool
+
+
+class _RequestRateLimiter:
+    """Space request starts at least ``1 / requests_per_second`` apart."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self._interval = 1 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self._interval
+
+
 class TreejarCatalogClient:
     """Async client for the canonical Treejar catalog API."""
 
@@ -21,6 +57,8 @@ class TreejarCatalogClient:
         base_url: str | None = None,
         timeout_seconds: float | None = None,
         max_retries: int | None = None,
+        max_concurrency: int | None = None,
+        requests_per_second: float | None = None,
     ) -> None:
         self.base_url = base_url or settings.catalog_api_url
         self.timeout_seconds = (
@@ -31,6 +69,18 @@ class TreejarCatalogClient:
         self.max_retries = (
             max_retries if max_retries is not None else settings.catalog_api_max_retries
         )
+        self.max_concurrency = max(
+            1,
+            max_concurrency
+            if max_concurrency is not None
+            else settings.catalog_api_max_concurrency,
+        )
+        self._request_slots = asyncio.Semaphore(self.max_concurrency)
+        self._rate_limiter = _RequestRateLimiter(
+            requests_per_second
+            if requests_per_second is not None
+            else settings.catalog_api_requests_per_second
+        )
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=httpx.Timeout(self.timeout_seconds),
@@ -40,7 +90,9 @@ class TreejarCatalogClient:
     async def _request_json(self, params: dict[str, Any]) -> dict[str, Any]:
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = await self.client.request("GET", "", params=params)
+                await self._rate_limiter.wait()
+                async with self._request_slots:
+                    response = await self.client.request("GET", "", params=params)
                 if (
                     response.status_code in {429, 500, 502, 503, 504}
                     and attempt < self.max_retries
@@ -152,6 +204,108 @@ class TreejarCatalogClient:
             )
         return dict(product)
 
+    async def get_category_slugs(self) -> list[str]:
+        """Return every category slug, parents before children, without repeats."""
+        slugs: list[str] = []
+        for category in self._flatten_categories(await self.get_categories()):
+            slug = category.get("slug")
+            if isinstance(slug, str) and slug.strip() and slug not in slugs:
+                slugs.append(slug)
+        return slugs
+
+    async def _hydrate_product(self, summary: dict[str, Any]) -> dict[str, Any]:
+        summary_slug = summary.get("slug")
+        if not isinstance(summary_slug, str) or not summary_slug.strip():
+            return dict(summary)
+        try:
+            return {**summary, **await self.get_product(summary_slug)}
+        except Exception:
+            logger.warning(
+                "Falling back to summary payload for Treejar slug %s",
+                summary_slug,
+                exc_info=True,
+            )
+            return dict(summary)
+
+    async def iter_category_pages(
+        self,
+        slugs: Sequence[str],
+        *,
+        limit: int | None = None,
+        concurrency: int | None = None,
+        buffer_pages: int | None = None,
+    ) -> AsyncGenerator[CatalogPage, None]:
+        """Page several categories concurrently and yield hydrated pages.
+
+        Each category is still paged in offset order by one task, but up to
+        ``concurrency`` categories are in flight at once and products within
+        a page are hydrated concurrently. Every request goes through the
+        client's concurrency slots and rate limiter. At most ``buffer_pages``
+        finished pages wait for the consumer, so a slow consumer throttles
+        fetching. Products repeated across categories are yielded once.
+        """
+        page_size = limit or settings.catalog_api_page_size
+        workers = max(1, min(concurrency or self.max_concurrency, len(slugs)))
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for slug in slugs:
+            pending.put_nowait(slug)
+        pages: asyncio.Queue[CatalogPage | Exception | None] = asyncio.Queue(
+            maxsize=max(1, buffer_pages or workers)
+        )
+
+        async def page_categories() -> None:
+            while True:
+                try:
+                    slug = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                offset = 0
+                while True:
+                    page = await self.get_category_products(
+                        slug, limit=page_size, offset=offset
+                    )
+                    products = page["products"]
+                    hydrated = await asyncio.gather(
+                        *(self._hydrate_product(summary) for summary in products)
+                    )
+                    is_last = not products or not page["hasMore"]
+                    await pages.put(CatalogPage(slug, offset, list(hydrated), is_last))
+                    if is_last:
+                        break
+                    offset += len(products)
+
+        async def run_workers() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(workers):
+                        group.create_task(page_categories())
+            except Exception as exc:
+                failures = exc.exceptions if isinstance(exc, ExceptionGroup) else (exc,)
+                await pages.put(failures[0])
+            else:
+                await pages.put(None)
+
+        if not slugs:
+            return
+        runner = asyncio.create_task(run_workers())
+        seen_keys: set[str] = set()
+        try:
+            while (item := await pages.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                unique: list[dict[str, Any]] = []
+                for product in item.products:
+                    dedupe_key = self._dedupe_key(product)
+                    if dedupe_key is None or dedupe_key in seen_keys:
+                        continue
+                    seen_keys.add(dedupe_key)
+                    unique.append(product)
+                yield CatalogPage(item.slug, item.offset, unique, item.is_last)
+        finally:
+            runner.cancel()
+            with suppress(asyncio.CancelledError):
+                await runner
+
     async def iter_all_products(
         self, *, limit: int | None = None
     ) -> AsyncIterator[dict[str, Any]]:
@@ -174,21 +328,7 @@ class TreejarCatalogClient:
                     break
 
                 for summary in products:
-                    hydrated = dict(summary)
-                    summary_slug = summary.get("slug")
-                    if isinstance(summary_slug, str) and summary_slug.strip():
-                        try:
-                            hydrated = {
-                                **summary,
-                                **await self.get_product(summary_slug),
-                            }
-                        except Exception:
-                            logger.warning(
-                                "Falling back to summary payload for Treejar slug %s",
-                                summary_slug,
-                                exc_info=True,
-                            )
-
+                    hydrated = await self._hydrate_product(summary)
                     dedupe_key = self._dedupe_key(hydrated)
                     if dedupe_key is None or dedupe_key in seen_keys:
                         continue
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import secrets
+import time
+from collections.abc import AsyncIterator, Collection
+from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import bindparam, case, func, select, text, update
+from pydantic import BaseModel, Field
+from sqlalchemy import bindparam, case, delete, func, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_upsert
 
 from src.core.config import settings
 from src.core.database import async_session_factory
-from src.integrations.catalog.treejar_catalog import TreejarCatalogClient
+from src.core.queues import enqueue_routed_job
+from src.integrations.catalog.treejar_catalog import CatalogPage, TreejarCatalogClient
 from src.integrations.inventory.zoho_inventory import ZohoInventoryClient
 from src.models.product import Product
+from src.models.product_neighbor import ProductNeighbor
 from src.schemas.product import ProductSyncResponse
 
 logger = logging.getLogger(__name__)
 
+TREEJAR_SYNC_CHECKPOINT_KEY = "catalog_sync:treejar:checkpoint"
+TREEJAR_SYNC_LOCK_KEY = "catalog_sync:treejar:lock"
+# SKUs read by the current logical sync. Unchanged rows are no longer
+# rewritten, so `synced_at` cannot tell which products are gone any more.
+TREEJAR_SYNC_SEEN_KEY = "catalog_sync:treejar:seen"
+_TREEJAR_SYNC_CHECKPOINT_TTL_SECONDS = 24 * 60 * 60
+_TREEJAR_SYNC_LOCK_GRACE_SECONDS = 120
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 @asynccontextmanager
 async def _zoho_client(redis: Any) -> AsyncIterator[ZohoInventoryClient]:
@@ -93,6 +116,8 @@ def _treejar_dedupe_key(item: dict[str, Any]) -> str | None:
 
 
 def _normalize_treejar_product(item: dict[str, Any]) -> dict[str, Any] | None:
+    from src.rag.embeddings import product_embedding_hash
+
     dedupe_key = _treejar_dedupe_key(item)
     slug = _as_str(item.get("slug"))
     if dedupe_key is None or slug is None:
@@ -117,7 +142,7 @@ def _normalize_treejar_product(item: dict[str, Any]) -> dict[str, Any] | None:
 
     normalized_raw = {key: value for key, value in item.items() if value is not None}
 
-    return {
+    normalized: dict[str, Any] = {
         "sku": dedupe_key,
         "zoho_item_id": None,
         "name_en": _as_str(item.get("name")) or slug,
@@ -156,59 +181,336 @@ def _normalize_treejar_product(item: dict[str, Any]) -> dict[str, Any] | None:
         },
         "is_active": True,
     }
+    normalized["content_hash"] = _treejar_content_hash(normalized)
+    normalized["embedding_hash"] = product_embedding_hash(
+        normalized["name_en"], normalized["category"], normalized["description_en"]
+    )
+    return normalized
+
+
+def _treejar_content_hash(normalized: dict[str, Any]) -> str:
+    """SHA-256 of the normalized row, excluding the raw API payload.
+
+    ``raw_source`` carries volatile fields (view counters, timestamps) that do
+    not change anything a customer sees, so it is left out of the hash.
+    """
+    attributes = {
+        key: value
+        for key, value in normalized["attributes"].items()
+        if key != "raw_source"
+    }
+    content = {
+        key: value
+        for key, value in normalized.items()
+        if key not in {"attributes", "content_hash", "embedding_hash"}
+    }
+    content["attributes"] = attributes
+    payload = json.dumps(content, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def _embedding_reset_expression(stmt: Any) -> Any:
     return case(
-        (
-            Product.name_en.is_distinct_from(stmt.excluded.name_en)
-            | Product.description_en.is_distinct_from(stmt.excluded.description_en)
-            | Product.category.is_distinct_from(stmt.excluded.category),
-            None,
-        ),
+        (Product.embedding_hash.is_distinct_from(stmt.excluded.embedding_hash), None),
         else_=Product.embedding,
     )
 
 
-async def sync_products_from_treejar_catalog(ctx: dict[str, Any]) -> dict[str, int]:
-    """ARQ background job for the canonical Treejar catalog sync."""
-    logger.info("Starting canonical Treejar catalog sync...")
+def _product_changed_condition(stmt: Any) -> Any:
+    """Only rewrite rows whose content moved or that are being reactivated."""
+    return (
+        Product.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        | Product.embedding_hash.is_distinct_from(stmt.excluded.embedding_hash)
+        | Product.is_active.is_not(True)
+    )
 
-    stats = ProductSyncResponse(synced=0, created=0, updated=0, errors=0)
-    sync_started_at = datetime.now(UTC)
 
+class _StageMeter:
+    """Item count and busy time of one sync pipeline stage."""
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.seconds = 0.0
+
+    @asynccontextmanager
+    async def measure(self) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds += time.perf_counter() - started
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "items": float(self.items),
+            "seconds": round(self.seconds, 3),
+            "per_second": round(self.items / self.seconds, 2) if self.seconds else 0.0,
+        }
+
+
+class _TreejarSyncCheckpoint(BaseModel):
+    """Progress of one logical catalog sync, carried across job runs."""
+
+    started_at: datetime
+    completed_categories: list[str] = Field(default_factory=list)
+    synced: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    embeddings_generated: int = 0
+
+
+async def _load_treejar_checkpoint(redis: Any) -> _TreejarSyncCheckpoint | None:
     try:
-        async with _treejar_catalog_client() as client:
-            batch: list[dict[str, Any]] = []
+        raw = await redis.get(TREEJAR_SYNC_CHECKPOINT_KEY)
+    except Exception:
+        logger.warning("Could not read Treejar sync checkpoint", exc_info=True)
+        return None
+    if not isinstance(raw, str | bytes):
+        return None
+    try:
+        return _TreejarSyncCheckpoint.model_validate_json(raw)
+    except ValueError:
+        logger.warning("Discarding unreadable Treejar sync checkpoint")
+        return None
+
+
+async def _save_treejar_checkpoint(
+    redis: Any,
+    checkpoint: _TreejarSyncCheckpoint,
+    stats: ProductSyncResponse,
+) -> None:
+    checkpoint.synced = stats.synced
+    checkpoint.created = stats.created
+    checkpoint.updated = stats.updated
+    checkpoint.skipped = stats.skipped
+    checkpoint.embeddings_generated = stats.embeddings_generated
+    try:
+        await redis.set(
+            TREEJAR_SYNC_CHECKPOINT_KEY,
+            checkpoint.model_dump_json(),
+            ex=_TREEJAR_SYNC_CHECKPOINT_TTL_SECONDS,
+        )
+    except Exception:
+        logger.warning("Could not write Treejar sync checkpoint", exc_info=True)
+
+
+async def _record_seen_skus(redis: Any, items: list[dict[str, Any]]) -> None:
+    """Add the SKUs of one upserted batch to the seen set of this sync.
+
+    Failures propagate: a sync that cannot record what it saw must not go on
+    to deactivate products based on an incomplete set.
+    """
+    skus = [
+        sku
+        for item in items
+        if _as_str(item.get("slug")) and (sku := _treejar_dedupe_key(item))
+    ]
+    if not skus:
+        return
+    await redis.sadd(TREEJAR_SYNC_SEEN_KEY, *skus)
+    await redis.expire(TREEJAR_SYNC_SEEN_KEY, _TREEJAR_SYNC_CHECKPOINT_TTL_SECONDS)
+
+
+async def _load_seen_skus(redis: Any) -> set[str]:
+    members = await redis.smembers(TREEJAR_SYNC_SEEN_KEY)
+    return {
+        member.decode() if isinstance(member, bytes) else str(member)
+        for member in members
+    }
 
-            async for item in client.iter_all_products(
-                limit=settings.catalog_api_page_size
-            ):
-                batch.append(item)
-                if len(batch) >= settings.catalog_api_page_size:
-                    await _upsert_treejar_products_batch(batch, stats)
-                    batch.clear()
 
+async def _run_treejar_sync_pipeline(
+    client: TreejarCatalogClient,
+    redis: Any,
+    checkpoint: _TreejarSyncCheckpoint,
+    stats: ProductSyncResponse,
+    meters: dict[str, _StageMeter],
+    *,
+    deadline: float,
+) -> bool:
+    """Stream catalog pages through upsert and embedding stages.
+
+    fetch -> upsert -> embed run concurrently, connected by bounded queues, so
+    a slow database or embedding model throttles fetching instead of
+    buffering the catalog in memory. A category is checkpointed once all of
+    its pages are committed. Returns False when fetching stopped at the time
+    budget before every category was read.
+
+    A stage sends its end-of-stream sentinel only when it finishes normally.
+    If any stage fails, the task group cancels the others, so none of them
+    waits on a queue whose reader is gone.
+    """
+    page_size = settings.catalog_api_page_size
+    depth = settings.catalog_sync_pipeline_depth
+    completed = set(checkpoint.completed_categories)
+    slugs = [
+        slug for slug in await client.get_category_slugs() if slug not in completed
+    ]
+    upserts: asyncio.Queue[CatalogPage | None] = asyncio.Queue(maxsize=depth)
+    embeddings: asyncio.Queue[list[UUID] | None] = asyncio.Queue(maxsize=depth)
+    loop = asyncio.get_running_loop()
+
+    async def fetch() -> bool:
+        pages = client.iter_category_pages(
+            slugs,
+            limit=page_size,
+            concurrency=settings.catalog_api_max_concurrency,
+            buffer_pages=depth,
+        )
+        fetched_all = True
+        try:
+            async with meters["fetch"].measure():
+                async for page in pages:
+                    meters["fetch"].items += len(page.products)
+                    await upserts.put(page)
+                    if loop.time() >= deadline:
+                        fetched_all = False
+                        break
+        finally:
+            await pages.aclose()
+        await upserts.put(None)
+        return fetched_all
+
+    async def upsert() -> None:
+        batch: list[dict[str, Any]] = []
+        finished_slugs: list[str] = []
+
+        async def flush() -> None:
             if batch:
-                await _upsert_treejar_products_batch(batch, stats)
+                items = batch.copy()
+                batch.clear()
+                async with meters["upsert"].measure():
+                    pending_ids = await _upsert_treejar_products_batch(items, stats)
+                    await _record_seen_skus(redis, items)
+                meters["upsert"].items += len(items)
+                if pending_ids:
+                    await embeddings.put(pending_ids)
+            if finished_slugs:
+                checkpoint.completed_categories.extend(finished_slugs)
+                finished_slugs.clear()
+                await _save_treejar_checkpoint(redis, checkpoint, stats)
+
+        while (page := await upserts.get()) is not None:
+            batch.extend(page.products)
+            if page.is_last:
+                finished_slugs.append(page.slug)
+            if len(batch) >= page_size or finished_slugs:
+                await flush()
+        await flush()
+        await embeddings.put(None)
+
+    async def embed() -> None:
+        while (product_ids := await embeddings.get()) is not None:
+            async with meters["embed"].measure():
+                generated = await _embed_products(product_ids)
+            meters["embed"].items += generated
+            stats.embeddings_generated += generated
+
+    async with asyncio.TaskGroup() as group:
+        fetched = group.create_task(fetch())
+        group.create_task(upsert())
+        group.create_task(embed())
+    return fetched.result()
+
+
+async def sync_products_from_treejar_catalog(ctx: dict[str, Any]) -> dict[str, Any]:
+    """ARQ background job for the canonical Treejar catalog sync.
+
+    Categories are paged concurrently and streamed into upsert batches, and
+    changed rows are embedded as their batch commits. Progress is checkpointed
+    in Redis per category: a run that reaches
+    ``settings.catalog_sync_time_budget_seconds`` re-enqueues itself and the
+    next run, or any run after a hard timeout, resumes from the checkpoint.
+    Stale-product deactivation only happens once every category was read.
+    """
+    redis = ctx["redis"]
+    lock_token = secrets.token_hex(16)
+    if not await redis.set(
+        TREEJAR_SYNC_LOCK_KEY,
+        lock_token,
+        ex=settings.catalog_sync_time_budget_seconds + _TREEJAR_SYNC_LOCK_GRACE_SECONDS,
+        nx=True,
+    ):
+        logger.info("Treejar catalog sync already running; skipping this run.")
+        return ProductSyncResponse(
+            synced=0, created=0, updated=0, errors=0, status="skipped"
+        ).model_dump()
+
+    checkpoint = await _load_treejar_checkpoint(redis)
+    if checkpoint is None:
+        logger.info("Starting canonical Treejar catalog sync...")
+        checkpoint = _TreejarSyncCheckpoint(started_at=datetime.now(UTC))
+        with suppress(Exception):
+            await redis.delete(TREEJAR_SYNC_SEEN_KEY)
+    else:
+        logger.info(
+            "Resuming canonical Treejar catalog sync with %d categories done...",
+            len(checkpoint.completed_categories),
+        )
+
+    stats = ProductSyncResponse(
+        synced=checkpoint.synced,
+        created=checkpoint.created,
+        updated=checkpoint.updated,
+        skipped=checkpoint.skipped,
+        errors=0,
+        embeddings_generated=checkpoint.embeddings_generated,
+    )
+    meters = {stage: _StageMeter() for stage in ("fetch", "upsert", "embed")}
+    deadline = (
+        asyncio.get_running_loop().time() + settings.catalog_sync_time_budget_seconds
+    )
+    finished = False
 
+    try:
+        async with _treejar_catalog_client() as client:
+            finished = await _run_treejar_sync_pipeline(
+                client, redis, checkpoint, stats, meters, deadline=deadline
+            )
     except Exception as exc:
         logger.error("Error syncing products from Treejar catalog: %s", exc)
         stats.errors += 1
+    finally:
+        with suppress(Exception):
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, TREEJAR_SYNC_LOCK_KEY, lock_token)
 
-    if stats.errors == 0 and stats.synced > 0:
-        stats.deactivated = await _deactivate_stale_products(sync_started_at)
-        stats.embeddings_generated = await _generate_missing_embeddings()
+    if finished and stats.errors == 0:
+        if stats.synced > 0:
+            stats.deactivated = await _deactivate_stale_products(
+                await _load_seen_skus(redis)
+            )
+            stats.embeddings_generated += await _generate_missing_embeddings()
+        with suppress(Exception):
+            await redis.delete(TREEJAR_SYNC_CHECKPOINT_KEY, TREEJAR_SYNC_SEEN_KEY)
+        if stats.created or stats.updated or stats.deactivated:
+            for job in ("refresh_product_neighbors", "refresh_catalog_artifacts"):
+                try:
+                    await enqueue_routed_job(redis, job)
+                except Exception:
+                    logger.warning("Could not enqueue %s after the catalog sync", job)
+        stats.status = "completed"
+    elif stats.errors == 0:
+        await _save_treejar_checkpoint(redis, checkpoint, stats)
+        await enqueue_routed_job(redis, "sync_products_from_treejar_catalog")
+        stats.status = "continued"
+    else:
+        # Completed categories stay checkpointed so a retry resumes after them.
+        await _save_treejar_checkpoint(redis, checkpoint, stats)
 
+    stats.stages = {stage: meter.as_dict() for stage, meter in meters.items()}
     logger.info(
-        "Treejar catalog sync completed. Synced: %d, Created: %d, Updated: %d, "
-        "Deactivated: %d, Embeddings: %d, Errors: %d",
+        "Treejar catalog sync %s. Synced: %d, Created: %d, Updated: %d, "
+        "Unchanged: %d, Deactivated: %d, Embeddings: %d, Errors: %d, Stages: %s",
+        stats.status or "failed",
         stats.synced,
         stats.created,
         stats.updated,
+        stats.skipped,
         stats.deactivated,
         stats.embeddings_generated,
         stats.errors,
+        stats.stages,
     )
 
     return stats.model_dump()
@@ -357,9 +659,14 @@ async def _upsert_items_batch(
 
 async def _upsert_treejar_products_batch(
     items: list[dict[str, Any]], stats: ProductSyncResponse
-) -> None:
+) -> list[UUID]:
+    """Upsert one batch and return ids of active rows that now lack an embedding.
+
+    Rows whose content and embedding hashes match the stored ones are left
+    untouched and counted as skipped.
+    """
     if not items:
-        return
+        return []
 
     values = []
     for item in items:
@@ -370,7 +677,7 @@ async def _upsert_treejar_products_batch(
         values.append(normalized)
 
     if not values:
-        return
+        return []
 
     async with async_session_factory() as session:
         try:
@@ -390,15 +697,33 @@ async def _upsert_treejar_products_batch(
                 "image_url": stmt.excluded.image_url,
                 "attributes": stmt.excluded.attributes,
                 "is_active": stmt.excluded.is_active,
+                "content_hash": stmt.excluded.content_hash,
+                "embedding_hash": stmt.excluded.embedding_hash,
                 "embedding": _embedding_reset_expression(stmt),
                 "synced_at": func.now(),
                 "updated_at": func.now(),
             }
 
-            stmt = stmt.on_conflict_do_update(index_elements=["sku"], set_=set_dict)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["sku"],
+                set_=set_dict,
+                where=_product_changed_condition(stmt),
+            )
 
-            result = await session.execute(stmt.returning(Product.id, text("xmax")))
+            result = await session.execute(
+                stmt.returning(Product.id, text("xmax"), Product.embedding.is_(None))
+            )
             rows = result.all()
+            pending_ids = [row[0] for row in rows if row[2]]
+            if pending_ids:
+                # A reset embedding makes the product's precomputed neighbours
+                # stale; missing rows are what the neighbour refresh recomputes.
+                await session.execute(
+                    delete(ProductNeighbor).where(
+                        ProductNeighbor.relation_type == "similar",
+                        ProductNeighbor.product_id.in_(pending_ids),
+                    )
+                )
             await session.commit()
 
             for row in rows:
@@ -406,7 +731,10 @@ async def _upsert_treejar_products_batch(
                     stats.created += 1
                 else:
                     stats.updated += 1
-            stats.synced += len(rows)
+            # Unchanged rows hit the conflict WHERE clause and return nothing.
+            stats.skipped += len(values) - len(rows)
+            stats.synced += len(values)
+            return pending_ids
 
         except Exception:
             await session.rollback()
@@ -415,23 +743,26 @@ async def _upsert_treejar_products_batch(
             raise
 
 
-async def _deactivate_stale_products(sync_started_at: datetime) -> int:
-    """Mark products as inactive if they were not updated during this sync cycle.
+async def _deactivate_stale_products(seen_skus: Collection[str]) -> int:
+    """Mark products as inactive if this sync cycle did not see their SKU.
 
-    Any product whose synced_at is older than the sync start time was not
-    present in the Zoho response, meaning it was deleted or deactivated there.
+    Any active product missing from ``seen_skus`` was not present in the
+    catalog response, meaning it was deleted or deactivated there. An empty
+    set deactivates nothing rather than the whole catalog.
 
     Returns:
         Number of products deactivated.
     """
+    if not seen_skus:
+        return 0
     async with async_session_factory() as session:
         try:
             stmt = (
                 text(
                     "UPDATE products SET is_active = false, embedding = NULL "
-                    "WHERE is_active = true AND (synced_at IS NULL OR synced_at < :cutoff)"
+                    "WHERE is_active = true AND NOT (sku = ANY(:seen_skus))"
                 )
-            ).bindparams(cutoff=sync_started_at)
+            ).bindparams(seen_skus=sorted(seen_skus))
 
             result = await session.execute(stmt)
             await session.commit()
@@ -446,6 +777,51 @@ async def _deactivate_stale_products(sync_started_at: datetime) -> int:
             return 0
 
 
+async def _embed_products(product_ids: list[UUID]) -> int:
+    """Embed the given active products that still lack an embedding."""
+    from src.rag.embeddings import EmbeddingEngine, product_embedding_text
+
+    async with async_session_factory() as session:
+        try:
+            rows = (
+                await session.execute(
+                    select(
+                        Product.id,
+                        Product.name_en,
+                        Product.category,
+                        Product.description_en,
+                    ).where(
+                        Product.id.in_(product_ids),
+                        Product.embedding.is_(None),
+                        Product.is_active.is_(True),
+                    )
+                )
+            ).all()
+            if not rows:
+                return 0
+            embeddings = await EmbeddingEngine().embed_batch_async(
+                [
+                    product_embedding_text(
+                        row.name_en, row.category, row.description_en
+                    )
+                    for row in rows
+                ]
+            )
+            await session.execute(
+                update(Product),
+                [
+                    {"id": row.id, "embedding": embedding}
+                    for row, embedding in zip(rows, embeddings, strict=True)
+                ],
+            )
+            await session.commit()
+            return len(rows)
+        except Exception as e:
+            await session.rollback()
+            logger.error("Error embedding synced products: %s", e)
+            return 0
+
+
 async def _generate_missing_embeddings() -> int:
     """Generate embeddings for all products that lack them."""
     from src.rag.embeddings import generate_product_embeddings
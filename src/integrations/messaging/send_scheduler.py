@@ -0,0 +1,139 @@
+"""Per-channel pacing of outbound Wazzup sends, shared by every process.
+
+Live replies and cron campaigns (payment reminders, proposal follow-ups,
+feedback requests, legacy follow-ups) used to call Wazzup as fast as they
+could, so a campaign burst tripped the channel's rate limit and the next
+customer reply spent its retries sleeping on 429s. Every ``POST /message``
+now takes a token from a Redis token bucket per channel first:
+``settings.wazzup_send_rate_per_second`` tokens are added per second up to
+``settings.wazzup_send_burst``.
+
+A send has one of two priorities. A ``live`` send takes any token, and if
+the bucket is empty waits for the next one for at most
+``settings.wazzup_send_live_max_wait_seconds`` before sending anyway. A
+``bulk`` send only takes a token while ``settings.wazzup_send_live_reserve``
+more remain, and otherwise waits inside its batch job for as long as it
+takes, so a campaign can never drain the tokens a live reply needs.
+
+A 429 pauses the whole channel for its ``Retry-After`` in the same Redis
+keys, so the other workers stop sending instead of tripping it again. Redis
+errors never block a send: the scheduler logs them and lets it through.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Literal
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OutboundPriority = Literal["live", "bulk"]
+
+SEND_BUCKET_KEY_PREFIX = "wazzup:outbound"
+_DEFAULT_CHANNEL = "default"
+# Returns 0 when a token was taken, otherwise the milliseconds to wait.
+_TAKE_TOKEN_SCRIPT = """
+local now = tonumber(ARGV[1])
+local paused_until = tonumber(redis.call("get", KEYS[2]) or "0")
+if paused_until > now then
+    return paused_until - now
+end
+local rate = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local state = redis.call("hmget", KEYS[1], "tokens", "ms")
+local tokens = tonumber(state[1]) or burst
+local last = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(now - last, 0) * rate / 1000)
+local wait = 0
+if tokens >= reserve + 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((reserve + 1 - tokens) * 1000 / rate)
+end
+redis.call("hset", KEYS[1], "tokens", tostring(tokens), "ms", tostring(now))
+redis.call("pexpire", KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+_PAUSE_SCRIPT = """
+local until_ms = tonumber(ARGV[1])
+if until_ms > tonumber(redis.call("get", KEYS[1]) or "0") then
+    redis.call("set", KEYS[1], ARGV[1], "px", ARGV[2])
+end
+return 1
+"""
+
+
+def _bucket_key(channel: str) -> str:
+    return f"{SEND_BUCKET_KEY_PREFIX}:{channel}:bucket"
+
+
+def _pause_key(channel: str) -> str:
+    return f"{SEND_BUCKET_KEY_PREFIX}:{channel}:paused_until"
+
+
+def send_channel(channel_id: str | None) -> str:
+    """The bucket a send through ``channel_id`` draws from."""
+    return channel_id or settings.wazzup_channel_id or _DEFAULT_CHANNEL
+
+
+async def acquire_send_slot(
+    redis: Any,
+    channel: str,
+    priority: OutboundPriority,
+) -> float:
+    """Wait until ``channel`` may send one message; returns the seconds waited."""
+    burst = settings.wazzup_send_burst
+    reserve = min(settings.wazzup_send_live_reserve, burst - 1)
+    waited = 0.0
+    while True:
+        try:
+            wait_ms = int(
+                await redis.eval(
+                    _TAKE_TOKEN_SCRIPT,
+                    2,
+                    _bucket_key(channel),
+                    _pause_key(channel),
+                    int(time.time() * 1000),
+                    settings.wazzup_send_rate_per_second,
+                    burst,
+                    reserve if priority == "bulk" else 0,
+                )
+            )
+        except Exception:
+            logger.warning("Outbound send bucket unavailable", exc_info=True)
+            return waited
+        if wait_ms <= 0:
+            return waited
+        delay = wait_ms / 1000
+        if priority == "live":
+            remaining = settings.wazzup_send_live_max_wait_seconds - waited
+            if remaining <= 0:
+                logger.warning(
+                    "Live send on channel %s waited %.1fs for the bucket; sending",
+                    channel,
+                    waited,
+                )
+                return waited
+            delay = min(delay, remaining)
+        await asyncio.sleep(delay)
+        waited += delay
+
+
+async def pause_channel(redis: Any, channel: str, seconds: float) -> None:
+    """Hold every send on ``channel`` for ``seconds``; never raises."""
+    pause_ms = max(int(seconds * 1000), 1)
+    try:
+        await redis.eval(
+            _PAUSE_SCRIPT,
+            1,
+            _pause_key(channel),
+            int(time.time() * 1000) + pause_ms,
+            pause_ms,
+        )
+    except Exception:
+        logger.warning("Could not pause outbound channel %s", channel, exc_info=True)
@@ -12,7 +12,14 @@ from urllib.parse import urljoin, urlsplit
 import httpx
 
 from src.core.config import settings
+from src.core.redis import get_redis_client
 from src.integrations.messaging.base import MessagingProvider
+from src.integrations.messaging.send_scheduler import (
+    OutboundPriority,
+    acquire_send_slot,
+    pause_channel,
+    send_channel,
+)
 from src.services.inbound_channels import normalize_channel_phone
 
 logger = logging.getLogger(__name__)
@@ -27,6 +34,16 @@ _DOWNLOAD_LINK_RE = re.compile(
     r"(?P<tail>[^>]*)>(?P<label>.*?)</a>",
     re.IGNORECASE | re.DOTALL,
 )
+_MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """The ``Retry-After`` delay of a 429, when given in seconds."""
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER_SECONDS)
 
 
 def _validated_tmpfiles_url(value: str) -> str:
@@ -78,6 +95,29 @@ async def _resolve_tmpfiles_download_url(
     raise RuntimeError("tmpfiles.org did not expose the uploaded bytes")
 
 
+class MediaTooLargeError(ValueError):
+    """A media download exceeded its byte cap and was abandoned."""
+
+
+async def _download_capped(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    max_bytes: int,
+) -> bytes:
+    async with client.stream("GET", url, timeout=httpx.Timeout(30.0)) as response:
+        response.raise_for_status()
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise MediaTooLargeError(f"Media declares {declared} bytes")
+        content = bytearray()
+        async for chunk in response.aiter_bytes():
+            content.extend(chunk)
+            if len(content) > max_bytes:
+                raise MediaTooLargeError(f"Media exceeds {max_bytes} bytes")
+    return bytes(content)
+
+
 @dataclass(frozen=True)
 class WazzupMediaSendResult:
     message_id: str
@@ -91,15 +131,23 @@ class WazzupProvider(MessagingProvider):
 
     supports_typing_indicator = False
 
-    def __init__(self, channel_id: str | None = None) -> None:
+    def __init__(
+        self,
+        channel_id: str | None = None,
+        *,
+        priority: OutboundPriority = "live",
+    ) -> None:
         """Initialize the Wazzup API client.
 
         Args:
             channel_id: Default channelId for messages. Can be overridden per request.
+            priority: Send priority in the outbound scheduler; cron campaigns
+                pass ``"bulk"`` so they yield to live replies.
         """
         self.base_url = settings.wazzup_api_url
         self.api_key = settings.wazzup_api_key
         self.channel_id = channel_id
+        self.priority = priority
 
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
@@ -113,10 +161,20 @@ class WazzupProvider(MessagingProvider):
         path: str,
         json: dict[str, Any] | None = None,
     ) -> httpx.Response:
-        """Make an authenticated request to Wazzup API with retries and backoff."""
+        """Make an authenticated request to Wazzup API with retries and backoff.
+
+        Message sends first wait for the channel's outbound scheduler when it
+        is enabled; a 429 honours ``Retry-After`` and pauses the channel for
+        every worker.
+        """
         max_retries = 3
+        paced = settings.wazzup_send_scheduler_enabled and path == "/message"
 
         for attempt in range(1, max_retries + 1):
+            if paced:
+                await acquire_send_slot(
+                    get_redis_client(), send_channel(self.channel_id), self.priority
+                )
             try:
                 response = await self.client.request(
                     method=method,
@@ -132,7 +190,12 @@ class WazzupProvider(MessagingProvider):
                 )
                 # 429 Too Many Requests
                 if e.response.status_code == 429 and attempt < max_retries:
-                    await asyncio.sleep(2**attempt)
+                    delay = _retry_after_seconds(e.response) or 2**attempt
+                    if paced:
+                        await pause_channel(
+                            get_redis_client(), send_channel(self.channel_id), delay
+                        )
+                    await asyncio.sleep(delay)
                     continue
                 raise
 
@@ -189,7 +252,11 @@ class WazzupProvider(MessagingProvider):
         return dl_url
 
     async def download_media(
-        self, url: str, max_retries: int = 2, client: httpx.AsyncClient | None = None
+        self,
+        url: str,
+        max_retries: int = 2,
+        client: httpx.AsyncClient | None = None,
+        max_bytes: int | None = None,
     ) -> bytes:
         """Download media content (audio, images, etc.) from a URL.
 
@@ -201,12 +268,21 @@ class WazzupProvider(MessagingProvider):
             url: Full URL to the media file (typically from Wazzup CDN).
             max_retries: Number of retry attempts for transient failures.
             client: Optional shared httpx.AsyncClient to reuse connection.
+            max_bytes: Stream the body and abandon it with
+                `MediaTooLargeError` once it exceeds this many bytes.
 
         Returns:
             Raw bytes of the media file.
         """
         for attempt in range(1, max_retries + 1):
             try:
+                if max_bytes is not None:
+                    if client is not None:
+                        return await _download_capped(client, url, max_bytes=max_bytes)
+                    async with httpx.AsyncClient() as dl_client:
+                        return await _download_capped(
+                            dl_client, url, max_bytes=max_bytes
+                        )
                 if client is not None:
                     response = await client.get(url, timeout=httpx.Timeout(30.0))
                     response.raise_for_status()
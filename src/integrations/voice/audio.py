@@ -0,0 +1,101 @@
+"""Local re-encoding of large voice notes before transcription.
+
+A voice note is sent to the STT endpoint base64-encoded inside one JSON
+request, so an uploaded WAV or high-bitrate M4A costs several times the bytes
+the speech needs. Notes above ``settings.voice_transcode_min_bytes`` are
+re-encoded by ``ffmpeg`` to mono 16 kHz Opus in Ogg and split into
+``settings.voice_chunk_seconds`` segments that can be transcribed
+concurrently. ``ffmpeg`` runs as a child process, so the encoding never
+holds the worker's event loop. Without ``ffmpeg`` on ``PATH``, or when it
+fails, the caller keeps the original bytes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+COMPACT_AUDIO_FORMAT = "ogg"
+_OPUS_BITRATE = "24k"
+_FFMPEG_TIMEOUT_SECONDS = 120.0
+
+
+def _write_input(directory: Path, audio_bytes: bytes) -> Path:
+    path = directory / "input"
+    path.write_bytes(audio_bytes)
+    return path
+
+
+def _read_segments(directory: Path) -> list[bytes]:
+    return [path.read_bytes() for path in sorted(directory.glob("segment-*.ogg"))]
+
+
+async def compact_audio_segments(
+    audio_bytes: bytes,
+    *,
+    segment_seconds: int,
+) -> list[bytes] | None:
+    """Mono 16 kHz Opus segments of a note, or ``None`` to keep the original."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    with tempfile.TemporaryDirectory(prefix="voice-") as name:
+        directory = Path(name)
+        input_path = await asyncio.to_thread(_write_input, directory, audio_bytes)
+        process = await asyncio.create_subprocess_exec(
+            ffmpeg,
+            "-nostdin",
+            "-loglevel",
+            "error",
+            "-i",
+            str(input_path),
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-c:a",
+            "libopus",
+            "-b:a",
+            _OPUS_BITRATE,
+            "-f",
+            "segment",
+            "-segment_time",
+            str(segment_seconds),
+            "-reset_timestamps",
+            "1",
+            str(directory / "segment-%03d.ogg"),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=_FFMPEG_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.warning("Voice note re-encoding timed out; keeping original")
+            return None
+        if process.returncode != 0:
+            logger.warning(
+                "Voice note re-encoding failed: returncode=%s stderr_bytes=%d",
+                process.returncode,
+                len(stderr or b""),
+            )
+            return None
+        segments = await asyncio.to_thread(_read_segments, directory)
+    if not segments:
+        return None
+    logger.info(
+        "Voice note re-encoded: input_bytes=%d output_bytes=%d segments=%d",
+        len(audio_bytes),
+        sum(len(segment) for segment in segments),
+        len(segments),
+    )
+    return segments
@@ -1,8 +1,17 @@
-"""Audio transcription through OpenRouter's dedicated STT endpoint."""
+"""Audio transcription through OpenRouter's dedicated STT endpoint.
+
+`transcribe_voice_note` is the inbound path: it replays a cached transcription
+of the same bytes, so a redelivered webhook does not pay twice, re-encodes
+large notes with `src.integrations.voice.audio`, and transcribes their
+segments concurrently over one pooled client per process.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import json
 import logging
 import time
 from collections.abc import Mapping
@@ -12,11 +21,15 @@ from typing import Any, cast
 import httpx
 
 from src.core.config import settings
-from src.llm.safety import PATH_VOICE_TRANSCRIPTION, policy_for_path
+from src.integrations.voice.audio import COMPACT_AUDIO_FORMAT, compact_audio_segments
+from src.llm.paths import PATH_VOICE_TRANSCRIPTION
+from src.llm.safety import policy_for_path
 
 logger = logging.getLogger(__name__)
 
 MAX_AUDIO_SIZE = 25 * 1024 * 1024
+TRANSCRIPTION_CACHE_PREFIX = "voice_transcription"
+_SEGMENT_CONCURRENCY = 4
 
 _SUPPORTED_FORMATS = frozenset({"aac", "flac", "m4a", "mp3", "ogg", "wav", "webm"})
 _MIME_FORMATS = {
@@ -244,3 +257,141 @@ async def _transcribe_with_client(
         request_duration_seconds=request_duration_seconds,
         generation_id=generation_id,
     )
+
+
+_voice_client: httpx.AsyncClient | None = None
+
+
+def voice_http_client() -> httpx.AsyncClient:
+    """This process's pooled client for voice downloads and transcriptions."""
+    global _voice_client
+    if _voice_client is None or _voice_client.is_closed:
+        _voice_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _voice_client
+
+
+async def close_voice_http_client() -> None:
+    global _voice_client
+    if _voice_client is not None:
+        await _voice_client.aclose()
+        _voice_client = None
+
+
+def _cache_key(audio_bytes: bytes) -> str:
+    digest = hashlib.sha256(audio_bytes).hexdigest()
+    return f"{TRANSCRIPTION_CACHE_PREFIX}:{settings.voice_transcription_model}:{digest}"
+
+
+async def _cached_transcription(
+    redis: Any, key: str
+) -> VoiceTranscriptionResult | None:
+    try:
+        raw = await redis.get(key)
+    except Exception:
+        logger.warning("Voice transcription cache read failed", exc_info=True)
+        return None
+    if not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+        text, model = payload["text"], payload["model"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not isinstance(text, str) or not isinstance(model, str):
+        return None
+    # Nothing was billed for this note now, so no usage is reported.
+    return VoiceTranscriptionResult(
+        text=text,
+        model=model,
+        duration_seconds=payload.get("duration_seconds"),
+    )
+
+
+async def _store_transcription(
+    redis: Any, key: str, result: VoiceTranscriptionResult
+) -> None:
+    ttl_seconds = settings.voice_transcription_cache_ttl_seconds
+    if ttl_seconds <= 0:
+        return
+    payload = {
+        "text": result.text,
+        "model": result.model,
+        "duration_seconds": result.duration_seconds,
+    }
+    try:
+        await redis.set(key, json.dumps(payload), ex=ttl_seconds)
+    except Exception:
+        logger.warning("Voice transcription cache write failed", exc_info=True)
+
+
+def _sum_present(values: list[int | float | None]) -> int | float | None:
+    present = [value for value in values if value is not None]
+    return sum(present) if present else None
+
+
+def _merge_segment_results(
+    results: list[VoiceTranscriptionResult],
+) -> VoiceTranscriptionResult:
+    if len(results) == 1:
+        return results[0]
+    return VoiceTranscriptionResult(
+        text=" ".join(result.text for result in results if result.text),
+        model=results[0].model,
+        tokens_in=_coerce_int(_sum_present([r.tokens_in for r in results])),
+        tokens_out=_coerce_int(_sum_present([r.tokens_out for r in results])),
+        total_tokens=_coerce_int(_sum_present([r.total_tokens for r in results])),
+        cost=_coerce_float(_sum_present([r.cost for r in results])),
+        duration_seconds=_coerce_float(
+            _sum_present([r.duration_seconds for r in results])
+        ),
+        request_duration_seconds=max(
+            result.request_duration_seconds for result in results
+        ),
+        generation_id=results[0].generation_id,
+    )
+
+
+async def transcribe_voice_note(
+    audio_bytes: bytes,
+    *,
+    audio_format: str,
+    redis: Any,
+    client: httpx.AsyncClient,
+) -> VoiceTranscriptionResult:
+    """Transcribe an inbound voice note through the cache and re-encoder."""
+    key = _cache_key(audio_bytes)
+    cached = await _cached_transcription(redis, key)
+    if cached is not None:
+        logger.info("Voice transcription served from cache: model=%s", cached.model)
+        return cached
+
+    chunks: list[tuple[bytes, str]] = [(audio_bytes, audio_format)]
+    if len(audio_bytes) > settings.voice_transcode_min_bytes:
+        segments = await compact_audio_segments(
+            audio_bytes, segment_seconds=settings.voice_chunk_seconds
+        )
+        if segments and (
+            len(segments) > 1 or sum(map(len, segments)) < len(audio_bytes)
+        ):
+            chunks = [(segment, COMPACT_AUDIO_FORMAT) for segment in segments]
+
+    semaphore = asyncio.Semaphore(_SEGMENT_CONCURRENCY)
+
+    async def transcribe_chunk(
+        chunk: bytes, chunk_format: str
+    ) -> VoiceTranscriptionResult:
+        async with semaphore:
+            return await transcribe_audio_with_metadata(
+                chunk, audio_format=chunk_format, client=client
+            )
+
+    results = await asyncio.gather(
+        *(transcribe_chunk(chunk, chunk_format) for chunk, chunk_format in chunks)
+    )
+    result = _merge_segment_results(list(results))
+    if result.text:
+        await _store_transcription(redis, key, result)
+    return result
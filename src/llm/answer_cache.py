@@ -0,0 +1,240 @@
+"""Replay of verified FAQ answers for near-identical service questions.
+
+Delivery areas, warranty and showroom hours are asked many times a day in
+nearly the same words, and each one used to cost a service-policy run of the
+sales agent that restated the same knowledge-base entry. An answer from such a
+run is stored here when it is safe to repeat, and a later question that is
+close enough gets it back without a model call.
+
+A bucket holds the answers given under one exact context: language, stage,
+whether it was the opening turn, the verified-answer decision, the FAQ entries
+the model was shown (id and content hash), the behaviour rules and the runtime
+directives. Editing, deleting or adding a knowledge-base entry changes which
+entries a question retrieves or their hashes, so the question lands in a new
+bucket and the old answers are never read again; they expire after
+``settings.answer_cache_ttl_seconds``. Within a bucket a question hits when
+the cosine similarity of its embedding to a stored question's reaches
+``settings.answer_cache_min_similarity``.
+
+The masked model text is stored, not the rendered reply. A hit is rendered
+through the same reply policy as a fresh answer, so greetings, asks and guards
+follow the current turn, and a hit the policy flags is not served. An answer
+is stored only when its run called no tools and its text carries nothing
+specific to the customer: no PII placeholder, none of their details, and no
+number the FAQ entries do not contain.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from src.core.minute_counters import (
+    decode_text,
+    read_minute_window,
+    record_minute_counters,
+)
+
+if TYPE_CHECKING:
+    from src.llm.verified_answers import VerifiedAnswerDecision
+
+logger = logging.getLogger(__name__)
+
+AnswerCacheEvent = Literal["hit", "miss", "rejected", "store"]
+
+ANSWER_CACHE_KEY_PREFIX = "answer_cache"
+_STATS_KEY_PREFIX = f"{ANSWER_CACHE_KEY_PREFIX}:stats"
+# Distinct phrasings kept per bucket; the oldest is dropped first.
+_BUCKET_SIZE = 8
+_MIN_PRIVATE_VALUE_LENGTH = 3
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_STORE_SCRIPT = """
+redis.call("lpush", KEYS[1], ARGV[1])
+redis.call("ltrim", KEYS[1], 0, tonumber(ARGV[2]) - 1)
+redis.call("expire", KEYS[1], ARGV[3])
+return 1
+"""
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def answer_cache_bucket(
+    *,
+    language: str,
+    stage: str,
+    is_first_turn: bool,
+    decision: VerifiedAnswerDecision,
+    faq_context: Sequence[Mapping[str, Any]],
+    behavior_rule_ids: Iterable[str],
+    runtime_directives: Sequence[str],
+) -> str | None:
+    """The bucket key of a service turn, or ``None`` if it is not cacheable."""
+    if (
+        decision.is_order_status
+        or decision.question_class not in {"service_low_risk", "service_high_risk"}
+        or decision.faq_support != "verified"
+        or decision.policy_action != "allow"
+        or not faq_context
+    ):
+        return None
+    context = {
+        "language": language,
+        "stage": stage,
+        "first_turn": is_first_turn,
+        "question_class": decision.question_class,
+        "topics": sorted(decision.matched_topics),
+        "faq": [
+            [str(item.get("id", "")), _content_hash(str(item.get("content", "")))]
+            for item in faq_context
+        ],
+        "rules": sorted(behavior_rule_ids),
+        "directives": list(runtime_directives),
+    }
+    digest = _content_hash(json.dumps(context, sort_keys=True, ensure_ascii=False))
+    return f"{ANSWER_CACHE_KEY_PREFIX}:v1:{digest}"
+
+
+def is_shareable_answer(
+    text: str,
+    *,
+    faq_context: Sequence[Mapping[str, Any]],
+    private_values: Iterable[str | None],
+) -> bool:
+    """Whether a reply can be repeated to another customer unchanged."""
+    if not text.strip() or "[PII-" in text:
+        return False
+    folded = text.casefold()
+    for value in private_values:
+        value = (value or "").strip().casefold()
+        if len(value) >= _MIN_PRIVATE_VALUE_LENGTH and value in folded:
+            return False
+    faq_numbers = {
+        number
+        for item in faq_context
+        for field in ("title", "content")
+        for number in _NUMBER_RE.findall(str(item.get(field, "")))
+    }
+    return set(_NUMBER_RE.findall(text)) <= faq_numbers
+
+
+def _encode_entry(embedding: Sequence[float], text: str) -> str:
+    vector = np.asarray(embedding, dtype=np.float32)
+    return json.dumps(
+        {"embedding": base64.b64encode(vector.tobytes()).decode(), "text": text}
+    )
+
+
+async def lookup_cached_answer(
+    redis: Any,
+    bucket: str,
+    embedding: Sequence[float],
+    *,
+    min_similarity: float,
+) -> str | None:
+    """The stored answer to the most similar stored question, if similar enough."""
+    try:
+        raw_entries = await redis.lrange(bucket, 0, -1)
+    except Exception:
+        logger.warning("Answer cache read failed", exc_info=True)
+        return None
+    query = np.asarray(embedding, dtype=np.float32)
+    best_text: str | None = None
+    best_similarity = min_similarity
+    for raw in raw_entries or []:
+        try:
+            entry = json.loads(decode_text(raw))
+            stored = np.frombuffer(
+                base64.b64decode(entry["embedding"]), dtype=np.float32
+            )
+            text = str(entry["text"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if stored.shape != query.shape:
+            continue
+        # Both sides are normalised embeddings, so the dot product is the cosine.
+        similarity = float(np.dot(stored, query))
+        if similarity >= best_similarity:
+            best_text, best_similarity = text, similarity
+    return best_text
+
+
+async def store_cached_answer(
+    redis: Any,
+    bucket: str,
+    embedding: Sequence[float],
+    text: str,
+    *,
+    ttl_seconds: int,
+) -> None:
+    """Add one answer to its bucket; never raises."""
+    try:
+        await redis.eval(
+            _STORE_SCRIPT,
+            1,
+            bucket,
+            _encode_entry(embedding, text),
+            _BUCKET_SIZE,
+            ttl_seconds,
+        )
+    except Exception:
+        logger.warning("Answer cache write failed", exc_info=True)
+
+
+async def record_answer_cache_event(
+    redis: Any,
+    event: AnswerCacheEvent,
+    *,
+    now: float | None = None,
+) -> None:
+    """Count one cache outcome in the current minute; never raises."""
+    try:
+        await record_minute_counters(redis, _STATS_KEY_PREFIX, {event: 1}, now=now)
+    except Exception:
+        logger.warning("Answer cache event %s not recorded", event, exc_info=True)
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerCacheStats:
+    hits: int = 0
+    misses: int = 0
+    rejected: int = 0
+    stores: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.rejected
+
+    @property
+    def hit_rate(self) -> float | None:
+        return self.hits / self.lookups if self.lookups else None
+
+
+async def read_answer_cache_stats(
+    redis: Any,
+    *,
+    minutes: int = 60,
+    now: float | None = None,
+) -> AnswerCacheStats:
+    """Cache outcomes of every worker over the last ``minutes``."""
+    totals: dict[str, int] = {}
+    for counts in await read_minute_window(
+        redis, _STATS_KEY_PREFIX, minutes=minutes, now=now
+    ):
+        for event, count in counts.items():
+            totals[event] = totals.get(event, 0) + count
+    return AnswerCacheStats(
+        hits=totals.get("hit", 0),
+        misses=totals.get("miss", 0),
+        rejected=totals.get("rejected", 0),
+        stores=totals.get("store", 0),
+    )
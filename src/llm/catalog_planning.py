@@ -6,7 +6,7 @@ import logging
 import re
 import sys
 from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
-from dataclasses import dataclass, field, replace
+from dataclasses import asdict, dataclass, field, replace
 from decimal import Decimal, InvalidOperation
 from functools import wraps
 from typing import Annotated, Any, Literal, cast
@@ -42,6 +42,7 @@ from src.llm.verified_answers import VerifiedAnswerDecision
 from src.models.conversation import Conversation
 from src.models.product import Product
 from src.rag.embeddings import EmbeddingEngine
+from src.services.catalog_artifacts import load_catalog_artifact
 from src.services.customer_language import is_arabic_customer_language
 from src.services.escalation_state import is_active_human_handoff
 from src.services.runtime_execution_evidence import (
@@ -890,7 +891,6 @@ _ANCHOR_FAMILIES: tuple[AnchorFamily, ...] = (
 # one available unit is a real purchasable floor; volume is a separate promise
 # and is disclosed whenever the winning row has fewer than five units.
 _ANCHOR_MIN_STOCK = 1
-_anchor_line_cache: dict[str, CatalogAnchor | None] = {}
 
 
 def _rounded_anchor_amount(lowest: float) -> float:
@@ -984,58 +984,117 @@ def anchor_line_from_catalog_rows(
     return anchor.line if anchor is not None else None
 
 
-async def catalog_anchor(db: AsyncSession, language: str) -> CatalogAnchor | None:
-    """Build the live purchasable price floor and its volume qualification.
+_PRICE_FLOORS_ARTIFACT = "price_floors"
 
-    The cheapest live row in each of the two families a customer names first.
-    It exists so the opening reply carries a real number before the customer has
-    told us anything, which is what both research reports of 2026-08-09 say the
-    first message must do.
 
-    Every figure is a catalog row. There is no fallback text with a number in
-    it: if the catalog cannot answer, the reply simply goes out without an
-    anchor rather than with an invented one.
+def _artifact_language(language: str) -> str:
+    return "ar" if is_arabic_customer_language(language) else "en"
 
-    `tj-3jo0`: this used to run one `MIN(price)` per family in SQL, which is why
-    it could not tell a Storage / Pedestal row from a desk -- the query only saw
-    the name. It reads the orderable rows and hands them to the same pure
-    function the measured round uses, so there is one family rule and not two.
-    """
 
-    from src.models.product import Product
+async def build_price_floors_artifact(db: AsyncSession) -> dict[str, Any]:
+    """Scan the priced in-stock rows once for every price floor a turn reads.
 
-    is_arabic = is_arabic_customer_language(language)
-    cache_key = "ar" if is_arabic else "en"
-    if cache_key in _anchor_line_cache:
-        return _anchor_line_cache[cache_key]
+    Per language: the `catalog_anchor` of the opening, and the cheapest
+    orderable row of every anchor family for the verified opening options.
+    The anchor reads every priced row with stock, as it always has; the
+    options read only active ones.
+    """
 
     result = await db.execute(
         select(
+            Product.sku,
             Product.name_en,
+            Product.name_ar,
             Product.category,
             Product.subcategory,
             Product.price,
+            Product.currency,
             Product.stock,
+            Product.is_active,
         ).where(
             Product.price.is_not(None),
             Product.price > 0,
             Product.stock >= _ANCHOR_MIN_STOCK,
         )
     )
+    products = result.all()
     rows = [
         AnchorCatalogRow(
-            name=str(name or ""),
-            category=category,
-            subcategory=subcategory,
-            price=(float(price) if isinstance(price, int | float | Decimal) else None),
-            stock=stock,
+            name=str(product.name_en or ""),
+            category=product.category,
+            subcategory=product.subcategory,
+            price=(
+                float(product.price)
+                if isinstance(product.price, int | float | Decimal)
+                else None
+            ),
+            stock=product.stock,
         )
-        for name, category, subcategory, price, stock in result.all()
+        for product in products
     ]
+    orderable = [product for product in products if product.is_active]
+    families = tuple(cast("CatalogFamily", family.key) for family in _ANCHOR_FAMILIES)
+    anchors: dict[str, dict[str, Any] | None] = {}
+    opening_lines: dict[str, list[dict[str, Any]]] = {}
+    for language in ("en", "ar"):
+        anchor = catalog_anchor_from_catalog_rows(rows, language=language)
+        anchors[language] = None if anchor is None else asdict(anchor)
+        opening_lines[language] = [
+            asdict(line)
+            for line in _verified_opening_catalog_lines(
+                orderable, families=families, language=language
+            )
+        ]
+    return {"anchors": anchors, "opening_lines": opening_lines}
+
+
+# Rebuilt by `refresh_catalog_artifacts` after every catalog sync that changes
+# rows; see `src.services.catalog_artifacts`.
+CATALOG_ARTIFACT_BUILDERS: dict[
+    str, Callable[[AsyncSession], Awaitable[dict[str, Any]]]
+] = {_PRICE_FLOORS_ARTIFACT: build_price_floors_artifact}
 
-    anchor = catalog_anchor_from_catalog_rows(rows, language=language)
-    _anchor_line_cache[cache_key] = anchor
-    return anchor
+
+async def _price_floors(db: AsyncSession, redis: Any) -> dict[str, Any]:
+    return await load_catalog_artifact(
+        _PRICE_FLOORS_ARTIFACT, db, redis, build_price_floors_artifact
+    )
+
+
+async def catalog_anchor(
+    db: AsyncSession,
+    language: str,
+    redis: Any = None,
+) -> CatalogAnchor | None:
+    """Build the live purchasable price floor and its volume qualification.
+
+    The cheapest live row in each of the two families a customer names first.
+    It exists so the opening reply carries a real number before the customer has
+    told us anything, which is what both research reports of 2026-08-09 say the
+    first message must do.
+
+    Every figure is a catalog row. There is no fallback text with a number in
+    it: if the catalog cannot answer, the reply simply goes out without an
+    anchor rather than with an invented one.
+
+    `tj-3jo0`: this used to run one `MIN(price)` per family in SQL, which is why
+    it could not tell a Storage / Pedestal row from a desk -- the query only saw
+    the name. It reads the orderable rows and hands them to the same pure
+    function the measured round uses, so there is one family rule and not two.
+
+    The floor is part of the price-floors catalog artefact, built once per
+    catalog version; with ``redis`` the turn reads that instead of the rows.
+    """
+
+    floors = await _price_floors(db, redis)
+    anchor = floors["anchors"][_artifact_language(language)]
+    if anchor is None:
+        return None
+    return CatalogAnchor(
+        line=anchor["line"],
+        has_limited_stock=anchor["has_limited_stock"],
+        grounded_amounts=tuple(anchor["grounded_amounts"]),
+    )
 
 
 async def catalog_anchor_line(db: AsyncSession, language: str) -> str | None:
@@ -2891,30 +2950,15 @@ async def _try_verified_opening_catalog_options(deps: SalesDeps) -> str | None:
     ):
         return None
 
-    result = await deps.db.execute(
-        select(Product)
-        .options(
-            load_only(
-                Product.sku,
-                Product.name_en,
-                Product.name_ar,
-                Product.category,
-                Product.subcategory,
-                Product.price,
-                Product.currency,
-                Product.stock,
-            )
-        )
-        .where(
-            Product.is_active.is_(True),
-            Product.stock > 0,
-            Product.price > 0,
-        )
-    )
-    lines = _verified_opening_catalog_lines(
-        tuple(result.scalars().all()),
-        families=planning.families,
-        language=str(deps.conversation.language),
+    floors = await _price_floors(deps.db, deps.redis)
+    by_family = {
+        line["family"]: VerifiedOpeningCatalogLine(**line)
+        for line in floors["opening_lines"][
+            _artifact_language(str(deps.conversation.language))
+        ]
+    }
+    lines = tuple(
+        by_family[family] for family in planning.families if family in by_family
     )
     response = _materialize_verified_opening_catalog_options(
         lines,
@@ -4134,7 +4178,6 @@ __all__ = (
     "_VERIFIED_PROSE_PROTECTED_RE",
     "_VERIFIED_PROSE_SLOT_RE",
     "_VERIFIED_PROSE_WORD_RE",
-    "_anchor_line_cache",
     "_append_required_tool_disclosures",
     "_best_catalog_coverage_selection",
     "_bounded_catalog_candidate_skus",
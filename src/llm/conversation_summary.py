@@ -6,17 +6,16 @@ from typing import Any
 
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import settings
 from src.core.database import async_session_factory
+from src.llm.paths import PATH_CONVERSATION_SUMMARY
 from src.llm.pii import mask_pii, unmask_pii
 from src.llm.safety import (
-    PATH_CONVERSATION_SUMMARY,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.models.conversation_summary import ConversationSummary
@@ -51,7 +50,7 @@ Rules:
 
 summary_model = OpenAIChatModel(
     SUMMARY_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(
         PATH_CONVERSATION_SUMMARY,
         model_name=SUMMARY_MODEL_NAME,
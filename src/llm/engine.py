@@ -22,7 +22,6 @@ import httpx
 from pydantic import BaseModel, Field, ValidationError
 from pydantic_ai import Agent, RunContext, ToolReturn, UnexpectedModelBehavior
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from pydantic_ai.tools import ToolDefinition
 from pydantic_ai.usage import RunUsage
 from sqlalchemy import case, func, or_, select
@@ -157,8 +156,13 @@ from src.llm.money import (
 from src.llm.opening_guard import canonical_opening
 from src.llm.order_quote_routes import QuotationItem, _order_quote_route_for_turn
 from src.llm.order_status import format_order_status
+from src.llm.paths import PATH_CORE_CHAT
 from src.llm.pii import EMAIL_PATTERN, PHONE_PATTERN, mask_pii, unmask_pii
-from src.llm.prompts import build_system_prompt
+from src.llm.prompts import (
+    build_stage_prompt,
+    build_static_prompt_prefix,
+    format_faq_context_prompt,
+)
 from src.llm.response_policy import (
     RenderedReply,
     ReplyPolicyState,
@@ -189,11 +193,11 @@ from src.llm.response_runtime import (
     _response_from_rendered_reply,
 )
 from src.llm.safety import (
-    PATH_CORE_CHAT,
     OpenRouterTelemetryChatModel,
     get_llm_usage_telemetry,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.llm.verified_answers import (
@@ -9651,7 +9655,7 @@ async def _prepare_sales_tools(
 CORE_CHAT_MODEL_NAME = model_name_for_path(PATH_CORE_CHAT)
 model = OpenAIChatModel(
     CORE_CHAT_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(PATH_CORE_CHAT, model_name=CORE_CHAT_MODEL_NAME),
 )
 
@@ -9691,10 +9695,18 @@ prose_agent = Agent(
 )
 
 
-@sales_agent.system_prompt
+# Instructions, not system prompt parts: PydanticAI only adds system prompt
+# parts to a run without message history, and they must reach every turn.
+# Registration order is prompt order, so the static prefix stays cacheable.
+@sales_agent.instructions
+async def inject_static_prompt_prefix(ctx: RunContext[SalesDeps]) -> str:
+    return await build_static_prompt_prefix(ctx.deps.db, ctx.deps.redis)
+
+
+@sales_agent.instructions
 async def inject_system_prompt(ctx: RunContext[SalesDeps]) -> str:
-    """Dynamically inject the system prompt based on current stage and language."""
-    base_prompt = await build_system_prompt(
+    """Per-turn prompt blocks, after the static prefix: stage, context, rules."""
+    base_prompt = await build_stage_prompt(
         db=ctx.deps.db,
         redis=ctx.deps.redis,
         stage=ctx.deps.conversation.sales_stage,
@@ -9706,27 +9718,8 @@ async def inject_system_prompt(ctx: RunContext[SalesDeps]) -> str:
 
     # RAG: inject cached knowledge base FAQ context
     if ctx.deps.faq_context:
-        faq_block = "\n\n[KNOWLEDGE BASE (FAQ)]\n"
-        for item in ctx.deps.faq_context:
-            faq_block += f"Q: {item['title']}\nA: {item['content']}\n---\n"
-        faq_block += "Use the above FAQ entries when answering. "
-        if ctx.deps.tool_mode == "order_handoff":
-            faq_block += (
-                "If the answer is NOT in the FAQ, do NOT make up information. "
-                "This run is restricted to order handoff handling, so do not rely on FAQ context to continue product discovery.\n"
-            )
-        elif ctx.deps.tool_mode == "service_policy":
-            faq_block += (
-                "If the answer is NOT in the FAQ, do NOT make up information. "
-                "This run is restricted to verified service-answer handling, so answer only from confirmed FAQ facts and do not continue product discovery.\n"
-            )
-        else:
-            faq_block += (
-                "If the answer is NOT in the FAQ, do NOT make up information. "
-                "WARNING: If the user asks for specific products or catalog items (e.g. chairs, tables), "
-                "you MUST call the `search_products` tool. Do not rely solely on the FAQ for products because the tool fetches live images!\n"
-            )
-        base_prompt += faq_block
+        faq_block = format_faq_context_prompt(ctx.deps.faq_context, ctx.deps.tool_mode)
+        base_prompt += f"\n\n{faq_block}"
 
     if ctx.deps.crm_context:
         profile_str = format_llm_crm_context(ctx.deps.crm_context)
@@ -11582,7 +11575,7 @@ async def recommend_products(
                 ),
             )
 
-        items = await get_cross_sell(ctx.deps.db, category, limit=3)
+        items = await get_cross_sell(ctx.deps.db, category, 3, product_id=product_id)
         if remaining_budget is not None and items:
             affordable_items = [
                 item
@@ -18,10 +18,11 @@ from src.llm.money import (
     BUDGET_AED_CURRENCY_PATTERN,
     canonical_amount,
 )
+from src.llm.paths import PATH_FACT_EXTRACTION
 from src.llm.pii import EMAIL_PATTERN, PHONE_PATTERN
 from src.llm.safety import (
-    PATH_FACT_EXTRACTION,
     model_settings_for_path,
+    openrouter_provider,
     usage_limits_for_path,
 )
 
@@ -234,7 +235,6 @@ class PydanticAIFastCustomerFactExtractor:
     ) -> FastCustomerFactExtractionOutput:
         from pydantic_ai import Agent
         from pydantic_ai.models.openai import OpenAIChatModel
-        from pydantic_ai.providers.openrouter import OpenRouterProvider
 
         model_settings = model_settings_for_path(
             PATH_FACT_EXTRACTION,
@@ -245,7 +245,7 @@ class PydanticAIFastCustomerFactExtractor:
             raise RuntimeError("Fact extraction safety policy must be non-core")
         model = OpenAIChatModel(
             self.model_name,
-            provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+            provider=openrouter_provider(),
             settings=model_settings,
         )
         agent: Agent[None, FastCustomerFactExtractionOutput] = Agent(
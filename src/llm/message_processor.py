@@ -34,7 +34,6 @@ from pydantic_ai.messages import (
     TextPart,
     UserPromptPart,
 )
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from pydantic_ai.usage import RunUsage
 
 import src.llm.engine as engine
@@ -50,6 +49,13 @@ from src.dialogue.runner import (
     quote_consent_signal,
     record_legacy_route,
 )
+from src.llm.answer_cache import (
+    answer_cache_bucket,
+    is_shareable_answer,
+    lookup_cached_answer,
+    record_answer_cache_event,
+    store_cached_answer,
+)
 from src.llm.catalog_planning import (
     CLAIM_CONTRACT_SCOPE_KEY,
     SalesDeps,
@@ -81,6 +87,7 @@ from src.llm.order_quote_routes import (
     build_declared_static_response,
 )
 from src.llm.outbound_reply_guard import finalize_customer_reply_text
+from src.llm.paths import PATH_CORE_CHAT
 from src.llm.pii import (
     mask_pii,
     unmask_pii,
@@ -108,10 +115,10 @@ from src.llm.response_runtime import (
     _response_from_rendered_reply,
 )
 from src.llm.safety import (
-    PATH_CORE_CHAT,
     get_llm_usage_telemetry,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.llm.verified_answers import (
@@ -324,7 +331,7 @@ class _LazyModelRuntime:
                 name,
                 engine.OpenAIChatModel(
                     name,
-                    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+                    provider=openrouter_provider(),
                     settings=model_settings_for_path(PATH_CORE_CHAT, model_name=name),
                 ),
             )
@@ -1436,21 +1443,140 @@ async def _verified_policy_routes(
         "service_low_risk",
         "service_high_risk",
     }:
-        result = await turn.run_agent(
-            replace(
-                turn.deps,
-                tool_mode="service_policy",
-                runtime_directives=(
-                    *turn.deps.runtime_directives,
-                    *build_service_runtime_directives(policy_decision),
-                ),
-            )
+        run_deps = replace(
+            turn.deps,
+            tool_mode="service_policy",
+            runtime_directives=(
+                *turn.deps.runtime_directives,
+                *build_service_runtime_directives(policy_decision),
+            ),
         )
+        cache_slot = await _answer_cache_slot(turn, policy_decision, run_deps)
+        if cache_slot is not None:
+            cached = await _cached_service_answer(
+                turn, cache_slot, run_deps, db_model_main
+            )
+            if cached is not None:
+                await turn.clear_repair_state()
+                return cached
+        result = await turn.run_agent(run_deps)
         await turn.clear_repair_state()
-        return turn.build_llm_response(result, db_model_main)
+        response = turn.build_llm_response(result, db_model_main)
+        if cache_slot is not None:
+            await _store_service_answer(turn, cache_slot, run_deps, result, response)
+        return response
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class _AnswerCacheSlot:
+    bucket: str
+    embedding: list[float]
+
+
+async def _answer_cache_slot(
+    turn: _Turn,
+    policy_decision: VerifiedAnswerDecisionT,
+    run_deps: SalesDepsT,
+) -> _AnswerCacheSlot | None:
+    """Where this service turn's answer is looked up and stored, if anywhere."""
+
+    if not settings.answer_cache_enabled or turn.redis is None:
+        return None
+    bucket = answer_cache_bucket(
+        language=str(run_deps.conversation.language),
+        stage=str(run_deps.conversation.sales_stage),
+        is_first_turn=turn.is_first_turn,
+        decision=policy_decision,
+        faq_context=run_deps.faq_context or [],
+        behavior_rule_ids=(
+            str(rule.get("id")) for rule in run_deps.behavior_rules or ()
+        ),
+        runtime_directives=run_deps.runtime_directives,
+    )
+    if bucket is None:
+        return None
+    try:
+        embedding = await turn.embedding_engine.embed_async(turn.masked_text)
+    except Exception:
+        logger.warning("Answer cache could not embed the question", exc_info=True)
+        return None
+    return _AnswerCacheSlot(bucket=bucket, embedding=embedding)
+
+
+async def _cached_service_answer(
+    turn: _Turn,
+    slot: _AnswerCacheSlot,
+    run_deps: SalesDepsT,
+    db_model_main: str,
+) -> LLMResponseT | None:
+    """A stored answer to a near-identical question, rendered for this turn."""
+
+    text = await lookup_cached_answer(
+        turn.redis,
+        slot.bucket,
+        slot.embedding,
+        min_similarity=settings.answer_cache_min_similarity,
+    )
+    if text is None:
+        await record_answer_cache_event(turn.redis, "miss")
+        return None
+    model_name = f"{db_model_main}|answer-cache"
+    rendered = turn.render_reply(
+        text, response_deps=run_deps, provenance="model", model_name=model_name
+    )
+    if rendered.flags:
+        # The reply policy would send this one to the repair judge; a fresh
+        # model answer is cheaper than a judge call on a replay.
+        await record_answer_cache_event(turn.redis, "rejected")
+        return None
+    await record_answer_cache_event(turn.redis, "hit")
+    return _response_from_rendered_reply(
+        rendered,
+        tokens_in=0,
+        tokens_out=0,
+        cost=None,
+        model=model_name,
+        usage_provenance="deterministic_static",
+    )
+
+
+async def _store_service_answer(
+    turn: _Turn,
+    slot: _AnswerCacheSlot,
+    run_deps: SalesDepsT,
+    result: Any,
+    response: LLMResponseT,
+) -> None:
+    if (
+        run_deps.executed_tool_names
+        or response.repair_flags
+        or response.deferred_product_media
+    ):
+        return
+    quote_details = engine._quote_customer_details_from_metadata(turn.conv)
+    private_values = (
+        turn.conv.customer_name,
+        turn.conv.phone,
+        *(turn.crm_context or {}).values(),
+        *quote_details.values(),
+    )
+    if not is_shareable_answer(
+        result.output,
+        faq_context=run_deps.faq_context or [],
+        private_values=(value for value in private_values if isinstance(value, str)),
+    ):
+        return
+    await store_cached_answer(
+        turn.redis,
+        slot.bucket,
+        slot.embedding,
+        result.output,
+        ttl_seconds=settings.answer_cache_ttl_seconds,
+    )
+    await record_answer_cache_event(turn.redis, "store")
+
+
 async def _verified_catalog_plan_route(
     turn: _Turn,
     *,
@@ -2159,7 +2285,7 @@ async def _capture_details_and_name_gate_routes(
         # not on a message that is about something other than furniture, where a
         # price list only contradicts the answer that follows it.
         anchor = (
-            await catalog_anchor(turn.db, str(turn.conv.language))
+            await catalog_anchor(turn.db, str(turn.conv.language), turn.redis)
             if opening_wants_a_price_anchor(turn.combined_text)
             else None
         )
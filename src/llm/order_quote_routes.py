@@ -13,10 +13,11 @@ from pydantic_ai import RunContext
 
 from src.core.config import settings
 from src.llm.order_handoff import is_high_confidence_first_turn_order
+from src.llm.paths import PATH_CORE_CHAT
 from src.llm.response_policy import (
     last_assistant_asked_quote_customer_details as _last_assistant_asked_quote_customer_details,
 )
-from src.llm.safety import PATH_CORE_CHAT, model_name_for_path
+from src.llm.safety import model_name_for_path
 from src.llm.verified_answers import is_quote_or_proposal_request
 from src.services.runtime_execution_evidence import build_runtime_tool_trace
 
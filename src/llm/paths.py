@@ -0,0 +1,18 @@
+"""Names of the LLM call paths recorded on `llm_attempts` rows.
+
+Kept apart from `src.llm.safety`, which imports pydantic-ai and the OpenAI
+SDK, so reporting code can filter attempts by path without loading either.
+"""
+
+PATH_CORE_CHAT = "core_chat"
+PATH_CORE_FOLLOWUP = "core_followup"
+PATH_QUALITY_FINAL = "quality_final"
+PATH_QUALITY_RED_FLAGS = "quality_red_flags"
+PATH_QUALITY_MANAGER = "quality_manager"
+PATH_CONVERSATION_SUMMARY = "conversation_summary"
+PATH_FACT_EXTRACTION = "fact_extraction"
+PATH_VOICE_TRANSCRIPTION = "voice_transcription"
+PATH_RESPONSE_ADAPTER = "response_adapter"
+PATH_RESPONSE_REPAIR_JUDGE = "response_repair_judge"
+PATH_AUTO_FAQ_TRANSLATE = "auto_faq_translate"
+PATH_AUTO_FAQ_CANDIDATE = "auto_faq_candidate"
@@ -1,4 +1,6 @@
+import hashlib
 import logging
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from sqlalchemy import select
@@ -6,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.llm.communication_policy import (
     COMMUNICATION_RULES_POLICY,
-    finalize_evidence_grounding_prompt,
+    EVIDENCE_GROUNDING_POLICY,
 )
 from src.models.system_prompt import SystemPrompt
 from src.schemas.common import Language, SalesStage
@@ -234,20 +236,20 @@ async def get_system_prompt_component(
     return val
 
 
-async def build_system_prompt(
-    db: AsyncSession,
-    redis: Any,
-    stage: str | SalesStage,
-    language: str | Language,
-) -> str:
+def prompt_prefix_version(prefix: str) -> str:
+    """Short content hash that names one revision of the static prompt prefix."""
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:12]
+
+
+_logged_prefix_versions: set[str] = set()
+
+
+async def build_static_prompt_prefix(db: AsyncSession, redis: Any) -> str:
     """
-    Assembles the complete system prompt for the current conversation stage and language.
-    Fetches base_prompt and stage_rules dynamically from DB.
+    Assembles the turn-independent head of the sales prompt: base prompt, then
+    the communication policy. Nothing per conversation or per turn goes here,
+    so the provider can serve it from its prompt cache across every turn.
     """
-    stage_val = stage.value if isinstance(stage, SalesStage) else stage
-    language_val = language.value if isinstance(language, Language) else language
-
-    # Fetch Base Prompt
     base_prompt = await get_system_prompt_component(
         db, redis, "base_prompt", BASE_SYSTEM_PROMPT
     )
@@ -257,6 +259,34 @@ async def build_system_prompt(
         "communication_rules_policy",
         COMMUNICATION_RULES_POLICY,
     )
+    # The grounding policy belongs to the prompt tail only.
+    parts = [
+        part.replace(EVIDENCE_GROUNDING_POLICY, "").strip()
+        for part in (base_prompt, communication_policy)
+    ]
+    prefix = "\n\n".join(part for part in parts if part)
+
+    version = prompt_prefix_version(prefix)
+    if version not in _logged_prefix_versions:
+        _logged_prefix_versions.add(version)
+        logger.info(
+            "Sales prompt static prefix version=%s chars=%d", version, len(prefix)
+        )
+    return prefix
+
+
+async def build_stage_prompt(
+    db: AsyncSession,
+    redis: Any,
+    stage: str | SalesStage,
+    language: str | Language,
+) -> str:
+    """
+    Assembles the conversation-dependent rules that follow the static prefix:
+    the language directive and the rule of the current stage.
+    """
+    stage_val = stage.value if isinstance(stage, SalesStage) else stage
+    language_val = language.value if isinstance(language, Language) else language
 
     language_name = customer_language_name(language_val)
     lang_directive = LANGUAGE_DIRECTIVE.format(language=language_name)
@@ -267,13 +297,32 @@ async def build_system_prompt(
         db, redis, f"stage_{stage_val}", default_stage_rule
     )
 
-    parts = [
-        base_prompt.strip(),
-        communication_policy.strip(),
-        lang_directive.strip(),
-        stage_rule.strip(),
-    ]
+    parts = [lang_directive.strip(), stage_rule.strip()]
+    return "\n\n".join(part for part in parts if part)
 
-    return finalize_evidence_grounding_prompt(
-        "\n\n".join(part for part in parts if part)
-    )
+
+def format_faq_context_prompt(
+    faq_context: Sequence[Mapping[str, str]], tool_mode: str
+) -> str:
+    """Render the knowledge-base entries retrieved for this turn."""
+    faq_block = "[KNOWLEDGE BASE (FAQ)]\n"
+    for item in faq_context:
+        faq_block += f"Q: {item['title']}\nA: {item['content']}\n---\n"
+    faq_block += "Use the above FAQ entries when answering. "
+    if tool_mode == "order_handoff":
+        faq_block += (
+            "If the answer is NOT in the FAQ, do NOT make up information. "
+            "This run is restricted to order handoff handling, so do not rely on FAQ context to continue product discovery.\n"
+        )
+    elif tool_mode == "service_policy":
+        faq_block += (
+            "If the answer is NOT in the FAQ, do NOT make up information. "
+            "This run is restricted to verified service-answer handling, so answer only from confirmed FAQ facts and do not continue product discovery.\n"
+        )
+    else:
+        faq_block += (
+            "If the answer is NOT in the FAQ, do NOT make up information. "
+            "WARNING: If the user asks for specific products or catalog items (e.g. chairs, tables), "
+            "you MUST call the `search_products` tool. Do not rely solely on the FAQ for products because the tool fetches live images!\n"
+        )
+    return faq_block
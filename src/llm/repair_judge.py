@@ -13,11 +13,10 @@ import httpx
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 from pydantic_ai import Agent, UnexpectedModelBehavior
 from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 
-from src.core.config import settings
 from src.llm.grounding_output import grounding_violation_rule
 from src.llm.opening_guard import is_own_opening_plus_question
+from src.llm.paths import PATH_RESPONSE_REPAIR_JUDGE
 from src.llm.pii import mask_pii, unmask_pii
 from src.llm.response_policy import (
     AskKind,
@@ -27,10 +26,10 @@ from src.llm.response_policy import (
     render_reply,
 )
 from src.llm.safety import (
-    PATH_RESPONSE_REPAIR_JUDGE,
     OpenRouterTelemetryChatModel,
     get_llm_usage_telemetry,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.services.customer_language import is_arabic_customer_language
@@ -559,7 +558,7 @@ def _request_payload(request: RepairJudgeRequest) -> str:
 
 @cache
 def _repair_judge_agent() -> Agent[None, RepairJudgeDecision]:
-    provider = OpenRouterProvider(api_key=settings.openrouter_api_key)
+    provider = openrouter_provider()
     model = OpenRouterTelemetryChatModel(
         REPAIR_JUDGE_MODEL,
         provider=provider,
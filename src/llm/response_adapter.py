@@ -14,16 +14,15 @@ from typing import cast
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 
 from src.core.config import settings
 from src.llm.money import PRICE_SIGNAL_CURRENCY_PATTERN
+from src.llm.paths import PATH_AUTO_FAQ_CANDIDATE, PATH_RESPONSE_ADAPTER
 from src.llm.safety import (
-    PATH_AUTO_FAQ_CANDIDATE,
-    PATH_RESPONSE_ADAPTER,
     LLMBudgetBlocked,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.services.auto_faq_types import AutoFAQCandidate
@@ -99,7 +98,7 @@ class ManagerReplyWithAutoFAQResult(BaseModel):
 
 adapter_model = OpenAIChatModel(
     ADAPTER_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(
         PATH_RESPONSE_ADAPTER,
         model_name=ADAPTER_MODEL_NAME,
@@ -118,7 +117,7 @@ response_adapter_agent: Agent[None, str] = Agent(
 
 auto_faq_manager_reply_model = OpenAIChatModel(
     AUTO_FAQ_CANDIDATE_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(
         PATH_AUTO_FAQ_CANDIDATE,
         model_name=AUTO_FAQ_CANDIDATE_MODEL_NAME,
@@ -138,7 +137,7 @@ auto_faq_manager_reply_agent: Agent[None, ManagerReplyWithAutoFAQResult] = Agent
 
 auto_faq_manager_reply_fallback_model = OpenAIChatModel(
     AUTO_FAQ_CANDIDATE_FALLBACK_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(
         PATH_AUTO_FAQ_CANDIDATE,
         model_name=AUTO_FAQ_CANDIDATE_FALLBACK_MODEL_NAME,
@@ -25,25 +25,28 @@ from pydantic_ai.models.openai import (
     OpenAIChatModel,
     OpenAIChatModelSettings,
 )
+from pydantic_ai.providers.openrouter import OpenRouterProvider
 
 from src.core.config import settings
+from src.llm.paths import (
+    PATH_AUTO_FAQ_CANDIDATE,
+    PATH_AUTO_FAQ_TRANSLATE,
+    PATH_CONVERSATION_SUMMARY,
+    PATH_CORE_CHAT,
+    PATH_CORE_FOLLOWUP,
+    PATH_FACT_EXTRACTION,
+    PATH_QUALITY_FINAL,
+    PATH_QUALITY_MANAGER,
+    PATH_QUALITY_RED_FLAGS,
+    PATH_RESPONSE_ADAPTER,
+    PATH_RESPONSE_REPAIR_JUDGE,
+    PATH_VOICE_TRANSCRIPTION,
+)
 
 logger = logging.getLogger(__name__)
 
 LLMScope = Literal["core", "non_core"]
 
-PATH_CORE_CHAT = "core_chat"
-PATH_CORE_FOLLOWUP = "core_followup"
-PATH_QUALITY_FINAL = "quality_final"
-PATH_QUALITY_RED_FLAGS = "quality_red_flags"
-PATH_QUALITY_MANAGER = "quality_manager"
-PATH_CONVERSATION_SUMMARY = "conversation_summary"
-PATH_FACT_EXTRACTION = "fact_extraction"
-PATH_VOICE_TRANSCRIPTION = "voice_transcription"
-PATH_RESPONSE_ADAPTER = "response_adapter"
-PATH_RESPONSE_REPAIR_JUDGE = "response_repair_judge"
-PATH_AUTO_FAQ_TRANSLATE = "auto_faq_translate"
-PATH_AUTO_FAQ_CANDIDATE = "auto_faq_candidate"
 OPENROUTER_PROVIDER_NAME = "openrouter"
 LLM_USAGE_TELEMETRY_ATTR = "__treejar_llm_usage_telemetry__"
 _OPENROUTER_CACHE_CONTROL_SUPPORTED_MODEL_PREFIXES = ("anthropic/",)
@@ -70,6 +73,22 @@ class OpenRouterCompletionError(ModelAPIError):
     """Terminal in-band OpenRouter error after provider-boundary handling."""
 
 
+def openrouter_provider() -> OpenRouterProvider:
+    """Return an OpenRouter provider that calls ``settings.openrouter_base_url``.
+
+    pydantic-ai pins the public OpenRouter URL. Any other base URL, e.g. a
+    proxy or the fake endpoint of ``scripts/replay_load_test.py``, is applied
+    to the provider's client.
+    """
+    provider = OpenRouterProvider(api_key=settings.openrouter_api_key)
+    base_url = settings.openrouter_base_url.rstrip("/")
+    if base_url == provider.base_url:
+        return provider
+    return OpenRouterProvider(
+        openai_client=provider.client.with_options(base_url=base_url)
+    )
+
+
 class OpenRouterTelemetryChatModel(OpenAIChatModel):
     """Preserve OpenRouter's provider-reported cost on the model response."""
 
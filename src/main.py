@@ -12,6 +12,7 @@ from src.api.admin.dashboard_redirect_admin import DashboardRedirectAdmin
 from src.api.v1.admin import require_admin_session
 from src.core.config import settings
 from src.core.database import async_session_factory, engine
+from src.core.queues import deserialize_job_payload, serialize_job_payload
 from src.core.redis import redis_client
 from src.core.safe_logging import install_sensitive_url_filter
 from src.integrations.notifications.telegram_webhook import sync_telegram_webhook
@@ -23,7 +24,11 @@ from src.services.telegram_admin_login import consume_telegram_admin_login_token
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
     install_sensitive_url_filter()
-    app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+    app.state.arq_pool = await create_pool(
+        RedisSettings.from_dsn(settings.redis_url),
+        job_serializer=serialize_job_payload,
+        job_deserializer=deserialize_job_payload,
+    )
     app.state.redis = redis_client
     await sync_telegram_webhook()
     yield
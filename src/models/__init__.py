@@ -18,8 +18,10 @@ from src.models.message import Message
 from src.models.metrics_snapshot import MetricsSnapshot
 from src.models.outbound_message import OutboundMessageAudit
 from src.models.product import Product
+from src.models.product_neighbor import ProductNeighbor
 from src.models.quality_review import QualityReview
 from src.models.referral import Referral
+from src.models.scheduled_action import ScheduledAction
 from src.models.system_config import SystemConfig
 from src.models.system_prompt import SystemPrompt
 
@@ -42,8 +44,10 @@ __all__ = [
     "MetricsSnapshot",
     "OutboundMessageAudit",
     "Product",
+    "ProductNeighbor",
     "QualityReview",
     "Referral",
+    "ScheduledAction",
     "SystemConfig",
     "SystemPrompt",
 ]
@@ -14,7 +14,7 @@ class AdminActionAudit(UUIDMixin, Base):
 
     __tablename__ = "admin_action_audits"
     __table_args__ = (
-        Index("ix_admin_action_audits_created_at", "created_at"),
+        Index("ix_admin_action_audits_created_at_id", "created_at", "id"),
         Index("ix_admin_action_audits_action", "action"),
         Index("ix_admin_action_audits_entity", "entity_type", "entity_id"),
     )
@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, DateTime, Numeric, String
+from sqlalchemy import DateTime, Index, Numeric, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin, UUIDMixin
@@ -21,6 +22,8 @@ class Conversation(UUIDMixin, TimestampMixin, Base):
     """A WhatsApp conversation with a customer."""
 
     __tablename__ = "conversations"
+    # Keyset order of the conversation and customer lists (src.core.pagination).
+    __table_args__ = (Index("ix_conversations_updated_at_id", "updated_at", "id"),)
 
     phone: Mapped[str] = mapped_column(String, index=True)
     customer_name: Mapped[str | None] = mapped_column(String, default=None)
@@ -35,8 +38,9 @@ class Conversation(UUIDMixin, TimestampMixin, Base):
     deal_delivered_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), default=None
     )
+    # Written back as a per-key diff at commit (src.services.turn_state).
     metadata_: Mapped[dict[str, Any] | None] = mapped_column(
-        "metadata", JSON, nullable=True, default=None
+        "metadata", JSONB, nullable=True, default=None
     )
 
     # Relationships
@@ -3,8 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, DateTime, String, Text, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, Index, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, column_property, mapped_column
 
 from src.models.base import Base, UUIDMixin
 
@@ -15,6 +15,7 @@ class KnowledgeBase(UUIDMixin, Base):
     __tablename__ = "knowledge_base"
     __table_args__ = (
         UniqueConstraint("source", "title", name="uq_knowledge_base_source_title"),
+        Index("ix_knowledge_base_created_at_id", "created_at", "id"),
     )
 
     source: Mapped[str] = mapped_column(String)
@@ -22,9 +23,19 @@ class KnowledgeBase(UUIDMixin, Base):
     content: Mapped[str] = mapped_column(Text)
     language: Mapped[str] = mapped_column(String, default="en")
     category: Mapped[str | None] = mapped_column(String, default=None)
+    # Deferred like `Product.embedding`; `has_embedding` answers the admin
+    # question without loading the vector.
     embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(1024), nullable=True, default=None
+        Vector(1024),
+        nullable=True,
+        default=None,
+        deferred=True,
+        deferred_raiseload=True,
     )
+    has_embedding: Mapped[bool] = column_property(embedding.is_not(None))
+    # SHA-256 of the content `embedding` was built from. An entry whose
+    # content no longer matches is pending re-embedding by the reindex job.
+    embedding_hash: Mapped[str | None] = mapped_column(String(64), default=None)
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(),
     )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import JSON, Numeric, String, Text
+from sqlalchemy import JSON, Index, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base, TimestampMixin, UUIDMixin
@@ -13,6 +13,14 @@ class KnowledgeBaseCandidate(UUIDMixin, TimestampMixin, Base):
     """Pending auto-FAQ candidate awaiting admin approval or rejection."""
 
     __tablename__ = "knowledge_base_candidates"
+    __table_args__ = (
+        Index(
+            "ix_knowledge_base_candidates_status_created_at_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+    )
 
     question: Mapped[str] = mapped_column(Text, nullable=False)
     answer: Mapped[str] = mapped_column(Text, nullable=False)
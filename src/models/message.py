@@ -25,6 +25,12 @@ class Message(UUIDMixin, Base):
             unique=True,
             postgresql_where=text("wazzup_message_id IS NOT NULL"),
         ),
+        Index(
+            "ix_messages_user_conversation_id_created_at",
+            "conversation_id",
+            "created_at",
+            postgresql_where=text("role = 'user'"),
+        ),
     )
 
     conversation_id: Mapped[uuid.UUID] = mapped_column(
@@ -4,8 +4,9 @@ from datetime import datetime
 from typing import Any
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, Boolean, Integer, Numeric, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import JSON, Boolean, Index, Integer, Numeric, String, Text, text
+from sqlalchemy.orm import Mapped, load_only, mapped_column
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from src.models.base import Base, TimestampMixin, UUIDMixin
 
@@ -14,6 +15,15 @@ class Product(UUIDMixin, TimestampMixin, Base):
     """A product from the Treejar catalog."""
 
     __tablename__ = "products"
+    # Keyset order of the public product list (src.core.pagination).
+    __table_args__ = (
+        Index(
+            "ix_products_active_updated_at_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     sku: Mapped[str] = mapped_column(String, unique=True, index=True)
     # unique=True on nullable is fine in PostgreSQL (NULLs are distinct)
@@ -29,8 +39,52 @@ class Product(UUIDMixin, TimestampMixin, Base):
     stock: Mapped[int] = mapped_column(Integer, default=0)
     image_url: Mapped[str | None] = mapped_column(String, default=None)
     attributes: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
+    # Deferred: only vector search and the embedding jobs need the 1024 floats.
+    # Reading it from a row loaded without ``undefer`` raises instead of
+    # issuing a second query.
     embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(1024), nullable=True, default=None
+        Vector(1024),
+        nullable=True,
+        default=None,
+        deferred=True,
+        deferred_raiseload=True,
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     synced_at: Mapped[datetime | None] = mapped_column(default=None)
+    # SHA-256 of the customer-facing catalog fields and of the embedding input
+    # text. The catalog sync skips rows whose content hash is unchanged and only
+    # resets the embedding when the embedding hash moves.
+    content_hash: Mapped[str | None] = mapped_column(String(64), default=None)
+    embedding_hash: Mapped[str | None] = mapped_column(String(64), default=None)
+
+
+# Slim read projections: ``select(Product).options(product_card())`` loads what
+# a product card or tool reply shows, ``product_pricing()`` what a quote line
+# needs. Unlisted attributes raise on access rather than lazy-loading. These
+# are built per call because constructing a loader option configures mappers.
+def product_card() -> LoaderOption:
+    return load_only(
+        Product.sku,
+        Product.name_en,
+        Product.name_ar,
+        Product.category,
+        Product.subcategory,
+        Product.price,
+        Product.currency,
+        Product.stock,
+        Product.image_url,
+        Product.is_active,
+        raiseload=True,
+    )
+
+
+def product_pricing() -> LoaderOption:
+    return load_only(
+        Product.sku,
+        Product.name_en,
+        Product.price,
+        Product.currency,
+        Product.stock,
+        Product.is_active,
+        raiseload=True,
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+PRODUCT_NEIGHBOR_RELATIONS = ("similar", "cross_sell")
+
+
+class ProductNeighbor(Base):
+    """A precomputed recommendation edge from one product to another.
+
+    ``similar`` rows are the top-k cosine neighbours of the product's
+    embedding; ``cross_sell`` rows are the configured complementary picks
+    for its category. ``rank`` orders a product's rows of one relation from 1.
+    """
+
+    __tablename__ = "product_neighbors"
+    __table_args__ = (Index("ix_product_neighbors_neighbor_id", "neighbor_id"),)
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    relation_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    neighbor_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+    )
+    # Cosine similarity for ``similar`` rows; NULL for ``cross_sell``.
+    score: Mapped[float | None] = mapped_column(Float, default=None)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base, TimestampMixin, UUIDMixin
+
+SCHEDULED_ACTION_OPEN_STATES = ("pending", "claimed")
+
+
+class ScheduledAction(UUIDMixin, TimestampMixin, Base):
+    """The next time a cron job has work to do for one conversation.
+
+    One row per conversation and ``kind``. ``pending`` rows are claimed once
+    ``due_at`` passes; a claimed row goes back to ``pending`` with its next
+    due time, or to ``done`` when nothing is left to send.
+    """
+
+    __tablename__ = "scheduled_actions"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "conversation_id",
+            "kind",
+            name="uq_scheduled_actions_conversation_id_kind",
+        ),
+        Index(
+            "ix_scheduled_actions_kind_due_at",
+            "kind",
+            "due_at",
+            postgresql_where=text("state IN ('pending', 'claimed')"),
+        ),
+    )
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+    )
+    kind: Mapped[str] = mapped_column(String(40))
+    due_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    state: Mapped[str] = mapped_column(String(20), default="pending")
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        default=None,
+    )
@@ -13,7 +13,6 @@ from sqlalchemy import select
 
 from src.core.database import async_session_factory
 from src.core.redis import get_redis_client
-from src.llm.safety import PATH_QUALITY_FINAL, is_glm5_model_name, model_name_for_path
 from src.models.system_config import SystemConfig
 
 logger = logging.getLogger(__name__)
@@ -67,7 +66,14 @@ class AIQualityRetryPolicyUpdate(BaseModel):
     )
 
 
+# `src.llm.safety` loads pydantic-ai and the OpenAI SDK; the admin API reads
+# this config without ever calling a model, so it is imported on use.
+
+
 def _default_qa_model() -> str:
+    from src.llm.paths import PATH_QUALITY_FINAL
+    from src.llm.safety import model_name_for_path
+
     return model_name_for_path(PATH_QUALITY_FINAL)
 
 
@@ -101,6 +107,8 @@ def _model_variant(model_name: str) -> str:
 
 def is_expensive_qa_model(model_name: str) -> bool:
     """True when a QA model costs enough to warrant an explicit admin override."""
+    from src.llm.safety import is_glm5_model_name
+
     if not is_glm5_model_name(model_name):
         return False
     return _model_variant(model_name) not in _AFFORDABLE_QA_MODEL_VARIANTS
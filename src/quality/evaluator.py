@@ -12,12 +12,10 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from src.core.config import settings
 from src.dialogue.claim_contract import (
     PROJECT_QUANTITY_THRESHOLD,
     defers_the_decision,
@@ -31,13 +29,13 @@ from src.dialogue.order_state import (
     quote_workflow_from_metadata,
 )
 from src.dialogue.state import DialogueState
+from src.llm.paths import PATH_QUALITY_FINAL, PATH_QUALITY_RED_FLAGS
 from src.llm.safety import (
-    PATH_QUALITY_FINAL,
-    PATH_QUALITY_RED_FLAGS,
     attach_llm_usage_telemetry,
     extract_llm_usage_telemetry,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.models.conversation import Conversation
@@ -63,7 +61,7 @@ from src.services.runtime_execution_evidence import (
 
 logger = logging.getLogger(__name__)
 
-_provider = OpenRouterProvider(api_key=settings.openrouter_api_key)
+_provider = openrouter_provider()
 _FINAL_MODEL_NAME = model_name_for_path(PATH_QUALITY_FINAL)
 _RED_FLAG_MODEL_NAME = model_name_for_path(PATH_QUALITY_RED_FLAGS)
 
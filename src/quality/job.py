@@ -13,7 +13,7 @@ from typing import Any, cast
 
 from sqlalchemy import select
 
-from src.core.database import async_session_factory
+from src.core.database import async_session_factory, profile_job_queries
 from src.core.redis import get_redis_client
 from src.integrations.crm.zoho_crm import ZohoCRMClient
 from src.llm.attempts import (
@@ -25,11 +25,8 @@ from src.llm.attempts import (
     record_llm_attempt_success,
     release_llm_attempt_lock,
 )
-from src.llm.safety import (
-    PATH_QUALITY_FINAL,
-    PATH_QUALITY_RED_FLAGS,
-    llm_usage_attempt_kwargs,
-)
+from src.llm.paths import PATH_QUALITY_FINAL, PATH_QUALITY_RED_FLAGS
+from src.llm.safety import llm_usage_attempt_kwargs
 from src.models.llm_attempt import LLMAttempt
 from src.quality.config import (
     AIQualityScope,
@@ -546,6 +543,7 @@ async def evaluate_recent_conversations_quality(ctx: dict[str, Any]) -> None:
     await evaluate_mature_conversations_quality(ctx)
 
 
+@profile_job_queries
 async def evaluate_realtime_red_flags(ctx: dict[str, Any]) -> None:
     """ARQ job: send compact realtime warnings only for critical red flags."""
     gate = await get_ai_quality_run_gate_from_ctx(
@@ -724,6 +722,7 @@ async def evaluate_realtime_red_flags(ctx: dict[str, Any]) -> None:
     )
 
 
+@profile_job_queries
 async def evaluate_mature_conversations_quality(ctx: dict[str, Any]) -> None:
     """ARQ job: persist and send owner-facing final reviews for mature dialogues."""
     gate = await get_ai_quality_run_gate_from_ctx(
@@ -17,17 +17,16 @@ from uuid import UUID
 
 from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import settings
+from src.llm.paths import PATH_QUALITY_MANAGER
 from src.llm.safety import (
-    PATH_QUALITY_MANAGER,
     attach_llm_usage_telemetry,
     extract_llm_usage_telemetry,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.models.conversation import Conversation
@@ -47,7 +46,7 @@ from src.quality.transcript_context import (
 )
 
 logger = logging.getLogger(__name__)
-_provider = OpenRouterProvider(api_key=settings.openrouter_api_key)
+_provider = openrouter_provider()
 _MANAGER_MODEL_NAME = model_name_for_path(PATH_QUALITY_MANAGER)
 
 # ---------------------------------------------------------------------------
@@ -18,7 +18,7 @@ from typing import Any, cast
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
-from src.core.database import async_session_factory
+from src.core.database import async_session_factory, profile_job_queries
 from src.core.redis import get_redis_client
 from src.llm.attempts import (
     LLMAttemptLease,
@@ -29,7 +29,8 @@ from src.llm.attempts import (
     record_llm_attempt_success,
     release_llm_attempt_lock,
 )
-from src.llm.safety import PATH_QUALITY_MANAGER, llm_usage_attempt_kwargs
+from src.llm.paths import PATH_QUALITY_MANAGER
+from src.llm.safety import llm_usage_attempt_kwargs
 from src.models.escalation import Escalation
 from src.models.llm_attempt import LLMAttempt
 from src.models.message import Message
@@ -298,6 +299,7 @@ async def _load_escalation(db: Any, esc_id: Any) -> Any:
     return esc_result.scalar_one()
 
 
+@profile_job_queries
 async def evaluate_escalated_conversations(ctx: dict[str, Any]) -> None:
     """ARQ job: evaluate resolved escalations without a manager review.
 
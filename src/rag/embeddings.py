@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import threading
+from typing import TYPE_CHECKING
 
-from sentence_transformers import SentenceTransformer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +13,9 @@ from src.core.config import settings
 from src.models.knowledge_base import KnowledgeBase
 from src.models.product import Product
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +38,11 @@ class EmbeddingEngine:
         if self._model is None:
             with self._lock:
                 if self._model is None:
+                    # sentence_transformers pulls in torch and transformers,
+                    # seconds of imports that only a process which actually
+                    # embeds should pay, so it is imported here.
+                    from sentence_transformers import SentenceTransformer
+
                     logger.info(
                         "Loading embedding model %s...", settings.embedding_model
                     )
@@ -66,6 +75,25 @@ class EmbeddingEngine:
         await asyncio.to_thread(self._get_model)
 
 
+def product_embedding_text(
+    name_en: str,
+    category: str | None,
+    description_en: str | None,
+) -> str:
+    """Format the text a product is embedded from: "Name | Category | Description"."""
+    return f"{name_en} | {category or ''} | {description_en or ''}"
+
+
+def product_embedding_hash(
+    name_en: str,
+    category: str | None,
+    description_en: str | None,
+) -> str:
+    """SHA-256 of the product embedding text; equal hashes share an embedding."""
+    text = product_embedding_text(name_en, category, description_en)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 async def generate_product_embeddings(db: AsyncSession) -> int:
     """Generate embeddings for all active products that lack them.
 
@@ -93,13 +121,10 @@ async def generate_product_embeddings(db: AsyncSession) -> int:
     for i in range(0, len(products), batch_size):
         batch = products[i : i + batch_size]
 
-        # Format strings for embedding: "Name | Category | Description"
-        texts = []
-        for p in batch:
-            cat = p.category or ""
-            desc = p.description_en or ""
-            text = f"{p.name_en} | {cat} | {desc}"
-            texts.append(text)
+        texts = [
+            product_embedding_text(p.name_en, p.category, p.description_en)
+            for p in batch
+        ]
 
         embeddings = await engine.embed_batch_async(texts)
 
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.integrations.vector.base import VectorStore
 from src.models.knowledge_base import KnowledgeBase
-from src.models.product import Product
+from src.models.product import Product, product_card
 from src.rag.embeddings import EmbeddingEngine
 from src.schemas.product import ProductRead, ProductSearchQuery, ProductSearchResult
 
@@ -35,7 +35,11 @@ class PgVectorStore(VectorStore):
         functions for products and knowledge base below instead of relying heavily
         on this generic interface for complex queries.
         """
-        stmt = select(Product).where(Product.embedding.is_not(None))
+        stmt = (
+            select(Product)
+            .options(product_card())
+            .where(Product.embedding.is_not(None))
+        )
 
         # Apply filters
         if filters:
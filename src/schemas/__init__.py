@@ -31,6 +31,8 @@ from .admin import (
     AdminResetExecuteResponse,
     AdminResetPreviewRead,
     AdminTimelineMessage,
+    ChatLatencyPhaseRead,
+    ChatLatencyResponse,
     ClientSelfTestItem,
     ClientSelfTestStatus,
     ClientSelfTestSubmitRequest,
@@ -175,6 +177,8 @@ __all__ = [
     "AdminResetExecuteResponse",
     "AdminResetPreviewRead",
     "AdminTimelineMessage",
+    "ChatLatencyPhaseRead",
+    "ChatLatencyResponse",
     "ClientSelfTestItem",
     "ClientSelfTestStatus",
     "ClientSelfTestSubmitRequest",
@@ -158,6 +158,26 @@ class TimeseriesResponse(BaseModel):
     points: list[TimeseriesPoint] = []
 
 
+class ChatLatencyPhaseRead(BaseModel):
+    """Percentiles of one chat turn phase, merged across workers."""
+
+    phase: str
+    count: int = 0
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    slo_p95_ms: float | None = None
+    breached: bool = False
+
+
+class ChatLatencyResponse(BaseModel):
+    """Rolling-window chat latency for the dashboard SLO panel."""
+
+    window: str
+    generated_at: datetime
+    phases: list[ChatLatencyPhaseRead] = []
+
+
 class SettingsRead(BaseModel):
     bot_enabled: bool
     default_language: Language
@@ -457,6 +477,7 @@ class AdminKnowledgeBaseRead(UUIDModel):
     language: str
     category: str | None = None
     has_embedding: bool = False
+    embedding_pending: bool = False
     is_auto_generated: bool = False
     original_question: str | None = None
     manager_draft: str | None = None
@@ -482,6 +503,18 @@ class AdminKnowledgeBaseUpdate(BaseModel):
     category: str | None = Field(default=None, max_length=120)
 
 
+class AdminKnowledgeBaseReindexStatus(BaseModel):
+    status: str = "idle"
+    total: int = 0
+    scanned: int = 0
+    embedded: int = 0
+    unchanged: int = 0
+    pending: int = 0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
 class AdminKnowledgeBasePreview(BaseModel):
     embedding_ready: bool
     duplicate: bool
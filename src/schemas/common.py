@@ -78,6 +78,10 @@ class PaginatedResponse[T](BaseModel):
     page: int
     page_size: int
     pages: int
+    # Pass as `cursor` to read the next page without OFFSET; None on the last.
+    next_cursor: str | None = None
+    # Cursor pages stop counting at `CURSOR_COUNT_CAP`; `total` is then a floor.
+    total_is_estimate: bool = False
 
 
 class ErrorResponse(BaseModel):
@@ -53,4 +53,12 @@ class ProductSyncResponse(BaseModel):
     updated: int
     errors: int
     deactivated: int = 0
+    # Canonical catalog sync only: rows whose content hash matched the stored
+    # one and were not rewritten. They are included in ``synced``.
+    skipped: int = 0
     embeddings_generated: int = 0
+    # Canonical catalog sync only: "completed", "continued" when the run hit its
+    # time budget and re-enqueued itself from a checkpoint, or "skipped" when
+    # another run held the sync lock.
+    status: str | None = None
+    stages: dict[str, dict[str, float]] = Field(default_factory=dict)
@@ -4,17 +4,16 @@ import asyncio
 import logging
 import math
 import uuid
-from collections import OrderedDict
 from datetime import UTC, date, datetime, time
 from decimal import Decimal
 from typing import Any
 
 from fastapi import HTTPException
-from pydantic_ai import UnexpectedModelBehavior
 from sqlalchemy import String, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
+from src.core.pagination import count_total, keyset_page, split_page
 from src.models.admin_action_audit import AdminActionAudit
 from src.models.conversation import Conversation
 from src.models.escalation import Escalation
@@ -28,7 +27,6 @@ from src.quality.config import (
     evaluate_ai_quality_run_gate,
     get_ai_quality_controls_config,
 )
-from src.quality.evaluator import evaluate_conversation
 from src.quality.service import conversation_already_reviewed, save_review
 from src.schemas.admin import (
     AdminActionAuditRead,
@@ -270,6 +268,7 @@ async def list_admin_customers(
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     search: str | None = None,
     status: str | None = None,
     stage: str | None = None,
@@ -291,29 +290,43 @@ async def list_admin_customers(
         date_to=date_to,
         segment=segment,
     )
-    stmt = select(Conversation).order_by(
-        Conversation.updated_at.desc(),
-        Conversation.created_at.desc(),
-    )
-    if filters:
-        stmt = stmt.where(*filters)
-
-    result = await db.execute(stmt)
-    conversations = list(result.scalars().all())
-    latest_by_phone: OrderedDict[str, Conversation] = OrderedDict()
-    counts_by_phone: dict[str, int] = {}
-    for conversation in conversations:
-        counts_by_phone[conversation.phone] = (
-            counts_by_phone.get(conversation.phone, 0) + 1
+    # One row per phone: its latest conversation and how many it has.
+    ranked = (
+        select(
+            Conversation.id,
+            func.row_number()
+            .over(
+                partition_by=Conversation.phone,
+                order_by=(Conversation.updated_at.desc(), Conversation.id.desc()),
+            )
+            .label("position"),
+            func.count()
+            .over(partition_by=Conversation.phone)
+            .label("conversation_count"),
         )
-        latest_by_phone.setdefault(conversation.phone, conversation)
-
-    all_latest = list(latest_by_phone.values())
-    total = len(all_latest)
-    start = (page - 1) * page_size
-    paged = all_latest[start : start + page_size]
+        .where(*filters)
+        .subquery()
+    )
+    total, total_is_estimate = await count_total(
+        db, select(ranked.c.id).where(ranked.c.position == 1), cursor=cursor
+    )
+    item_stmt = keyset_page(
+        select(Conversation, ranked.c.conversation_count)
+        .join(ranked, ranked.c.id == Conversation.id)
+        .where(ranked.c.position == 1),
+        Conversation.updated_at,
+        Conversation.id,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+    )
+    rows, next_cursor = split_page(
+        (await db.execute(item_stmt)).all(),
+        page_size,
+        lambda row: (row[0].updated_at, row[0].id),
+    )
     items: list[AdminCustomerListItem] = []
-    for conversation in paged:
+    for conversation, conversation_count in rows:
         metadata = _metadata(conversation)
         _, last_message_at, last_message_preview = await _message_summary(
             db,
@@ -326,7 +339,7 @@ async def list_admin_customers(
                 latest_conversation_id=conversation.id,
                 latest_message_at=last_message_at,
                 latest_message_preview=last_message_preview,
-                conversation_count=counts_by_phone[conversation.phone],
+                conversation_count=conversation_count,
                 status=conversation.status,
                 sales_stage=conversation.sales_stage,
                 language=conversation.language,
@@ -345,6 +358,8 @@ async def list_admin_customers(
         page=page,
         page_size=page_size,
         pages=_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -353,6 +368,7 @@ async def list_admin_conversations(
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     search: str | None = None,
     phone: str | None = None,
     status: str | None = None,
@@ -378,21 +394,24 @@ async def list_admin_conversations(
     if phone:
         filters.append(Conversation.phone == phone)
 
-    count_stmt = select(func.count()).select_from(Conversation)
-    item_stmt = select(Conversation).order_by(
-        Conversation.updated_at.desc(),
-        Conversation.created_at.desc(),
+    total, total_is_estimate = await count_total(
+        db, select(Conversation.id).where(*filters), cursor=cursor
     )
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-        item_stmt = item_stmt.where(*filters)
-
-    total_result = await db.execute(count_stmt)
-    total = int(total_result.scalar_one())
     item_result = await db.execute(
-        item_stmt.offset((page - 1) * page_size).limit(page_size)
+        keyset_page(
+            select(Conversation).where(*filters),
+            Conversation.updated_at,
+            Conversation.id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    )
+    conversations, next_cursor = split_page(
+        item_result.scalars().all(),
+        page_size,
+        lambda row: (row.updated_at, row.id),
     )
-    conversations = list(item_result.scalars().all())
 
     return PaginatedResponse(
         items=[
@@ -403,6 +422,8 @@ async def list_admin_conversations(
         page=page,
         page_size=page_size,
         pages=_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -672,6 +693,10 @@ async def run_admin_bot_quality_review(
     conversation_id: uuid.UUID,
     request: object | None,
 ) -> AdminActionResult:
+    from pydantic_ai import UnexpectedModelBehavior
+
+    from src.quality.evaluator import evaluate_conversation
+
     await require_admin_ai_quality_manual_gate(db, AIQualityScope.BOT_QA)
     if await conversation_already_reviewed(db, conversation_id):
         raise HTTPException(status_code=409, detail="Conversation already reviewed")
@@ -771,6 +796,7 @@ async def list_admin_audit(
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     action: str | None = None,
     entity_type: str | None = None,
     entity_id: str | None = None,
@@ -791,25 +817,31 @@ async def list_admin_audit(
     if end is not None:
         filters.append(AdminActionAudit.created_at <= end.replace(tzinfo=UTC))
 
-    count_stmt = select(func.count()).select_from(AdminActionAudit)
-    item_stmt = select(AdminActionAudit).order_by(AdminActionAudit.created_at.desc())
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-        item_stmt = item_stmt.where(*filters)
-
-    total_result = await db.execute(count_stmt)
-    total = int(total_result.scalar_one())
+    total, total_is_estimate = await count_total(
+        db, select(AdminActionAudit.id).where(*filters), cursor=cursor
+    )
     item_result = await db.execute(
-        item_stmt.offset((page - 1) * page_size).limit(page_size)
+        keyset_page(
+            select(AdminActionAudit).where(*filters),
+            AdminActionAudit.created_at,
+            AdminActionAudit.id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    )
+    rows, next_cursor = split_page(
+        item_result.scalars().all(),
+        page_size,
+        lambda row: (row.created_at, row.id),
     )
-    items = [
-        AdminActionAuditRead.model_validate(row) for row in item_result.scalars().all()
-    ]
 
     return PaginatedResponse(
-        items=items,
+        items=[AdminActionAuditRead.model_validate(row) for row in rows],
         total=total,
         page=page,
         page_size=page_size,
         pages=_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
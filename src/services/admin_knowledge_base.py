@@ -8,10 +8,12 @@ from typing import Any
 
 from fastapi import HTTPException
 from sqlalchemy import func, or_, select
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
+from src.core.pagination import count_total, keyset_page, split_page
 from src.models.knowledge_base import KnowledgeBase
 from src.models.knowledge_base_candidate import KnowledgeBaseCandidate
 from src.rag.embeddings import EmbeddingEngine
@@ -22,16 +24,16 @@ from src.schemas.admin import (
     AdminKnowledgeBaseCandidateReject,
     AdminKnowledgeBasePreview,
     AdminKnowledgeBaseRead,
+    AdminKnowledgeBaseReindexStatus,
     AdminKnowledgeBaseUpdate,
     AdminKnowledgeBaseWrite,
 )
 from src.schemas.common import PaginatedResponse
 from src.services.admin_audit import log_admin_action
-from src.services.auto_faq import (
-    DUPLICATE_THRESHOLD,
-    _detect_context_specific_reasons,
-    _detect_unsafe_reasons,
-    _nearest_duplicate_similarity,
+from src.services.knowledge_base_index import (
+    embedding_pending_clause,
+    get_kb_reindex_progress,
+    is_embedding_pending,
 )
 
 
@@ -57,6 +59,14 @@ def _float(value: object | None) -> float | None:
     return None
 
 
+def _has_embedding(entry: KnowledgeBase) -> bool:
+    # The vector itself is deferred: a freshly assigned one is authoritative,
+    # otherwise the loaded `has_embedding` flag answers without reading it.
+    if "embedding" not in sa_inspect(entry).unloaded:
+        return entry.embedding is not None
+    return bool(entry.has_embedding)
+
+
 def _kb_snapshot(entry: KnowledgeBase) -> dict[str, Any]:
     return {
         "source": entry.source,
@@ -64,7 +74,7 @@ def _kb_snapshot(entry: KnowledgeBase) -> dict[str, Any]:
         "content": entry.content,
         "language": entry.language,
         "category": entry.category,
-        "has_embedding": entry.embedding is not None,
+        "has_embedding": _has_embedding(entry),
         "deleted_at": entry.deleted_at.isoformat() if entry.deleted_at else None,
         "deleted_by": entry.deleted_by,
     }
@@ -78,7 +88,8 @@ def _kb_read(entry: KnowledgeBase) -> AdminKnowledgeBaseRead:
         content=entry.content,
         language=entry.language,
         category=entry.category,
-        has_embedding=entry.embedding is not None,
+        has_embedding=_has_embedding(entry),
+        embedding_pending=is_embedding_pending(entry),
         is_auto_generated=bool(entry.is_auto_generated),
         original_question=entry.original_question,
         manager_draft=entry.manager_draft,
@@ -147,6 +158,7 @@ async def list_admin_kb_entries(
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     search: str | None = None,
     source: str | None = None,
     category: str | None = None,
@@ -172,23 +184,32 @@ async def list_admin_kb_entries(
     if language:
         filters.append(KnowledgeBase.language == language)
 
-    count_stmt = select(func.count()).select_from(KnowledgeBase)
-    item_stmt = select(KnowledgeBase).order_by(KnowledgeBase.created_at.desc())
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-        item_stmt = item_stmt.where(*filters)
-
-    total_result = await db.execute(count_stmt)
-    total = int(total_result.scalar_one())
+    total, total_is_estimate = await count_total(
+        db, select(KnowledgeBase.id).where(*filters), cursor=cursor
+    )
     item_result = await db.execute(
-        item_stmt.offset((page - 1) * page_size).limit(page_size)
+        keyset_page(
+            select(KnowledgeBase).where(*filters),
+            KnowledgeBase.created_at,
+            KnowledgeBase.id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    )
+    entries, next_cursor = split_page(
+        item_result.scalars().all(),
+        page_size,
+        lambda row: (row.created_at, row.id),
     )
     return PaginatedResponse(
-        items=[_kb_read(entry) for entry in item_result.scalars().all()],
+        items=[_kb_read(entry) for entry in entries],
         total=total,
         page=page,
         page_size=page_size,
         pages=_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -206,6 +227,14 @@ async def preview_admin_kb_entry(
     db: AsyncSession,
     body: AdminKnowledgeBaseWrite | AdminKnowledgeBaseUpdate,
 ) -> AdminKnowledgeBasePreview:
+    # auto_faq builds its translation agent at import; only previews need it.
+    from src.services.auto_faq import (
+        DUPLICATE_THRESHOLD,
+        _detect_context_specific_reasons,
+        _detect_unsafe_reasons,
+        _nearest_duplicate_similarity,
+    )
+
     content = body.content or ""
     unsafe_reasons = list(_detect_unsafe_reasons(body.title or "", content))
     context_reasons = list(_detect_context_specific_reasons(body.title or "", content))
@@ -237,7 +266,6 @@ async def create_admin_kb_entry(
         content=body.content,
         language=body.language.value,
         category=body.category,
-        embedding=await EmbeddingEngine().embed_async(body.content),
         is_auto_generated=False,
         updated_at=now,
     )
@@ -276,8 +304,6 @@ async def update_admin_kb_entry(
         if key == "language" and value is not None:
             value = value.value
         setattr(entry, key, value)
-    if "content" in update_data:
-        entry.embedding = await EmbeddingEngine().embed_async(entry.content)
     entry.updated_at = _now()
 
     await log_admin_action(
@@ -334,7 +360,7 @@ async def reindex_admin_kb_entry(
         raise HTTPException(status_code=404, detail="Knowledge-base entry not found")
 
     before = _kb_snapshot(entry)
-    entry.embedding = await EmbeddingEngine().embed_async(entry.content)
+    entry.embedding_hash = None
     entry.updated_at = _now()
     await log_admin_action(
         db,
@@ -353,38 +379,52 @@ async def reindex_admin_kb_entry(
 async def reindex_admin_kb_entries(
     db: AsyncSession,
     *,
+    force: bool,
     request: object | None,
 ) -> AdminActionResult:
-    result = await db.execute(
-        select(KnowledgeBase)
-        .where(KnowledgeBase.deleted_at.is_(None))
-        .order_by(KnowledgeBase.created_at.asc())
+    """Audit a reindex request; the caller queues the background job."""
+    total = int(
+        (
+            await db.execute(
+                select(func.count()).where(KnowledgeBase.deleted_at.is_(None))
+            )
+        ).scalar_one_or_none()
+        or 0
     )
-    entries = list(result.scalars().all())
-    if not entries:
+    if not total:
         return AdminActionResult(ok=True, status="noop", detail="No entries to reindex")
 
-    embeddings = await EmbeddingEngine().embed_batch_async(
-        [entry.content for entry in entries]
-    )
-    now = _now()
-    for entry, embedding in zip(entries, embeddings, strict=False):
-        entry.embedding = embedding
-        entry.updated_at = now
-
     await log_admin_action(
         db,
         action="knowledge_base.reindex_all",
         entity_type="knowledge_base",
         before=None,
-        after={"processed_count": len(entries)},
+        after={"entry_count": total, "force": force},
         request=request,
     )
     await db.commit()
     return AdminActionResult(
         ok=True,
-        status="processed",
-        detail=f"Reindexed {len(entries)} entries",
+        status="queued",
+        detail=f"Reindex of {total} entries queued",
+    )
+
+
+async def get_admin_kb_reindex_status(
+    db: AsyncSession,
+    redis: Any,
+) -> AdminKnowledgeBaseReindexStatus:
+    progress = await get_kb_reindex_progress(redis)
+    pending = await db.execute(
+        select(func.count()).where(
+            KnowledgeBase.deleted_at.is_(None), embedding_pending_clause()
+        )
+    )
+    return AdminKnowledgeBaseReindexStatus.model_validate(
+        {
+            **{key: value for key, value in progress.items() if value != ""},
+            "pending": int(pending.scalar_one_or_none() or 0),
+        }
     )
 
 
@@ -393,31 +433,39 @@ async def list_admin_kb_candidates(
     *,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     status: str | None = "needs_confirmation",
 ) -> PaginatedResponse[AdminKnowledgeBaseCandidate]:
     filters: list[ColumnElement[bool]] = []
     if status:
         filters.append(KnowledgeBaseCandidate.status == status)
 
-    count_stmt = select(func.count()).select_from(KnowledgeBaseCandidate)
-    item_stmt = select(KnowledgeBaseCandidate).order_by(
-        KnowledgeBaseCandidate.created_at.desc()
+    total, total_is_estimate = await count_total(
+        db, select(KnowledgeBaseCandidate.id).where(*filters), cursor=cursor
     )
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-        item_stmt = item_stmt.where(*filters)
-
-    total_result = await db.execute(count_stmt)
-    total = int(total_result.scalar_one())
     item_result = await db.execute(
-        item_stmt.offset((page - 1) * page_size).limit(page_size)
+        keyset_page(
+            select(KnowledgeBaseCandidate).where(*filters),
+            KnowledgeBaseCandidate.created_at,
+            KnowledgeBaseCandidate.id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    )
+    candidates, next_cursor = split_page(
+        item_result.scalars().all(),
+        page_size,
+        lambda row: (row.created_at, row.id),
     )
     return PaginatedResponse(
-        items=[_candidate_read(row) for row in item_result.scalars().all()],
+        items=[_candidate_read(row) for row in candidates],
         total=total,
         page=page,
         page_size=page_size,
         pages=_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -500,7 +548,6 @@ async def approve_admin_kb_candidate(
         content=content,
         language=candidate.language,
         category="faq",
-        embedding=await EmbeddingEngine().embed_async(content),
         is_auto_generated=True,
         original_question=candidate.original_question or candidate.question,
         manager_draft=candidate.manager_draft,
@@ -16,15 +16,14 @@ from typing import Any, Literal
 
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import settings
+from src.llm.paths import PATH_AUTO_FAQ_TRANSLATE
 from src.llm.safety import (
-    PATH_AUTO_FAQ_TRANSLATE,
     model_name_for_path,
     model_settings_for_path,
+    openrouter_provider,
     run_agent_with_safety,
 )
 from src.models.knowledge_base import KnowledgeBase
@@ -94,7 +93,7 @@ If the text is already in English, return it unchanged."""
 
 _translate_model = OpenAIChatModel(
     AUTO_FAQ_TRANSLATE_MODEL_NAME,
-    provider=OpenRouterProvider(api_key=settings.openrouter_api_key),
+    provider=openrouter_provider(),
     settings=model_settings_for_path(
         PATH_AUTO_FAQ_TRANSLATE,
         model_name=AUTO_FAQ_TRANSLATE_MODEL_NAME,
@@ -0,0 +1,129 @@
+"""Values derived from the whole catalog, built once per catalog version.
+
+Some reads depend on every priced row -- the opening price floors, for
+example -- and scanning the catalog for them on each turn is wasteful, while
+keeping them in process memory forever leaves prices stale until a restart.
+A catalog sync that changed rows queues `refresh_catalog_artifacts`, which
+builds every artefact from the database, bumps ``catalog:version`` and stores
+the artefacts in Redis under the new version.
+
+Readers go through `load_catalog_artifact`: one ``GET`` of the version, then
+the decoded value from process memory while the version is unchanged. A
+reader that finds no artefact for the current version (Redis was flushed, or
+the refresh is still running) builds it from the database and publishes it
+for the other workers. Without Redis it builds from the database every time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "catalog:version"
+# Long enough that a catalog without syncs keeps its artefacts for days; a
+# reader rebuilds an expired one on demand.
+_ARTIFACT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+type ArtifactBuilder = Callable[[AsyncSession], Awaitable[dict[str, Any]]]
+
+_loaded: dict[str, tuple[str, dict[str, Any]]] = {}
+
+
+def catalog_artifact_key(name: str, version: str) -> str:
+    return f"catalog:artifact:{name}:{version}"
+
+
+def _version_text(raw: object) -> str | None:
+    if isinstance(raw, bytes):
+        return raw.decode()
+    if isinstance(raw, str | int):
+        return str(raw)
+    return None
+
+
+async def current_catalog_version(redis: Any) -> str | None:
+    """The published catalog version, ``"0"`` before the first refresh.
+
+    ``None`` means Redis cannot say, and the caller must not cache.
+    """
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(CATALOG_VERSION_KEY)
+    except Exception:
+        logger.warning("Could not read the catalog version", exc_info=True)
+        return None
+    return "0" if raw is None else _version_text(raw)
+
+
+async def load_catalog_artifact(
+    name: str,
+    db: AsyncSession,
+    redis: Any,
+    build: ArtifactBuilder,
+) -> dict[str, Any]:
+    """Return artefact ``name`` for the current catalog version."""
+    version = await current_catalog_version(redis)
+    if version is None:
+        return await build(db)
+    loaded = _loaded.get(name)
+    if loaded is not None and loaded[0] == version:
+        return loaded[1]
+
+    key = catalog_artifact_key(name, version)
+    value: dict[str, Any] | None = None
+    try:
+        raw = await redis.get(key)
+        if isinstance(raw, str | bytes):
+            value = json.loads(raw)
+    except Exception:
+        logger.warning("Could not read catalog artefact %s", key, exc_info=True)
+    if value is None:
+        value = await build(db)
+        try:
+            await redis.set(key, json.dumps(value), ex=_ARTIFACT_TTL_SECONDS, nx=True)
+        except Exception:
+            logger.warning("Could not store catalog artefact %s", key, exc_info=True)
+    _loaded[name] = (version, value)
+    return value
+
+
+async def publish_catalog_artifacts(
+    db: AsyncSession,
+    redis: Any,
+    builders: Mapping[str, ArtifactBuilder],
+) -> str:
+    """Build every artefact and publish them under a new catalog version."""
+    values = {name: await build(db) for name, build in builders.items()}
+    version = str(await redis.incr(CATALOG_VERSION_KEY))
+    for name, value in values.items():
+        await redis.set(
+            catalog_artifact_key(name, version),
+            json.dumps(value),
+            ex=_ARTIFACT_TTL_SECONDS,
+        )
+    return version
+
+
+async def refresh_catalog_artifacts(ctx: dict[str, Any]) -> dict[str, Any]:
+    """ARQ job: rebuild the catalog artefacts after a catalog sync."""
+    from src.llm.catalog_planning import CATALOG_ARTIFACT_BUILDERS
+
+    async with async_session_factory() as session:
+        version = await publish_catalog_artifacts(
+            session, ctx["redis"], CATALOG_ARTIFACT_BUILDERS
+        )
+    logger.info(
+        "Catalog artefacts published. Version: %s, Artefacts: %s",
+        version,
+        ", ".join(CATALOG_ARTIFACT_BUILDERS),
+    )
+    return {"version": version, "artifacts": list(CATALOG_ARTIFACT_BUILDERS)}
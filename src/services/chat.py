@@ -6,22 +6,28 @@ import json
 import logging
 import re
 import secrets
+import uuid
 from collections.abc import Mapping, Sequence
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 from arq import Retry
-from pydantic import ValidationError
 from sqlalchemy import func, select
 
 from src.core.config import settings
-from src.core.database import async_session_factory
+from src.core.database import (
+    async_session_factory,
+    current_query_stats,
+    log_query_budget,
+    track_queries,
+)
+from src.core.queues import enqueue_routed_job
 from src.integrations.crm.zoho_crm import ZohoCRMClient
 from src.integrations.inventory.zoho_inventory import ZohoInventoryClient
-from src.integrations.messaging.wazzup import WazzupProvider
+from src.integrations.messaging.wazzup import MediaTooLargeError, WazzupProvider
 from src.integrations.zoho_oauth import ZohoOAuthError
 from src.llm.conversation_summary import should_enqueue_conversation_summary_refresh
 from src.llm.engine import ProductMediaPayload, process_message
@@ -38,7 +44,7 @@ from src.schemas.webhook import WazzupIncomingMessage
 from src.services.chat_latency import (
     CHAT_LATENCY_EVENT,
     ChatLatencyTrace,
-    format_chat_latency,
+    format_chat_latency_snapshot,
 )
 from src.services.customer_identity import (
     apply_source_attribution_metadata,
@@ -50,21 +56,27 @@ from src.services.escalation_state import (
     should_send_escalation_fallback,
 )
 from src.services.inbound_batch import (
+    decode_inbound_message,
     inbound_chat_reference,
     inbound_execution_key,
     inbound_lock_key,
+    inbound_message_text,
     inbound_processing_key,
     inbound_queue_key,
     is_inbound_chat_reference,
 )
 from src.services.inbound_channels import update_conversation_inbound_channel
+from src.services.latency_slo import chat_latency_recorder
 from src.services.outbound_audit import (
     deterministic_crm_message_id,
     send_wazzup_media_with_audit,
     send_wazzup_text_with_audit,
 )
 from src.services.proposal_followup import record_customer_reply
-from src.services.public_media import build_signed_product_image_url
+from src.services.public_media import (
+    build_signed_product_image_url,
+    cache_product_image,
+)
 from src.services.runtime_execution_evidence import (
     record_runtime_turn_evidence,
     snapshot_runtime_inventory,
@@ -73,6 +85,8 @@ from src.services.runtime_monitoring import (
     INBOUND_BATCH_FAILURES_KEY,
     ZOHO_OAUTH_FAILURES_KEY,
 )
+from src.services.turn_profiler import sample_turn_profile
+from src.services.turn_state import TurnStateBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +100,8 @@ INBOUND_EXECUTION_STARTED = "started"
 INBOUND_EXECUTION_COMPLETED = "completed"
 _INBOUND_BATCH_FAILURE_HISTORY_LIMIT = 1000
 _ZOHO_OAUTH_FAILURE_HISTORY_LIMIT = 1000
+# Zoho image downloads run at once when a reply carries product media.
+_PRODUCT_MEDIA_PREFETCH_CONCURRENCY = 4
 _RELEASE_INBOUND_LOCK_SCRIPT = """
 if redis.call("get", KEYS[1]) == ARGV[1] then
     return redis.call("del", KEYS[1])
@@ -103,6 +119,20 @@ end
 redis.call("del", KEYS[1])
 return 0
 """
+# Returns an interrupted batch as-is, otherwise renames the whole queue onto the
+# processing list. RENAME is O(1) and atomic, so webhook RPUSHes land either in
+# this batch or in a fresh queue list, and nothing is read twice.
+_CLAIM_INBOUND_MESSAGES_SCRIPT = """
+local existing = redis.call("lrange", KEYS[2], 0, -1)
+if #existing > 0 then
+    return existing
+end
+if redis.call("exists", KEYS[1]) == 0 then
+    return {}
+end
+redis.call("rename", KEYS[1], KEYS[2])
+return redis.call("lrange", KEYS[2], 0, -1)
+"""
 _FINALIZE_INBOUND_BATCH_SCRIPT = """
 redis.call("del", KEYS[1])
 return redis.call("expire", KEYS[2], ARGV[1])
@@ -215,10 +245,10 @@ def _record_voice_transcription_audit(
     conversation.metadata_ = metadata
 
 
-def _inbound_batch_id(raw_messages: Sequence[str]) -> str:
+def _inbound_batch_id(raw_messages: Sequence[bytes]) -> str:
     digest = hashlib.sha256()
     for raw_message in raw_messages:
-        digest.update(raw_message.encode("utf-8"))
+        digest.update(raw_message)
         digest.update(b"\x1e")
     return digest.hexdigest()[:24]
 
@@ -312,13 +342,13 @@ async def _store_inbound_quarantine(
     redis: Any,
     *,
     batch_id: str,
-    raw_messages: Sequence[str],
+    raw_messages: Sequence[bytes],
 ) -> str:
     quarantine_key = f"{INBOUND_BATCH_QUARANTINE_PREFIX}{batch_id}"
     quarantine_payload = json.dumps(
         {
             "batch_id": batch_id,
-            "raw_messages": list(raw_messages),
+            "raw_messages": [inbound_message_text(raw) for raw in raw_messages],
         },
         sort_keys=True,
         separators=(",", ":"),
@@ -337,8 +367,8 @@ async def _store_inbound_quarantine(
     return quarantine_key
 
 
-def _decode_redis_message(raw: str | bytes) -> str:
-    return raw if isinstance(raw, str) else raw.decode()
+def _redis_message_bytes(raw: str | bytes) -> bytes:
+    return raw.encode() if isinstance(raw, str) else raw
 
 
 async def _claim_inbound_messages(
@@ -346,19 +376,18 @@ async def _claim_inbound_messages(
     *,
     queue_key: str,
     processing_key: str,
-) -> list[str]:
-    """Recover an interrupted batch and atomically move newly queued messages."""
-    existing = await redis.lrange(processing_key, 0, -1)
-    raw_messages = [_decode_redis_message(raw) for raw in existing]
-    if raw_messages:
-        return raw_messages
+) -> list[bytes]:
+    """Recover an interrupted batch or atomically move every queued message.
 
-    while True:
-        raw = await redis.lmove(queue_key, processing_key, "LEFT", "RIGHT")
-        if raw is None:
-            break
-        raw_messages.append(_decode_redis_message(raw))
-    return raw_messages
+    One script call replaces the former LRANGE plus one LMOVE per message.
+    """
+    claimed = await redis.eval(
+        _CLAIM_INBOUND_MESSAGES_SCRIPT,
+        2,
+        queue_key,
+        processing_key,
+    )
+    return [_redis_message_bytes(raw) for raw in claimed or []]
 
 
 async def _release_inbound_lock(
@@ -588,7 +617,9 @@ async def _enqueue_summary_refresh_if_needed(
     has_summary = summary_result.scalar_one_or_none() is not None
 
     if should_enqueue_conversation_summary_refresh(total_messages, has_summary):
-        await redis.enqueue_job("refresh_conversation_summary", str(conversation_id))
+        await enqueue_routed_job(
+            redis, "refresh_conversation_summary", str(conversation_id)
+        )
 
 
 async def _handle_escalation_fallback(
@@ -688,6 +719,49 @@ async def _handle_escalation_fallback(
             )
 
 
+def _product_media_send_url(item: ProductMediaPayload) -> str:
+    if item.zoho_item_id and "zoho-image" not in item.url and "zoho" in item.url:
+        return build_signed_product_image_url(item.zoho_item_id)
+    return item.url
+
+
+async def _prefetch_product_images(
+    redis: Any,
+    media_items: Sequence[ProductMediaPayload],
+) -> None:
+    """Fetch the Zoho images of signed media URLs before the sends start.
+
+    Wazzup downloads each image from the public media route; with the bytes
+    already cached there, the ordered sends never wait on Zoho one by one.
+    """
+    item_ids = list(
+        dict.fromkeys(
+            item.zoho_item_id
+            for item in media_items
+            if item.zoho_item_id and _product_media_send_url(item) != item.url
+        )
+    )
+    if not item_ids:
+        return
+    semaphore = asyncio.Semaphore(_PRODUCT_MEDIA_PREFETCH_CONCURRENCY)
+
+    async def prefetch(inventory: ZohoInventoryClient, item_id: str) -> None:
+        async with semaphore:
+            try:
+                image = await inventory.get_item_image(item_id)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to prefetch product image: error_type=%s",
+                    type(exc).__name__,
+                )
+                return
+        if image is not None:
+            await cache_product_image(redis, item_id, *image)
+
+    async with ZohoInventoryClient(redis_client=redis) as inventory:
+        await asyncio.gather(*(prefetch(inventory, item_id) for item_id in item_ids))
+
+
 async def _send_deferred_product_media(
     db: Any,
     *,
@@ -698,17 +772,14 @@ async def _send_deferred_product_media(
     follow_up_suppressed: bool,
     media_items: Sequence[ProductMediaPayload],
 ) -> None:
-    """Send queued product images after the customer-facing text reply."""
+    """Send queued product images in display order; commit their audits once.
+
+    Each image runs in a savepoint, so an audit write that fails rolls back
+    only its own image and the audits of the others still commit.
+    """
     for item in media_items:
+        savepoint = await db.begin_nested()
         try:
-            send_url = item.url
-            if (
-                item.zoho_item_id
-                and "zoho-image" not in item.url
-                and "zoho" in item.url
-            ):
-                send_url = build_signed_product_image_url(item.zoho_item_id)
-
             await send_wazzup_media_with_audit(
                 db,
                 provider=provider,
@@ -727,7 +798,7 @@ async def _send_deferred_product_media(
                     item.product_key,
                     "caption",
                 ),
-                url=send_url,
+                url=_product_media_send_url(item),
                 caption=item.caption,
                 content=None,
                 content_type=None,
@@ -737,14 +808,89 @@ async def _send_deferred_product_media(
                     "follow_up_suppressed": follow_up_suppressed,
                 },
             )
-            await db.commit()
+            await savepoint.commit()
         except Exception as exc:
+            # A failed send commits its error audit, which closes the savepoint.
+            if db.in_nested_transaction():
+                await savepoint.rollback()
             logger.warning(
                 "Failed to send deferred product image: conversation_ref=%s "
                 "error_type=%s",
                 inbound_chat_reference(str(conversation_id)),
                 type(exc).__name__,
             )
+    await db.commit()
+
+
+async def _enqueue_deferred_product_media(
+    redis: Any,
+    *,
+    conversation_id: Any,
+    chat_id: str,
+    channel_id: str | None,
+    source_message_id: str | None,
+    follow_up_suppressed: bool,
+    media_items: Sequence[ProductMediaPayload],
+) -> bool:
+    """Hand a reply's product images to `deliver_product_media`."""
+    try:
+        await enqueue_routed_job(
+            redis,
+            "deliver_product_media",
+            str(conversation_id),
+            chat_id,
+            channel_id=channel_id,
+            source_message_id=source_message_id,
+            follow_up_suppressed=follow_up_suppressed,
+            media_items=[
+                {**asdict(item), "reference_tokens": list(item.reference_tokens)}
+                for item in media_items
+            ],
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to enqueue deferred product media; sending inline: error_type=%s",
+            type(exc).__name__,
+        )
+        return False
+    return True
+
+
+async def deliver_product_media(
+    ctx: dict[str, Any],
+    conversation_id: str,
+    chat_id: str,
+    *,
+    channel_id: str | None,
+    source_message_id: str | None,
+    follow_up_suppressed: bool,
+    media_items: list[dict[str, Any]],
+) -> None:
+    """ARQ job: send a reply's product images after its text reply went out."""
+    items = [
+        ProductMediaPayload(
+            url=str(item["url"]),
+            caption=str(item["caption"]),
+            product_key=str(item["product_key"]),
+            zoho_item_id=item.get("zoho_item_id"),
+            reference_tokens=tuple(item.get("reference_tokens") or ()),
+        )
+        for item in media_items
+    ]
+    await _prefetch_product_images(ctx["redis"], items)
+    async with (
+        async_session_factory() as db,
+        WazzupProvider(channel_id=channel_id) as provider,
+    ):
+        await _send_deferred_product_media(
+            db,
+            provider=provider,
+            conversation_id=uuid.UUID(conversation_id),
+            chat_id=chat_id,
+            source_message_id=source_message_id,
+            follow_up_suppressed=follow_up_suppressed,
+            media_items=items,
+        )
 
 
 def _provider_supports_typing_indicator(provider: Any) -> bool:
@@ -887,7 +1033,8 @@ async def process_incoming_batch(
                 elif execution_state == INBOUND_EXECUTION_STARTED:
                     raise InboundBatchTerminalError("uncertain_replay")
                 else:
-                    await _process_batch_inner(redis, queue_token, raw_messages)
+                    with track_queries(), sample_turn_profile():
+                        await _process_batch_inner(redis, queue_token, raw_messages)
                     await _mark_inbound_execution_completed(redis, batch_id)
             except Exception as exc:
                 failed_at = datetime.now(UTC)
@@ -999,10 +1146,26 @@ async def process_incoming_batch(
                 )
 
 
+async def _emit_chat_latency(
+    redis: Any,
+    trace: ChatLatencyTrace,
+    *,
+    status: str,
+) -> None:
+    """Log the turn's latency record and add it to the shared SLO histograms."""
+    snapshot = trace.snapshot(status=status)
+    logger.info("%s %s", CHAT_LATENCY_EVENT, format_chat_latency_snapshot(snapshot))
+    log_query_budget(
+        "chat turn", trace.query_stats, max_queries=settings.db_turn_query_budget
+    )
+    chat_latency_recorder.record(snapshot)
+    await chat_latency_recorder.maybe_flush(redis)
+
+
 async def _process_batch_inner(
     redis: Any,
     queue_token: str,
-    raw_messages: Sequence[str],
+    raw_messages: Sequence[bytes],
 ) -> None:
     """Inner implementation — separated for clean error handling."""
     batch_id = _inbound_batch_id(raw_messages)
@@ -1015,13 +1178,11 @@ async def _process_batch_inner(
         await _begin_inbound_side_effects(redis, batch_id)
         side_effects_started = True
 
-    latency_trace = ChatLatencyTrace()
+    latency_trace = ChatLatencyTrace(query_stats=current_query_stats())
     pre_llm_started = latency_trace.start_phase()
     try:
-        messages = [
-            WazzupIncomingMessage.model_validate_json(raw) for raw in raw_messages
-        ]
-    except ValidationError as exc:
+        messages = [decode_inbound_message(raw) for raw in raw_messages]
+    except ValueError as exc:  # pydantic's ValidationError included
         raise InboundBatchTerminalError("invalid_payload") from exc
     if not messages:
         raise InboundBatchTerminalError("empty_batch")
@@ -1115,7 +1276,8 @@ async def _process_batch_inner(
         from src.integrations.voice.voxtral import (
             MAX_AUDIO_SIZE,
             detect_audio_format,
-            transcribe_audio_with_metadata,
+            transcribe_voice_note,
+            voice_http_client,
         )
 
         async def _process_single_audio(
@@ -1137,15 +1299,20 @@ async def _process_batch_inner(
                     batch_ref,
                 )
 
-                audio_bytes = await wazzup_dl.download_media(
-                    audio_url, max_retries=2, client=shared_client
-                )
+                try:
+                    audio_bytes = await wazzup_dl.download_media(
+                        audio_url,
+                        max_retries=2,
+                        client=shared_client,
+                        max_bytes=MAX_AUDIO_SIZE,
+                    )
+                except MediaTooLargeError:
+                    audio_bytes = None
 
-                if len(audio_bytes) > MAX_AUDIO_SIZE:
+                if audio_bytes is None or len(audio_bytes) > MAX_AUDIO_SIZE:
                     logger.warning(
-                        "Audio too large: batch_ref=%s bytes=%d max_bytes=%d",
+                        "Audio too large: batch_ref=%s max_bytes=%d",
                         batch_ref,
-                        len(audio_bytes),
                         MAX_AUDIO_SIZE,
                     )
                     return (
@@ -1167,8 +1334,11 @@ async def _process_batch_inner(
                     mime_type=mime,
                 )
 
-                transcription = await transcribe_audio_with_metadata(
-                    audio_bytes, audio_format=audio_format, client=shared_client
+                transcription = await transcribe_voice_note(
+                    audio_bytes,
+                    audio_format=audio_format,
+                    redis=redis,
+                    client=shared_client,
                 )
                 if transcription.text:
                     logger.info(
@@ -1235,10 +1405,8 @@ async def _process_batch_inner(
                 )
 
         try:
-            async with (
-                WazzupProvider(channel_id=channel_id) as wazzup_dl,
-                httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as shared_client,
-            ):
+            async with WazzupProvider(channel_id=channel_id) as wazzup_dl:
+                shared_client = voice_http_client()
                 tasks = [
                     _process_single_audio(msg, wazzup_dl, shared_client)
                     for msg in audio_messages
@@ -1287,7 +1455,7 @@ async def _process_batch_inner(
         logger.warning("No text content in batch: batch_ref=%s", batch_ref)
         return
 
-    async with async_session_factory() as db:
+    async with async_session_factory() as db, TurnStateBuffer(db) as turn_state:
         # 0. Check if bot is enabled
         cfg_stmt = select(SystemConfig).where(SystemConfig.key == "bot_enabled")
         cfg_result = await db.execute(cfg_stmt)
@@ -1342,6 +1510,7 @@ async def _process_batch_inner(
             conv = Conversation(phone=chat_id)
             db.add(conv)
             await db.flush()
+        turn_state.track(conv)
 
         apply_source_attribution_metadata(
             conv,
@@ -1579,11 +1748,7 @@ async def _process_batch_inner(
                     )
                     latency_trace.mark_text_delivered()
                     await db.commit()
-                    logger.info(
-                        "%s %s",
-                        CHAT_LATENCY_EVENT,
-                        format_chat_latency(latency_trace, status="timeout"),
-                    )
+                    await _emit_chat_latency(redis, latency_trace, status="timeout")
                     return
                 latency_trace.finish_phase("llm", llm_started)
 
@@ -1669,24 +1834,30 @@ async def _process_batch_inner(
                 if bot_reply_sent and llm_response.deferred_product_media:
                     media_started = latency_trace.start_phase()
                     try:
-                        await _send_deferred_product_media(
-                            db,
-                            provider=wazzup_provider,
+                        if not await _enqueue_deferred_product_media(
+                            redis,
                             conversation_id=conv.id,
                             chat_id=chat_id,
+                            channel_id=channel_id,
                             source_message_id=source_message_id,
                             follow_up_suppressed=runtime_follow_up_suppressed,
                             media_items=llm_response.deferred_product_media,
-                        )
+                        ):
+                            await _send_deferred_product_media(
+                                db,
+                                provider=wazzup_provider,
+                                conversation_id=conv.id,
+                                chat_id=chat_id,
+                                source_message_id=source_message_id,
+                                follow_up_suppressed=runtime_follow_up_suppressed,
+                                media_items=llm_response.deferred_product_media,
+                            )
                     finally:
                         latency_trace.finish_phase("deferred_media", media_started)
                 if bot_reply_sent:
                     logger.info("Reply sent successfully: batch_ref=%s", batch_ref)
-                logger.info(
-                    "%s %s",
-                    CHAT_LATENCY_EVENT,
-                    format_chat_latency(
-                        latency_trace,
-                        status="sent" if bot_reply_sent else "send_failed",
-                    ),
+                await _emit_chat_latency(
+                    redis,
+                    latency_trace,
+                    status="sent" if bot_reply_sent else "send_failed",
                 )
@@ -7,7 +7,10 @@ import math
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from time import perf_counter
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.database import QueryStats
 
 CHAT_LATENCY_EVENT = "noor_chat_latency"
 CHAT_LATENCY_SCHEMA_VERSION = 1
@@ -44,6 +47,8 @@ _STATUSES = frozenset(
     }
 )
 _ROOT_FIELDS = frozenset({"event", "schema_version", "status", "latency_ms"})
+# Present only while SQL profiling is on; see `src.core.database.track_queries`.
+_OPTIONAL_ROOT_FIELDS = frozenset({"db"})
 
 
 def _milliseconds(seconds: float) -> float:
@@ -59,6 +64,7 @@ class ChatLatencyTrace:
     _phase_ms: dict[str, float] = field(default_factory=dict, init=False, repr=False)
     _queue_wait_ms: float | None = field(default=None, init=False, repr=False)
     _text_delivered_at: float | None = field(default=None, init=False, repr=False)
+    query_stats: QueryStats | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         self._started_at = self.clock()
@@ -95,21 +101,25 @@ class ChatLatencyTrace:
                 self._text_delivered_at - self._started_at
             )
         latency_ms["total"] = _milliseconds(finished_at - self._started_at)
-        return {
+        snapshot: dict[str, Any] = {
             "event": CHAT_LATENCY_EVENT,
             "schema_version": CHAT_LATENCY_SCHEMA_VERSION,
             "status": safe_status,
             "latency_ms": dict(sorted(latency_ms.items())),
         }
+        if self.query_stats is not None:
+            snapshot["db"] = self.query_stats.snapshot()
+        return snapshot
 
 
 def format_chat_latency(trace: ChatLatencyTrace, *, status: str) -> str:
     """Return a stable JSON payload suitable for a single structured log line."""
-    return json.dumps(
-        trace.snapshot(status=status),
-        sort_keys=True,
-        separators=(",", ":"),
-    )
+    return format_chat_latency_snapshot(trace.snapshot(status=status))
+
+
+def format_chat_latency_snapshot(snapshot: Mapping[str, Any]) -> str:
+    """Format an already-taken `ChatLatencyTrace.snapshot()` payload."""
+    return json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
 
 
 def parse_chat_latency_line(line: str) -> dict[str, Any] | None:
@@ -121,7 +131,9 @@ def parse_chat_latency_line(line: str) -> dict[str, Any] | None:
         payload = json.loads(line[payload_start:])
     except (json.JSONDecodeError, TypeError):
         return None
-    if not isinstance(payload, dict) or set(payload) != _ROOT_FIELDS:
+    if not isinstance(payload, dict) or not (
+        _ROOT_FIELDS <= set(payload) <= _ROOT_FIELDS | _OPTIONAL_ROOT_FIELDS
+    ):
         return None
     if (
         payload.get("event") != CHAT_LATENCY_EVENT
@@ -144,12 +156,32 @@ def parse_chat_latency_line(line: str) -> dict[str, Any] | None:
             return None
         normalized[phase] = round(numeric_value, 3)
 
-    return {
+    parsed: dict[str, Any] = {
         "event": CHAT_LATENCY_EVENT,
         "schema_version": CHAT_LATENCY_SCHEMA_VERSION,
         "status": payload["status"],
         "latency_ms": normalized,
     }
+    if "db" in payload:
+        db = _parse_db_stats(payload["db"])
+        if db is None:
+            return None
+        parsed["db"] = db
+    return parsed
+
+
+def _parse_db_stats(value: object) -> dict[str, float] | None:
+    """Keep the query count and DB time; statement text is not allowlisted."""
+    if not isinstance(value, dict):
+        return None
+    queries, time_ms = value.get("queries"), value.get("time_ms")
+    if isinstance(queries, bool) or not isinstance(queries, int) or queries < 0:
+        return None
+    if isinstance(time_ms, bool) or not isinstance(time_ms, int | float):
+        return None
+    if not math.isfinite(time_ms) or time_ms < 0:
+        return None
+    return {"queries": queries, "time_ms": round(float(time_ms), 3)}
 
 
 def _percentile(values: list[float], percentile: float) -> float:
@@ -189,12 +221,15 @@ def summarize_chat_latency(samples: Iterable[Mapping[str, Any]]) -> dict[str, An
 
     status_counts: dict[str, int] = {}
     phase_values: dict[str, list[float]] = {}
+    db_values: dict[str, list[float]] = {}
     for sample in valid_samples:
         status = str(sample["status"])
         status_counts[status] = status_counts.get(status, 0) + 1
         timings = sample["latency_ms"]
         for phase, value in timings.items():
             phase_values.setdefault(phase, []).append(float(value))
+        for metric, value in sample.get("db", {}).items():
+            db_values.setdefault(metric, []).append(float(value))
 
     candidate_phases = {
         phase: values
@@ -223,4 +258,8 @@ def summarize_chat_latency(samples: Iterable[Mapping[str, Any]]) -> dict[str, An
     summary["phase_ms"] = {
         phase: _metric(values) for phase, values in sorted(candidate_phases.items())
     }
+    if db_values:
+        summary["db"] = {
+            metric: _metric(values) for metric, values in sorted(db_values.items())
+        }
     return summary
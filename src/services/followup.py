@@ -10,7 +10,7 @@ from logfire import Logfire
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 from sqlalchemy import func, select
 
-from src.core.database import async_session_factory
+from src.core.database import async_session_factory, profile_job_queries
 from src.core.redis import get_redis_client
 from src.integrations.crm.zoho_crm import ZohoCRMClient
 from src.integrations.messaging.wazzup import WazzupProvider
@@ -28,6 +28,12 @@ from src.services.outbound_audit import (
     send_wazzup_template_with_audit,
     send_wazzup_text_with_audit,
 )
+from src.services.scheduled_actions import (
+    ScheduledActionKind,
+    claim_due_actions,
+    load_claimed_conversations,
+    reschedule_claimed_action,
+)
 
 logfire = Logfire()
 logger = logging.getLogger(__name__)
@@ -526,6 +532,47 @@ def _record_payment_state(
     conv.metadata_ = metadata
 
 
+def _open_approved_order_key(
+    conversation: Conversation,
+    metadata: Mapping[str, Any],
+) -> str:
+    """The approved order still awaiting payment, or ``""``."""
+    if _quotation_status(metadata) != "approved" or _has_stop_metadata(metadata):
+        return ""
+    if _lower_text(getattr(conversation, "status", None)) not in {"", "active"}:
+        return ""
+    if _lower_text(getattr(conversation, "deal_status", None)) in {
+        "delivered",
+        "paid",
+        "cancelled",
+        "canceled",
+    }:
+        return ""
+    return _order_key(metadata)
+
+
+def payment_reminder_due_at(conversation: Conversation) -> datetime.datetime | None:
+    """When the approved order's payment reminder is first worth checking.
+
+    The approval time, or ``None`` once the order is closed or a reminder for
+    it was sent. The run adds ``min_hours_after_approval`` on claiming it.
+    """
+    metadata = (
+        conversation.metadata_ if isinstance(conversation.metadata_, dict) else {}
+    )
+    order_key = _open_approved_order_key(conversation, metadata)
+    if not order_key:
+        return None
+    reminders = metadata.get("payment_reminders")
+    order_state = reminders.get(order_key) if isinstance(reminders, Mapping) else None
+    if isinstance(order_state, Mapping) and any(
+        isinstance(state, Mapping) and state.get("status") == "sent"
+        for state in order_state.values()
+    ):
+        return None
+    return _approval_at(conversation, metadata)
+
+
 def build_payment_reminder_candidate(
     conversation: Conversation,
     *,
@@ -541,27 +588,13 @@ def build_payment_reminder_candidate(
         conversation.metadata_ if isinstance(conversation.metadata_, dict) else {}
     )
 
-    if _lower_text(getattr(conversation, "status", None)) not in {"", "active"}:
-        return None
     if _lower_text(getattr(conversation, "escalation_status", None)) not in {
         "",
         "none",
         "resolved",
     }:
         return None
-    if _lower_text(getattr(conversation, "deal_status", None)) in {
-        "delivered",
-        "paid",
-        "cancelled",
-        "canceled",
-    }:
-        return None
-    if _has_stop_metadata(metadata):
-        return None
-    if _quotation_status(metadata) != "approved":
-        return None
-
-    order_key = _order_key(metadata)
+    order_key = _open_approved_order_key(conversation, metadata)
     if not order_key:
         return None
 
@@ -682,6 +715,16 @@ async def _count_payment_reminders_sent_today(
     return int(result.scalar() or 0)
 
 
+def _payment_reminder_next_due_at(
+    conversation: Conversation,
+    controls: PaymentReminderControlsConfig,
+) -> datetime.datetime | None:
+    approved_at = payment_reminder_due_at(conversation)
+    if approved_at is None:
+        return None
+    return approved_at + datetime.timedelta(hours=controls.min_hours_after_approval)
+
+
 async def _payment_reminder_candidate_rows(
     db: Any,
     *,
@@ -689,44 +732,31 @@ async def _payment_reminder_candidate_rows(
     now: datetime.datetime,
     limit: int,
 ) -> list[tuple[Conversation, datetime.datetime | None]]:
+    """Claim due payment reminder rows until ``limit`` of them can be sent.
+
+    Claimed conversations that turn out not to be candidates are released to
+    their next due time straight away.
+    """
     if limit <= 0:
         return []
 
-    last_customer_message = (
-        select(
-            Message.conversation_id.label("conversation_id"),
-            func.max(Message.created_at).label("last_customer_inbound_at"),
-        )
-        .where(Message.role == "user")
-        .group_by(Message.conversation_id)
-        .subquery()
-    )
-    page_size = max(limit * 5, 50)
     scan_cap = max(limit * 50, MIN_PAYMENT_REMINDER_SCAN_CAP)
-    offset = 0
     scanned_count = 0
     candidates: list[tuple[Conversation, datetime.datetime | None]] = []
 
     while len(candidates) < limit and scanned_count < scan_cap:
-        current_page_size = min(page_size, scan_cap - scanned_count)
-        stmt = (
-            select(Conversation, last_customer_message.c.last_customer_inbound_at)
-            .outerjoin(
-                last_customer_message,
-                last_customer_message.c.conversation_id == Conversation.id,
-            )
-            .where(Conversation.status == "active")
-            .where(Conversation.escalation_status.in_(("none", "resolved")))
-            .order_by(Conversation.updated_at.asc(), Conversation.id.asc())
-            .limit(current_page_size)
-            .offset(offset)
+        conversation_ids = await claim_due_actions(
+            db,
+            ScheduledActionKind.PAYMENT_REMINDER,
+            now=now,
+            limit=min(limit - len(candidates), scan_cap - scanned_count),
         )
-        result = await db.execute(stmt)
-        rows = [(row[0], row[1]) for row in result.all()]
-        if not rows:
+        if not conversation_ids:
             break
 
-        for conv, last_customer_inbound_at in rows:
+        for conv, last_customer_inbound_at in await load_claimed_conversations(
+            db, conversation_ids
+        ):
             scanned_count += 1
             if build_payment_reminder_candidate(
                 conv,
@@ -735,14 +765,15 @@ async def _payment_reminder_candidate_rows(
                 now=now,
             ):
                 candidates.append((conv, last_customer_inbound_at))
-                if len(candidates) >= limit:
-                    break
-
-        if len(candidates) >= limit or scanned_count >= scan_cap:
-            break
-        if len(rows) < current_page_size:
-            break
-        offset += len(rows)
+                continue
+            await reschedule_claimed_action(
+                db,
+                conv.id,
+                ScheduledActionKind.PAYMENT_REMINDER,
+                _payment_reminder_next_due_at(conv, controls),
+                now=now,
+            )
+        await db.commit()
 
     if scanned_count >= scan_cap and len(candidates) < limit:
         logger.warning(
@@ -758,6 +789,31 @@ async def _payment_reminder_candidate_rows(
     return candidates
 
 
+async def _release_payment_reminder(
+    db: Any,
+    conv: Conversation,
+    *,
+    controls: PaymentReminderControlsConfig,
+    now: datetime.datetime,
+) -> None:
+    try:
+        await reschedule_claimed_action(
+            db,
+            conv.id,
+            ScheduledActionKind.PAYMENT_REMINDER,
+            _payment_reminder_next_due_at(conv, controls),
+            now=now,
+        )
+        await db.commit()
+    except Exception:
+        # The claim lapses after CLAIM_LEASE and the row is due again.
+        await db.rollback()
+        logger.exception(
+            "Failed to reschedule payment reminder",
+            extra={"conversation_id": str(conv.id)},
+        )
+
+
 async def _process_payment_reminder_for_conversation(
     db: Any,
     conv: Conversation,
@@ -794,7 +850,7 @@ async def _process_payment_reminder_for_conversation(
         )
 
     created_provider = provider is None
-    messaging = provider or WazzupProvider()
+    messaging = provider or WazzupProvider(priority="bulk")
     try:
         last_customer_activity = last_customer_inbound_at or _conversation_datetime(
             conv.updated_at
@@ -916,7 +972,7 @@ async def _run_payment_reminders_with_db(
         return
 
     sent_count = 0
-    async with WazzupProvider() as provider:
+    async with WazzupProvider(priority="bulk") as provider:
         for conv, last_customer_inbound_at in rows:
             if sent_count >= max_attempts:
                 break
@@ -937,8 +993,10 @@ async def _run_payment_reminders_with_db(
                     conv_id=conv.id,
                     error=str(e),
                 )
+            await _release_payment_reminder(db, conv, controls=controls, now=now)
 
 
+@profile_job_queries
 async def run_payment_reminders(ctx: dict[str, Any]) -> None:
     """Cron/manual entrypoint for accepted payment reminder sends."""
     async with async_session_factory() as db:
@@ -955,6 +1013,7 @@ async def run_payment_reminders(ctx: dict[str, Any]) -> None:
         )
 
 
+@profile_job_queries
 async def run_automatic_followups(ctx: dict[str, Any]) -> None:
     """Cron job for safe reminder follow-ups.
 
@@ -990,7 +1049,7 @@ async def _process_followup_for_conversation(db: Any, conv: Conversation) -> Non
     redis = get_redis_client()
     engine = EmbeddingEngine()
     zoho_crm = ZohoCRMClient(redis)
-    messaging = WazzupProvider()
+    messaging = WazzupProvider(priority="bulk")
     zoho = None
 
     from src.integrations.inventory.zoho_inventory import ZohoInventoryClient
@@ -1004,13 +1063,10 @@ async def _process_followup_for_conversation(db: Any, conv: Conversation) -> Non
     from src.llm.catalog_planning import SalesDeps
     from src.llm.context import build_message_history
     from src.llm.engine import sales_agent
+    from src.llm.paths import PATH_CORE_FOLLOWUP
     from src.llm.pii import unmask_pii
-    from src.llm.safety import (
-        PATH_CORE_FOLLOWUP,
-        model_name_for_path,
-        run_agent_with_safety,
-    )
-    from src.models.message import Message, message_created_at_now
+    from src.llm.safety import model_name_for_path, run_agent_with_safety
+    from src.models.message import message_created_at_now
 
     # 1. Provide context
     pii_map: dict[str, str] = {}
@@ -1078,6 +1134,7 @@ async def _process_followup_for_conversation(db: Any, conv: Conversation) -> Non
     logfire.info(f"Follow-up sent successfully to {conv.phone}")
 
 
+@profile_job_queries
 async def run_feedback_requests(ctx: dict[str, Any]) -> None:
     """Cron job to send feedback requests to customers with delivered orders.
 
@@ -1154,7 +1211,7 @@ async def _send_feedback_request(
             "Could you share some feedback with us?"
         )
 
-    async with WazzupProvider() as messaging:
+    async with WazzupProvider(priority="bulk") as messaging:
         send_result = await send_wazzup_text_with_audit(
             db,
             provider=messaging,
@@ -1,12 +1,24 @@
-"""Privacy-safe identifiers for queued inbound message batches."""
+"""Privacy-safe identifiers and payloads for queued inbound message batches.
+
+A queued message used to be the full webhook message as JSON. With
+``settings.compact_queue_payloads`` enabled it is a versioned msgpack
+envelope instead: a version byte followed by a map of only the fields the
+batch worker reads, without the empty ones. `decode_inbound_message` reads
+both forms, so messages queued before the switch are still processed.
+"""
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import re
+from typing import Any
+
+import ormsgpack
 
 from src.core.config import settings
+from src.schemas.webhook import WazzupIncomingMessage
 
 _REFERENCE_PREFIX = "ib1_"
 _REFERENCE_RE = re.compile(r"^ib1_[0-9a-f]{24}$")
@@ -14,6 +26,23 @@ _QUEUE_PREFIX = "wazzup_msgs:"
 _PROCESSING_PREFIX = "wazzup:inbound:processing:"
 _LOCK_PREFIX = "wazzup:inbound:lock:"
 _EXECUTION_PREFIX = "wazzup:inbound:execution:"
+# A JSON message starts with "{", so the version byte tells the formats apart.
+_ENVELOPE_V1 = b"\x01"
+# The fields `_process_batch_inner` reads; everything else is dropped.
+_ENVELOPE_FIELDS: dict[str, Any] = {
+    "messageId": True,
+    "chatId": True,
+    "channelId": True,
+    "type": True,
+    "text": True,
+    "dateTime": True,
+    "timestamp": True,
+    "authorType": True,
+    "authorName": True,
+    "contentUri": True,
+    "media": {"url", "mimeType"},
+}
+_QUARANTINE_ENVELOPE_PREFIX = "msgpack-v1:"
 
 
 def inbound_chat_reference(chat_id: str) -> str:
@@ -49,3 +78,28 @@ def inbound_lock_key(batch_ref: str) -> str:
 def inbound_execution_key(batch_id: str) -> str:
     """Return the replay guard key for one immutable inbound batch."""
     return f"{_EXECUTION_PREFIX}{batch_id}"
+
+
+def encode_inbound_message(message: WazzupIncomingMessage) -> bytes:
+    """The queue payload of one accepted inbound message."""
+    if not settings.compact_queue_payloads:
+        return message.model_dump_json().encode()
+    fields = message.model_dump(include=_ENVELOPE_FIELDS, exclude_none=True)
+    return _ENVELOPE_V1 + ormsgpack.packb(fields)
+
+
+def decode_inbound_message(raw: bytes) -> WazzupIncomingMessage:
+    """Parse a queued message; raises ``ValueError`` if it is malformed."""
+    if raw[:1] != _ENVELOPE_V1:
+        return WazzupIncomingMessage.model_validate_json(raw)
+    fields = ormsgpack.unpackb(raw[1:])
+    if not isinstance(fields, dict):
+        raise ValueError("malformed inbound message envelope")
+    return WazzupIncomingMessage.model_validate(fields)
+
+
+def inbound_message_text(raw: bytes) -> str:
+    """A queued message as text, for the restricted quarantine record."""
+    if raw[:1] == _ENVELOPE_V1:
+        return _QUARANTINE_ENVELOPE_PREFIX + base64.b64encode(raw[1:]).decode()
+    return raw.decode("utf-8", errors="replace")
@@ -0,0 +1,146 @@
+"""Rolling per-function ARQ job outcome counters, merged across workers.
+
+Runtime monitoring used to count failed jobs with ARQ's ``all_job_results``,
+which SCANs the keyspace and unpickles every result kept for
+``keep_result`` -- most expensive exactly when the workers are busiest. Now
+every registered job and cron is wrapped by `record_job_stats`, which adds
+the job's outcome and duration to a per-minute Redis hash as it finishes:
+``<function>:succeeded|failed|retried`` counts, the summed ``duration_ms``
+and the ``max_ms``. A window is read back as the sum of its minute hashes in
+one script call, so its cost depends on the window and the number of job
+functions, not on how many results ARQ keeps.
+
+ARQ's own ``on_job_end`` hook only receives the job context, not the
+outcome, hence the wrapper. ``retried`` counts `arq.Retry`; a timeout,
+abort or shutdown cancellation counts as ``failed``, as ARQ reports it.
+Jobs rejected for exceeding ``max_tries`` never start and are not counted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from arq.worker import Retry
+
+from src.core.minute_counters import read_minute_window, record_minute_counters
+
+logger = logging.getLogger(__name__)
+
+JobOutcome = Literal["succeeded", "failed", "retried"]
+
+JOB_STATS_KEY_PREFIX = "arq_job_stats"
+_OUTCOMES: tuple[JobOutcome, ...] = ("succeeded", "failed", "retried")
+
+
+async def record_job_outcome(
+    redis: Any,
+    function: str,
+    outcome: JobOutcome,
+    duration_ms: float,
+    *,
+    now: float | None = None,
+) -> None:
+    """Add one finished job to the current minute; never raises."""
+    duration = max(round(duration_ms), 0)
+    try:
+        await record_minute_counters(
+            redis,
+            JOB_STATS_KEY_PREFIX,
+            {f"{function}:{outcome}": 1, f"{function}:duration_ms": duration},
+            {f"{function}:max_ms": duration},
+            now=now,
+        )
+    except Exception:
+        logger.warning(
+            "Could not record the outcome of job %s", function, exc_info=True
+        )
+
+
+def record_job_stats[**P, R](
+    coroutine: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Wrap an ARQ job so its outcome and duration land in the job counters."""
+    name = coroutine.__qualname__
+
+    @functools.wraps(coroutine)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        ctx = args[0] if args else None
+        redis = ctx.get("redis") if isinstance(ctx, dict) else None
+        started = time.perf_counter()
+        outcome: JobOutcome = "failed"
+        try:
+            result = await coroutine(*args, **kwargs)
+        except Retry:
+            outcome = "retried"
+            raise
+        else:
+            outcome = "succeeded"
+            return result
+        finally:
+            if redis is not None:
+                duration_ms = (time.perf_counter() - started) * 1000
+                # Shielded: a cancelled job still reports that it failed.
+                await asyncio.shield(
+                    record_job_outcome(redis, name, outcome, duration_ms)
+                )
+
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class JobStatsSummary:
+    function: str
+    succeeded: int
+    failed: int
+    retried: int
+    duration_ms_total: int
+    max_ms: int
+
+    @property
+    def runs(self) -> int:
+        return self.succeeded + self.failed + self.retried
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.runs if self.runs else 0.0
+
+    @property
+    def mean_ms(self) -> float | None:
+        return round(self.duration_ms_total / self.runs, 3) if self.runs else None
+
+
+async def read_job_stats(
+    redis: Any,
+    *,
+    minutes: int = 60,
+    now: float | None = None,
+) -> list[JobStatsSummary]:
+    """Every worker's job counters for the last ``minutes``, per function."""
+    totals: dict[str, dict[str, int]] = {}
+    for counts in await read_minute_window(
+        redis, JOB_STATS_KEY_PREFIX, minutes=minutes, now=now
+    ):
+        for key, value in counts.items():
+            function, _, field = key.rpartition(":")
+            counters = totals.setdefault(function, {})
+            if field == "max_ms":
+                counters[field] = max(counters.get(field, 0), value)
+            else:
+                counters[field] = counters.get(field, 0) + value
+    return [
+        JobStatsSummary(
+            function=function,
+            succeeded=counters.get("succeeded", 0),
+            failed=counters.get("failed", 0),
+            retried=counters.get("retried", 0),
+            duration_ms_total=counters.get("duration_ms", 0),
+            max_ms=counters.get("max_ms", 0),
+        )
+        for function, counters in sorted(totals.items())
+    ]
@@ -0,0 +1,203 @@
+"""Background embedding of knowledge-base entries.
+
+Admin saves never embed inside the request. They store the entry, leave its
+`embedding_hash` out of step with its content, which marks it pending, and
+queue `reindex_knowledge_base`. The job walks live entries in
+``(created_at, id)`` keyset order, ``settings.kb_reindex_chunk_size`` rows at
+a time, embeds only the pending rows of each chunk in one batch and commits
+per chunk. Progress is published to a Redis hash the admin panel polls.
+
+Only one run works at a time. A request that arrives during a run sets a
+flag, and the running job makes another pass before it exits, so an entry
+saved behind the pass's position is still picked up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import secrets
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.config import settings
+from src.core.database import async_session_factory
+from src.core.queues import enqueue_routed_job
+from src.models.knowledge_base import KnowledgeBase
+from src.rag.embeddings import EmbeddingEngine
+
+logger = logging.getLogger(__name__)
+
+KB_REINDEX_PROGRESS_KEY = "kb_reindex:progress"
+KB_REINDEX_LOCK_KEY = "kb_reindex:lock"
+KB_REINDEX_REQUESTED_KEY = "kb_reindex:requested"
+_LOCK_TTL_SECONDS = 900
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def kb_embedding_hash(content: str) -> str:
+    """SHA-256 of the text a knowledge-base entry is embedded from."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def is_embedding_pending(entry: KnowledgeBase) -> bool:
+    return entry.embedding_hash != kb_embedding_hash(entry.content)
+
+
+def embedding_pending_clause() -> ColumnElement[bool]:
+    """SQL twin of `is_embedding_pending`, for counting pending entries."""
+    content_hash = func.encode(
+        func.sha256(func.convert_to(KnowledgeBase.content, "UTF8")), "hex"
+    )
+    return KnowledgeBase.embedding_hash.is_distinct_from(content_hash)
+
+
+async def request_kb_reindex(arq_pool: Any, *, force: bool = False) -> None:
+    """Queue a reindex pass; ``force`` re-embeds unchanged entries too."""
+    await arq_pool.set(KB_REINDEX_REQUESTED_KEY, "1")
+    await enqueue_routed_job(arq_pool, "reindex_knowledge_base", force=force)
+
+
+async def get_kb_reindex_progress(redis: Any) -> dict[str, str]:
+    progress: dict[str, str] = await redis.hgetall(KB_REINDEX_PROGRESS_KEY)
+    return progress
+
+
+async def _publish(redis: Any, **fields: object) -> None:
+    await redis.hset(
+        KB_REINDEX_PROGRESS_KEY,
+        mapping={key: str(value) for key, value in fields.items()},
+    )
+
+
+async def _reindex_pass(
+    db: AsyncSession,
+    redis: Any,
+    engine: EmbeddingEngine,
+    *,
+    force: bool,
+) -> tuple[int, int]:
+    """Embed every pending live entry; returns (embedded, unchanged)."""
+    live = KnowledgeBase.deleted_at.is_(None)
+    total = int(
+        (await db.execute(select(func.count()).where(live))).scalar_one_or_none() or 0
+    )
+    await _publish(redis, total=total, scanned=0, embedded=0, unchanged=0)
+
+    scanned = embedded = unchanged = 0
+    after: tuple[datetime, uuid.UUID] | None = None
+    while True:
+        stmt = (
+            select(
+                KnowledgeBase.id,
+                KnowledgeBase.created_at,
+                KnowledgeBase.content,
+                KnowledgeBase.embedding_hash,
+            )
+            .where(live)
+            .order_by(KnowledgeBase.created_at, KnowledgeBase.id)
+            .limit(settings.kb_reindex_chunk_size)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(KnowledgeBase.created_at, KnowledgeBase.id)
+                > tuple_(literal(after[0]), literal(after[1]))
+            )
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return embedded, unchanged
+        after = (rows[-1].created_at, rows[-1].id)
+
+        pending = [
+            row
+            for row in rows
+            if force or row.embedding_hash != kb_embedding_hash(row.content)
+        ]
+        if pending:
+            vectors = await engine.embed_batch_async([row.content for row in pending])
+            # The hash is of the content embedded here: an admin edit that
+            # lands meanwhile leaves the entry pending for the next pass.
+            await db.execute(
+                update(KnowledgeBase),
+                [
+                    {
+                        "id": row.id,
+                        "embedding": vector,
+                        "embedding_hash": kb_embedding_hash(row.content),
+                    }
+                    for row, vector in zip(pending, vectors, strict=True)
+                ],
+            )
+            await db.commit()
+        scanned += len(rows)
+        embedded += len(pending)
+        unchanged += len(rows) - len(pending)
+        await _publish(redis, scanned=scanned, embedded=embedded, unchanged=unchanged)
+
+
+async def reindex_knowledge_base(
+    ctx: dict[str, Any],
+    *,
+    force: bool = False,
+) -> dict[str, Any]:
+    """ARQ job: embed pending knowledge-base entries in committed chunks."""
+    redis = ctx["redis"]
+    engine = EmbeddingEngine()
+    embedded = unchanged = passes = 0
+    while True:
+        token = secrets.token_hex(16)
+        if not await redis.set(
+            KB_REINDEX_LOCK_KEY, token, ex=_LOCK_TTL_SECONDS, nx=True
+        ):
+            logger.info("Knowledge-base reindex already running; skipping this run.")
+            return {"status": "skipped", "embedded": embedded, "unchanged": unchanged}
+        await _publish(
+            redis,
+            status="running",
+            started_at=datetime.now(UTC).isoformat(),
+            finished_at="",
+            error="",
+        )
+        try:
+            while await redis.delete(KB_REINDEX_REQUESTED_KEY) or passes == 0:
+                passes += 1
+                async with async_session_factory() as session:
+                    pass_embedded, unchanged = await _reindex_pass(
+                        session, redis, engine, force=force and passes == 1
+                    )
+                embedded += pass_embedded
+        except Exception as exc:
+            logger.exception("Knowledge-base reindex failed")
+            await _publish(
+                redis,
+                status="failed",
+                finished_at=datetime.now(UTC).isoformat(),
+                error=type(exc).__name__,
+            )
+            raise
+        finally:
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, KB_REINDEX_LOCK_KEY, token)
+
+        await _publish(redis, status="done", finished_at=datetime.now(UTC).isoformat())
+        # A request made between the last flag check and the lock release
+        # found the lock held and skipped; serve it here.
+        if not await redis.exists(KB_REINDEX_REQUESTED_KEY):
+            break
+
+    logger.info(
+        "Knowledge-base reindex finished. Embedded: %d, Unchanged: %d, Passes: %d",
+        embedded,
+        unchanged,
+        passes,
+    )
+    return {"status": "done", "embedded": embedded, "unchanged": unchanged}
@@ -0,0 +1,243 @@
+"""Rolling per-phase chat latency histograms merged across workers.
+
+Every finished turn's `ChatLatencyTrace` snapshot is folded into in-process,
+log-bucketed histograms (HDR-style: bucket width grows with the value, so the
+relative error stays near 4% from milliseconds to hours). Each worker adds its
+pending counts to Redis hashes keyed by minute and by hour at most once per
+``settings.chat_latency_flush_interval_seconds``. Counts from all workers
+therefore merge by addition, and a rolling window is read back as the sum of
+its minute or hour hashes. Only phase names and bucket counts leave the
+process; nothing identifies a customer or a turn.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from src.core.config import settings
+from src.core.minute_counters import read_hashes
+
+logger = logging.getLogger(__name__)
+
+LatencyWindow = Literal["5m", "15m", "1h", "24h"]
+
+# Display order: turn phases roughly as they happen, then the aggregates.
+SLO_PHASES = (
+    "queue_wait",
+    "pre_llm",
+    "llm_context",
+    "faq_rag",
+    "behavior_rag",
+    "model_tools",
+    "llm",
+    "persist_response",
+    "outbound_text",
+    "summary_refresh_enqueue",
+    "deferred_media",
+    "to_text_delivery",
+    "total",
+)
+
+CHAT_LATENCY_KEY_PREFIX = "chat_latency"
+_BUCKETS_PER_DOUBLING = 8
+_MAX_BUCKET = 24 * _BUCKETS_PER_DOUBLING  # 2**24 ms, about 4.7 hours
+_MINUTE_KEY_TTL_SECONDS = 2 * 60 * 60
+_HOUR_KEY_TTL_SECONDS = 26 * 60 * 60
+_WINDOWS: dict[str, tuple[Literal["m", "h"], int]] = {
+    "5m": ("m", 5),
+    "15m": ("m", 15),
+    "1h": ("m", 60),
+    "24h": ("h", 24),
+}
+_FLUSH_HISTOGRAMS_SCRIPT = """
+for index, key in ipairs(KEYS) do
+    for bucket, count in string.gmatch(ARGV[2 * index], "(%d+):(%d+)") do
+        redis.call("hincrby", key, bucket, count)
+    end
+    redis.call("expire", key, ARGV[2 * index - 1])
+end
+return #KEYS
+"""
+
+
+def _bucket_for(value_ms: float) -> int:
+    if value_ms < 1.0:
+        return 0
+    bucket = math.floor(math.log2(value_ms) * _BUCKETS_PER_DOUBLING) + 1
+    return min(bucket, _MAX_BUCKET)
+
+
+def _bucket_upper_ms(bucket: int) -> float:
+    """Highest value a bucket can hold; percentiles never under-report."""
+    return 2 ** (bucket / _BUCKETS_PER_DOUBLING)
+
+
+class LatencyHistogram:
+    """Sparse log-bucketed counts of one phase's millisecond durations."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Mapping[int, int] | None = None) -> None:
+        self.counts: dict[int, int] = dict(counts or {})
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def record(self, value_ms: float) -> None:
+        if not math.isfinite(value_ms) or value_ms < 0:
+            return
+        bucket = _bucket_for(value_ms)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return round(_bucket_upper_ms(bucket), 3)
+        return round(_bucket_upper_ms(max(self.counts)), 3)
+
+    def encode(self) -> str:
+        return ",".join(f"{bucket}:{count}" for bucket, count in self.counts.items())
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseLatencySummary:
+    phase: str
+    count: int
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+
+
+def _histogram_key(resolution: str, period: int, phase: str) -> str:
+    return f"{CHAT_LATENCY_KEY_PREFIX}:{resolution}:{period}:{phase}"
+
+
+class ChatLatencyRecorder:
+    """Per-process accumulator that flushes histograms to Redis on an interval."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._flush_interval_seconds = flush_interval_seconds
+        self._clock = clock
+        self._pending: dict[tuple[int, str], LatencyHistogram] = {}
+        self._last_flush = clock()
+
+    @property
+    def flush_interval_seconds(self) -> float:
+        if self._flush_interval_seconds is not None:
+            return self._flush_interval_seconds
+        return settings.chat_latency_flush_interval_seconds
+
+    def record(self, snapshot: Mapping[str, Any]) -> None:
+        """Fold one `ChatLatencyTrace.snapshot()` payload into the pending counts."""
+        timings = snapshot.get("latency_ms")
+        if not isinstance(timings, Mapping):
+            return
+        minute = int(self._clock() // 60)
+        for phase, value in timings.items():
+            if phase not in SLO_PHASES or isinstance(value, bool):
+                continue
+            if not isinstance(value, int | float):
+                continue
+            histogram = self._pending.setdefault((minute, phase), LatencyHistogram())
+            histogram.record(float(value))
+
+    async def maybe_flush(self, redis: Any) -> None:
+        if self._clock() - self._last_flush >= self.flush_interval_seconds:
+            await self.flush(redis)
+
+    async def flush(self, redis: Any) -> None:
+        """Add pending counts to the shared minute and hour hashes.
+
+        On a Redis error the counts are kept and retried with the next flush.
+        """
+        self._last_flush = self._clock()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        keys: list[str] = []
+        args: list[str | int] = []
+        for (minute, phase), histogram in pending.items():
+            encoded = histogram.encode()
+            keys.extend(
+                (
+                    _histogram_key("m", minute, phase),
+                    _histogram_key("h", minute // 60, phase),
+                )
+            )
+            args.extend(
+                (_MINUTE_KEY_TTL_SECONDS, encoded, _HOUR_KEY_TTL_SECONDS, encoded)
+            )
+        try:
+            await redis.eval(_FLUSH_HISTOGRAMS_SCRIPT, len(keys), *keys, *args)
+        except Exception:
+            logger.warning("Could not flush chat latency histograms", exc_info=True)
+            for key, histogram in pending.items():
+                self._pending.setdefault(key, LatencyHistogram()).merge(histogram)
+
+
+chat_latency_recorder = ChatLatencyRecorder()
+
+
+async def read_latency_window(
+    redis: Any,
+    window: LatencyWindow,
+    *,
+    now: float | None = None,
+) -> dict[str, LatencyHistogram]:
+    """Merge every worker's histograms for ``window``, ending at ``now``."""
+    resolution, periods = _WINDOWS[window]
+    seconds = 60 if resolution == "m" else 3600
+    current = int((now if now is not None else time.time()) // seconds)
+    keys = [
+        _histogram_key(resolution, period, phase)
+        for phase in SLO_PHASES
+        for period in range(current - periods + 1, current + 1)
+    ]
+    merged: dict[str, LatencyHistogram] = {}
+    for key, counts in zip(keys, await read_hashes(redis, keys), strict=True):
+        if not counts:
+            continue
+        phase = key.rsplit(":", maxsplit=1)[-1]
+        histogram = merged.setdefault(phase, LatencyHistogram())
+        histogram.merge(
+            LatencyHistogram({int(bucket): count for bucket, count in counts.items()})
+        )
+    return merged
+
+
+def summarize_latency_window(
+    histograms: Mapping[str, LatencyHistogram],
+) -> list[PhaseLatencySummary]:
+    """p50/p95/p99 per phase in display order, skipping phases with no samples."""
+    return [
+        PhaseLatencySummary(
+            phase=phase,
+            count=histogram.count,
+            p50_ms=histogram.quantile(0.5),
+            p95_ms=histogram.quantile(0.95),
+            p99_ms=histogram.quantile(0.99),
+        )
+        for phase in SLO_PHASES
+        if (histogram := histograms.get(phase)) is not None and histogram.count
+    ]
@@ -0,0 +1,313 @@
+"""Precomputed product recommendations in the `product_neighbors` table.
+
+``similar`` rows hold each active product's top-k cosine neighbours. A refresh
+loads every active embedding once and runs batched NumPy matrix products for
+the products whose vectors changed since the last refresh, i.e. those without
+rows, since the catalog sync drops a product's rows when it resets its
+embedding. Unchanged products are recomputed only when a changed or removed
+product is on their list or a changed one now beats their weakest neighbour.
+
+``cross_sell`` rows fan the configured category picks out to every product of
+a source category and are rebuilt in full on each refresh, and whenever the
+``cross_sell_rules`` setting is saved in the admin.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import async_session_factory
+from src.models.product import Product
+from src.models.product_neighbor import ProductNeighbor
+from src.services.recommendations import (
+    cross_sell_catalog_categories,
+    load_cross_sell_rules,
+)
+
+logger = logging.getLogger(__name__)
+
+# Query rows per matrix product: bounds the similarity block to
+# rows x catalog float32 values (256 x 10k products = 10 MB).
+_QUERY_BATCH_ROWS = 256
+# Keeps each DELETE ... IN (...) well below asyncpg's bind-parameter limit.
+_ID_CHUNK = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class NeighborRefreshStats:
+    recomputed: int = 0
+    removed: int = 0
+    cross_sell: int = 0
+
+
+def top_k_neighbors(
+    vectors: np.ndarray,
+    rows: Sequence[int],
+    k: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the top-``k`` cosine neighbours of ``rows`` among ``vectors``.
+
+    ``vectors`` must be L2-normalised. A row is never its own neighbour.
+    Returns neighbour indices and scores, best first, shaped
+    ``(len(rows), min(k, n - 1))``, and for every column the best similarity
+    any of ``rows`` reached.
+    """
+    count = len(vectors)
+    k = max(0, min(k, count - 1))
+    row_index = np.asarray(rows, dtype=np.intp)
+    indices = np.empty((len(row_index), k), dtype=np.intp)
+    scores = np.empty((len(row_index), k), dtype=np.float32)
+    column_best = np.full(count, -np.inf, dtype=np.float32)
+    for start in range(0, len(row_index), _QUERY_BATCH_ROWS):
+        batch = row_index[start : start + _QUERY_BATCH_ROWS]
+        similarities = vectors[batch] @ vectors.T
+        similarities[np.arange(len(batch)), batch] = -np.inf
+        np.maximum(column_best, similarities.max(axis=0), out=column_best)
+        if k == 0:
+            continue
+        top = np.argpartition(similarities, -k, axis=1)[:, -k:]
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        stop = start + len(batch)
+        indices[start:stop] = np.take_along_axis(top, order, axis=1)
+        scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+    return indices, scores, column_best
+
+
+def _normalized(embeddings: Sequence[Any]) -> np.ndarray:
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: np.ndarray = matrix / norms
+    return normalized
+
+
+def _chunks(ids: Iterable[uuid.UUID]) -> Iterator[list[uuid.UUID]]:
+    chunk: list[uuid.UUID] = []
+    for product_id in ids:
+        chunk.append(product_id)
+        if len(chunk) == _ID_CHUNK:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _replace_rows(
+    db: AsyncSession,
+    relation_type: str,
+    product_ids: Iterable[uuid.UUID] | None,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Delete a relation's rows (all of them when ``product_ids`` is None)."""
+    base = delete(ProductNeighbor).where(ProductNeighbor.relation_type == relation_type)
+    if product_ids is None:
+        await db.execute(base)
+    else:
+        for chunk in _chunks(product_ids):
+            await db.execute(base.where(ProductNeighbor.product_id.in_(chunk)))
+    if rows:
+        await db.execute(insert(ProductNeighbor), rows)
+
+
+async def refresh_similar_neighbors(
+    db: AsyncSession,
+    *,
+    full: bool = False,
+    k: int | None = None,
+) -> tuple[int, int]:
+    """Recompute stale ``similar`` rows; returns (recomputed, removed) products."""
+    k = k or settings.product_neighbors_top_k
+    live = (
+        await db.execute(
+            select(Product.id, Product.embedding).where(
+                Product.is_active.is_(True), Product.embedding.is_not(None)
+            )
+        )
+    ).all()
+    existing: dict[uuid.UUID, list[tuple[uuid.UUID, float]]] = {}
+    for product_id, neighbor_id, score in (
+        await db.execute(
+            select(
+                ProductNeighbor.product_id,
+                ProductNeighbor.neighbor_id,
+                ProductNeighbor.score,
+            )
+            .where(ProductNeighbor.relation_type == "similar")
+            .order_by(ProductNeighbor.product_id, ProductNeighbor.rank)
+        )
+    ).all():
+        existing.setdefault(product_id, []).append((neighbor_id, float(score or 0.0)))
+
+    ids = [row.id for row in live]
+    removed = set(existing) - set(ids)
+    changed = (
+        list(range(len(ids)))
+        if full
+        else [
+            index for index, product_id in enumerate(ids) if product_id not in existing
+        ]
+    )
+    if not changed and not removed:
+        return 0, 0
+
+    results: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    if ids:
+        vectors = _normalized([row.embedding for row in live])
+        column_best = np.full(len(ids), -np.inf, dtype=np.float32)
+        if changed:
+            indices, scores, column_best = top_k_neighbors(vectors, changed, k)
+            results.update(
+                (row, (indices[offset], scores[offset]))
+                for offset, row in enumerate(changed)
+            )
+        invalid = {ids[index] for index in changed} | removed
+        expected = min(k, len(ids) - 1)
+        affected = [
+            index
+            for index, product_id in enumerate(ids)
+            if index not in results
+            and (
+                len(neighbors := existing.get(product_id, [])) < expected
+                or any(neighbor_id in invalid for neighbor_id, _ in neighbors)
+                or (neighbors and float(column_best[index]) > neighbors[-1][1])
+            )
+        ]
+        if affected:
+            indices, scores, _ = top_k_neighbors(vectors, affected, k)
+            results.update(
+                (row, (indices[offset], scores[offset]))
+                for offset, row in enumerate(affected)
+            )
+
+    rows = [
+        {
+            "product_id": ids[row],
+            "relation_type": "similar",
+            "rank": rank,
+            "neighbor_id": ids[int(neighbor)],
+            "score": round(float(score), 6),
+        }
+        for row, (neighbors, scores) in results.items()
+        for rank, (neighbor, score) in enumerate(
+            zip(neighbors, scores, strict=True), start=1
+        )
+    ]
+    await _replace_rows(
+        db,
+        "similar",
+        None if full else [*(ids[row] for row in results), *removed],
+        rows,
+    )
+    return len(results), len(removed)
+
+
+async def refresh_cross_sell_neighbors(db: AsyncSession) -> int:
+    """Rebuild every ``cross_sell`` row from the current rules and stock."""
+    rules = await load_cross_sell_rules(db)
+    targets = {source: cross_sell_catalog_categories(rules, source) for source in rules}
+    targets = {source: aliases for source, aliases in targets.items() if aliases}
+    if not targets:
+        await _replace_rows(db, "cross_sell", None, [])
+        return 0
+
+    category = func.lower(Product.category)
+    picks = {
+        row.category: row.id
+        for row in (
+            await db.execute(
+                select(Product.id, category.label("category"))
+                .where(
+                    Product.is_active.is_(True),
+                    Product.stock > 0,
+                    Product.price > 0,
+                    category.in_(
+                        {alias for aliases in targets.values() for alias in aliases}
+                    ),
+                )
+                .distinct(category)
+                .order_by(category, Product.stock.desc(), Product.price.asc())
+            )
+        ).all()
+    }
+    sources = (
+        await db.execute(
+            select(Product.id, category.label("category")).where(
+                Product.is_active.is_(True),
+                category.in_(list(targets)),
+            )
+        )
+    ).all()
+    rows: list[dict[str, Any]] = []
+    for source in sources:
+        pick_ids = list(
+            dict.fromkeys(
+                picks[alias] for alias in targets[source.category] if alias in picks
+            )
+        )
+        rows.extend(
+            {
+                "product_id": source.id,
+                "relation_type": "cross_sell",
+                "rank": rank,
+                "neighbor_id": neighbor_id,
+                "score": None,
+            }
+            for rank, neighbor_id in enumerate(pick_ids, start=1)
+        )
+    await _replace_rows(db, "cross_sell", None, rows)
+    return len(rows)
+
+
+async def rebuild_cross_sell_neighbors() -> int:
+    """Rebuild the ``cross_sell`` rows in their own transaction."""
+    async with async_session_factory() as session:
+        try:
+            rows = await refresh_cross_sell_neighbors(session)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+    logger.info("Cross-sell neighbours rebuilt: %d rows", rows)
+    return rows
+
+
+async def refresh_product_neighbors(
+    ctx: dict[str, Any],
+    *,
+    full: bool = False,
+) -> dict[str, int]:
+    """ARQ job: refresh `product_neighbors` after a catalog sync.
+
+    ``full=True`` recomputes every product's ``similar`` rows, e.g. after
+    ``settings.product_neighbors_top_k`` changes.
+    """
+    del ctx
+    async with async_session_factory() as session:
+        try:
+            recomputed, removed = await refresh_similar_neighbors(session, full=full)
+            cross_sell = await refresh_cross_sell_neighbors(session)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            logger.exception("Product neighbour refresh failed")
+            raise
+    stats = NeighborRefreshStats(
+        recomputed=recomputed, removed=removed, cross_sell=cross_sell
+    )
+    logger.info(
+        "Product neighbours refreshed. Recomputed: %d, Removed: %d, Cross-sell: %d",
+        stats.recomputed,
+        stats.removed,
+        stats.cross_sell,
+    )
+    return asdict(stats)
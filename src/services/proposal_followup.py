@@ -9,12 +9,11 @@ from dataclasses import dataclass, field
 from typing import Any, Literal
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 
-from src.core.database import async_session_factory
+from src.core.database import async_session_factory, profile_job_queries
 from src.integrations.messaging.wazzup import WazzupProvider
 from src.models.conversation import Conversation
-from src.models.message import Message
 from src.models.outbound_message import OutboundMessageAudit
 from src.models.system_config import SystemConfig
 from src.services.customer_language import normalize_customer_language
@@ -23,6 +22,12 @@ from src.services.outbound_audit import (
     send_wazzup_template_with_audit,
     send_wazzup_text_with_audit,
 )
+from src.services.scheduled_actions import (
+    ScheduledActionKind,
+    claim_due_actions,
+    load_claimed_conversations,
+    reschedule_claimed_action,
+)
 
 PROPOSAL_FOLLOWUP_METADATA_KEY = "proposal_followup"
 PROPOSAL_FOLLOWUP_CONTROLS_KEY = "proposal_followup_send_controls"
@@ -638,6 +643,34 @@ def next_due_followup_step(
     return None
 
 
+def proposal_followup_due_at(conversation: Conversation) -> datetime.datetime | None:
+    """When the proposal chain next needs the cron: a step or the final verdict."""
+    state = _state(conversation)
+    if state is None or state.get("chain_stopped") is True:
+        return None
+
+    if state.get("final_status") == "awaiting_response_after_final_followup":
+        return _parse_datetime(state.get("final_no_response_due_at"))
+
+    steps = _steps(state)
+    pending = [
+        scheduled_at
+        for step in FOLLOWUP_OFFSETS_BY_STEP
+        if isinstance(step_state := steps.get(str(step)), Mapping)
+        and step_state.get("status", "pending") == "pending"
+        and (scheduled_at := _parse_datetime(step_state.get("scheduled_at")))
+        is not None
+    ]
+    due_at = min(pending, default=None)
+    if due_at is None:
+        return None
+
+    pause_until = _parse_datetime(state.get("pause_until"))
+    if pause_until is not None and pause_until > due_at:
+        return pause_until
+    return due_at
+
+
 def _normalized_text(text: str) -> str:
     return " ".join(text.casefold().split())
 
@@ -961,58 +994,46 @@ async def _proposal_followup_candidate_rows(
     limit: int,
     scan_cap: int,
 ) -> list[tuple[Conversation, datetime.datetime | None]]:
+    """Claim due proposal follow-up rows until ``limit`` of them have work.
+
+    Claimed conversations with nothing due after all are released to their
+    next due time straight away.
+    """
     if limit <= 0 or scan_cap <= 0:
         return []
 
-    last_customer_message = (
-        select(
-            Message.conversation_id.label("conversation_id"),
-            func.max(Message.created_at).label("last_customer_inbound_at"),
-        )
-        .where(Message.role == "user")
-        .group_by(Message.conversation_id)
-        .subquery()
-    )
-    page_size = max(limit * 5, 50)
     bounded_scan_cap = max(scan_cap, limit)
-    offset = 0
     scanned_count = 0
     candidates: list[tuple[Conversation, datetime.datetime | None]] = []
 
     while len(candidates) < limit and scanned_count < bounded_scan_cap:
-        current_page_size = min(page_size, bounded_scan_cap - scanned_count)
-        stmt = (
-            select(Conversation, last_customer_message.c.last_customer_inbound_at)
-            .outerjoin(
-                last_customer_message,
-                last_customer_message.c.conversation_id == Conversation.id,
-            )
-            .where(Conversation.status == "active")
-            .where(Conversation.metadata_.is_not(None))
-            .order_by(Conversation.updated_at.asc(), Conversation.id.asc())
-            .limit(current_page_size)
-            .offset(offset)
+        conversation_ids = await claim_due_actions(
+            db,
+            ScheduledActionKind.PROPOSAL_FOLLOWUP,
+            now=now,
+            limit=min(limit - len(candidates), bounded_scan_cap - scanned_count),
         )
-        result = await db.execute(stmt)
-        rows = [(row[0], row[1]) for row in result.all()]
-        if not rows:
+        if not conversation_ids:
             break
 
-        for conversation, last_customer_inbound_at in rows:
+        for conversation, last_customer_inbound_at in await load_claimed_conversations(
+            db, conversation_ids
+        ):
             scanned_count += 1
             if next_due_followup_step(
                 conversation,
                 now=now,
             ) or final_no_response_due(conversation, now=now):
                 candidates.append((conversation, last_customer_inbound_at))
-                if len(candidates) >= limit:
-                    break
-
-        if len(candidates) >= limit or scanned_count >= bounded_scan_cap:
-            break
-        if len(rows) < current_page_size:
-            break
-        offset += len(rows)
+                continue
+            await reschedule_claimed_action(
+                db,
+                conversation.id,
+                ScheduledActionKind.PROPOSAL_FOLLOWUP,
+                proposal_followup_due_at(conversation),
+                now=now,
+            )
+        await db.commit()
 
     if scanned_count >= bounded_scan_cap and len(candidates) < limit:
         logger.warning(
@@ -1028,6 +1049,30 @@ async def _proposal_followup_candidate_rows(
     return candidates
 
 
+async def _release_proposal_followup(
+    db: Any,
+    conversation: Conversation,
+    *,
+    now: datetime.datetime,
+) -> None:
+    try:
+        await reschedule_claimed_action(
+            db,
+            conversation.id,
+            ScheduledActionKind.PROPOSAL_FOLLOWUP,
+            proposal_followup_due_at(conversation),
+            now=now,
+        )
+        await db.commit()
+    except Exception:
+        # The claim lapses after CLAIM_LEASE and the row is due again.
+        await db.rollback()
+        logger.exception(
+            "Failed to reschedule proposal follow-up",
+            extra={"conversation_id": str(conversation.id)},
+        )
+
+
 async def run_due_proposal_followups(
     db: Any,
     *,
@@ -1055,7 +1100,7 @@ async def run_due_proposal_followups(
 
     sent_count = 0
     created_provider = provider is None
-    messaging = provider or WazzupProvider()
+    messaging = provider or WazzupProvider(priority="bulk")
     try:
         for conversation, last_customer_inbound_at in rows:
             if sent_count >= max_attempts:
@@ -1074,9 +1119,10 @@ async def run_due_proposal_followups(
                     "Failed to process proposal follow-up",
                     extra={"conversation_id": str(conversation.id)},
                 )
-                continue
-            if result.sent:
-                sent_count += 1
+            else:
+                if result.sent:
+                    sent_count += 1
+            await _release_proposal_followup(db, conversation, now=now)
     finally:
         if created_provider:
             await messaging.close()
@@ -1084,6 +1130,7 @@ async def run_due_proposal_followups(
     return sent_count
 
 
+@profile_job_queries
 async def run_proposal_followups(ctx: dict[str, Any]) -> None:
     """ARQ entrypoint for disabled-by-default proposal follow-up sends."""
     async with async_session_factory() as db:
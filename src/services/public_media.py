@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import base64
+import json
+import logging
+from typing import Any
 from urllib.parse import quote, urlencode
 
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
@@ -8,6 +12,12 @@ from src.core.config import settings
 
 _CANONICAL_BASE_URL = "https://noor.starec.ai"
 _PRODUCT_MEDIA_SIGNING_SALT = "product-media-v1"
+# A signed product image URL is valid for five minutes; a prefetched image
+# only needs to outlive the URLs signed with it.
+PRODUCT_MEDIA_TOKEN_TTL_SECONDS = 300
+_PRODUCT_IMAGE_CACHE_PREFIX = "public_media:product_image"
+
+logger = logging.getLogger(__name__)
 
 
 def _public_base_url() -> str:
@@ -59,3 +69,49 @@ def build_signed_product_image_url(zoho_item_id: str) -> str:
     safe_item_id = quote(zoho_item_id, safe="")
     query = urlencode({"token": sign_product_image_token(zoho_item_id)})
     return f"{_public_base_url()}/api/v1/public-media/products/{safe_item_id}?{query}"
+
+
+def _product_image_cache_key(zoho_item_id: str) -> str:
+    return f"{_PRODUCT_IMAGE_CACHE_PREFIX}:{zoho_item_id}"
+
+
+async def cache_product_image(
+    redis: Any,
+    zoho_item_id: str,
+    content: bytes,
+    content_type: str,
+) -> None:
+    """Keep a fetched product image for the public media route; never raises."""
+    payload = json.dumps(
+        {
+            "content_type": content_type,
+            "content": base64.b64encode(content).decode("ascii"),
+        }
+    )
+    try:
+        await redis.set(
+            _product_image_cache_key(zoho_item_id),
+            payload,
+            ex=PRODUCT_MEDIA_TOKEN_TTL_SECONDS,
+        )
+    except Exception:
+        logger.warning("Could not cache a product image", exc_info=True)
+
+
+async def cached_product_image(
+    redis: Any,
+    zoho_item_id: str,
+) -> tuple[bytes, str] | None:
+    """A product image prefetched by `cache_product_image`, if still cached."""
+    try:
+        raw = await redis.get(_product_image_cache_key(zoho_item_id))
+    except Exception:
+        logger.warning("Could not read a cached product image", exc_info=True)
+        return None
+    if not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+        return base64.b64decode(payload["content"]), str(payload["content_type"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -3,6 +3,11 @@
 Provides two types of recommendations:
 1. Similar products via pgvector cosine similarity on embeddings
 2. Cross-sell rules loaded from SystemConfig
+
+Both are read from the precomputed `product_neighbors` table when it has rows
+for the source product (see `src.services.product_neighbors`), and computed
+live otherwise. Cross-sell also falls back to the live rules when every
+precomputed pick has since sold out or been deactivated.
 """
 
 from __future__ import annotations
@@ -13,12 +18,15 @@ from uuid import UUID
 from pydantic import BaseModel
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from src.models.product import Product
+from src.models.product import Product, product_pricing
+from src.models.product_neighbor import ProductNeighbor
 from src.models.system_config import SystemConfig
 
 logger = logging.getLogger(__name__)
 
+CROSS_SELL_RULES_KEY = "cross_sell_rules"
 _CROSS_SELL_CATEGORY_FAMILIES: dict[str, tuple[str, ...]] = {
     "chair": ("chairs",),
     "monitor_arm": ("accessories",),
@@ -50,6 +58,63 @@ class RecommendationItem(BaseModel):
     recommendation_type: str = "similar"  # similar | cross_sell
 
 
+async def _precomputed_neighbors(
+    db: AsyncSession,
+    product_id: UUID,
+    relation_type: str,
+    limit: int,
+) -> list[RecommendationItem] | None:
+    """Read a product's precomputed neighbours; None when it has no rows.
+
+    Rows are filtered against live state, so a neighbour deactivated or sold
+    out since the last refresh is skipped rather than recommended.
+    """
+    result = await db.execute(
+        select(
+            Product.id,
+            Product.name_en,
+            Product.sku,
+            Product.price,
+            Product.currency,
+            Product.stock,
+            Product.is_active,
+            ProductNeighbor.score,
+        )
+        .join(ProductNeighbor, ProductNeighbor.neighbor_id == Product.id)
+        .where(
+            ProductNeighbor.product_id == product_id,
+            ProductNeighbor.relation_type == relation_type,
+        )
+        .order_by(ProductNeighbor.rank)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    items: list[RecommendationItem] = []
+    for row in rows:
+        if not row.is_active:
+            continue
+        if relation_type == "cross_sell" and (row.stock <= 0 or row.price <= 0):
+            continue
+        items.append(
+            RecommendationItem(
+                id=row.id,
+                name=row.name_en,
+                sku=row.sku,
+                price=float(row.price),
+                currency=row.currency,
+                stock=row.stock,
+                similarity_score=(
+                    round(float(row.score), 4) if row.score is not None else None
+                ),
+                recommendation_type=relation_type,
+            )
+        )
+        if len(items) >= limit:
+            break
+    return items
+
+
 async def get_similar_products(
     db: AsyncSession,
     product_id: UUID,
@@ -65,8 +130,12 @@ async def get_similar_products(
     Returns:
         List of similar products ordered by similarity.
     """
-    # Get the source product's embedding
-    source = await db.get(Product, product_id)
+    precomputed = await _precomputed_neighbors(db, product_id, "similar", limit)
+    if precomputed is not None:
+        return precomputed
+
+    # Get the source product's embedding (deferred on ordinary loads)
+    source = await db.get(Product, product_id, options=[undefer(Product.embedding)])
     if not source or source.embedding is None:
         return []
 
@@ -104,10 +173,42 @@ async def get_similar_products(
     ]
 
 
+async def load_cross_sell_rules(db: AsyncSession) -> dict[str, list[str]]:
+    """Load the category cross-sell rules from SystemConfig ({} when unset)."""
+    rules_stmt = select(SystemConfig).where(SystemConfig.key == CROSS_SELL_RULES_KEY)
+    result = await db.execute(rules_stmt)
+    config = result.scalar_one_or_none()
+
+    if not config or not isinstance(config.value, dict):
+        return {}
+    rules: dict[str, list[str]] = config.value
+    return rules
+
+
+def cross_sell_catalog_categories(
+    rules: dict[str, list[str]],
+    category: str,
+) -> list[str]:
+    """Resolve a source category's rule targets to live catalog categories."""
+    catalog_categories: list[str] = []
+    for target in rules.get(category.casefold(), []):
+        normalized_target = str(target).strip().casefold()
+        aliases = _CROSS_SELL_CATEGORY_FAMILIES.get(
+            normalized_target,
+            (normalized_target.replace("_", " "),),
+        )
+        for alias in aliases:
+            if alias and alias not in catalog_categories:
+                catalog_categories.append(alias)
+    return catalog_categories
+
+
 async def get_cross_sell(
     db: AsyncSession,
     category: str,
     limit: int = 3,
+    *,
+    product_id: UUID | str | None = None,
 ) -> list[RecommendationItem]:
     """Get cross-sell recommendations based on category rules.
 
@@ -118,35 +219,28 @@ async def get_cross_sell(
         db: Database session.
         category: Source product category.
         limit: Maximum number of results.
+        product_id: Source product, when known; its precomputed picks are used
+            if it has any. A malformed id falls back to the category rules.
 
     Returns:
         List of cross-sell products.
     """
-    # Load rules from SystemConfig
-    rules_stmt = select(SystemConfig).where(SystemConfig.key == "cross_sell_rules")
-    result = await db.execute(rules_stmt)
-    config = result.scalar_one_or_none()
-
-    if not config or not isinstance(config.value, dict):
-        return []
+    if isinstance(product_id, str):
+        try:
+            product_id = UUID(product_id)
+        except ValueError:
+            product_id = None
+    if product_id is not None:
+        precomputed = await _precomputed_neighbors(db, product_id, "cross_sell", limit)
+        if precomputed:
+            return precomputed
 
-    rules: dict[str, list[str]] = config.value
-    target_categories = rules.get(category.casefold(), [])
-
-    if not target_categories:
+    catalog_categories = cross_sell_catalog_categories(
+        await load_cross_sell_rules(db), category
+    )
+    if not catalog_categories:
         return []
 
-    catalog_categories: list[str] = []
-    for target in target_categories:
-        normalized_target = str(target).strip().casefold()
-        aliases = _CROSS_SELL_CATEGORY_FAMILIES.get(
-            normalized_target,
-            (normalized_target.replace("_", " "),),
-        )
-        for alias in aliases:
-            if alias and alias not in catalog_categories:
-                catalog_categories.append(alias)
-
     products: list[Product] = []
     seen_ids: set[UUID] = set()
     for catalog_category in catalog_categories:
@@ -154,6 +248,7 @@ async def get_cross_sell(
             break
         prod_stmt = (
             select(Product)
+            .options(product_pricing())
             .where(
                 Product.is_active.is_(True),
                 func.lower(Product.category) == catalog_category,
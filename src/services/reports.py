@@ -19,7 +19,7 @@ from pydantic import BaseModel
 from sqlalchemy import func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.llm.safety import (
+from src.llm.paths import (
     PATH_QUALITY_FINAL,
     PATH_QUALITY_MANAGER,
     PATH_QUALITY_RED_FLAGS,
@@ -6,6 +6,7 @@ import json
 import logging
 import secrets
 from contextlib import suppress
+from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal
@@ -15,8 +16,17 @@ from sqlalchemy import func, select, text
 
 from src.core.config import settings
 from src.core.database import async_session_factory
+from src.core.queues import active_queue_names, job_class_for, queue_name_for_job
+from src.core.redis import redis_pool_stats
+from src.llm.answer_cache import read_answer_cache_stats
 from src.models.escalation import Escalation
 from src.schemas.common import EscalationStatus
+from src.services.job_stats import read_job_stats
+from src.services.latency_slo import (
+    LatencyWindow,
+    read_latency_window,
+    summarize_latency_window,
+)
 from src.services.notifications import send_telegram_message
 
 logger = logging.getLogger(__name__)
@@ -29,6 +39,8 @@ _DURABLE_INBOUND_KEY_PATTERNS = (
     "wazzup:inbound:processing:*",
 )
 _LOOKBACK = timedelta(hours=1)
+# Monitoring runs every five minutes; three runs see each latency sample.
+_CHAT_LATENCY_WINDOW: LatencyWindow = "15m"
 _STALE_ESCALATION_AGE = timedelta(days=30)
 _RELEASE_CLAIM_SCRIPT = """
 if redis.call("get", KEYS[1]) == ARGV[1] then
@@ -36,6 +48,71 @@ if redis.call("get", KEYS[1]) == ARGV[1] then
 end
 return 0
 """
+# Idle time before length for every key of one SCAN page, so reading the length
+# does not reset the idle clock being measured. -1 marks a key that vanished.
+_DURABLE_KEY_PROBE_SCRIPT = """
+local probes = {}
+for index, key in ipairs(KEYS) do
+    local idle = redis.call("object", "idletime", key)
+    probes[2 * index - 1] = idle or -1
+    probes[2 * index] = redis.call("llen", key)
+end
+return probes
+"""
+
+
+class QueueMetrics(BaseModel):
+    """Depth and wait time of one ARQ queue, read from its sorted-set scores."""
+
+    job_class: str
+    queue_name: str
+    depth: int = Field(ge=0)
+    ready: int = Field(ge=0)
+    oldest_wait_seconds: float | None = Field(default=None, ge=0)
+
+
+class RedisPoolMetrics(BaseModel):
+    """Shared Redis pool occupancy and checkout waits since the previous run."""
+
+    max_connections: int = Field(ge=1)
+    in_use: int = Field(ge=0)
+    acquisitions: int = Field(ge=0)
+    waits: int = Field(ge=0)
+    wait_seconds_total: float = Field(ge=0)
+    wait_seconds_max: float = Field(ge=0)
+    timeouts: int = Field(ge=0)
+
+
+class PhaseLatencyMetrics(BaseModel):
+    """Merged chat latency percentiles of one turn phase over a rolling window."""
+
+    phase: str
+    count: int = Field(ge=0)
+    p50_ms: float | None = Field(default=None, ge=0)
+    p95_ms: float | None = Field(default=None, ge=0)
+    p99_ms: float | None = Field(default=None, ge=0)
+
+
+class JobMetrics(BaseModel):
+    """Outcome counts and durations of one ARQ job function over the lookback."""
+
+    function: str
+    succeeded: int = Field(ge=0)
+    failed: int = Field(ge=0)
+    retried: int = Field(ge=0)
+    failure_rate: float = Field(ge=0, le=1)
+    mean_duration_ms: float | None = Field(default=None, ge=0)
+    max_duration_ms: float | None = Field(default=None, ge=0)
+
+
+class AnswerCacheMetrics(BaseModel):
+    """Semantic answer cache outcomes over the lookback."""
+
+    hits: int = Field(ge=0)
+    misses: int = Field(ge=0)
+    rejected: int = Field(ge=0)
+    stores: int = Field(ge=0)
+    hit_rate: float | None = Field(default=None, ge=0, le=1)
 
 
 class RuntimeSnapshot(BaseModel):
@@ -51,6 +128,17 @@ class RuntimeSnapshot(BaseModel):
     maintenance_age_seconds: float | None = Field(default=None, ge=0)
     maintenance_last_run_succeeded: bool | None = None
     maintenance_heartbeat_missing: bool = False
+    queues: list[QueueMetrics] = Field(default_factory=list)
+    redis_pool: RedisPoolMetrics | None = None
+    chat_latency: list[PhaseLatencyMetrics] = Field(default_factory=list)
+    jobs: list[JobMetrics] = Field(default_factory=list)
+    answer_cache: AnswerCacheMetrics | None = None
+
+
+def _default_chat_latency_p95_ms() -> dict[str, float]:
+    # `to_text_delivery` is the customer-visible target from
+    # docs/latency-evidence.md; queue wait alerts well before a batch stalls.
+    return {"queue_wait": 30_000.0, "to_text_delivery": 25_000.0}
 
 
 class RuntimeThresholds(BaseModel):
@@ -63,6 +151,14 @@ class RuntimeThresholds(BaseModel):
     stale_pending_escalations: int = Field(default=1, ge=1)
     health_dependency_failures: int = Field(default=1, ge=1)
     maintenance_age_seconds: float = Field(default=93_600, gt=0)
+    queue_wait_seconds: float = Field(default=900, gt=0)
+    redis_pool_timeouts: int = Field(default=1, ge=1)
+    chat_latency_p95_ms: dict[str, float] = Field(
+        default_factory=_default_chat_latency_p95_ms
+    )
+    chat_latency_min_samples: int = Field(default=5, ge=1)
+    job_failure_rate: float = Field(default=0.5, gt=0, le=1)
+    job_failure_rate_min_runs: int = Field(default=4, ge=1)
 
 
 class RuntimeSignal(BaseModel):
@@ -97,6 +193,20 @@ def _signal(
     )
 
 
+def chat_latency_slo_breached(
+    latency: PhaseLatencyMetrics,
+    thresholds: RuntimeThresholds,
+) -> bool:
+    """Return whether a phase's p95 meets its threshold on enough samples."""
+    threshold = thresholds.chat_latency_p95_ms.get(latency.phase)
+    return (
+        threshold is not None
+        and latency.p95_ms is not None
+        and latency.count >= thresholds.chat_latency_min_samples
+        and latency.p95_ms >= threshold
+    )
+
+
 def evaluate_runtime_snapshot(
     snapshot: RuntimeSnapshot,
     thresholds: RuntimeThresholds,
@@ -110,7 +220,7 @@ def evaluate_runtime_snapshot(
                 severity="critical",
                 value=snapshot.failed_jobs_last_hour,
                 threshold=thresholds.failed_jobs_last_hour,
-                source="ARQ result metadata",
+                source="ARQ job outcome counters",
                 remediation="Inspect failed jobs and retry only after fixing the cause.",
             )
         )
@@ -208,6 +318,65 @@ def evaluate_runtime_snapshot(
                 remediation="Verify the installed schedule and its last-run record.",
             )
         )
+    for queue in snapshot.queues:
+        if (
+            queue.oldest_wait_seconds is not None
+            and queue.oldest_wait_seconds >= thresholds.queue_wait_seconds
+        ):
+            signals.append(
+                _signal(
+                    code=f"arq_queue_waiting_{queue.job_class}",
+                    severity="warning",
+                    value=queue.oldest_wait_seconds,
+                    threshold=thresholds.queue_wait_seconds,
+                    source="ARQ queue scores",
+                    remediation="Check the worker pool serving this queue.",
+                )
+            )
+    if (
+        snapshot.redis_pool is not None
+        and snapshot.redis_pool.timeouts >= thresholds.redis_pool_timeouts
+    ):
+        signals.append(
+            _signal(
+                code="redis_pool_exhausted",
+                severity="warning",
+                value=snapshot.redis_pool.timeouts,
+                threshold=thresholds.redis_pool_timeouts,
+                source="Redis connection pool",
+                remediation="Raise REDIS_POOL_CONNECTIONS_PER_JOB or lower worker max_jobs.",
+            )
+        )
+    for latency in snapshot.chat_latency:
+        if not chat_latency_slo_breached(latency, thresholds):
+            continue
+        signals.append(
+            _signal(
+                code=f"chat_latency_p95_{latency.phase}",
+                severity="warning",
+                value=latency.p95_ms or 0.0,
+                threshold=thresholds.chat_latency_p95_ms[latency.phase],
+                source="Chat latency histograms",
+                remediation="Open the admin latency panel and check the dominant phase.",
+            )
+        )
+    for job in snapshot.jobs:
+        runs = job.succeeded + job.failed + job.retried
+        if (
+            runs < thresholds.job_failure_rate_min_runs
+            or job.failure_rate < thresholds.job_failure_rate
+        ):
+            continue
+        signals.append(
+            _signal(
+                code=f"arq_job_failure_rate_{job.function}",
+                severity="warning",
+                value=job.failure_rate,
+                threshold=thresholds.job_failure_rate,
+                source="ARQ job outcome counters",
+                remediation="Read this job's recent worker logs for the failing step.",
+            )
+        )
     return signals
 
 
@@ -290,7 +459,10 @@ def _count_recent_oauth_failures(
 async def _durable_inbound_queue_metadata(
     redis: Any,
 ) -> tuple[int, float | None, bool]:
-    """Count durable inbound messages and their oldest key idle age without payloads."""
+    """Count durable inbound messages and their oldest key idle age without payloads.
+
+    Keys are probed one SCAN page at a time in a single script call.
+    """
     message_count = 0
     oldest_idle_seconds: float | None = None
     try:
@@ -302,9 +474,13 @@ async def _durable_inbound_queue_metadata(
                     match=pattern,
                     count=100,
                 )
-                for key in keys:
-                    idle_raw = await redis.object("idletime", key)
-                    length = int(await redis.llen(key))
+                probes = (
+                    await redis.eval(_DURABLE_KEY_PROBE_SCRIPT, len(keys), *keys)
+                    if keys
+                    else []
+                )
+                for idle_raw, length_raw in zip(probes[::2], probes[1::2], strict=True):
+                    length = int(length_raw)
                     if length <= 0:
                         continue
                     message_count += length
@@ -312,7 +488,9 @@ async def _durable_inbound_queue_metadata(
                         idle_raw, int | float
                     ):
                         continue
-                    idle_seconds = max(float(idle_raw), 0.0)
+                    if idle_raw < 0:
+                        continue
+                    idle_seconds = float(idle_raw)
                     oldest_idle_seconds = max(
                         oldest_idle_seconds or 0.0,
                         idle_seconds,
@@ -325,6 +503,75 @@ async def _durable_inbound_queue_metadata(
     return message_count, oldest_idle_seconds, True
 
 
+async def _arq_queue_metrics(
+    redis: Any,
+    *,
+    observed_at: datetime,
+) -> list[QueueMetrics]:
+    """Read depth and oldest due-job wait per queue without loading job payloads.
+
+    ARQ scores each queued job with the epoch milliseconds at which it becomes
+    due, so jobs scored at or before now are waiting for a worker slot.
+    """
+    now_ms = int(observed_at.timestamp() * 1000)
+    metrics: list[QueueMetrics] = []
+    for job_class, queue_name in active_queue_names().items():
+        try:
+            depth = int(await redis.zcard(queue_name))
+            ready = int(await redis.zcount(queue_name, "-inf", now_ms))
+            oldest = await redis.zrangebyscore(
+                queue_name,
+                "-inf",
+                now_ms,
+                start=0,
+                num=1,
+                withscores=True,
+            )
+        except Exception:
+            logger.exception(
+                "Runtime monitoring could not read ARQ queue metadata queue=%s",
+                job_class.value,
+            )
+            continue
+        oldest_wait_seconds = None
+        for _job_id, score in oldest:
+            oldest_wait_seconds = max(0.0, (now_ms - float(score)) / 1000)
+        metrics.append(
+            QueueMetrics(
+                job_class=job_class.value,
+                queue_name=queue_name,
+                depth=max(depth, 0),
+                ready=max(ready, 0),
+                oldest_wait_seconds=oldest_wait_seconds,
+            )
+        )
+    return metrics
+
+
+async def _shared_queue_inbound_jobs(
+    redis: Any,
+    *,
+    current: datetime,
+) -> tuple[int, float | None]:
+    """Inbound jobs on the one shared queue, which needs their function names."""
+    try:
+        queued_jobs = await redis.queued_jobs(
+            queue_name=queue_name_for_job(_INBOUND_JOB_FUNCTION)
+        )
+    except Exception:
+        queued_jobs = []
+        logger.exception("Runtime monitoring could not read ARQ queue metadata")
+    inbound_jobs = [
+        job
+        for job in queued_jobs
+        if job.function.rsplit(".", maxsplit=1)[-1] == _INBOUND_JOB_FUNCTION
+    ]
+    if not inbound_jobs:
+        return 0, None
+    oldest = min(_as_utc(job.enqueue_time) for job in inbound_jobs)
+    return len(inbound_jobs), max(0.0, (current - oldest).total_seconds())
+
+
 def _maintenance_heartbeat(
     path: Path,
     *,
@@ -367,15 +614,46 @@ async def collect_runtime_snapshot(
         logger.exception("Runtime monitoring Redis health probe failed")
 
     try:
-        job_results = await redis.all_job_results()
+        job_metrics = [
+            JobMetrics(
+                function=summary.function,
+                succeeded=summary.succeeded,
+                failed=summary.failed,
+                retried=summary.retried,
+                failure_rate=round(summary.failure_rate, 3),
+                mean_duration_ms=summary.mean_ms,
+                max_duration_ms=summary.max_ms if summary.runs else None,
+            )
+            for summary in await read_job_stats(
+                redis,
+                minutes=int(_LOOKBACK.total_seconds() // 60),
+                now=current.timestamp(),
+            )
+        ]
     except Exception:
-        job_results = []
-        logger.exception("Runtime monitoring could not read ARQ results")
-    failed_jobs = sum(
-        1
-        for result in job_results
-        if not result.success and _as_utc(result.finish_time) >= cutoff
-    )
+        job_metrics = []
+        logger.exception("Runtime monitoring could not read ARQ job counters")
+    failed_jobs = sum(job.failed for job in job_metrics)
+    answer_cache = None
+    if settings.answer_cache_enabled:
+        try:
+            stats = await read_answer_cache_stats(
+                redis,
+                minutes=int(_LOOKBACK.total_seconds() // 60),
+                now=current.timestamp(),
+            )
+        except Exception:
+            logger.exception("Runtime monitoring could not read answer cache counters")
+        else:
+            answer_cache = AnswerCacheMetrics(
+                hits=stats.hits,
+                misses=stats.misses,
+                rejected=stats.rejected,
+                stores=stats.stores,
+                hit_rate=(
+                    round(stats.hit_rate, 3) if stats.hit_rate is not None else None
+                ),
+            )
 
     try:
         failure_records = await redis.lrange(ZOHO_OAUTH_FAILURES_KEY, 0, -1)
@@ -387,26 +665,20 @@ async def collect_runtime_snapshot(
         cutoff=cutoff,
     )
 
-    try:
-        queued_jobs = await redis.queued_jobs()
-    except Exception:
-        queued_jobs = []
-        logger.exception("Runtime monitoring could not read ARQ queue metadata")
-    inbound_jobs = [
-        job
-        for job in queued_jobs
-        if job.function.rsplit(".", maxsplit=1)[-1] == _INBOUND_JOB_FUNCTION
-    ]
-    arq_queue_age = (
-        max(
-            0.0,
-            (
-                current - min(_as_utc(job.enqueue_time) for job in inbound_jobs)
-            ).total_seconds(),
-        )
-        if inbound_jobs
-        else None
+    queue_metrics = await _arq_queue_metrics(redis, observed_at=current)
+    inbound_class = job_class_for(_INBOUND_JOB_FUNCTION).value
+    inbound_queue = next(
+        (queue for queue in queue_metrics if queue.job_class == inbound_class), None
     )
+    if inbound_queue is not None:
+        # Split queues: the realtime queue holds inbound batches only, so its
+        # scores answer without loading a job.
+        inbound_depth = inbound_queue.depth
+        arq_queue_age = inbound_queue.oldest_wait_seconds
+    else:
+        inbound_depth, arq_queue_age = await _shared_queue_inbound_jobs(
+            redis, current=current
+        )
     (
         durable_depth,
         durable_queue_age,
@@ -414,9 +686,23 @@ async def collect_runtime_snapshot(
     ) = await _durable_inbound_queue_metadata(redis)
     if not durable_metadata_healthy:
         dependency_failures += 1
-    queue_depth = max(len(inbound_jobs), durable_depth)
+    queue_depth = max(inbound_depth, durable_depth)
     queue_ages = [age for age in (arq_queue_age, durable_queue_age) if age is not None]
     oldest_queue_age = max(queue_ages) if queue_ages else None
+    # Windowed per monitoring run, in the worker process that runs it.
+    pool_stats = redis_pool_stats(reset=True)
+    try:
+        chat_latency = [
+            PhaseLatencyMetrics.model_validate(asdict(summary))
+            for summary in summarize_latency_window(
+                await read_latency_window(
+                    redis, _CHAT_LATENCY_WINDOW, now=current.timestamp()
+                )
+            )
+        ]
+    except Exception:
+        chat_latency = []
+        logger.exception("Runtime monitoring could not read chat latency histograms")
 
     database_healthy = True
     try:
@@ -462,6 +748,11 @@ async def collect_runtime_snapshot(
         maintenance_age_seconds=maintenance_age,
         maintenance_last_run_succeeded=maintenance_succeeded,
         maintenance_heartbeat_missing=heartbeat_missing,
+        queues=queue_metrics,
+        redis_pool=RedisPoolMetrics.model_validate(asdict(pool_stats)),
+        chat_latency=chat_latency,
+        jobs=job_metrics,
+        answer_cache=answer_cache,
     )
 
 
@@ -0,0 +1,279 @@
+"""Due times of the follow-up crons, one indexed row per conversation and kind.
+
+Proposal follow-ups and payment reminders used to find their work by paging
+through every active conversation hourly and checking its metadata in Python.
+Now each conversation keeps a `ScheduledAction` row per kind whose ``due_at``
+is derived from the same metadata -- `proposal_followup_due_at` and
+`payment_reminder_due_at` -- and the crons claim only rows that are due, with
+``FOR UPDATE SKIP LOCKED``.
+
+The rows follow the metadata wherever it changes: a `TurnStateBuffer` syncs
+its conversations at every commit of an inbound turn (proposal sent, order
+approved in chat, customer reply), the Telegram order decision syncs its
+conversation, and each claimed row is rescheduled or closed after the cron
+handles it. `reconcile_scheduled_actions` fills in rows a crashed writer
+missed, and the whole table on first deploy.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import uuid
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import Executable
+
+from src.core.database import async_session_factory, profile_job_queries
+from src.models.conversation import Conversation
+from src.models.message import Message
+from src.models.scheduled_action import (
+    SCHEDULED_ACTION_OPEN_STATES,
+    ScheduledAction,
+)
+
+logger = logging.getLogger(__name__)
+
+# A claim older than this belongs to a run that died; the row is due again.
+CLAIM_LEASE = datetime.timedelta(minutes=15)
+# A claimed row that is still due but could not be sent (send window closed,
+# template missing, escalation open) is looked at again after the next run.
+RETRY_DELAY = datetime.timedelta(hours=1)
+RECONCILE_BATCH_SIZE = 500
+
+
+class ScheduledActionKind(StrEnum):
+    PROPOSAL_FOLLOWUP = "proposal_followup"
+    PAYMENT_REMINDER = "payment_reminder"
+
+
+ScheduledActionDues = dict[ScheduledActionKind, datetime.datetime | None]
+
+
+def _as_aware_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.UTC)
+    return value.astimezone(datetime.UTC)
+
+
+def scheduled_action_dues(conversation: Conversation) -> ScheduledActionDues:
+    """Each kind's due time as the conversation's metadata stands."""
+    from src.services.followup import payment_reminder_due_at
+    from src.services.proposal_followup import proposal_followup_due_at
+
+    return {
+        ScheduledActionKind.PROPOSAL_FOLLOWUP: proposal_followup_due_at(conversation),
+        ScheduledActionKind.PAYMENT_REMINDER: payment_reminder_due_at(conversation),
+    }
+
+
+def schedule_action_statement(
+    conversation_id: uuid.UUID,
+    kind: ScheduledActionKind,
+    due_at: datetime.datetime | None,
+) -> Executable:
+    """Upsert the pending row for ``due_at``, or close the open row if ``None``."""
+    if due_at is None:
+        return (
+            update(ScheduledAction)
+            .where(
+                ScheduledAction.conversation_id == conversation_id,
+                ScheduledAction.kind == kind.value,
+                ScheduledAction.state.in_(SCHEDULED_ACTION_OPEN_STATES),
+            )
+            .values(state="done", claimed_at=None, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+    stmt = insert(ScheduledAction).values(
+        id=uuid.uuid4(),
+        conversation_id=conversation_id,
+        kind=kind.value,
+        due_at=_as_aware_utc(due_at),
+        state="pending",
+    )
+    return stmt.on_conflict_do_update(
+        constraint="uq_scheduled_actions_conversation_id_kind",
+        set_={
+            "due_at": stmt.excluded.due_at,
+            "state": "pending",
+            "claimed_at": None,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def changed_schedule_statements(
+    conversation_id: uuid.UUID,
+    dues: Mapping[ScheduledActionKind, datetime.datetime | None],
+    previous: Mapping[ScheduledActionKind, datetime.datetime | None] | None,
+) -> list[Executable]:
+    """Statements for the kinds whose due time moved since ``previous``."""
+    return [
+        schedule_action_statement(conversation_id, kind, due_at)
+        for kind, due_at in dues.items()
+        if previous is None or kind not in previous or previous[kind] != due_at
+    ]
+
+
+async def sync_scheduled_actions(
+    db: Any,
+    conversation: Conversation,
+    *,
+    previous: Mapping[ScheduledActionKind, datetime.datetime | None] | None = None,
+) -> ScheduledActionDues:
+    """Bring the conversation's rows in line with its metadata; commit is yours."""
+    dues = scheduled_action_dues(conversation)
+    for stmt in changed_schedule_statements(conversation.id, dues, previous):
+        await db.execute(stmt)
+    return dues
+
+
+async def claim_due_actions(
+    db: Any,
+    kind: ScheduledActionKind,
+    *,
+    now: datetime.datetime,
+    limit: int,
+) -> list[uuid.UUID]:
+    """Claim up to ``limit`` due rows of ``kind``; their conversation ids.
+
+    Concurrent runs skip each other's locked rows instead of waiting, and the
+    claim is committed before the caller starts sending.
+    """
+    if limit <= 0:
+        return []
+    now_utc = _as_aware_utc(now)
+    due = (
+        select(ScheduledAction.id)
+        .where(
+            ScheduledAction.kind == kind.value,
+            ScheduledAction.state.in_(SCHEDULED_ACTION_OPEN_STATES),
+            ScheduledAction.due_at <= now_utc,
+            or_(
+                ScheduledAction.state == "pending",
+                and_(
+                    ScheduledAction.state == "claimed",
+                    ScheduledAction.claimed_at < now_utc - CLAIM_LEASE,
+                ),
+            ),
+        )
+        .order_by(ScheduledAction.due_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        update(ScheduledAction)
+        .where(ScheduledAction.id.in_(due))
+        .values(state="claimed", claimed_at=now_utc, updated_at=func.now())
+        .returning(ScheduledAction.conversation_id)
+        .execution_options(synchronize_session=False)
+    )
+    conversation_ids = list(result.scalars().all())
+    await db.commit()
+    return conversation_ids
+
+
+async def load_claimed_conversations(
+    db: Any,
+    conversation_ids: Sequence[uuid.UUID],
+) -> list[tuple[Conversation, datetime.datetime | None]]:
+    """The claimed conversations with the time of their last customer message."""
+    if not conversation_ids:
+        return []
+    last_customer_message = (
+        select(
+            Message.conversation_id.label("conversation_id"),
+            func.max(Message.created_at).label("last_customer_inbound_at"),
+        )
+        .where(Message.role == "user")
+        .where(Message.conversation_id.in_(conversation_ids))
+        .group_by(Message.conversation_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(Conversation, last_customer_message.c.last_customer_inbound_at)
+        .outerjoin(
+            last_customer_message,
+            last_customer_message.c.conversation_id == Conversation.id,
+        )
+        .where(Conversation.id.in_(conversation_ids))
+        .order_by(Conversation.id)
+    )
+    return [(row[0], row[1]) for row in result.all()]
+
+
+async def reschedule_claimed_action(
+    db: Any,
+    conversation_id: uuid.UUID,
+    kind: ScheduledActionKind,
+    due_at: datetime.datetime | None,
+    *,
+    now: datetime.datetime,
+) -> None:
+    """Release a claimed row: pending at ``due_at``, or done if ``None``.
+
+    A row that is still due is pushed back by `RETRY_DELAY` so one run never
+    claims it twice.
+    """
+    if due_at is not None:
+        due_at = max(_as_aware_utc(due_at), _as_aware_utc(now) + RETRY_DELAY)
+    await db.execute(schedule_action_statement(conversation_id, kind, due_at))
+
+
+async def _reconcile_batch(db: Any, conversations: Sequence[Conversation]) -> int:
+    ids = [conversation.id for conversation in conversations]
+    result = await db.execute(
+        select(
+            ScheduledAction.conversation_id,
+            ScheduledAction.kind,
+            ScheduledAction.state,
+        ).where(ScheduledAction.conversation_id.in_(ids))
+    )
+    open_rows = {
+        (row[0], row[1])
+        for row in result.all()
+        if row[2] in SCHEDULED_ACTION_OPEN_STATES
+    }
+    written = 0
+    for conversation in conversations:
+        for kind, due_at in scheduled_action_dues(conversation).items():
+            # Open rows are the crons' to move; only missing or stale ones
+            # are written here.
+            is_open = (conversation.id, kind.value) in open_rows
+            if is_open == (due_at is not None):
+                continue
+            await db.execute(schedule_action_statement(conversation.id, kind, due_at))
+            written += 1
+    return written
+
+
+@profile_job_queries
+async def reconcile_scheduled_actions(ctx: dict[str, Any]) -> None:
+    """Daily safety net: create due rows the metadata implies but nobody wrote."""
+    written = 0
+    last_id: uuid.UUID | None = None
+    async with async_session_factory() as db:
+        while True:
+            stmt = (
+                select(Conversation)
+                .where(Conversation.status == "active")
+                .where(Conversation.metadata_.is_not(None))
+                .order_by(Conversation.id)
+                .limit(RECONCILE_BATCH_SIZE)
+            )
+            if last_id is not None:
+                stmt = stmt.where(Conversation.id > last_id)
+            conversations = list((await db.execute(stmt)).scalars().all())
+            if not conversations:
+                break
+            written += await _reconcile_batch(db, conversations)
+            await db.commit()
+            last_id = conversations[-1].id
+            if len(conversations) < RECONCILE_BATCH_SIZE:
+                break
+    if written:
+        logger.warning("Reconciled %d scheduled actions", written)
@@ -0,0 +1,332 @@
+"""Sampled, privacy-safe statistical profiles of inbound chat turns.
+
+With ``settings.worker_profile_sample_rate`` above zero, that fraction of
+`process_incoming_batch` runs is profiled: a sampler thread reads the stack of
+the event-loop thread and of the default executor's threads (where WeasyPrint
+and the embedding model run) every ``worker_profile_interval_ms``, and a loop
+heartbeat records every interval the loop was blocked longer than
+``worker_profile_block_threshold_ms``, with the stack seen while it was.
+
+A profile stores only ``path:function`` frames, sample counts, the wall and
+the loop thread's CPU time -- never locals, arguments or message text -- as one
+JSON file per turn in ``worker_profile_dir``. The stacks are in the folded
+``frame;frame;frame`` form flamegraph tools read, and
+``scripts/aggregate_turn_profiles.py`` sums the files per function.
+
+Stacks of the loop thread are prefixed ``loop``, executor stacks
+``executor``. A loop sample parked in the selector is counted as ``(idle)``:
+the loop was awaiting I/O. The sampler sees the whole process, so turns that
+run concurrently in the worker share the samples; one turn is profiled at a
+time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TURN_PROFILE_SCHEMA_VERSION = 1
+IDLE_STACK = "(idle)"
+_MAX_STACK_DEPTH = 64
+_EXECUTOR_THREAD_PREFIX = "asyncio_"
+_REPO_ROOT = str(Path(__file__).resolve().parents[2]) + "/"
+_WAITING_FILES = ("selectors.py", "threading.py", "queue.py")
+_profiling = threading.Lock()
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    if path.startswith(_REPO_ROOT):
+        path = path[len(_REPO_ROOT) :]
+    elif (marker := path.rfind("-packages/")) >= 0:
+        path = path[marker + len("-packages/") :]
+    else:
+        path = path.rsplit("/", 1)[-1]
+    return f"{path}:{code.co_qualname}"
+
+
+def _folded_stack(frame: FrameType | None) -> tuple[str, bool]:
+    """Root-first ``frame;frame`` labels and whether the thread is waiting."""
+    labels: list[str] = []
+    leaf_file = frame.f_code.co_filename if frame is not None else ""
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    waiting = leaf_file.endswith(_WAITING_FILES)
+    return ";".join(reversed(labels)), waiting
+
+
+def _thread_cpu_seconds(thread_id: int) -> float | None:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+    except (AttributeError, OSError):
+        return None
+
+
+@dataclass(slots=True)
+class _Sampler:
+    loop_thread_id: int
+    interval: float
+    stacks: Counter[str] = field(default_factory=Counter)
+    samples: int = 0
+    _recent: deque[tuple[float, str]] = field(
+        default_factory=lambda: deque(maxlen=1024)
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _stop: threading.Event = field(default_factory=threading.Event)
+
+    def run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def sample(self) -> None:
+        frames = sys._current_frames()
+        executor_ids = {
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.name.startswith(_EXECUTOR_THREAD_PREFIX)
+        }
+        now = time.perf_counter()
+        with self._lock:
+            self.samples += 1
+            for thread_id, frame in frames.items():
+                if thread_id == self.loop_thread_id:
+                    stack, waiting = _folded_stack(frame)
+                    stack = f"loop;{IDLE_STACK}" if waiting else f"loop;{stack}"
+                    self._recent.append((now, stack))
+                elif thread_id in executor_ids:
+                    stack, waiting = _folded_stack(frame)
+                    if waiting:
+                        continue
+                    stack = f"executor;{stack}"
+                else:
+                    continue
+                self.stacks[stack] += 1
+
+    def loop_stack_between(self, start: float, end: float) -> str | None:
+        with self._lock:
+            seen = Counter(stack for at, stack in self._recent if start <= at <= end)
+        return seen.most_common(1)[0][0] if seen else None
+
+
+@dataclass(slots=True)
+class TurnProfile:
+    """One sampled turn; `snapshot` is the JSON artefact."""
+
+    interval_ms: float
+    block_threshold_ms: float
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    wall_ms: float = 0.0
+    cpu_ms: float | None = None
+    samples: int = 0
+    stacks: dict[str, int] = field(default_factory=dict)
+    blocking: list[dict[str, Any]] = field(default_factory=list)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "schema_version": TURN_PROFILE_SCHEMA_VERSION,
+            "started_at": self.started_at.isoformat(),
+            "interval_ms": self.interval_ms,
+            "block_threshold_ms": self.block_threshold_ms,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": None if self.cpu_ms is None else round(self.cpu_ms, 3),
+            "samples": self.samples,
+            "stacks": dict(sorted(self.stacks.items())),
+            "blocking": self.blocking,
+        }
+
+
+@contextmanager
+def _profile(interval_ms: float, block_threshold_ms: float) -> Iterator[TurnProfile]:
+    loop = asyncio.get_running_loop()
+    loop_thread_id = threading.get_ident()
+    interval = interval_ms / 1000
+    threshold = block_threshold_ms / 1000
+    profile = TurnProfile(
+        interval_ms=interval_ms, block_threshold_ms=block_threshold_ms
+    )
+    sampler = _Sampler(loop_thread_id=loop_thread_id, interval=interval)
+    thread = threading.Thread(target=sampler.run, name="turn-profiler", daemon=True)
+    started = time.perf_counter()
+    cpu_started = _thread_cpu_seconds(loop_thread_id)
+    heartbeat: asyncio.TimerHandle | None = None
+
+    def tick(expected: float) -> None:
+        nonlocal heartbeat
+        now = time.perf_counter()
+        late = now - expected
+        if late > threshold:
+            profile.blocking.append(
+                {
+                    "offset_ms": round((expected - started) * 1000, 3),
+                    "duration_ms": round(late * 1000, 3),
+                    "stack": sampler.loop_stack_between(expected, now),
+                }
+            )
+        heartbeat = loop.call_later(interval, tick, now + interval)
+
+    heartbeat = loop.call_later(interval, tick, started + interval)
+    thread.start()
+    try:
+        yield profile
+    finally:
+        sampler.stop()
+        if heartbeat is not None:
+            heartbeat.cancel()
+        thread.join()
+        profile.wall_ms = (time.perf_counter() - started) * 1000
+        cpu_finished = _thread_cpu_seconds(loop_thread_id)
+        if cpu_started is not None and cpu_finished is not None:
+            profile.cpu_ms = (cpu_finished - cpu_started) * 1000
+        profile.samples = sampler.samples
+        profile.stacks = dict(sampler.stacks)
+
+
+def write_turn_profile(profile: TurnProfile, directory: Path, max_files: int) -> Path:
+    """Write ``profile`` and drop the oldest files beyond ``max_files``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = profile.started_at.strftime("%Y%m%dT%H%M%S%f")
+    path = directory / f"turn-{stamp}-{uuid.uuid4().hex[:8]}.json"
+    path.write_text(json.dumps(profile.snapshot(), separators=(",", ":")))
+    existing = sorted(directory.glob("turn-*.json"))
+    for stale in existing[: max(len(existing) - max_files, 0)]:
+        stale.unlink(missing_ok=True)
+    return path
+
+
+@contextmanager
+def sample_turn_profile() -> Iterator[TurnProfile | None]:
+    """Profile the enclosed turn if it is sampled; yield ``None`` otherwise."""
+    rate = settings.worker_profile_sample_rate
+    if rate <= 0 or random.random() >= rate:
+        yield None
+        return
+    if not _profiling.acquire(blocking=False):
+        yield None
+        return
+    profile: TurnProfile | None = None
+    try:
+        with _profile(
+            settings.worker_profile_interval_ms,
+            settings.worker_profile_block_threshold_ms,
+        ) as profile:
+            yield profile
+    finally:
+        _profiling.release()
+        if profile is not None:
+            try:
+                write_turn_profile(
+                    profile,
+                    Path(settings.worker_profile_dir),
+                    settings.worker_profile_max_files,
+                )
+            except OSError:
+                logger.warning("Could not write the turn profile", exc_info=True)
+
+
+def _stack_functions(stack: str) -> tuple[str, list[str]]:
+    thread, _, frames = stack.partition(";")
+    return thread, frames.split(";") if frames else []
+
+
+def summarize_turn_profiles(
+    profiles: Iterable[Mapping[str, Any]],
+    *,
+    top: int = 25,
+) -> dict[str, Any]:
+    """Sum profile artefacts per function, split by loop and executor threads.
+
+    ``self`` counts the samples a function was the leaf of, ``total`` those it
+    was anywhere on the stack (once per sample, however deep it recursed).
+    """
+    valid = [
+        profile
+        for profile in profiles
+        if profile.get("schema_version") == TURN_PROFILE_SCHEMA_VERSION
+    ]
+    functions: dict[str, dict[str, Counter[str]]] = {}
+    thread_samples: Counter[str] = Counter()
+    idle_samples = 0
+    blocked: Counter[str] = Counter()
+    blocking_ms: list[float] = []
+    for profile in valid:
+        for stack, count in profile.get("stacks", {}).items():
+            thread, frames = _stack_functions(stack)
+            thread_samples[thread] += count
+            if frames == [IDLE_STACK]:
+                idle_samples += count
+                continue
+            counters = functions.setdefault(
+                thread, {"self": Counter(), "total": Counter()}
+            )
+            if frames:
+                counters["self"][frames[-1]] += count
+            for function in set(frames):
+                counters["total"][function] += count
+        for interval in profile.get("blocking", []):
+            duration = float(interval.get("duration_ms", 0.0))
+            blocking_ms.append(duration)
+            _thread, frames = _stack_functions(interval.get("stack") or "loop;")
+            blocked[frames[-1] if frames else "(unknown)"] += round(duration)
+
+    wall_ms = sum(float(profile.get("wall_ms", 0.0)) for profile in valid)
+    cpu_values = [
+        float(profile["cpu_ms"])
+        for profile in valid
+        if profile.get("cpu_ms") is not None
+    ]
+    loop_samples = thread_samples.get("loop", 0)
+    return {
+        "profiles": len(valid),
+        "wall_ms": round(wall_ms, 3),
+        "loop_cpu_ms": round(sum(cpu_values), 3) if cpu_values else None,
+        "loop_idle_share": (
+            round(idle_samples / loop_samples, 3) if loop_samples else None
+        ),
+        "samples": dict(sorted(thread_samples.items())),
+        "functions": {
+            thread: {
+                kind: [
+                    {"function": function, "samples": count}
+                    for function, count in counter.most_common(top)
+                ]
+                for kind, counter in counters.items()
+            }
+            for thread, counters in sorted(functions.items())
+        },
+        "blocking": {
+            "intervals": len(blocking_ms),
+            "max_ms": round(max(blocking_ms), 3) if blocking_ms else None,
+            "by_function_ms": dict(blocked.most_common(top)),
+        },
+    }
+
+
+def merge_folded_stacks(profiles: Iterable[Mapping[str, Any]]) -> list[str]:
+    """Folded ``stack count`` lines for flamegraph.pl, speedscope and friends."""
+    merged: Counter[str] = Counter()
+    for profile in profiles:
+        merged.update(profile.get("stacks", {}))
+    return [f"{stack} {count}" for stack, count in sorted(merged.items())]
@@ -0,0 +1,215 @@
+"""Write conversation metadata back once per commit, as a JSONB diff.
+
+The dialogue code updates ``Conversation.metadata_`` by reassigning the whole
+dict -- quote frames, pending selections, fact traces, sales memory -- often
+with a flush in between, and every flush used to rewrite the entire blob. A
+`TurnStateBuffer` bound to the turn's session keeps those reassignments in
+memory: before each flush it marks the tracked conversations' metadata as
+already written, and before each commit it compares the metadata with what
+was last written, key by key, and issues one ``UPDATE`` that merges only the
+changed keys and drops the removed ones (``metadata || changed - removed``).
+
+Reads within the turn see the in-memory value, as before. A rollback of the
+whole transaction expires the conversation, so the buffer stops tracking it
+and nothing stale is written. A savepoint rollback keeps the tracking: the
+deferred keys were never sent, so the next commit still writes them. The
+same write-back moves the conversation's `ScheduledAction` rows when the
+metadata changes their due time, in the same transaction.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy import Text, event, func, literal, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history, set_committed_value
+from sqlalchemy.sql.dml import Update
+
+from src.models.conversation import Conversation
+from src.services.scheduled_actions import (
+    ScheduledActionDues,
+    changed_schedule_statements,
+    scheduled_action_dues,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _encoded_keys(metadata: Mapping[str, Any] | None) -> dict[str, str]:
+    return {key: _encode(value) for key, value in (metadata or {}).items()}
+
+
+@dataclass(frozen=True, slots=True)
+class MetadataDiff:
+    changed: dict[str, Any]
+    removed: tuple[str, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+    @property
+    def size(self) -> int:
+        """Bytes of the diff as sent to the database."""
+        return len(_encode(self.changed)) + sum(len(key) for key in self.removed)
+
+
+def metadata_diff(
+    written: Mapping[str, str],
+    metadata: Mapping[str, Any] | None,
+) -> MetadataDiff:
+    """What changed in ``metadata`` since the keys encoded in ``written``."""
+    current = metadata or {}
+    return MetadataDiff(
+        changed={
+            key: value
+            for key, value in current.items()
+            if written.get(key) != _encode(value)
+        },
+        removed=tuple(sorted(key for key in written if key not in current)),
+    )
+
+
+def metadata_diff_update(conversation_id: uuid.UUID, diff: MetadataDiff) -> Update:
+    """``UPDATE`` merging ``diff`` into the stored metadata, key by key."""
+    merged = func.coalesce(Conversation.metadata_, literal({}, JSONB)).op(
+        "||", return_type=JSONB
+    )(literal(diff.changed, JSONB))
+    if diff.removed:
+        merged = merged.op("-", return_type=JSONB)(
+            literal(list(diff.removed), ARRAY(Text))
+        )
+    return (
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(metadata_=merged)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@dataclass(slots=True)
+class TurnStateWriteStats:
+    """Metadata bytes a turn wrote, against what whole-blob rewrites would."""
+
+    diff_writes: int = 0
+    diff_bytes: int = 0
+    deferred_flushes: int = 0
+    whole_blob_bytes: int = 0
+
+
+@dataclass(slots=True)
+class _Tracked:
+    conversation: Conversation
+    written: dict[str, str]
+    dues: ScheduledActionDues
+
+
+@dataclass(slots=True)
+class TurnStateBuffer:
+    """Defers one session's conversation-metadata writes to its commits.
+
+    Use it around the turn's session and `track` the conversation once it is
+    persistent. Only a real ORM session has flush and commit events to hook;
+    given anything else the buffer does nothing.
+    """
+
+    session: AsyncSession | Session
+    stats: TurnStateWriteStats = field(default_factory=TurnStateWriteStats)
+    _sync_session: Session | None = field(default=None, init=False)
+    _tracked: dict[uuid.UUID, _Tracked] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        sync_session = getattr(self.session, "sync_session", self.session)
+        if isinstance(sync_session, Session):
+            self._sync_session = sync_session
+
+    def open(self) -> None:
+        if self._sync_session is None:
+            return
+        event.listen(self._sync_session, "before_flush", self._before_flush)
+        event.listen(self._sync_session, "before_commit", self._before_commit)
+        event.listen(self._sync_session, "after_soft_rollback", self._forget)
+
+    def close(self) -> None:
+        if self._sync_session is None:
+            return
+        event.remove(self._sync_session, "before_flush", self._before_flush)
+        event.remove(self._sync_session, "before_commit", self._before_commit)
+        event.remove(self._sync_session, "after_soft_rollback", self._forget)
+        self._tracked.clear()
+
+    async def __aenter__(self) -> Self:
+        self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+        if self.stats.deferred_flushes or self.stats.diff_writes:
+            logger.info(
+                "Turn metadata write-back: writes=%d bytes=%d; whole-blob "
+                "rewrites would have been %d writes, %d bytes",
+                self.stats.diff_writes,
+                self.stats.diff_bytes,
+                self.stats.deferred_flushes,
+                self.stats.whole_blob_bytes,
+            )
+
+    def track(self, conversation: Conversation) -> None:
+        """Buffer ``conversation``'s metadata; its stored value is the baseline."""
+        if self._sync_session is None:
+            return
+        self._tracked[conversation.id] = _Tracked(
+            conversation,
+            _encoded_keys(conversation.metadata_),
+            scheduled_action_dues(conversation),
+        )
+
+    def _before_flush(self, session: Session, *_args: Any) -> None:
+        for tracked in self._tracked.values():
+            conversation = tracked.conversation
+            if get_history(conversation, "metadata_").has_changes():
+                self.stats.deferred_flushes += 1
+                self.stats.whole_blob_bytes += len(_encode(conversation.metadata_))
+                set_committed_value(conversation, "metadata_", conversation.metadata_)
+
+    def _before_commit(self, session: Session) -> None:
+        self.write_back(session)
+
+    def write_back(self, session: Session) -> None:
+        """Merge each tracked conversation's metadata changes into its row."""
+        for conversation_id, tracked in self._tracked.items():
+            metadata = tracked.conversation.metadata_
+            diff = metadata_diff(tracked.written, metadata)
+            if not diff:
+                continue
+            session.execute(metadata_diff_update(conversation_id, diff))
+            tracked.written = _encoded_keys(metadata)
+            dues = scheduled_action_dues(tracked.conversation)
+            for statement in changed_schedule_statements(
+                conversation_id, dues, tracked.dues
+            ):
+                session.execute(statement)
+            tracked.dues = dues
+            self.stats.diff_writes += 1
+            self.stats.diff_bytes += diff.size
+
+    def _forget(self, session: Session, previous_transaction: Any) -> None:
+        if not previous_transaction.nested:
+            self._tracked.clear()
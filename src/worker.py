@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import Any
 
 from arq import func
 from arq.connections import RedisSettings
-from arq.cron import cron
+from arq.cron import CronJob, cron
+from arq.worker import Function
 
+from src.api.telegram_webhook import run_telegram_action
+from src.api.v1.webhook import persist_wazzup_statuses
 from src.core.config import settings
+from src.core.queues import (
+    BATCH_QUEUE,
+    INTERACTIVE_QUEUE,
+    REALTIME_QUEUE,
+    JobClass,
+    deserialize_job_payload,
+    job_class_for,
+    serialize_job_payload,
+)
 from src.core.safe_logging import install_sensitive_url_filter
 from src.integrations.inventory.sync import (
     sync_products_from_treejar_catalog,
     sync_products_from_zoho,
 )
+from src.integrations.voice.voxtral import close_voice_http_client
 from src.llm.conversation_summary import refresh_conversation_summary
 from src.quality.job import (
     evaluate_mature_conversations_quality,
@@ -21,13 +35,23 @@ from src.quality.job import (
 )
 from src.quality.manager_job import evaluate_escalated_conversations
 from src.rag.embeddings import EmbeddingEngine
-from src.services.chat import INBOUND_BATCH_MAX_TRIES, process_incoming_batch
+from src.services.catalog_artifacts import refresh_catalog_artifacts
+from src.services.chat import (
+    INBOUND_BATCH_MAX_TRIES,
+    deliver_product_media,
+    process_incoming_batch,
+)
 from src.services.followup import run_automatic_followups, run_feedback_requests
+from src.services.job_stats import record_job_stats
+from src.services.knowledge_base_index import reindex_knowledge_base
+from src.services.latency_slo import chat_latency_recorder
 from src.services.metrics import calculate_and_store_metrics
 from src.services.notifications import run_daily_summary
+from src.services.product_neighbors import refresh_product_neighbors
 from src.services.proposal_followup import run_proposal_followups
 from src.services.reports import run_weekly_report
 from src.services.runtime_monitoring import run_runtime_monitoring
+from src.services.scheduled_actions import reconcile_scheduled_actions
 
 logger = logging.getLogger(__name__)
 
@@ -73,75 +97,177 @@ async def startup(ctx: dict[str, Any]) -> None:
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
-    """Worker shutdown — log clean exit."""
+    """Worker shutdown — flush latency histograms, close pooled clients, log exit."""
+    await chat_latency_recorder.flush(ctx["redis"])
+    await close_voice_http_client()
     logger.info("ARQ worker shutting down.")
 
 
-class WorkerSettings:
-    functions: list[Any] = [
+def _with_job_stats(functions: list[Any]) -> list[Any]:
+    """Wrap each job so its outcome feeds the runtime monitoring counters."""
+    return [
+        replace(function, coroutine=record_job_stats(function.coroutine))
+        if isinstance(function, Function | CronJob)
+        else record_job_stats(function)
+        for function in functions
+    ]
+
+
+_FUNCTIONS: list[Any] = [
+    sync_products_from_treejar_catalog,
+    sync_products_from_zoho,
+    refresh_product_neighbors,
+    refresh_catalog_artifacts,
+    reindex_knowledge_base,
+    func(process_incoming_batch, max_tries=INBOUND_BATCH_MAX_TRIES),
+    deliver_product_media,
+    refresh_conversation_summary,
+    run_telegram_action,
+    persist_wazzup_statuses,
+    run_automatic_followups,
+    run_proposal_followups,
+    run_feedback_requests,
+    reconcile_scheduled_actions,
+    calculate_and_store_metrics,
+    evaluate_realtime_red_flags,
+    evaluate_mature_conversations_quality,
+    evaluate_recent_conversations_quality,
+    evaluate_escalated_conversations,
+    run_daily_summary,
+    run_weekly_report,
+    run_runtime_monitoring,
+]
+
+_CRON_JOBS = [
+    cron(
         sync_products_from_treejar_catalog,
-        sync_products_from_zoho,
-        func(process_incoming_batch, max_tries=INBOUND_BATCH_MAX_TRIES),
-        refresh_conversation_summary,
-        run_automatic_followups,
-        run_proposal_followups,
-        run_feedback_requests,
+        hour={0, 6, 12, 18},
+        minute={0},
+        run_at_startup=False,
+    ),
+    # Catches entries whose reindex could not be queued when they were saved.
+    cron(reindex_knowledge_base, minute={25}, run_at_startup=False),
+    cron(run_automatic_followups, minute={0}, run_at_startup=False),
+    cron(run_proposal_followups, minute={15}, run_at_startup=False),
+    cron(run_feedback_requests, hour={10}, minute={0}, run_at_startup=False),
+    # Also at startup, so a fresh deploy schedules existing conversations.
+    cron(
+        reconcile_scheduled_actions,
+        hour={3},
+        minute={40},
+        run_at_startup=True,
+    ),
+    cron(
         calculate_and_store_metrics,
-        evaluate_realtime_red_flags,
+        minute={0, 10, 20, 30, 40, 50},
+        run_at_startup=True,
+    ),
+    cron(
         evaluate_mature_conversations_quality,
-        evaluate_recent_conversations_quality,
+        minute={0},
+        run_at_startup=False,
+    ),
+    cron(
+        evaluate_realtime_red_flags,
+        minute={30},
+        run_at_startup=False,
+    ),
+    cron(
         evaluate_escalated_conversations,
-        run_daily_summary,
+        minute={0, 30},
+        run_at_startup=False,
+    ),
+    cron(run_daily_summary, hour={6}, minute={0}, run_at_startup=False),
+    cron(
         run_weekly_report,
+        weekday={0},
+        hour={6},
+        minute={0},
+        run_at_startup=False,
+    ),
+    cron(
         run_runtime_monitoring,
+        minute={2, 7, 12, 17, 22, 27, 32, 37, 42, 47, 52, 57},
+        run_at_startup=False,
+    ),
+]
+
+# Every job reports its outcome to the runtime monitoring counters.
+_FUNCTIONS = _with_job_stats(_FUNCTIONS)
+_CRON_JOBS = _with_job_stats(_CRON_JOBS)
+
+
+def _function_name(function: Any) -> str:
+    if isinstance(function, Function):
+        return function.name
+    return str(function.__name__)
+
+
+def _functions_for(job_class: JobClass) -> list[Any]:
+    return [
+        function
+        for function in _FUNCTIONS
+        if job_class_for(_function_name(function)) is job_class
     ]
-    cron_jobs = [
-        cron(
-            sync_products_from_treejar_catalog,
-            hour={0, 6, 12, 18},
-            minute={0},
-            run_at_startup=False,
-        ),
-        cron(run_automatic_followups, minute={0}, run_at_startup=False),
-        cron(run_proposal_followups, minute={15}, run_at_startup=False),
-        cron(run_feedback_requests, hour={10}, minute={0}, run_at_startup=False),
-        cron(
-            calculate_and_store_metrics,
-            minute={0, 10, 20, 30, 40, 50},
-            run_at_startup=True,
-        ),
-        cron(
-            evaluate_mature_conversations_quality,
-            minute={0},
-            run_at_startup=False,
-        ),
-        cron(
-            evaluate_realtime_red_flags,
-            minute={30},
-            run_at_startup=False,
-        ),
-        cron(
-            evaluate_escalated_conversations,
-            minute={0, 30},
-            run_at_startup=False,
-        ),
-        cron(run_daily_summary, hour={6}, minute={0}, run_at_startup=False),
-        cron(
-            run_weekly_report,
-            weekday={0},
-            hour={6},
-            minute={0},
-            run_at_startup=False,
-        ),
-        cron(
-            run_runtime_monitoring,
-            minute={2, 7, 12, 17, 22, 27, 32, 37, 42, 47, 52, 57},
-            run_at_startup=False,
-        ),
-    ]
+
+
+# ARQ reads worker options from each settings class's own ``__dict__``, so the
+# shared options are repeated per class instead of inherited.
+
+
+class WorkerSettings:
+    """Batch worker: ARQ's default queue, every cron, and every registered job.
+
+    With ``ARQ_SPLIT_QUEUES`` disabled this is the only worker process and it
+    serves realtime and interactive jobs too. With split queues enabled it
+    drains batch work only, plus anything left on the default queue from
+    before the switch. Run with ``arq src.worker.WorkerSettings``.
+    """
+
+    functions = _FUNCTIONS
+    cron_jobs = _CRON_JOBS
+    queue_name = BATCH_QUEUE
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
     job_timeout = 600  # 10 min — accommodate large catalogs (856+ SKU)
-    max_jobs = 2
+    max_jobs = settings.arq_batch_max_jobs
     keep_result = 3600  # keep results for 1 hour for debugging
+    job_serializer = serialize_job_payload
+    job_deserializer = deserialize_job_payload
+
+
+class RealtimeWorkerSettings:
+    """Inbound customer turns only.
+
+    Run with ``arq src.worker.RealtimeWorkerSettings``.
+    """
+
+    functions = _functions_for(JobClass.REALTIME)
+    queue_name = REALTIME_QUEUE
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    job_timeout = 600
+    max_jobs = settings.arq_realtime_max_jobs
+    keep_result = 3600
+    job_serializer = serialize_job_payload
+    job_deserializer = deserialize_job_payload
+
+
+class InteractiveWorkerSettings:
+    """Short side effects of turns and operator actions.
+
+    Run with ``arq src.worker.InteractiveWorkerSettings``.
+    """
+
+    functions = _functions_for(JobClass.INTERACTIVE)
+    queue_name = INTERACTIVE_QUEUE
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    job_timeout = 600
+    max_jobs = settings.arq_interactive_max_jobs
+    keep_result = 3600
+    job_serializer = serialize_job_payload
+    job_deserializer = deserialize_job_payload
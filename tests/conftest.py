@@ -143,6 +143,20 @@ def repair_judge_is_local() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def forget_catalog_artifacts() -> Generator[None, None, None]:
+    """Each test builds catalog artefacts from its own rows.
+
+    Workers keep artefacts per catalog version, and every mocked Redis reports
+    the same version, so one test's price floors would otherwise serve the next.
+    """
+    from src.services import catalog_artifacts
+
+    catalog_artifacts._loaded.clear()
+    yield
+    catalog_artifacts._loaded.clear()
+
+
 @pytest.fixture(autouse=True)
 def cleanup_db_pool() -> Generator[None, None, None]:
     """Force SQLAlchemy to dispose of the connection pool after each test.
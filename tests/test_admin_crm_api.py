@@ -236,6 +236,7 @@ async def test_update_admin_conversation_writes_audit(
 async def test_admin_bot_quality_review_respects_disabled_ai_controls(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    from src.quality import evaluator
     from src.services import admin_crm
 
     evaluate_mock = AsyncMock(side_effect=AssertionError("LLM should not run"))
@@ -245,7 +246,7 @@ async def test_admin_bot_quality_review_respects_disabled_ai_controls(
         "conversation_already_reviewed",
         AsyncMock(return_value=False),
     )
-    monkeypatch.setattr(admin_crm, "evaluate_conversation", evaluate_mock)
+    monkeypatch.setattr(evaluator, "evaluate_conversation", evaluate_mock)
 
     class FakeResult:
         def scalar_one_or_none(self) -> object | None:
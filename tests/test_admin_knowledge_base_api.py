@@ -71,7 +71,7 @@ async def test_admin_knowledge_base_list_endpoint(
 
 
 @pytest.mark.asyncio
-async def test_create_admin_knowledge_base_entry_indexes_and_audits(
+async def test_create_admin_knowledge_base_entry_is_pending_and_audited(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     from src.schemas.admin import AdminKnowledgeBaseWrite
@@ -94,17 +94,12 @@ async def test_create_admin_knowledge_base_entry_indexes_and_audits(
             row.id = uuid.uuid4()
             row.created_at = datetime(2026, 5, 7, 12, 0, 0)
 
-    class FakeEmbeddingEngine:
-        async def embed_async(self, text: str) -> list[float]:
-            assert "Delivery" in text
-            return [0.1] * 1024
-
     audit_calls: list[dict[str, Any]] = []
 
     async def fake_log_admin_action(*_: object, **kwargs: Any) -> None:
         audit_calls.append(kwargs)
 
-    monkeypatch.setattr(admin_knowledge_base, "EmbeddingEngine", FakeEmbeddingEngine)
+    monkeypatch.setattr(admin_knowledge_base, "EmbeddingEngine", None)
     monkeypatch.setattr(admin_knowledge_base, "log_admin_action", fake_log_admin_action)
 
     entry = await admin_knowledge_base.create_admin_kb_entry(
@@ -120,7 +115,9 @@ async def test_create_admin_knowledge_base_entry_indexes_and_audits(
     )
 
     assert entry.title == "Delivery time"
-    assert entry.has_embedding is True
+    # Embedding happens in the reindex job, not in the request.
+    assert entry.has_embedding is False
+    assert entry.embedding_pending is True
     assert audit_calls[0]["action"] == "knowledge_base.create"
     assert audit_calls[0]["after"]["title"] == "Delivery time"
 
@@ -301,17 +298,11 @@ async def test_approve_admin_kb_candidate_uses_collision_safe_title(
             self.refreshed = row
             row.created_at = datetime(2026, 5, 11, 12, 0, 0)
 
-    class FakeEmbeddingEngine:
-        async def embed_async(self, text: str) -> list[float]:
-            assert question in text
-            return [0.1] * 1024
-
     audit_calls: list[dict[str, Any]] = []
 
     async def fake_log_admin_action(*_: object, **kwargs: Any) -> None:
         audit_calls.append(kwargs)
 
-    monkeypatch.setattr(admin_knowledge_base, "EmbeddingEngine", FakeEmbeddingEngine)
     monkeypatch.setattr(admin_knowledge_base, "log_admin_action", fake_log_admin_action)
 
     entry = await admin_knowledge_base.approve_admin_kb_candidate(
@@ -322,6 +313,7 @@ async def test_approve_admin_kb_candidate_uses_collision_safe_title(
 
     assert entry.title.startswith(question)
     assert entry.title != question
+    assert entry.embedding_pending is True
     assert candidate.status == "approved"
     assert candidate.updated_at is not None
     assert candidate.updated_at.tzinfo is None
@@ -393,3 +385,91 @@ async def test_reject_admin_kb_candidate_marks_rejected_and_preserves_reason(
     assert candidate.updated_at.tzinfo is None
     assert db.committed is True
     assert audit_calls[0]["action"] == "knowledge_base.candidate_reject"
+
+
+@pytest.mark.asyncio
+async def test_admin_kb_save_returns_even_when_the_reindex_cannot_be_queued(
+    admin_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.api.v1 import admin_knowledge_base
+    from src.main import app
+    from src.schemas.admin import AdminKnowledgeBaseRead
+
+    saved = AdminKnowledgeBaseRead(
+        id=uuid.uuid4(),
+        source="manual",
+        title="Delivery time",
+        content="Delivery takes 3-5 business days.",
+        language="en",
+        embedding_pending=True,
+        created_at=datetime(2026, 5, 7, 12, 0, 0),
+    )
+    queued: list[object] = []
+
+    async def fake_create(**_: Any) -> AdminKnowledgeBaseRead:
+        return saved
+
+    async def failing_request_kb_reindex(pool: object, **_: Any) -> None:
+        queued.append(pool)
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(admin_knowledge_base, "create_admin_kb_entry", fake_create)
+    monkeypatch.setattr(
+        admin_knowledge_base, "request_kb_reindex", failing_request_kb_reindex
+    )
+    monkeypatch.setattr(app.state, "arq_pool", object(), raising=False)
+
+    response = await admin_client.post(
+        "/api/v1/admin/knowledge-base/entries",
+        json={
+            "source": "manual",
+            "title": "Delivery time",
+            "content": "Delivery takes 3-5 business days.",
+        },
+    )
+
+    assert response.status_code == 201
+    assert response.json()["embedding_pending"] is True
+    assert len(queued) == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_kb_reindex_status_reports_progress_and_pending(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.services import admin_knowledge_base
+
+    class FakeRedis:
+        async def hgetall(self, key: str) -> dict[str, str]:
+            assert key == "kb_reindex:progress"
+            return {
+                "status": "running",
+                "total": "120",
+                "scanned": "64",
+                "embedded": "3",
+                "unchanged": "61",
+                "started_at": "2026-10-19T10:00:00+00:00",
+                "finished_at": "",
+                "error": "",
+            }
+
+    class FakeResult:
+        def scalar_one_or_none(self) -> int:
+            return 5
+
+    class FakeDB:
+        async def execute(self, statement: object) -> FakeResult:
+            sql = str(statement)
+            assert "sha256" in sql and "embedding_hash" in sql
+            return FakeResult()
+
+    status = await admin_knowledge_base.get_admin_kb_reindex_status(
+        db=FakeDB(),  # type: ignore[arg-type]
+        redis=FakeRedis(),
+    )
+
+    assert status.status == "running"
+    assert (status.total, status.scanned, status.pending) == (120, 64, 5)
+    assert status.finished_at is None
+    assert status.error is None
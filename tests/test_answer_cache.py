@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.llm.answer_cache import (
+    answer_cache_bucket,
+    is_shareable_answer,
+    lookup_cached_answer,
+    read_answer_cache_stats,
+    store_cached_answer,
+)
+from src.llm.verified_answers import VerifiedAnswerDecision
+
+_FAQ = [
+    {
+        "id": "kb-1",
+        "title": "Delivery",
+        "content": "Delivery within Dubai takes 3-5 working days.",
+    }
+]
+_VERIFIED = VerifiedAnswerDecision(
+    question_class="service_low_risk",
+    faq_support="verified",
+    matched_topics=("delivery",),
+)
+
+
+def _bucket(**overrides: Any) -> str | None:
+    arguments: dict[str, Any] = {
+        "language": "en",
+        "stage": "greeting",
+        "is_first_turn": False,
+        "decision": _VERIFIED,
+        "faq_context": _FAQ,
+        "behavior_rule_ids": (),
+        "runtime_directives": ("answer from FAQ",),
+    }
+    arguments.update(overrides)
+    return answer_cache_bucket(**arguments)
+
+
+def _unit(*values: float) -> list[float]:
+    vector = np.asarray(values, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def test_bucket_follows_the_faq_entries_and_context() -> None:
+    bucket = _bucket()
+
+    assert bucket is not None
+    assert _bucket() == bucket
+    edited = [{**_FAQ[0], "content": "Delivery within Dubai takes 2 days."}]
+    assert _bucket(faq_context=edited) != bucket
+    assert _bucket(language="ar") != bucket
+    assert _bucket(stage="solution") != bucket
+    assert _bucket(is_first_turn=True) != bucket
+
+
+def test_only_verified_allowed_service_answers_are_cacheable() -> None:
+    partial = VerifiedAnswerDecision(
+        question_class="service_low_risk", faq_support="partial"
+    )
+    handoff = VerifiedAnswerDecision(
+        question_class="service_high_risk",
+        faq_support="verified",
+        policy_action="handoff",
+    )
+    product = VerifiedAnswerDecision(question_class="product", faq_support="missing")
+
+    assert _bucket(decision=partial) is None
+    assert _bucket(decision=handoff) is None
+    assert _bucket(decision=product) is None
+    assert _bucket(faq_context=[]) is None
+
+
+def test_shareable_answer_carries_nothing_of_the_customer() -> None:
+    def shareable(text: str) -> bool:
+        return is_shareable_answer(
+            text, faq_context=_FAQ, private_values=("Omar", "ACME Trading", None)
+        )
+
+    assert shareable("Delivery within Dubai takes 3-5 working days.")
+    assert not shareable("Omar, delivery within Dubai takes 3-5 working days.")
+    assert not shareable("For your 40 chairs, delivery takes 3-5 working days.")
+    assert not shareable("We will email [PII-1a2b] the delivery slot.")
+
+
+@pytest.mark.asyncio
+async def test_lookup_serves_the_closest_answer_above_the_threshold() -> None:
+    redis = AsyncMock()
+    await store_cached_answer(
+        redis, "bucket", _unit(1, 0, 0), "Delivery takes 3-5 days.", ttl_seconds=60
+    )
+    await store_cached_answer(
+        redis, "bucket", _unit(0, 1, 0), "Warranty is 5 years.", ttl_seconds=60
+    )
+    redis.lrange.return_value = [
+        call.args[3].encode() for call in reversed(redis.eval.await_args_list)
+    ]
+
+    near = await lookup_cached_answer(
+        redis, "bucket", _unit(0.98, 0.05, 0), min_similarity=0.95
+    )
+    far = await lookup_cached_answer(
+        redis, "bucket", _unit(1, 1, 0), min_similarity=0.95
+    )
+
+    assert near == "Delivery takes 3-5 days."
+    assert far is None
+    assert json.loads(redis.lrange.return_value[0])["text"] == "Warranty is 5 years."
+
+
+@pytest.mark.asyncio
+async def test_stats_sum_the_minutes_of_the_window() -> None:
+    redis = AsyncMock()
+    redis.eval.return_value = [
+        [b"hit", b"3", b"miss", b"1"],
+        [],
+        [b"hit", b"1", b"store", b"1", b"rejected", b"1"],
+    ]
+
+    stats = await read_answer_cache_stats(redis, minutes=3, now=180.0)
+
+    assert redis.eval.await_args.args[2:] == (
+        "answer_cache:stats:m:1",
+        "answer_cache:stats:m:2",
+        "answer_cache:stats:m:3",
+    )
+    assert (stats.hits, stats.misses, stats.rejected, stats.stores) == (4, 1, 1, 1)
+    assert stats.hit_rate == pytest.approx(4 / 6)
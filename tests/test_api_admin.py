@@ -530,11 +530,52 @@ async def test_admin_product_sync_operator_endpoint(admin_client: AsyncClient) -
 
     assert response.status_code == 200
     assert response.json()["errors"] == 0
-    mock_pool.enqueue_job.assert_awaited_with("sync_products_from_treejar_catalog")
+    mock_pool.enqueue_job.assert_awaited_with(
+        "sync_products_from_treejar_catalog", _queue_name="arq:queue"
+    )
 
     del app.state.arq_pool
 
 
+@pytest.mark.asyncio
+async def test_admin_dashboard_latency_reports_percentiles_and_slo(
+    admin_client: AsyncClient,
+) -> None:
+    from src.core.redis import get_redis
+    from src.services.latency_slo import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for value in (8000.0, 12000.0, 15000.0, 20000.0, 26000.0, 40000.0):
+        histogram.record(value)
+    redis = AsyncMock()
+    app.dependency_overrides[get_redis] = lambda: redis
+    try:
+        with patch(
+            "src.api.v1.admin.read_latency_window",
+            AsyncMock(return_value={"to_text_delivery": histogram}),
+        ) as read_window:
+            response = await admin_client.get(
+                "/api/v1/admin/dashboard/latency/?window=15m"
+            )
+            bad_window = await admin_client.get(
+                "/api/v1/admin/dashboard/latency/?window=7d"
+            )
+    finally:
+        app.dependency_overrides.pop(get_redis, None)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["window"] == "15m"
+    assert read_window.await_args.args[:2] == (redis, "15m")
+    [phase] = payload["phases"]
+    assert phase["phase"] == "to_text_delivery"
+    assert phase["count"] == 6
+    assert phase["p95_ms"] >= 40000
+    assert phase["slo_p95_ms"] == 25000
+    assert phase["breached"] is True
+    assert bad_window.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_admin_manager_review_operator_endpoints(
     admin_client: AsyncClient,
@@ -157,6 +157,68 @@ async def test_list_conversations_can_filter_phone_fuzzy_explicitly(
     assert "LIKE" in list_sql.upper()
 
 
+@pytest.mark.asyncio
+async def test_list_conversations_cursor_pages_seek_instead_of_offset(
+    mock_db: AsyncMock,
+) -> None:
+    def conversation(minute: int) -> Conversation:
+        stamp = datetime(2026, 10, 19, 12, minute, tzinfo=UTC)
+        return Conversation(
+            id=uuid.uuid4(),
+            phone="12345",
+            language="en",
+            status="active",
+            sales_stage="greeting",
+            escalation_status="none",
+            created_at=stamp,
+            updated_at=stamp,
+            metadata_={},
+        )
+
+    first_page = MagicMock()
+    first_page.scalar_one_or_none.return_value = 3
+    first_page.scalars.return_value.all.return_value = [
+        conversation(3),
+        conversation(2),
+        conversation(1),  # look-ahead row
+    ]
+    second_page = MagicMock()
+    second_page.scalar_one_or_none.return_value = 3
+    second_page.scalars.return_value.all.return_value = [conversation(1)]
+    mock_db.execute.side_effect = [first_page, first_page, second_page, second_page]
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        first = await ac.get(
+            "/api/v1/conversations/",
+            params={"page_size": 2},
+            headers=AUTH_HEADERS,
+        )
+        second = await ac.get(
+            "/api/v1/conversations/",
+            params={"page_size": 2, "cursor": first.json()["next_cursor"]},
+            headers=AUTH_HEADERS,
+        )
+        invalid = await ac.get(
+            "/api/v1/conversations/",
+            params={"cursor": "not-a-cursor"},
+            headers=AUTH_HEADERS,
+        )
+
+    assert len(first.json()["items"]) == 2
+    assert first.json()["next_cursor"]
+    assert second.json()["next_cursor"] is None
+    assert [item["updated_at"][:16] for item in second.json()["items"]] == [
+        "2026-10-19T12:01"
+    ]
+    cursor_sql = _executed_sql(mock_db, 3)
+    assert "OFFSET" not in cursor_sql.upper()
+    assert "(conversations.updated_at, conversations.id) <" in cursor_sql
+    assert "LIMIT" in _executed_sql(mock_db, 2).upper()  # bounded cursor count
+    assert invalid.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_conversation_success(mock_db: AsyncMock) -> None:
     conv_id = uuid.uuid4()
@@ -132,7 +132,9 @@ async def test_sync_products_treejar_default(admin_client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json()["synced"] == 0
-    mock_pool.enqueue_job.assert_awaited_with("sync_products_from_treejar_catalog")
+    mock_pool.enqueue_job.assert_awaited_with(
+        "sync_products_from_treejar_catalog", _queue_name="arq:queue"
+    )
 
     del app.state.arq_pool
 
@@ -147,7 +149,9 @@ async def test_sync_products_zoho(admin_client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json()["synced"] == 0
-    mock_pool.enqueue_job.assert_awaited_with("sync_products_from_zoho")
+    mock_pool.enqueue_job.assert_awaited_with(
+        "sync_products_from_zoho", _queue_name="arq:queue"
+    )
 
     # Clean up state to not affect other tests
     del app.state.arq_pool
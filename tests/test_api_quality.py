@@ -148,7 +148,7 @@ async def test_create_review_success() -> None:
     with (
         patch("src.api.v1.quality.conversation_already_reviewed", return_value=False),
         patch(
-            "src.api.v1.quality.evaluate_conversation", return_value=mock_eval_result
+            "src.quality.evaluator.evaluate_conversation", return_value=mock_eval_result
         ),
         patch("src.api.v1.quality.save_review", return_value=mock_review),
     ):
@@ -188,7 +188,7 @@ async def test_create_review_conversation_not_found() -> None:
     with (
         patch("src.api.v1.quality.conversation_already_reviewed", return_value=False),
         patch(
-            "src.api.v1.quality.evaluate_conversation",
+            "src.quality.evaluator.evaluate_conversation",
             side_effect=ValueError(f"No messages found for conversation {conv_id}"),
         ),
     ):
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.llm.catalog_planning import build_price_floors_artifact, catalog_anchor
+from src.services.catalog_artifacts import (
+    CATALOG_VERSION_KEY,
+    catalog_artifact_key,
+    load_catalog_artifact,
+    publish_catalog_artifacts,
+)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, "0")) + 1
+        self.data[key] = str(value)
+        return value
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, db: Any) -> dict[str, Any]:
+        self.calls += 1
+        return {"build": self.calls}
+
+
+class _Result:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+
+class _Session:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, statement: Any) -> _Result:
+        self.queries += 1
+        return _Result(self.rows)
+
+
+def _product(
+    sku: str,
+    name: str,
+    category: str,
+    price: float,
+    stock: int,
+    *,
+    is_active: bool = True,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        sku=sku,
+        name_en=name,
+        name_ar=None,
+        category=category,
+        subcategory=None,
+        price=price,
+        currency="AED",
+        stock=stock,
+        is_active=is_active,
+    )
+
+
+@pytest.mark.asyncio
+async def test_artifact_is_built_once_per_version_and_shared_through_redis() -> None:
+    redis, build = _FakeRedis(), _Builder()
+
+    first = await load_catalog_artifact("floors", None, redis, build)  # type: ignore[arg-type]
+    again = await load_catalog_artifact("floors", None, redis, build)  # type: ignore[arg-type]
+
+    assert first == again == {"build": 1}
+    assert build.calls == 1
+    assert json.loads(redis.data[catalog_artifact_key("floors", "0")]) == first
+
+
+@pytest.mark.asyncio
+async def test_a_new_catalog_version_replaces_the_worker_copy() -> None:
+    redis = _FakeRedis()
+    stale = await load_catalog_artifact("floors", None, redis, _Builder())  # type: ignore[arg-type]
+
+    version = await publish_catalog_artifacts(
+        None,  # type: ignore[arg-type]
+        redis,
+        {"floors": _Builder()},
+    )
+    reader = _Builder()
+    fresh = await load_catalog_artifact("floors", None, redis, reader)  # type: ignore[arg-type]
+
+    assert version == "1"
+    assert redis.data[CATALOG_VERSION_KEY] == "1"
+    assert stale == fresh == {"build": 1}
+    assert reader.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_without_redis_the_artifact_is_built_every_time() -> None:
+    build = _Builder()
+
+    await load_catalog_artifact("floors", None, None, build)  # type: ignore[arg-type]
+    await load_catalog_artifact("floors", None, None, build)  # type: ignore[arg-type]
+
+    assert build.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_price_floors_scan_the_catalog_once_for_anchor_and_openings() -> None:
+    session = _Session(
+        [
+            _product("CH-1", "Mesh chair", "Chairs", 295.0, 36),
+            _product("CH-2", "Retired chair", "Chairs", 99.0, 4, is_active=False),
+            _product("DK-1", "Bench workstation", "Workstation", 1813.0, 8),
+        ]
+    )
+
+    artifact = await build_price_floors_artifact(session)  # type: ignore[arg-type]
+
+    assert session.queries == 1
+    assert artifact["anchors"]["en"]["line"] == (
+        "Chairs from AED 99, desks and workstations from AED 1,813."
+    )
+    assert [line["sku"] for line in artifact["opening_lines"]["en"]] == [
+        "CH-1",
+        "DK-1",
+    ]
+    json.dumps(artifact)
+
+
+@pytest.mark.asyncio
+async def test_catalog_anchor_reads_the_published_floors() -> None:
+    redis = _FakeRedis()
+    session = _Session([_product("CH-1", "Mesh chair", "Chairs", 295.0, 3)])
+    await publish_catalog_artifacts(
+        session,  # type: ignore[arg-type]
+        redis,
+        {"price_floors": build_price_floors_artifact},
+    )
+    session.rows = []
+
+    anchor = await catalog_anchor(session, "en", redis)  # type: ignore[arg-type]
+
+    assert anchor is not None
+    assert anchor.line == "Chairs from AED 295."
+    assert anchor.has_limited_stock is True
+    assert anchor.grounded_amounts == (295.0,)
+    assert session.queries == 1
@@ -9,6 +9,7 @@ Verifies:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,7 +17,11 @@ import pytest
 
 from src.llm import LLMResponse
 from src.schemas.webhook import WazzupIncomingMessage
-from src.services.chat import _determine_role, process_incoming_batch
+from src.services.chat import (
+    _CLAIM_INBOUND_MESSAGES_SCRIPT,
+    _determine_role,
+    process_incoming_batch,
+)
 
 # ---------------------------------------------------------------------------
 # _determine_role tests
@@ -79,12 +84,23 @@ def _make_mock_conv(
     return mock_conv
 
 
+def _inbound_eval(claimed: list[str]) -> Callable[..., object]:
+    """Fake `redis.eval`: the first claim returns ``claimed``, later ones nothing."""
+    claims = [claimed]
+
+    def fake_eval(script: str, *args: object) -> object:
+        del args
+        if script == _CLAIM_INBOUND_MESSAGES_SCRIPT:
+            return claims.pop() if claims else []
+        return 0
+
+    return fake_eval
+
+
 def _seed_inbound_redis(redis: AsyncMock, raw_messages: list[str]) -> None:
     redis.set.return_value = True
     redis.get.return_value = None
-    redis.lrange.return_value = []
-    redis.lmove.side_effect = [*raw_messages, None]
-    redis.eval.return_value = 0
+    redis.eval.side_effect = _inbound_eval(raw_messages)
 
 
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from collections.abc import Iterator
 
 import pytest
 
+from src.core.database import QueryStats
 from src.services.chat_latency import (
     CHAT_LATENCY_EVENT,
     ChatLatencyTrace,
@@ -86,3 +87,21 @@ def test_chat_latency_parser_and_summary_find_dominant_phase() -> None:
 )
 def test_chat_latency_parser_rejects_payloads_with_unapproved_fields(line: str) -> None:
     assert parse_chat_latency_line(line) is None
+
+
+def test_chat_latency_carries_the_turn_query_count_but_not_statements() -> None:
+    stats = QueryStats()
+    stats.record("SELECT * FROM messages WHERE conversation_id = $1", 4.0)
+    stats.record("SELECT * FROM messages WHERE conversation_id = $1", 6.0)
+    trace = ChatLatencyTrace(query_stats=stats)
+
+    payload = trace.snapshot(status="sent")
+    parsed = parse_chat_latency_line(json.dumps(payload))
+    summary = summarize_chat_latency([payload, payload])
+
+    assert payload["db"]["queries"] == 2
+    assert payload["db"]["slowest"][0]["calls"] == 2
+    assert parsed is not None
+    assert parsed["db"] == {"queries": 2, "time_ms": 10.0}
+    assert summary["db"]["queries"] == {"p50": 2.0, "p95": 2.0, "max": 2.0}
+    assert "db" not in ChatLatencyTrace().snapshot(status="sent")
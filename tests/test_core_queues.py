@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from arq.jobs import (
+    deserialize_job,
+    deserialize_result,
+    serialize_job,
+    serialize_result,
+)
+
+from src.core.queues import (
+    BATCH_QUEUE,
+    INTERACTIVE_QUEUE,
+    REALTIME_QUEUE,
+    JobClass,
+    active_queue_names,
+    deserialize_job_payload,
+    enqueue_routed_job,
+    queue_name_for_job,
+    serialize_job_payload,
+)
+
+
+def test_jobs_stay_on_default_queue_until_split_is_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.core.queues.settings.arq_split_queues", False)
+
+    assert queue_name_for_job("process_incoming_batch") == "arq:queue"
+    assert queue_name_for_job("refresh_conversation_summary") == "arq:queue"
+    assert active_queue_names() == {JobClass.BATCH: "arq:queue"}
+
+
+def test_split_queues_route_by_job_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.core.queues.settings.arq_split_queues", True)
+
+    assert queue_name_for_job("process_incoming_batch") == REALTIME_QUEUE
+    assert queue_name_for_job("refresh_conversation_summary") == INTERACTIVE_QUEUE
+    assert queue_name_for_job("sync_products_from_treejar_catalog") == BATCH_QUEUE
+    assert queue_name_for_job("unknown_job") == BATCH_QUEUE
+    assert BATCH_QUEUE == "arq:queue"
+
+
+@pytest.mark.asyncio
+async def test_enqueue_routed_job_passes_queue_name(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.core.queues.settings.arq_split_queues", True)
+    pool = AsyncMock()
+
+    await enqueue_routed_job(
+        pool, "process_incoming_batch", batch_ref="ib1", _defer_by=5
+    )
+
+    pool.enqueue_job.assert_awaited_once_with(
+        "process_incoming_batch",
+        _queue_name=REALTIME_QUEUE,
+        batch_ref="ib1",
+        _defer_by=5,
+    )
+
+
+def test_job_payloads_stay_pickled_until_compact_payloads_are_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.core.queues.settings.compact_queue_payloads", False)
+    job = serialize_job(
+        "process_incoming_batch",
+        (),
+        {"batch_ref": "ib1_ref"},
+        1,
+        1_700_000_000_000,
+        serializer=serialize_job_payload,
+    )
+
+    assert job.startswith(b"\x80")
+    assert deserialize_job(job, deserializer=deserialize_job_payload).kwargs == {
+        "batch_ref": "ib1_ref"
+    }
+
+
+def test_compact_job_payloads_are_msgpack_and_read_legacy_pickles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    arguments = ("conversation-id", "chat-id")
+    kwargs = {"media_items": [{"url": "https://img", "reference_tokens": ["a"]}]}
+    legacy = serialize_job("deliver_product_media", arguments, kwargs, 1, 1)
+    monkeypatch.setattr("src.core.queues.settings.compact_queue_payloads", True)
+    compact = serialize_job(
+        "deliver_product_media",
+        arguments,
+        kwargs,
+        1,
+        1,
+        serializer=serialize_job_payload,
+    )
+
+    assert len(compact) < len(legacy)
+    job = deserialize_job(compact, deserializer=deserialize_job_payload)
+    assert job.function == "deliver_product_media"
+    assert list(job.args) == list(arguments)
+    assert job.kwargs["media_items"][0]["reference_tokens"] == ["a"]
+    assert deserialize_job(legacy, deserializer=deserialize_job_payload).args == (
+        arguments
+    )
+
+
+def test_compact_results_drop_arguments_and_keep_errors_as_text(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.core.queues.settings.compact_queue_payloads", True)
+    result = serialize_result(
+        "run_telegram_action",
+        ("manager_reply",),
+        {"payload": {"chat": {"id": 12345}}},
+        1,
+        1,
+        False,
+        RuntimeError("boom"),
+        2,
+        3,
+        "ref",
+        "arq:queue",
+        "job-id",
+        serializer=serialize_job_payload,
+    )
+
+    assert result is not None
+    decoded = deserialize_result(result, deserializer=deserialize_job_payload)
+    assert decoded.success is False
+    assert decoded.result == "RuntimeError: boom"
+    assert (list(decoded.args), decoded.kwargs) == ([], {})
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.redis import InstrumentedConnectionPool, redis_pool_size
+
+
+def _pool(max_connections: int, timeout: float) -> InstrumentedConnectionPool:
+    pool = InstrumentedConnectionPool(
+        max_connections=max_connections,
+        timeout=timeout,
+        connection_class=AsyncMock,
+    )
+    pool.ensure_connection = AsyncMock()  # type: ignore[method-assign]
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_checkouts_that_wait_for_a_free_connection() -> None:
+    pool = _pool(max_connections=1, timeout=1.0)
+    held = await pool.get_connection()
+
+    waiter = asyncio.create_task(pool.get_connection())
+    await asyncio.sleep(0.02)
+    await pool.release(held)
+    await waiter
+
+    stats = pool.stats()
+    assert stats.acquisitions == 2
+    assert stats.waits == 1
+    assert stats.wait_seconds_max >= 0.01
+    assert stats.timeouts == 0
+    assert stats.in_use == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_checkout_timeouts_and_resets_window() -> None:
+    pool = _pool(max_connections=1, timeout=0.01)
+    await pool.get_connection()
+
+    with pytest.raises(RedisConnectionError):
+        await pool.get_connection()
+
+    assert pool.stats(reset=True).timeouts == 1
+    stats = pool.stats()
+    assert stats.timeouts == 0
+    assert stats.acquisitions == 0
+    assert stats.in_use == 1
+
+
+def test_pool_size_scales_with_busiest_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.core.redis.settings.redis_pool_min_connections", 20)
+    monkeypatch.setattr("src.core.redis.settings.redis_pool_connections_per_job", 4)
+    monkeypatch.setattr("src.core.redis.settings.arq_batch_max_jobs", 2)
+    monkeypatch.setattr("src.core.redis.settings.arq_realtime_max_jobs", 8)
+
+    monkeypatch.setattr("src.core.redis.settings.arq_split_queues", False)
+    assert redis_pool_size() == 20
+
+    monkeypatch.setattr("src.core.redis.settings.arq_split_queues", True)
+    assert redis_pool_size() == 32
+    assert redis_pool_size(max_jobs=3) == 20
@@ -1,8 +1,21 @@
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, patch
 
 import pytest
-
-from src.core.database import get_db
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from src.core import database
+from src.core.database import (
+    QueryStats,
+    current_query_stats,
+    get_db,
+    normalize_statement,
+    profile_job_queries,
+    query_budget_warnings,
+    track_queries,
+)
 
 
 @pytest.mark.asyncio
@@ -47,3 +60,101 @@ async def test_get_db_exception() -> None:
 
         mock_session.rollback.assert_awaited_once()
         mock_session.commit.assert_not_called()
+
+
+@pytest.fixture
+def profiled_engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    monkeypatch.setattr(database, "_instrumented_engines", set())
+    sync_engine = create_engine("sqlite://")
+    database.instrument_query_stats(sync_engine)
+    yield sync_engine
+    sync_engine.dispose()
+
+
+def test_normalize_statement_keeps_the_shape_without_values() -> None:
+    statement = """
+        SELECT products.sku FROM products
+        WHERE products.id IN ($1::UUID, $2::UUID, $3::UUID)
+          AND products.name_en = 'Mesh chair' AND products.stock >= 10
+    """
+
+    assert normalize_statement(statement) == (
+        "SELECT products.sku FROM products WHERE products.id IN (?, ...) "
+        "AND products.name_en = ? AND products.stock >= ?"
+    )
+
+
+def test_track_queries_is_off_until_an_engine_is_instrumented(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(database, "_instrumented_engines", set())
+
+    with track_queries() as stats:
+        assert stats is None
+
+
+def test_track_queries_counts_statements_for_every_enclosing_block(
+    profiled_engine: Engine,
+) -> None:
+    with profiled_engine.connect() as conn, track_queries() as job:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as turn:
+            for value in range(3):
+                conn.execute(text("SELECT :value"), {"value": value})
+        assert current_query_stats() is job
+
+    assert job is not None and turn is not None
+    assert (job.count, turn.count) == (4, 3)
+    assert [(s.statement, s.calls) for s in turn.slowest(5)] == [("SELECT ?", 3)]
+    snapshot = job.snapshot()
+    assert snapshot["queries"] == 4
+    assert snapshot["time_ms"] >= 0
+    assert {entry["statement"] for entry in snapshot["slowest"]} == {"SELECT ?"}
+    assert current_query_stats() is None
+
+
+def test_failed_statements_leave_nothing_on_the_pooled_connection(
+    profiled_engine: Engine,
+) -> None:
+    with profiled_engine.connect() as conn, track_queries() as stats:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        info = dict(conn.info)
+
+    assert stats is not None and stats.count == 1
+    assert info == {}
+
+
+def test_query_budget_warns_on_count_and_on_slow_statements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(database.settings, "db_slow_query_ms", 100.0)
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM conversations WHERE id = $1", 5.0)
+    stats.record("SELECT * FROM products ORDER BY embedding <=> $1", 450.0)
+
+    assert query_budget_warnings(stats, max_queries=10) == [
+        "450 ms for SELECT * FROM products ORDER BY embedding <=> ?"
+    ]
+    assert query_budget_warnings(stats, max_queries=3)[0] == ("4 SQL queries, budget 3")
+    assert query_budget_warnings(None, max_queries=0) == []
+
+
+@pytest.mark.asyncio
+async def test_profiled_job_logs_its_sql_profile(
+    profiled_engine: Engine, caplog: pytest.LogCaptureFixture
+) -> None:
+    @profile_job_queries
+    async def nightly_job(ctx: dict[str, object]) -> int:
+        with profiled_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return 7
+
+    with caplog.at_level("INFO", logger="src.core.database"):
+        assert await nightly_job({}) == 7
+
+    assert nightly_job.__name__ == "nightly_job"
+    assert 'SQL profile of nightly_job: {"queries":1,' in caplog.text
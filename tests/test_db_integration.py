@@ -295,6 +295,7 @@ async def test_get_similar_products_no_source() -> None:
     from src.services.recommendations import get_similar_products
 
     mock_db = AsyncMock()
+    mock_db.execute.return_value.all = MagicMock(return_value=[])  # no neighbours
     mock_db.get.return_value = None  # product not found
 
     result = await get_similar_products(mock_db, uuid4())
@@ -310,6 +311,7 @@ async def test_get_similar_products_no_embedding() -> None:
     mock_product.embedding = None
 
     mock_db = AsyncMock()
+    mock_db.execute.return_value.all = MagicMock(return_value=[])  # no neighbours
     mock_db.get.return_value = mock_product
 
     result = await get_similar_products(mock_db, uuid4())
@@ -382,3 +384,39 @@ async def test_get_cross_sell_with_rules() -> None:
     assert result[1].name == "Desk Screen Divider"
     assert result[0].recommendation_type == "cross_sell"
     assert mock_db.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_recommendations_read_precomputed_neighbours_in_one_query() -> None:
+    """Stored neighbour rows answer without the embedding or rules lookups."""
+    from src.services.recommendations import get_cross_sell, get_similar_products
+
+    def neighbour(name: str, *, stock: int = 5, active: bool = True) -> MagicMock:
+        row = MagicMock()
+        row.id = uuid4()
+        row.name_en = name
+        row.sku = name.upper()
+        row.price = 120.0
+        row.currency = "AED"
+        row.stock = stock
+        row.is_active = active
+        row.score = 0.91234
+        return row
+
+    rows = [
+        neighbour("Retired Desk", active=False),
+        neighbour("Sold Out Chair", stock=0),
+        neighbour("Oak Desk"),
+    ]
+    mock_db = AsyncMock()
+    mock_db.execute.return_value.all = MagicMock(return_value=rows)
+
+    similar = await get_similar_products(mock_db, uuid4(), limit=5)
+    cross_sell = await get_cross_sell(mock_db, "desk", product_id=uuid4())
+
+    assert [item.name for item in similar] == ["Sold Out Chair", "Oak Desk"]
+    assert similar[0].similarity_score == 0.9123
+    assert [item.name for item in cross_sell] == ["Oak Desk"]
+    assert cross_sell[0].recommendation_type == "cross_sell"
+    assert mock_db.execute.await_count == 2
+    mock_db.get.assert_not_awaited()
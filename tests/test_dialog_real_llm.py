@@ -165,7 +165,7 @@ class TestRealLLMGreeting:
     """The model should greet professionally, mention Treejar, ask for the customer's name."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     async def test_greeting_is_professional(self, mock_prompt: AsyncMock) -> None:
         mock_prompt.return_value = (
             "You are Noor, an expert B2B office furniture sales consultant at Treejar.\n"
@@ -203,7 +203,7 @@ class TestRealLLMProductSearch:
     """When user asks about products, model should call search_products tool."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_model_calls_search_products(
         self,
@@ -254,7 +254,7 @@ class TestRealLLMStockCheck:
     """When user asks about stock for a specific SKU, model should call get_stock."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     async def test_model_calls_get_stock(self, mock_prompt: AsyncMock) -> None:
         mock_prompt.return_value = (
             "You are Noor, an expert B2B office furniture sales consultant at Treejar.\n"
@@ -298,7 +298,7 @@ class TestRealLLMWholesaleDiscount:
     """Wholesale segment customer should see discounted prices (15% off)."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_wholesale_price_shown(
         self,
@@ -372,7 +372,7 @@ class TestRealLLMEscalation:
     """When user demands a manager, bot should respond empathetically."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     async def test_escalation_response_is_empathetic(
         self, mock_prompt: AsyncMock
     ) -> None:
@@ -422,7 +422,7 @@ class TestRealLLMArabic:
     """When user writes in Arabic, bot should respond entirely in Arabic."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     async def test_arabic_response(self, mock_prompt: AsyncMock) -> None:
         mock_prompt.return_value = (
             "You are Noor, an expert B2B office furniture sales consultant at Treejar.\n"
@@ -101,7 +101,7 @@ class TestScenario1HappyPath:
     """
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     async def test_greeting_triggers_advance_stage(
         self, mock_prompt: AsyncMock
     ) -> None:
@@ -147,7 +147,7 @@ class TestScenario1HappyPath:
         assert "chair" in result.output.lower() or "help" in result.output.lower()
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_search_products_called_on_query(
         self,
@@ -204,7 +204,7 @@ class TestScenario2WholesaleDiscount:
     """Known Wholesale client gets 15% discount on product prices."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_wholesale_segment_gets_discounted_price(
         self,
@@ -297,7 +297,7 @@ class TestScenario3QuotationFlow:
         "src.integrations.notifications.escalation.notify_manager_escalation",
         new_callable=AsyncMock,
     )
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch(
         "src.services.pdf.generator.render_quotation_html",
         return_value="<html>QUOTE</html>",
@@ -427,7 +427,7 @@ class TestScenario4Escalation:
     """Customer message that warrants escalation should trigger the tool."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch(
         "src.integrations.notifications.escalation.notify_manager_escalation",
         new_callable=AsyncMock,
@@ -501,7 +501,7 @@ class TestScenario5MultiToolChaining:
     """Customer searches products then checks stock for a specific SKU."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_search_then_stock_check(
         self,
@@ -605,7 +605,7 @@ class TestScenario6ProductSearchCap:
     """Product search can retry once, then must continue without a third search."""
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_search_products_removed_after_second_empty_result(
         self,
@@ -683,7 +683,7 @@ class TestScenario6ProductSearchCap:
 
 class TestScenario7OrderHandoffGuard:
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.rag.pipeline.search_knowledge", new_callable=AsyncMock)
     @patch("src.core.config.get_system_config", new_callable=AsyncMock)
     @patch("src.llm.engine.build_message_history", new_callable=AsyncMock)
@@ -783,7 +783,7 @@ class TestScenario7OrderHandoffGuard:
         assert tool_names_by_step[1] == {"escalate_to_manager", "update_language"}
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.rag.pipeline.search_knowledge", new_callable=AsyncMock)
     @patch("src.core.config.get_system_config", new_callable=AsyncMock)
     @patch("src.llm.engine.build_message_history", new_callable=AsyncMock)
@@ -870,7 +870,7 @@ class TestScenario7OrderHandoffGuard:
         assert "advance_stage" in tool_names_by_step[0]
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.rag.pipeline.search_knowledge", new_callable=AsyncMock)
     @patch("src.core.config.get_system_config", new_callable=AsyncMock)
     @patch("src.llm.engine.build_message_history", new_callable=AsyncMock)
@@ -1015,7 +1015,7 @@ class TestScenario7OrderHandoffGuard:
         assert "would you like me to narrow this down" in response.text.lower()
 
     @pytest.mark.asyncio
-    @patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+    @patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
     @patch("src.llm.engine.rag_search_products", new_callable=AsyncMock)
     async def test_search_cap_uses_previous_results_contract_after_second_nearby_search(
         self,
@@ -0,0 +1,112 @@
+"""Guard: hot-path catalog and knowledge reads never select embedding vectors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.models.knowledge_base import KnowledgeBase
+from src.models.product import Product, product_card, product_pricing
+from src.schemas.product import ProductSearchQuery
+
+_EMBEDDING_COLUMNS = ("products.embedding", "knowledge_base.embedding")
+
+
+def _selected_sql(statement: Any) -> str:
+    """The column list of a compiled SELECT, without its WHERE/ORDER BY."""
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    return sql.split("\nFROM ", maxsplit=1)[0]
+
+
+def _assert_no_embedding_loaded(statement: Any) -> None:
+    selected = _selected_sql(statement)
+    loaded = [
+        column
+        for column in _EMBEDDING_COLUMNS
+        if f"{column}," in selected or selected.rstrip().endswith(column)
+    ]
+    assert not loaded, f"hot-path query selects {loaded}: {selected}"
+
+
+class _Result:
+    def __init__(self, value: object = None) -> None:
+        self._value = value
+
+    def scalars(self) -> _Result:
+        return self
+
+    def all(self) -> list[object]:
+        return []
+
+    def scalar_one_or_none(self) -> object:
+        return self._value
+
+
+class _RecordingSession:
+    def __init__(self, *results: _Result) -> None:
+        self.statements: list[Any] = []
+        self._results = list(results)
+
+    async def execute(self, statement: Any, *_: object) -> _Result:
+        self.statements.append(statement)
+        return self._results.pop(0) if self._results else _Result()
+
+    async def scalar(self, statement: Any) -> int:
+        self.statements.append(statement)
+        return 0
+
+
+def test_default_orm_loads_defer_embeddings() -> None:
+    _assert_no_embedding_loaded(select(Product))
+    _assert_no_embedding_loaded(select(KnowledgeBase))
+
+
+@pytest.mark.parametrize("projection", [product_card, product_pricing])
+def test_slim_projections_select_only_their_fields(
+    projection: Callable[[], Any],
+) -> None:
+    selected = _selected_sql(select(Product).options(projection()))
+
+    assert "products.sku" in selected
+    assert "products.price" in selected
+    assert "products.description_en" not in selected
+    assert "products.attributes" not in selected
+    _assert_no_embedding_loaded(select(Product).options(projection()))
+
+
+@pytest.mark.asyncio
+async def test_catalog_hot_paths_do_not_select_embeddings() -> None:
+    from src.api.v1.products import list_products
+    from src.dialogue.catalog_refs import resolve_catalog_references_from_db
+    from src.llm.engine import (
+        _find_catalog_product_by_sku,
+        _find_catalog_products_by_sku_stem,
+    )
+    from src.rag.pipeline import PgVectorStore, search_knowledge, search_products
+    from src.services.recommendations import get_cross_sell
+
+    class _Embeddings:
+        async def embed_async(self, text: str) -> list[float]:
+            return [0.0] * 1024
+
+    session = _RecordingSession()
+    await list_products(page=1, page_size=20, category=None, db=session)  # type: ignore[arg-type]
+    await search_products(session, ProductSearchQuery(query="desk"), _Embeddings())  # type: ignore[arg-type]
+    await search_knowledge(session, "delivery", _Embeddings())  # type: ignore[arg-type]
+    await PgVectorStore(session).search([0.0] * 1024)  # type: ignore[arg-type]
+    await _find_catalog_product_by_sku(session, "TJ-1001")  # type: ignore[arg-type]
+    await _find_catalog_products_by_sku_stem(session, "TJ-1001")  # type: ignore[arg-type]
+    await resolve_catalog_references_from_db(["TJ-1001"], session)
+    rules = SimpleNamespace(value={"desk": ["chair"]})
+    cross_sell_session = _RecordingSession(_Result(rules))
+    await get_cross_sell(cross_sell_session, "desk")  # type: ignore[arg-type]
+
+    statements = [*session.statements, *cross_sell_session.statements[1:]]
+    assert len(statements) >= 8
+    for statement in statements:
+        _assert_no_embedding_loaded(statement)
@@ -13,7 +13,7 @@ from src.rag.embeddings import (
 
 @pytest.fixture
 def mock_embedding_engine() -> Generator[Any, None, None]:
-    with patch("src.rag.embeddings.SentenceTransformer") as MockSentenceTransformer:
+    with patch("sentence_transformers.SentenceTransformer") as MockSentenceTransformer:
         mock_model = MockSentenceTransformer.return_value
 
         # Mocks the encode method
@@ -198,7 +198,7 @@ def test_singleton_returns_same_instance() -> None:
     EmbeddingEngine._instance = None
 
     try:
-        with patch("src.rag.embeddings.SentenceTransformer"):
+        with patch("sentence_transformers.SentenceTransformer"):
             engine_a = EmbeddingEngine()
             engine_b = EmbeddingEngine()
             assert engine_a is engine_b
@@ -212,12 +212,12 @@ def test_singleton_reset_between_tests() -> None:
     created.  This verifies the reset pattern used by test fixtures."""
     EmbeddingEngine._instance = None
 
-    with patch("src.rag.embeddings.SentenceTransformer"):
+    with patch("sentence_transformers.SentenceTransformer"):
         first = EmbeddingEngine()
 
     EmbeddingEngine._instance = None
 
-    with patch("src.rag.embeddings.SentenceTransformer"):
+    with patch("sentence_transformers.SentenceTransformer"):
         second = EmbeddingEngine()
 
     # After the reset, a new object is created
@@ -232,7 +232,9 @@ def test_singleton_class_level_patch_works() -> None:
     EmbeddingEngine._instance = None
 
     try:
-        with patch("src.rag.embeddings.SentenceTransformer") as MockSentenceTransformer:
+        with patch(
+            "sentence_transformers.SentenceTransformer"
+        ) as MockSentenceTransformer:
             mock_model = MagicMock()
 
             def _fake_encode(texts: str | list[str], **kwargs: Any) -> Any:
@@ -265,7 +267,9 @@ def test_singleton_model_not_loaded_until_embed_called() -> None:
     EmbeddingEngine._model = None
 
     try:
-        with patch("src.rag.embeddings.SentenceTransformer") as MockSentenceTransformer:
+        with patch(
+            "sentence_transformers.SentenceTransformer"
+        ) as MockSentenceTransformer:
             MockSentenceTransformer.return_value = MagicMock()
             _engine = EmbeddingEngine()
             # Model not yet loaded
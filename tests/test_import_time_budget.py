@@ -0,0 +1,100 @@
+"""Cold-start guard: the API and worker entry points stay within their budgets.
+
+Each check imports the entry point in a fresh interpreter under
+``-X importtime`` (scripts/profile_import_time.py) and fails with the import
+chain that pulled in a forbidden module. Wall-clock budgets depend on machine
+load, so they are only asserted with ``RUN_IMPORT_TIME_BUDGET_TESTS=1``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PROFILER_PATH = REPO_ROOT / "scripts" / "profile_import_time.py"
+RUN_IMPORT_TIME_BUDGET_TESTS = os.getenv("RUN_IMPORT_TIME_BUDGET_TESTS") == "1"
+
+
+def _load_profiler():
+    spec = importlib.util.spec_from_file_location(
+        "scripts.profile_import_time", PROFILER_PATH
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve their module through sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_importtime_parser_reports_the_chain_that_loaded_a_module() -> None:
+    profiler = _load_profiler()
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       900 |     250000 |       torch",
+            "import time:       100 |     251000 |     src.rag.embeddings",
+            "import time:        50 |        50 |     json",
+            "import time:       300 |     251350 |   src.api.v1.products",
+            "import time:       700 |     260000 | src.main",
+        ]
+    )
+
+    profile = profiler.parse_importtime("src.main", stderr)
+
+    assert profile.total_ms == 260.0
+    assert profile.import_chain("torch") == [
+        "torch",
+        "src.rag.embeddings",
+        "src.api.v1.products",
+        "src.main",
+    ]
+    assert [record.name for record in profile.slowest(2)] == [
+        "src.main",
+        "src.api.v1.products",
+    ]
+    violations = profiler.budget_violations(
+        profile, budget_ms=100, forbidden=("torch", "openai")
+    )
+    assert violations == [
+        "torch is imported via torch <- src.rag.embeddings <- "
+        "src.api.v1.products <- src.main",
+        "src.main took 260 ms, budget 100 ms",
+    ]
+
+
+@pytest.mark.parametrize("entry", ["api", "worker"])
+def test_entry_point_does_not_import_forbidden_modules(entry: str) -> None:
+    profiler = _load_profiler()
+    budget = profiler.ENTRY_BUDGETS[entry]
+
+    profile = profiler.profile_import(budget.module)
+
+    assert (
+        profiler.budget_violations(profile, budget_ms=None, forbidden=budget.forbidden)
+        == []
+    )
+
+
+@pytest.mark.skipif(
+    not RUN_IMPORT_TIME_BUDGET_TESTS,
+    reason="Set RUN_IMPORT_TIME_BUDGET_TESTS=1 to check import-time budgets",
+)
+@pytest.mark.parametrize("entry", ["api", "worker"])
+def test_entry_point_import_stays_within_budget(entry: str) -> None:
+    profiler = _load_profiler()
+    budget = profiler.ENTRY_BUDGETS[entry]
+
+    profile = profiler.profile_import(budget.module)
+
+    assert (
+        profiler.budget_violations(
+            profile, budget_ms=budget.budget_ms, forbidden=budget.forbidden
+        )
+        == []
+    )
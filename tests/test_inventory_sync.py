@@ -1,9 +1,16 @@
-from datetime import UTC
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.integrations.catalog.treejar_catalog import CatalogPage
 from src.integrations.inventory.sync import (
+    TREEJAR_SYNC_CHECKPOINT_KEY,
+    TREEJAR_SYNC_LOCK_KEY,
+    TREEJAR_SYNC_SEEN_KEY,
     _deactivate_stale_products,
     _normalize_treejar_product,
     _upsert_items_batch,
@@ -11,27 +18,98 @@ from src.integrations.inventory.sync import (
     sync_products_from_treejar_catalog,
     sync_products_from_zoho,
 )
+from src.rag.embeddings import product_embedding_hash
 from src.schemas.product import ProductSyncResponse
 
 
+class _FakeSyncRedis:
+    """In-memory stand-in for the ARQ Redis calls the catalog sync makes."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.enqueue_job = AsyncMock()
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def sadd(self, key: str, *members: str) -> int:
+        existing = self.sets.setdefault(key, set())
+        added = set(members) - existing
+        existing.update(added)
+        return len(added)
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return {member.encode() for member in self.sets.get(key, set())}
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        removed = [self.data.pop(key, None) or self.sets.pop(key, None) for key in keys]
+        return sum(1 for value in removed if value is not None)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        del seconds
+        return key in self.sets
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        del script, numkeys
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+def _catalog_client(
+    pages: list[CatalogPage], slugs: list[str] | None = None
+) -> MagicMock:
+    requested: list[list[str]] = []
+
+    async def iterate_pages(
+        requested_slugs: list[str], **kwargs: object
+    ) -> AsyncIterator[CatalogPage]:
+        del kwargs
+        requested.append(list(requested_slugs))
+        for page in pages:
+            if page.slug in requested_slugs:
+                yield page
+
+    client = MagicMock()
+    client.get_category_slugs = AsyncMock(
+        return_value=slugs or list(dict.fromkeys(page.slug for page in pages))
+    )
+    client.iter_category_pages.side_effect = iterate_pages
+    client.requested_slugs = requested
+    return client
+
+
 @pytest.mark.asyncio
 async def test_sync_products_from_treejar_catalog_success() -> None:
-    ctx = {"redis": AsyncMock()}
-
-    catalog_items = [
-        {"slug": "chair-1", "sku": "SKU-1", "name": "Chair 1"},
-        {"slug": "chair-2", "sku": "SKU-2", "name": "Chair 2"},
+    redis = _FakeSyncRedis()
+    pages = [
+        CatalogPage(
+            "chairs",
+            0,
+            [
+                {"slug": "chair-1", "sku": "SKU-1", "name": "Chair 1"},
+                {"slug": "chair-2", "sku": "SKU-2", "name": "Chair 2"},
+            ],
+            True,
+        )
     ]
 
-    async def iterate_items() -> object:
-        for item in catalog_items:
-            yield item
-
     async def mock_upsert_impl(
         items: list[dict[str, str]], stats: ProductSyncResponse
-    ) -> None:
+    ) -> list[str]:
         stats.synced += len(items)
         stats.created += len(items)
+        return ["product-1"]
 
     with (
         patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm,
@@ -40,6 +118,11 @@ async def test_sync_products_from_treejar_catalog_success() -> None:
             new_callable=AsyncMock,
             side_effect=mock_upsert_impl,
         ) as mock_upsert,
+        patch(
+            "src.integrations.inventory.sync._embed_products",
+            new_callable=AsyncMock,
+            return_value=1,
+        ) as mock_embed_changed,
         patch(
             "src.integrations.inventory.sync._deactivate_stale_products",
             new_callable=AsyncMock,
@@ -51,33 +134,201 @@ async def test_sync_products_from_treejar_catalog_success() -> None:
             return_value=2,
         ) as mock_embed,
     ):
-        mock_client = MagicMock()
-        mock_client.iter_all_products.return_value = iterate_items()
-        mock_cm.return_value.__aenter__.return_value = mock_client
+        mock_cm.return_value.__aenter__.return_value = _catalog_client(pages)
 
-        result = await sync_products_from_treejar_catalog(ctx)
+        result = await sync_products_from_treejar_catalog({"redis": redis})
 
     mock_upsert.assert_awaited_once()
-    mock_deactivate.assert_awaited_once()
+    mock_embed_changed.assert_awaited_once_with(["product-1"])
+    mock_deactivate.assert_awaited_once_with({"SKU-1", "SKU-2"})
     mock_embed.assert_awaited_once()
     assert result["synced"] == 2
     assert result["created"] == 2
     assert result["deactivated"] == 1
-    assert result["embeddings_generated"] == 2
+    assert result["embeddings_generated"] == 3
+    assert result["status"] == "completed"
+    assert result["stages"]["fetch"]["items"] == 2
+    assert result["stages"]["upsert"]["items"] == 2
+    assert result["stages"]["embed"]["items"] == 1
+    assert TREEJAR_SYNC_CHECKPOINT_KEY not in redis.data
+    assert TREEJAR_SYNC_LOCK_KEY not in redis.data
+    assert TREEJAR_SYNC_SEEN_KEY not in redis.sets
+    assert [call.args for call in redis.enqueue_job.await_args_list] == [
+        ("refresh_product_neighbors",),
+        ("refresh_catalog_artifacts",),
+    ]
 
 
 @pytest.mark.asyncio
 async def test_sync_products_from_treejar_catalog_api_error() -> None:
-    ctx = {"redis": AsyncMock()}
+    ctx = {"redis": _FakeSyncRedis()}
 
     with patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm:
         mock_client = AsyncMock()
-        mock_client.iter_all_products.side_effect = RuntimeError("catalog down")
+        mock_client.get_category_slugs.side_effect = RuntimeError("catalog down")
         mock_cm.return_value.__aenter__.return_value = mock_client
 
         result = await sync_products_from_treejar_catalog(ctx)
 
     assert result["errors"] == 1
+    assert result["status"] is None
+
+
+@pytest.mark.asyncio
+async def test_treejar_sync_resumes_from_checkpoint() -> None:
+    redis = _FakeSyncRedis()
+    started_at = datetime(2026, 3, 18, 12, 0, tzinfo=UTC)
+    redis.data[TREEJAR_SYNC_CHECKPOINT_KEY] = json.dumps(
+        {
+            "started_at": started_at.isoformat(),
+            "completed_categories": ["chairs"],
+            "synced": 5,
+            "created": 1,
+            "updated": 4,
+        }
+    )
+    redis.sets[TREEJAR_SYNC_SEEN_KEY] = {"SKU-1"}
+    pages = [
+        CatalogPage("chairs", 0, [{"slug": "chair-1", "sku": "SKU-1"}], True),
+        CatalogPage("desks", 0, [{"slug": "desk-1", "sku": "SKU-9"}], True),
+    ]
+    client = _catalog_client(pages)
+
+    async def mock_upsert_impl(
+        items: list[dict[str, str]], stats: ProductSyncResponse
+    ) -> list[str]:
+        stats.synced += len(items)
+        stats.updated += len(items)
+        return []
+
+    with (
+        patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm,
+        patch(
+            "src.integrations.inventory.sync._upsert_treejar_products_batch",
+            new_callable=AsyncMock,
+            side_effect=mock_upsert_impl,
+        ) as mock_upsert,
+        patch(
+            "src.integrations.inventory.sync._deactivate_stale_products",
+            new_callable=AsyncMock,
+            return_value=0,
+        ) as mock_deactivate,
+        patch(
+            "src.integrations.inventory.sync._generate_missing_embeddings",
+            new_callable=AsyncMock,
+            return_value=0,
+        ),
+    ):
+        mock_cm.return_value.__aenter__.return_value = client
+
+        result = await sync_products_from_treejar_catalog({"redis": redis})
+
+    assert client.requested_slugs == [["desks"]]
+    assert [item["sku"] for item in mock_upsert.await_args.args[0]] == ["SKU-9"]
+    mock_deactivate.assert_awaited_once_with({"SKU-1", "SKU-9"})
+    assert result["synced"] == 6
+    assert result["updated"] == 5
+    assert result["status"] == "completed"
+    assert TREEJAR_SYNC_CHECKPOINT_KEY not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_treejar_sync_checkpoints_and_continues_at_time_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _FakeSyncRedis()
+    monkeypatch.setattr(
+        "src.integrations.inventory.sync.settings.catalog_sync_time_budget_seconds",
+        0,
+    )
+    pages = [
+        CatalogPage("chairs", 0, [{"slug": "chair-1", "sku": "SKU-1"}], True),
+        CatalogPage("desks", 0, [{"slug": "desk-1", "sku": "SKU-9"}], True),
+    ]
+
+    async def mock_upsert_impl(
+        items: list[dict[str, str]], stats: ProductSyncResponse
+    ) -> list[str]:
+        stats.synced += len(items)
+        return []
+
+    with (
+        patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm,
+        patch(
+            "src.integrations.inventory.sync._upsert_treejar_products_batch",
+            new_callable=AsyncMock,
+            side_effect=mock_upsert_impl,
+        ),
+        patch(
+            "src.integrations.inventory.sync._deactivate_stale_products",
+            new_callable=AsyncMock,
+        ) as mock_deactivate,
+    ):
+        mock_cm.return_value.__aenter__.return_value = _catalog_client(pages)
+
+        result = await sync_products_from_treejar_catalog({"redis": redis})
+
+    assert result["status"] == "continued"
+    mock_deactivate.assert_not_awaited()
+    checkpoint = json.loads(redis.data[TREEJAR_SYNC_CHECKPOINT_KEY])
+    assert checkpoint["completed_categories"] == ["chairs"]
+    assert checkpoint["synced"] == 1
+    assert redis.sets[TREEJAR_SYNC_SEEN_KEY] == {"SKU-1"}
+    assert redis.enqueue_job.await_args.args == ("sync_products_from_treejar_catalog",)
+
+
+@pytest.mark.asyncio
+async def test_treejar_sync_fails_instead_of_hanging_when_upsert_dies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _FakeSyncRedis()
+    monkeypatch.setattr(
+        "src.integrations.inventory.sync.settings.catalog_sync_pipeline_depth", 1
+    )
+    monkeypatch.setattr(
+        "src.integrations.inventory.sync.settings.catalog_api_page_size", 1
+    )
+    pages = [
+        CatalogPage("chairs", index, [{"slug": f"chair-{index}"}], False)
+        for index in range(5)
+    ]
+
+    async def failing_upsert(
+        items: list[dict[str, str]], stats: ProductSyncResponse
+    ) -> list[str]:
+        # Fetching fills the one-page queue while this batch is in flight.
+        await asyncio.sleep(0.05)
+        raise RuntimeError("database down")
+
+    with (
+        patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm,
+        patch(
+            "src.integrations.inventory.sync._upsert_treejar_products_batch",
+            new_callable=AsyncMock,
+            side_effect=failing_upsert,
+        ),
+    ):
+        mock_cm.return_value.__aenter__.return_value = _catalog_client(pages)
+
+        result = await asyncio.wait_for(
+            sync_products_from_treejar_catalog({"redis": redis}), timeout=5
+        )
+
+    assert result["errors"] == 1
+    assert TREEJAR_SYNC_LOCK_KEY not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_treejar_sync_skips_while_another_run_holds_the_lock() -> None:
+    redis = _FakeSyncRedis()
+    redis.data[TREEJAR_SYNC_LOCK_KEY] = "other-run"
+
+    with patch("src.integrations.inventory.sync._treejar_catalog_client") as mock_cm:
+        result = await sync_products_from_treejar_catalog({"redis": redis})
+
+    assert result["status"] == "skipped"
+    mock_cm.assert_not_called()
+    assert redis.data[TREEJAR_SYNC_LOCK_KEY] == "other-run"
 
 
 @pytest.mark.asyncio
@@ -271,20 +522,75 @@ async def test_upsert_treejar_products_batch_preserves_existing_zoho_item_id(
     mock_session_factory.return_value.__aenter__.return_value = mock_session
 
     class MockResult:
-        def all(self) -> list[tuple[str, int]]:
-            return [("uuid-1", 1)]
+        def all(self) -> list[tuple[str, int, bool]]:
+            return [("uuid-1", 1, True)]
 
     mock_session.execute.return_value = MockResult()
 
-    await _upsert_treejar_products_batch(items, stats)
+    pending_embedding = await _upsert_treejar_products_batch(items, stats)
 
-    stmt = mock_session.execute.call_args[0][0]
+    stmt = mock_session.execute.call_args_list[0][0][0]
     sql = str(stmt.compile()).lower()
     insert_sql = sql.split("on conflict")[0]
     assert "coalesce(products.zoho_item_id" in sql
     assert "synced_at" in insert_sql
+    assert "content_hash" in insert_sql
+    conflict_where = sql.split("on conflict")[1].split(" where ")[-1]
+    assert "products.content_hash is distinct from excluded.content_hash" in (
+        conflict_where
+    )
+    assert "products.embedding_hash is distinct from excluded.embedding_hash" in (
+        conflict_where
+    )
     assert stats.updated == 1
     assert stats.synced == 1
+    assert stats.skipped == 0
+    assert pending_embedding == ["uuid-1"]
+    neighbor_reset = str(mock_session.execute.call_args_list[1][0][0].compile())
+    assert neighbor_reset.startswith("DELETE FROM product_neighbors")
+
+
+@pytest.mark.asyncio
+@patch("src.integrations.inventory.sync.async_session_factory")
+async def test_upsert_treejar_products_batch_counts_unchanged_rows_as_skipped(
+    mock_session_factory: AsyncMock,
+) -> None:
+    items = [
+        {"slug": "chair-1", "sku": "SKU-1", "name": "Chair 1"},
+        {"slug": "chair-2", "sku": "SKU-2", "name": "Chair 2"},
+    ]
+    stats = ProductSyncResponse(synced=0, created=0, updated=0, errors=0)
+
+    mock_session = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = mock_session
+    result = MagicMock()
+    result.all.return_value = [("uuid-2", 7, False)]
+    mock_session.execute.return_value = result
+
+    pending_embedding = await _upsert_treejar_products_batch(items, stats)
+
+    assert stats.synced == 2
+    assert stats.updated == 1
+    assert stats.skipped == 1
+    assert pending_embedding == []
+
+
+def test_normalize_treejar_product_hashes_ignore_volatile_raw_fields() -> None:
+    item = {"slug": "chair-1", "sku": "SKU-1", "name": "Chair 1", "price": 100}
+
+    first = _normalize_treejar_product({**item, "views": 10})
+    second = _normalize_treejar_product({**item, "views": 11})
+    repriced = _normalize_treejar_product({**item, "price": 90})
+    renamed = _normalize_treejar_product({**item, "name": "Chair One"})
+
+    assert first is not None and second is not None
+    assert repriced is not None and renamed is not None
+    assert len(first["content_hash"]) == 64
+    assert first["content_hash"] == second["content_hash"]
+    assert repriced["content_hash"] != first["content_hash"]
+    assert repriced["embedding_hash"] == first["embedding_hash"]
+    assert renamed["embedding_hash"] != first["embedding_hash"]
+    assert first["embedding_hash"] == product_embedding_hash("Chair 1", None, None)
 
 
 @pytest.mark.asyncio
@@ -322,17 +628,24 @@ async def test_deactivate_stale_products(mock_session_factory: AsyncMock) -> Non
     mock_result.rowcount = 3
     mock_session.execute.return_value = mock_result
 
-    from datetime import datetime
-
-    sync_start = datetime(2026, 3, 18, 12, 0, 0, tzinfo=UTC)
-
-    count = await _deactivate_stale_products(sync_start)
+    count = await _deactivate_stale_products({"SKU-1", "SKU-2"})
 
     assert count == 3
-    mock_session.execute.assert_awaited_once()
+    stmt = mock_session.execute.await_args.args[0]
+    assert "sku = any(:seen_skus)" in str(stmt).lower()
+    assert stmt.compile().params["seen_skus"] == ["SKU-1", "SKU-2"]
     mock_session.commit.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+@patch("src.integrations.inventory.sync.async_session_factory")
+async def test_deactivate_stale_products_ignores_empty_seen_set(
+    mock_session_factory: AsyncMock,
+) -> None:
+    assert await _deactivate_stale_products(set()) == 0
+    mock_session_factory.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_sync_products_from_zoho_skips_catalog_lifecycle_steps() -> None:
     ctx = {"redis": AsyncMock()}
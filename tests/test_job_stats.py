@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from arq.worker import Retry
+
+from src.services.job_stats import read_job_stats, record_job_stats
+
+
+def _recorded(redis: AsyncMock) -> list[tuple[Any, ...]]:
+    """(function, outcome) of every outcome written through ``redis.eval``."""
+    # Args: script, 1, key, TTL, counted fields, then the outcome field first.
+    return [
+        tuple(call.args[5].rsplit(":", maxsplit=1))
+        for call in redis.eval.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_wrapper_records_success_failure_and_retry() -> None:
+    redis = AsyncMock()
+
+    @record_job_stats
+    async def flaky(ctx: dict[str, Any], mode: str) -> str:
+        if mode == "fail":
+            raise RuntimeError("boom")
+        if mode == "retry":
+            raise Retry(defer=5)
+        return mode
+
+    assert await flaky({"redis": redis}, "ok") == "ok"
+    with pytest.raises(RuntimeError):
+        await flaky({"redis": redis}, "fail")
+    with pytest.raises(Retry):
+        await flaky({"redis": redis}, "retry")
+
+    name = flaky.__wrapped__.__qualname__  # type: ignore[attr-defined]
+    assert _recorded(redis) == [
+        (name, "succeeded"),
+        (name, "failed"),
+        (name, "retried"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_counts_as_failed() -> None:
+    redis = AsyncMock()
+    started = asyncio.Event()
+
+    @record_job_stats
+    async def slow(ctx: dict[str, Any]) -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    task = asyncio.create_task(slow({"redis": redis}))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert [outcome for _function, outcome in _recorded(redis)] == ["failed"]
+
+
+@pytest.mark.asyncio
+async def test_recording_errors_never_fail_the_job() -> None:
+    redis = AsyncMock()
+    redis.eval.side_effect = ConnectionError("redis down")
+
+    @record_job_stats
+    async def job(ctx: dict[str, Any]) -> int:
+        return 7
+
+    assert await job({"redis": redis}) == 7
+
+
+@pytest.mark.asyncio
+async def test_read_sums_minutes_and_keeps_the_largest_max() -> None:
+    redis = AsyncMock()
+    redis.eval.return_value = [
+        [
+            b"sync_products:succeeded",
+            b"3",
+            b"sync_products:duration_ms",
+            b"900",
+            b"sync_products:max_ms",
+            b"500",
+        ],
+        [],
+        [
+            b"sync_products:failed",
+            b"1",
+            b"sync_products:duration_ms",
+            b"100",
+            b"sync_products:max_ms",
+            b"100",
+            b"run_daily_summary:retried",
+            b"2",
+        ],
+    ]
+
+    summaries = await read_job_stats(redis, minutes=3, now=180.0)
+
+    keys = redis.eval.await_args.args[2:]
+    assert keys == ("arq_job_stats:m:1", "arq_job_stats:m:2", "arq_job_stats:m:3")
+    by_function = {summary.function: summary for summary in summaries}
+    products = by_function["sync_products"]
+    assert (products.succeeded, products.failed, products.max_ms) == (3, 1, 500)
+    assert products.failure_rate == 0.25
+    assert products.mean_ms == 250
+    assert by_function["run_daily_summary"].retried == 2
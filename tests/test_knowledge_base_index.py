@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import knowledge_base_index
+from src.services.knowledge_base_index import (
+    KB_REINDEX_PROGRESS_KEY,
+    KB_REINDEX_REQUESTED_KEY,
+    kb_embedding_hash,
+    reindex_knowledge_base,
+)
+
+
+class _Result:
+    def __init__(self, rows: list[Any] | None = None, value: object = None) -> None:
+        self._rows = rows or []
+        self._value = value
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def scalar_one_or_none(self) -> object:
+        return self._value
+
+
+class _KnowledgeSession:
+    """Serves keyset chunks of ``rows`` and records the bulk updates."""
+
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self._rows = rows
+        self.updates: list[list[dict[str, Any]]] = []
+        self.commits = 0
+        self.reads = 0
+
+    async def execute(self, statement: Any, params: Any = None) -> _Result:
+        if statement.is_update:
+            self.updates.append(params)
+            return _Result()
+        if statement._limit_clause is None:  # the pass's COUNT(*)
+            return _Result(value=len(self._rows))
+        limit = statement._limit_clause.value
+        start = self.reads * limit
+        self.reads += 1
+        return _Result(self._rows[start : start + limit])
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def __aenter__(self) -> _KnowledgeSession:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.progress: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, **kwargs: Any) -> bool:
+        if kwargs.get("nx") and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.values.pop(key, None) is not None else 0
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.values)
+
+    async def eval(self, _script: str, _count: int, key: str, token: str) -> int:
+        if self.values.get(key) == token:
+            del self.values[key]
+            return 1
+        return 0
+
+    async def hset(self, key: str, mapping: dict[str, str]) -> None:
+        assert key == KB_REINDEX_PROGRESS_KEY
+        self.progress.update(mapping)
+
+
+def _entries(contents: list[str], *, embedded: set[int]) -> list[SimpleNamespace]:
+    start = datetime(2026, 10, 1)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            created_at=start + timedelta(minutes=index),
+            content=content,
+            embedding_hash=kb_embedding_hash(content) if index in embedded else None,
+        )
+        for index, content in enumerate(contents)
+    ]
+
+
+def _engine() -> MagicMock:
+    engine = MagicMock()
+    engine.embed_batch_async = AsyncMock(
+        side_effect=lambda texts: [[float(len(text))] for text in texts]
+    )
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_reindex_embeds_only_changed_entries_in_committed_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(knowledge_base_index.settings, "kb_reindex_chunk_size", 2)
+    rows = _entries(["a", "bb", "ccc", "dddd", "eeeee"], embedded={0, 2, 3})
+    session = _KnowledgeSession(rows)
+    redis = _Redis()
+    engine = _engine()
+
+    with (
+        patch.object(knowledge_base_index, "EmbeddingEngine", return_value=engine),
+        patch.object(
+            knowledge_base_index, "async_session_factory", return_value=session
+        ),
+    ):
+        result = await reindex_knowledge_base({"redis": redis})
+
+    assert result == {"status": "done", "embedded": 2, "unchanged": 3}
+    assert [call.args[0] for call in engine.embed_batch_async.await_args_list] == [
+        ["bb"],
+        ["eeeee"],
+    ]
+    assert session.commits == 2
+    assert [[row["id"] for row in update] for update in session.updates] == [
+        [rows[1].id],
+        [rows[4].id],
+    ]
+    assert session.updates[0][0]["embedding_hash"] == kb_embedding_hash("bb")
+    assert redis.progress["status"] == "done"
+    assert (redis.progress["total"], redis.progress["scanned"]) == ("5", "5")
+    assert "kb_reindex:lock" not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_forced_reindex_re_embeds_unchanged_entries() -> None:
+    rows = _entries(["a", "bb"], embedded={0, 1})
+    session = _KnowledgeSession(rows)
+    engine = _engine()
+
+    with (
+        patch.object(knowledge_base_index, "EmbeddingEngine", return_value=engine),
+        patch.object(
+            knowledge_base_index, "async_session_factory", return_value=session
+        ),
+    ):
+        result = await reindex_knowledge_base({"redis": _Redis()}, force=True)
+
+    assert result["embedded"] == 2
+    engine.embed_batch_async.assert_awaited_once_with(["a", "bb"])
+
+
+@pytest.mark.asyncio
+async def test_reindex_requested_during_a_run_gets_another_pass() -> None:
+    redis = _Redis()
+    passes: list[int] = []
+
+    async def fake_pass(*_: Any, **__: Any) -> tuple[int, int]:
+        passes.append(1)
+        if len(passes) == 1:
+            # An admin saves an entry while the first pass is running.
+            await redis.set(KB_REINDEX_REQUESTED_KEY, "1")
+        return 1, 0
+
+    with (
+        patch.object(knowledge_base_index, "_reindex_pass", side_effect=fake_pass),
+        patch.object(knowledge_base_index, "EmbeddingEngine"),
+        patch.object(
+            knowledge_base_index,
+            "async_session_factory",
+            return_value=_KnowledgeSession([]),
+        ),
+    ):
+        result = await reindex_knowledge_base({"redis": redis})
+
+    assert len(passes) == 2
+    assert result["embedded"] == 2
+    assert KB_REINDEX_REQUESTED_KEY not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_reindex_skips_while_another_run_holds_the_lock() -> None:
+    redis = _Redis()
+    redis.values["kb_reindex:lock"] = "other-run"
+
+    with patch.object(knowledge_base_index, "_reindex_pass") as run_pass:
+        result = await reindex_knowledge_base({"redis": redis})
+
+    assert result["status"] == "skipped"
+    run_pass.assert_not_called()
+    assert redis.values["kb_reindex:lock"] == "other-run"
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.minute_counters import _READ_HASHES_SCRIPT
+from src.services.latency_slo import (
+    _FLUSH_HISTOGRAMS_SCRIPT,
+    ChatLatencyRecorder,
+    LatencyHistogram,
+    read_latency_window,
+    summarize_latency_window,
+)
+
+# 2026-10-01 00:00:30 UTC, early in both its minute and its hour.
+NOW = 1_790_812_830.0
+MINUTE = int(NOW // 60)
+HOUR = MINUTE // 60
+
+
+class _HashRedis:
+    """Runs the flush and read scripts against in-memory hashes."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: object) -> object:
+        keys = [str(key) for key in keys_and_args[:numkeys]]
+        args = [str(arg) for arg in keys_and_args[numkeys:]]
+        if script == _FLUSH_HISTOGRAMS_SCRIPT:
+            for index, key in enumerate(keys):
+                histogram = self.hashes.setdefault(key, {})
+                for pair in args[2 * index + 1].split(","):
+                    bucket, count = pair.split(":")
+                    histogram[bucket] = histogram.get(bucket, 0) + int(count)
+                self.ttls[key] = int(args[2 * index])
+            return len(keys)
+        assert script == _READ_HASHES_SCRIPT
+        return [
+            [
+                item
+                for bucket, count in self.hashes.get(key, {}).items()
+                for item in (bucket.encode(), str(count).encode())
+            ]
+            for key in keys
+        ]
+
+
+def test_histogram_quantiles_stay_within_bucket_error() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    p50 = histogram.quantile(0.5)
+    p99 = histogram.quantile(0.99)
+
+    assert p50 is not None and 500 <= p50 <= 500 * 1.1
+    assert p99 is not None and 990 <= p99 <= 990 * 1.1
+    assert histogram.count == 1000
+
+
+def test_histogram_ignores_invalid_values_and_reports_empty() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(float("nan"))
+    histogram.record(-5.0)
+
+    assert histogram.count == 0
+    assert histogram.quantile(0.95) is None
+
+
+@pytest.mark.asyncio
+async def test_recorder_flushes_minute_and_hour_hashes_once_per_interval() -> None:
+    clock = [NOW]
+    recorder = ChatLatencyRecorder(flush_interval_seconds=10, clock=lambda: clock[0])
+    redis = _HashRedis()
+
+    recorder.record({"latency_ms": {"queue_wait": 120.0, "llm": 2300, "x": 5}})
+    await recorder.maybe_flush(redis)
+    assert redis.hashes == {}
+
+    clock[0] += 10
+    await recorder.maybe_flush(redis)
+
+    assert set(redis.hashes) == {
+        f"chat_latency:m:{MINUTE}:queue_wait",
+        f"chat_latency:h:{HOUR}:queue_wait",
+        f"chat_latency:m:{MINUTE}:llm",
+        f"chat_latency:h:{HOUR}:llm",
+    }
+    assert redis.ttls[f"chat_latency:m:{MINUTE}:llm"] == 2 * 60 * 60
+    assert redis.ttls[f"chat_latency:h:{HOUR}:llm"] == 26 * 60 * 60
+
+
+@pytest.mark.asyncio
+async def test_read_latency_window_merges_counts_from_every_worker() -> None:
+    redis = _HashRedis()
+    for worker_values in ([100.0, 200.0], [300.0, 40000.0]):
+        recorder = ChatLatencyRecorder(flush_interval_seconds=10, clock=lambda: NOW)
+        for value in worker_values:
+            recorder.record({"latency_ms": {"to_text_delivery": value}})
+        await recorder.flush(redis)
+
+    histograms = await read_latency_window(redis, "15m", now=NOW + 120)
+    summaries = summarize_latency_window(histograms)
+
+    assert [summary.phase for summary in summaries] == ["to_text_delivery"]
+    assert summaries[0].count == 4
+    assert summaries[0].p99_ms is not None and summaries[0].p99_ms >= 40000
+    # The minute has left the 5-minute window but is still in the daily one.
+    assert await read_latency_window(redis, "5m", now=NOW + 600) == {}
+    daily = await read_latency_window(redis, "24h", now=NOW + 600)
+    assert daily["to_text_delivery"].count == 4
+
+
+@pytest.mark.asyncio
+async def test_recorder_keeps_pending_counts_when_redis_fails() -> None:
+    recorder = ChatLatencyRecorder(flush_interval_seconds=10, clock=lambda: NOW)
+    recorder.record({"latency_ms": {"total": 5000}})
+    failing = AsyncMock()
+    failing.eval.side_effect = ConnectionError("redis down")
+
+    await recorder.flush(failing)
+    recorder.record({"latency_ms": {"total": 7000}})
+    redis = _HashRedis()
+    await recorder.flush(redis)
+
+    histograms = await read_latency_window(redis, "5m", now=NOW)
+    assert histograms["total"].count == 2
@@ -1773,7 +1773,7 @@ async def test_engine_process_message_success(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_appends_runtime_directives(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -1813,7 +1813,7 @@ async def test_inject_system_prompt_appends_runtime_directives(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_prompt_and_guard_consume_the_same_permitted_ask_set(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -1868,7 +1868,7 @@ async def test_prompt_and_guard_consume_the_same_permitted_ask_set(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_keeps_one_grounding_policy_as_final_tail(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -1925,7 +1925,7 @@ async def test_inject_system_prompt_keeps_one_grounding_policy_as_final_tail(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_marks_customer_facts_as_untrusted_data(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -1963,7 +1963,7 @@ async def test_inject_system_prompt_marks_customer_facts_as_untrusted_data(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_appends_bot_operating_rules(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -2012,7 +2012,7 @@ async def test_inject_system_prompt_appends_bot_operating_rules(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_includes_captured_sales_context(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -2078,7 +2078,7 @@ async def test_inject_system_prompt_includes_captured_sales_context(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_escapes_captured_sales_context_values(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -2121,7 +2121,7 @@ async def test_inject_system_prompt_escapes_captured_sales_context_values(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_omits_search_requirement_in_order_handoff_mode(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -2159,7 +2159,7 @@ async def test_inject_system_prompt_omits_search_requirement_in_order_handoff_mo
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_bounds_returning_customer_context(
     mock_prompt: AsyncMock,
     mock_deps: tuple[
@@ -2227,14 +2227,68 @@ async def test_engine_process_message_db_error(
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_static_prompt_prefix", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
+async def test_sales_prompt_reaches_turns_with_history_static_prefix_first(
+    mock_prompt: AsyncMock,
+    mock_prefix: AsyncMock,
+    mock_deps: tuple[
+        AsyncMock, Conversation, AsyncMock, AsyncMock, AsyncMock, AsyncMock, AsyncMock
+    ],
+) -> None:
+    from pydantic_ai import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    mock_prefix.return_value = "STATIC PREFIX"
+    mock_prompt.return_value = "STAGE RULE"
+    db, conv, engine, zoho, zoho_crm, redis, messaging = mock_deps
+    deps = SalesDeps(
+        db=db,
+        redis=redis,
+        conversation=conv,
+        embedding_engine=engine,
+        zoho_inventory=zoho,
+        zoho_crm=zoho_crm,
+        messaging_client=messaging,
+        pii_map={},
+        faq_context=[{"title": "Delivery", "content": "Delivery takes 3-5 days."}],
+    )
+    seen_instructions: list[str | None] = []
+
+    def model_fn(messages: list[object], info: AgentInfo) -> object:
+        seen_instructions.append(info.instructions)
+        return ModelResponse(parts=[TextPart("Delivery takes 3-5 days.")])
+
+    with sales_agent.override(model=FunctionModel(model_fn)):
+        await sales_agent.run(
+            "How long is delivery?",
+            deps=deps,
+            message_history=[
+                ModelRequest(parts=[UserPromptPart("Hello")]),
+                ModelResponse(parts=[TextPart("Hello, I'm Noor from Treejar.")]),
+            ],
+        )
+
+    [instructions] = seen_instructions
+    assert instructions is not None
+    assert instructions.startswith("STATIC PREFIX\n\nSTAGE RULE")
+    assert instructions.index("STAGE RULE") < instructions.index(
+        "[KNOWLEDGE BASE (FAQ)]"
+    )
+    assert instructions.rstrip().endswith(EVIDENCE_GROUNDING_POLICY)
+
+
+@pytest.mark.asyncio
+@patch("src.llm.engine.build_static_prompt_prefix", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_order_handoff_mode_limits_available_tools(
     mock_prompt: AsyncMock,
+    mock_prefix: AsyncMock,
     mock_deps: tuple[
         AsyncMock, Conversation, AsyncMock, AsyncMock, AsyncMock, AsyncMock, AsyncMock
     ],
 ) -> None:
-    mock_prompt.return_value = "You are Noor."
+    mock_prefix.return_value = "You are Noor."
+    mock_prompt.return_value = "Greeting stage."
     db, conv, engine, zoho, zoho_crm, redis, messaging = mock_deps
     deps = SalesDeps(
         db=db,
@@ -7566,6 +7620,67 @@ async def test_process_message_service_handoff_deduplicates_current_user_in_rece
     )
 
 
+@pytest.mark.asyncio
+@patch("src.rag.pipeline.search_knowledge", new_callable=AsyncMock)
+@patch("src.core.config.get_system_config", new_callable=AsyncMock)
+@patch("src.llm.engine.build_message_history", new_callable=AsyncMock)
+@patch("src.llm.engine.sales_agent.run", new_callable=AsyncMock)
+async def test_process_message_replays_cached_verified_faq_answer(
+    mock_run: AsyncMock,
+    mock_build_history: AsyncMock,
+    mock_get_system_config: AsyncMock,
+    mock_search_knowledge: AsyncMock,
+    mock_deps: tuple[
+        AsyncMock, Conversation, AsyncMock, AsyncMock, AsyncMock, AsyncMock, AsyncMock
+    ],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.llm import message_processor
+
+    db, conv, engine, zoho, _zoho_crm, redis, messaging = mock_deps
+    monkeypatch.setattr(message_processor.settings, "answer_cache_enabled", True)
+    text = "What are your delivery times in Dubai?"
+    mock_build_history.return_value = _non_first_turn_history(text)
+    mock_get_system_config.return_value = "mock-model"
+    mock_search_knowledge.return_value = [
+        {
+            "id": "kb-delivery",
+            "title": "Delivery policy",
+            "content": "Q: What are your delivery times?\nA: Standard delivery takes 3-5 business days in Dubai and 5-7 business days across UAE.",
+        }
+    ]
+    engine.embed_async.return_value = [1.0, 0.0, 0.0]
+    redis.lrange.return_value = []
+    mock_run.return_value = _FakeAgentResult(
+        "Standard delivery takes 3-5 business days in Dubai."
+    )
+
+    async def ask() -> Any:
+        return await process_message(
+            conversation_id=conv.id,
+            combined_text=text,
+            db=db,
+            redis=redis,
+            embedding_engine=engine,
+            zoho_client=zoho,
+            messaging_client=messaging,
+        )
+
+    first = await ask()
+    stored = [
+        call.args for call in redis.eval.await_args_list if "lpush" in str(call.args[0])
+    ]
+    assert len(stored) == 1
+    redis.lrange.return_value = [stored[0][3].encode()]
+
+    second = await ask()
+
+    assert mock_run.await_count == 1
+    assert second.model == "mock-model|answer-cache"
+    assert second.tokens_in == 0
+    assert second.text == first.text
+
+
 @pytest.mark.asyncio
 @patch(
     "src.integrations.notifications.escalation.notify_manager_escalation",
@@ -8733,7 +8848,7 @@ async def test_recommend_products_cross_sell_returns_grounding_contract(
     assert [trace.tool_name for trace in deps.recovery_tool_traces] == [
         "recommend_products"
     ]
-    mock_get_cross_sell.assert_awaited_once_with(db, "desk", limit=3)
+    mock_get_cross_sell.assert_awaited_once_with(db, "desk", 3, product_id=None)
 
 
 @pytest.mark.asyncio
@@ -22142,6 +22257,7 @@ async def test_realistic_opening_always_returns_verified_rows_not_a_form(
             price=139.0,
             currency="AED",
             stock=12,
+            is_active=True,
         ),
         SimpleNamespace(
             sku="DESK-A",
@@ -22152,9 +22268,10 @@ async def test_realistic_opening_always_returns_verified_rows_not_a_form(
             price=250.0,
             currency="AED",
             stock=12,
+            is_active=True,
         ),
     ]
-    db.execute.return_value.scalars.return_value.all.return_value = products
+    db.execute.return_value.all.return_value = products
     planning = engine_module._catalog_planning_for_turn(
         conv,
         [f"user: {opening}"],
@@ -95,7 +95,7 @@ async def _config(_db: object, key: str, default: str) -> str:
 
 
 @pytest.mark.asyncio
-@patch("src.llm.engine.build_system_prompt", new_callable=AsyncMock)
+@patch("src.llm.engine.build_stage_prompt", new_callable=AsyncMock)
 async def test_inject_system_prompt_includes_customer_facts_memory(
     mock_prompt: AsyncMock,
 ) -> None:
@@ -1,4 +1,5 @@
 import re
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -6,19 +7,29 @@ import pytest
 from src.llm.communication_policy import (
     COMMERCIAL_CAPABILITIES,
     EVIDENCE_GROUNDING_POLICY,
+    finalize_evidence_grounding_prompt,
+)
+from src.llm.prompts import (
+    build_stage_prompt,
+    build_static_prompt_prefix,
+    prompt_prefix_version,
 )
-from src.llm.prompts import build_system_prompt
 from src.schemas.common import SalesStage
 
 
+async def _sales_prompt(db: Any, redis: Any, stage: str, language: str) -> str:
+    """Static prefix, then the finalized stage tail, as the sales agent sends them."""
+    prefix = await build_static_prompt_prefix(db, redis)
+    tail = await build_stage_prompt(db, redis, stage, language)
+    return f"{prefix}\n\n{finalize_evidence_grounding_prompt(tail)}"
+
+
 @pytest.mark.asyncio
-async def test_build_system_prompt_default_language() -> None:
+async def test_sales_prompt_default_language() -> None:
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.GREETING.value, language="ru"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="ru")
 
     assert "You are Noor" in prompt
     assert "You work for Treejar" in prompt
@@ -35,27 +46,23 @@ async def test_build_system_prompt_default_language() -> None:
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_custom_language() -> None:
+async def test_sales_prompt_custom_language() -> None:
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.SOLUTION.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.SOLUTION.value, language="en")
 
     assert "The user prefers to communicate in English" in prompt
     assert "STAGE: SOLUTION" in prompt
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_includes_compact_communication_policy() -> None:
+async def test_sales_prompt_includes_compact_communication_policy() -> None:
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.SOLUTION.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.SOLUTION.value, language="en")
 
     marker = "[COMMUNICATION RULES POLICY]"
     assert marker in prompt
@@ -78,9 +85,7 @@ async def test_build_system_prompt_includes_compact_communication_policy() -> No
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_keeps_policy_when_base_prompt_is_overridden() -> (
-    None
-):
+async def test_sales_prompt_keeps_policy_when_base_prompt_is_overridden() -> None:
     db, redis = AsyncMock(), AsyncMock()
 
     async def fake_component(
@@ -96,7 +101,7 @@ async def test_build_system_prompt_keeps_policy_when_base_prompt_is_overridden()
         "src.llm.prompts.get_system_prompt_component",
         side_effect=fake_component,
     ):
-        prompt = await build_system_prompt(
+        prompt = await _sales_prompt(
             db, redis, SalesStage.SOLUTION.value, language="en"
         )
 
@@ -202,9 +207,7 @@ async def test_customer_owned_furniture_redirect_covers_the_service_promise_fami
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.GREETING.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="en")
     capability = COMMERCIAL_CAPABILITIES["customer_owned_furniture"]
     instruction = capability.instruction
 
@@ -222,9 +225,28 @@ async def test_customer_owned_furniture_redirect_covers_the_service_promise_fami
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_appends_immutable_evidence_grounding_policy() -> (
-    None
-):
+async def test_static_prompt_prefix_is_the_same_for_every_stage_and_language() -> None:
+    db, redis = AsyncMock(), AsyncMock()
+    redis.get.return_value = None
+    db.execute.return_value.scalars.return_value.first.return_value = None
+
+    prefix = await build_static_prompt_prefix(db, redis)
+    greeting = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="ar")
+    solution = await _sales_prompt(db, redis, SalesStage.SOLUTION.value, language="en")
+
+    assert greeting.startswith(prefix)
+    assert solution.startswith(prefix)
+    assert "[COMMUNICATION RULES POLICY]" in prefix
+    assert "STAGE:" not in prefix
+    assert "prefers to communicate" not in prefix
+    assert EVIDENCE_GROUNDING_POLICY not in prefix
+    assert prompt_prefix_version(prefix) == prompt_prefix_version(
+        await build_static_prompt_prefix(db, redis)
+    )
+
+
+@pytest.mark.asyncio
+async def test_sales_prompt_appends_immutable_evidence_grounding_policy() -> None:
     db, redis = AsyncMock(), AsyncMock()
 
     async def fake_component(
@@ -242,7 +264,7 @@ async def test_build_system_prompt_appends_immutable_evidence_grounding_policy()
         "src.llm.prompts.get_system_prompt_component",
         side_effect=fake_component,
     ):
-        prompt = await build_system_prompt(
+        prompt = await _sales_prompt(
             db, redis, SalesStage.SOLUTION.value, language="en"
         )
 
@@ -279,12 +301,12 @@ async def test_build_system_prompt_appends_immutable_evidence_grounding_policy()
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_unknown_stage() -> None:
+async def test_sales_prompt_unknown_stage() -> None:
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
     # If a database field has an invalid stage string, we default to generic
-    prompt = await build_system_prompt(db, redis, "unknown_stage_123", language="ru")
+    prompt = await _sales_prompt(db, redis, "unknown_stage_123", language="ru")
 
     # Should contain base rules
     assert "You are Noor" in prompt
@@ -294,16 +316,14 @@ async def test_build_system_prompt_unknown_stage() -> None:
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_prioritizes_concrete_orders_without_false_positives() -> (
+async def test_sales_prompt_prioritizes_concrete_orders_without_false_positives() -> (
     None
 ):
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.GREETING.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="en")
 
     assert "Product questions, even about wholesale/MOQ/bulk pricing" in prompt
     assert "a concrete order on the first turn" in prompt
@@ -312,16 +332,14 @@ async def test_build_system_prompt_prioritizes_concrete_orders_without_false_pos
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_requires_immediate_handoff_for_first_turn_concrete_orders() -> (
+async def test_sales_prompt_requires_immediate_handoff_for_first_turn_concrete_orders() -> (
     None
 ):
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.GREETING.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="en")
 
     assert "I need 200 chairs delivered to Dubai Marina by next week" in prompt
     assert "exact street address, SKU, or price approval is not required" in prompt
@@ -333,16 +351,14 @@ async def test_build_system_prompt_requires_immediate_handoff_for_first_turn_con
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_preserves_non_escalation_examples_for_bulk_questions() -> (
+async def test_sales_prompt_preserves_non_escalation_examples_for_bulk_questions() -> (
     None
 ):
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.GREETING.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.GREETING.value, language="en")
 
     assert "What is your MOQ for chairs?" in prompt
     assert "What are your wholesale prices for bulk orders?" in prompt
@@ -355,14 +371,12 @@ async def test_build_system_prompt_preserves_non_escalation_examples_for_bulk_qu
 
 
 @pytest.mark.asyncio
-async def test_build_system_prompt_defers_product_search_budget_to_runtime() -> None:
+async def test_sales_prompt_defers_product_search_budget_to_runtime() -> None:
     db, redis = AsyncMock(), AsyncMock()
     redis.get.return_value = None
     db.execute.return_value.scalars.return_value.first.return_value = None
 
-    prompt = await build_system_prompt(
-        db, redis, SalesStage.SOLUTION.value, language="en"
-    )
+    prompt = await _sales_prompt(db, redis, SalesStage.SOLUTION.value, language="en")
 
     assert "at most ONE silent retry" not in prompt
     assert "Never do more than 2 `search_products` calls" not in prompt
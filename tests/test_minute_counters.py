@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.minute_counters import (
+    MINUTE_COUNTER_TTL_SECONDS,
+    read_minute_window,
+    record_minute_counters,
+)
+
+
+@pytest.mark.asyncio
+async def test_record_sends_counts_before_maxima_to_the_current_minute() -> None:
+    redis = AsyncMock()
+
+    await record_minute_counters(
+        redis, "stats", {"hit": 1, "duration_ms": 40}, {"max_ms": 40}, now=125.0
+    )
+
+    assert redis.eval.await_args.args[1:] == (
+        1,
+        "stats:m:2",
+        MINUTE_COUNTER_TTL_SECONDS,
+        2,
+        "hit",
+        1,
+        "duration_ms",
+        40,
+        "max_ms",
+        40,
+    )
+
+
+@pytest.mark.asyncio
+async def test_window_decodes_each_minute_oldest_first() -> None:
+    redis = AsyncMock()
+    redis.eval.return_value = [[b"hit", b"3"], [], ["miss", "1"]]
+
+    counts = await read_minute_window(redis, "stats", minutes=3, now=180.0)
+
+    assert redis.eval.await_args.args[2:] == ("stats:m:1", "stats:m:2", "stats:m:3")
+    assert counts == [{"hit": 3}, {}, {"miss": 1}]
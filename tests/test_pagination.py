@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.core.pagination import (
+    CURSOR_COUNT_CAP,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    split_page,
+)
+from src.models.admin_action_audit import AdminActionAudit
+
+STAMP = datetime(2026, 10, 19, 9, 30, 15, 123456, tzinfo=UTC)
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trips_and_stays_url_safe() -> None:
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(STAMP, row_id)
+
+    assert decode_cursor(cursor) == (STAMP, row_id)
+    assert set(cursor) <= set(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    )
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", "bm90LWpzb24", "WyJ4IiwieSJd"])
+def test_malformed_cursor_is_a_client_error(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_keyset_page_uses_offset_only_without_a_cursor() -> None:
+    base = select(AdminActionAudit)
+    columns = (AdminActionAudit.created_at, AdminActionAudit.id)
+
+    offset_sql = _sql(keyset_page(base, *columns, page=3, page_size=20, cursor=None))
+    cursor_sql = _sql(
+        keyset_page(
+            base,
+            *columns,
+            page=3,
+            page_size=20,
+            cursor=encode_cursor(STAMP, uuid.uuid4()),
+        )
+    )
+
+    order = "ORDER BY admin_action_audits.created_at DESC, admin_action_audits.id DESC"
+    assert order in offset_sql and order in cursor_sql
+    assert "OFFSET" in offset_sql
+    assert "OFFSET" not in cursor_sql
+    assert "(admin_action_audits.created_at, admin_action_audits.id) <" in cursor_sql
+
+
+def test_split_page_returns_a_cursor_only_when_a_row_is_left() -> None:
+    rows = [(STAMP, uuid.uuid4()) for _ in range(3)]
+
+    page, next_cursor = split_page(rows, 2, lambda row: row)
+    last_page, no_cursor = split_page(rows[:2], 2, lambda row: row)
+
+    assert page == rows[:2]
+    assert next_cursor is not None and decode_cursor(next_cursor) == rows[1]
+    assert last_page == rows[:2]
+    assert no_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_cursor_counts_stop_at_the_cap() -> None:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = CURSOR_COUNT_CAP + 1
+    db = AsyncMock()
+    db.execute.return_value = result
+    id_stmt = select(AdminActionAudit.id)
+
+    exact = await count_total(db, id_stmt, cursor=None)
+    capped = await count_total(db, id_stmt, cursor=encode_cursor(STAMP, uuid.uuid4()))
+
+    assert exact == (CURSOR_COUNT_CAP + 1, False)
+    assert capped == (CURSOR_COUNT_CAP, True)
+    assert "LIMIT" not in _sql(db.execute.await_args_list[0].args[0])
+    assert "LIMIT" in _sql(db.execute.await_args_list[1].args[0])
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.api.admin.views import SystemConfigAdmin
+from src.services import product_neighbors
+from src.services.product_neighbors import (
+    refresh_cross_sell_neighbors,
+    refresh_similar_neighbors,
+    top_k_neighbors,
+)
+from src.services.recommendations import get_cross_sell
+
+
+class _Result:
+    def __init__(self, rows: list[Any] | None = None, value: object = None) -> None:
+        self._rows = rows or []
+        self._value = value
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def scalar_one_or_none(self) -> object:
+        return self._value
+
+    def scalars(self) -> _Result:
+        return self
+
+
+class _NeighborSession:
+    """Answers reads in order and records the DELETE/INSERT writes."""
+
+    def __init__(self, *results: _Result) -> None:
+        self._results = list(results)
+        self.deleted: list[set[uuid.UUID] | None] = []
+        self.inserted: list[dict[str, Any]] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> _Result:
+        if statement.is_delete:
+            criteria = statement.compile().params
+            ids = next(
+                (value for value in criteria.values() if isinstance(value, list)),
+                None,
+            )
+            self.deleted.append(set(ids) if ids is not None else None)
+            return _Result()
+        if statement.is_insert:
+            self.inserted.extend(params)
+            return _Result()
+        return self._results.pop(0)
+
+
+def _ids(count: int) -> list[uuid.UUID]:
+    return [uuid.uuid4() for _ in range(count)]
+
+
+def _neighbors_by_product(
+    rows: list[dict[str, Any]],
+) -> dict[uuid.UUID, list[uuid.UUID]]:
+    lists: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for row in sorted(rows, key=lambda row: row["rank"]):
+        lists.setdefault(row["product_id"], []).append(row["neighbor_id"])
+    return lists
+
+
+def test_top_k_neighbors_matches_brute_force_across_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(product_neighbors, "_QUERY_BATCH_ROWS", 3)
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(20, 8)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    rows = [0, 4, 5, 9, 13, 19, 2]
+
+    indices, scores, column_best = top_k_neighbors(vectors, rows, 4)
+
+    similarities = vectors @ vectors.T
+    np.fill_diagonal(similarities, -np.inf)
+    for offset, row in enumerate(rows):
+        expected = np.argsort(-similarities[row], kind="stable")[:4]
+        assert indices[offset].tolist() == expected.tolist()
+        assert row not in indices[offset]
+        np.testing.assert_allclose(
+            scores[offset], similarities[row, expected], rtol=1e-5
+        )
+    np.testing.assert_allclose(column_best, similarities[rows].max(axis=0), rtol=1e-5)
+
+
+def test_top_k_neighbors_caps_k_at_the_other_products() -> None:
+    vectors = np.eye(3, dtype=np.float32)
+
+    indices, scores, _ = top_k_neighbors(vectors, [1], 10)
+
+    assert indices.shape == scores.shape == (1, 2)
+    assert set(indices[0].tolist()) == {0, 2}
+
+
+@pytest.mark.asyncio
+async def test_refresh_similar_recomputes_new_products_and_lists_they_beat() -> None:
+    p0, p1, p2, p3 = _ids(4)
+    live = [
+        SimpleNamespace(id=p0, embedding=[1.0, 0.0]),
+        SimpleNamespace(id=p1, embedding=[0.9, 0.1]),
+        SimpleNamespace(id=p2, embedding=[0.0, 1.0]),
+        SimpleNamespace(id=p3, embedding=[0.95, 0.05]),  # new since last refresh
+    ]
+    existing = [(p0, p1, 0.9939), (p1, p0, 0.9939), (p2, p1, 0.1104)]
+    session = _NeighborSession(_Result(live), _Result(existing))
+
+    recomputed, removed = await refresh_similar_neighbors(
+        session,  # type: ignore[arg-type]
+        k=1,
+    )
+
+    # p3 now beats the only neighbour of p0 and p1, but not p2's.
+    assert (recomputed, removed) == (3, 0)
+    assert session.deleted == [{p0, p1, p3}]
+    assert _neighbors_by_product(session.inserted) == {
+        p0: [p3],
+        p1: [p3],
+        p3: [p0],
+    }
+
+
+@pytest.mark.asyncio
+async def test_refresh_similar_repairs_lists_that_name_a_removed_product() -> None:
+    p0, p1, p2, gone = _ids(4)
+    live = [
+        SimpleNamespace(id=p0, embedding=[1.0, 0.0]),
+        SimpleNamespace(id=p1, embedding=[0.0, 1.0]),
+        SimpleNamespace(id=p2, embedding=[0.7, 0.7]),
+    ]
+    existing = [
+        (p0, p2, 0.7071),
+        (p1, p2, 0.7071),
+        (p2, gone, 0.99),
+        (gone, p2, 0.99),
+    ]
+    session = _NeighborSession(_Result(live), _Result(existing))
+
+    recomputed, removed = await refresh_similar_neighbors(
+        session,  # type: ignore[arg-type]
+        k=1,
+    )
+
+    assert (recomputed, removed) == (1, 1)
+    assert session.deleted == [{p2, gone}]
+    assert [row["product_id"] for row in session.inserted] == [p2]
+
+
+@pytest.mark.asyncio
+async def test_refresh_similar_without_changes_writes_nothing() -> None:
+    p0, p1 = _ids(2)
+    live = [
+        SimpleNamespace(id=p0, embedding=[1.0, 0.0]),
+        SimpleNamespace(id=p1, embedding=[0.0, 1.0]),
+    ]
+    existing = [(p0, p1, 0.0), (p1, p0, 0.0)]
+    session = _NeighborSession(_Result(live), _Result(existing))
+
+    assert await refresh_similar_neighbors(session, k=1) == (0, 0)  # type: ignore[arg-type]
+    assert session.deleted == []
+    assert session.inserted == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_cross_sell_fans_category_picks_out_to_sources() -> None:
+    desk_a, desk_b, chair, divider = _ids(4)
+    rules = SimpleNamespace(value={"desk": ["chair", "accessories"], "sofa": []})
+    picks = [
+        SimpleNamespace(id=divider, category="accessories"),
+        SimpleNamespace(id=chair, category="chairs"),
+    ]
+    sources = [
+        SimpleNamespace(id=desk_a, category="desk"),
+        SimpleNamespace(id=desk_b, category="desk"),
+    ]
+    session = _NeighborSession(_Result(value=rules), _Result(picks), _Result(sources))
+
+    written = await refresh_cross_sell_neighbors(session)  # type: ignore[arg-type]
+
+    assert written == 4
+    assert session.deleted == [None]
+    assert _neighbors_by_product(session.inserted) == {
+        desk_a: [chair, divider],
+        desk_b: [chair, divider],
+    }
+    assert {row["relation_type"] for row in session.inserted} == {"cross_sell"}
+
+
+@pytest.mark.asyncio
+async def test_cross_sell_uses_live_rules_once_every_pick_is_sold_out() -> None:
+    desk, sold_out_chair, chair = _ids(3)
+    pick = SimpleNamespace(
+        id=sold_out_chair,
+        name_en="Mesh chair",
+        sku="CH-1",
+        price=450,
+        currency="AED",
+        stock=0,
+        is_active=True,
+        score=None,
+    )
+    live_chair = SimpleNamespace(
+        id=chair, name_en="Task chair", sku="CH-2", price=300, currency="AED", stock=4
+    )
+    session = _NeighborSession(
+        _Result([pick]),
+        _Result(value=SimpleNamespace(value={"desk": ["chair"]})),
+        _Result([live_chair]),
+    )
+
+    items = await get_cross_sell(session, "desk", product_id=desk)  # type: ignore[arg-type]
+
+    assert [item.id for item in items] == [chair]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("key", "rebuilds"), [("cross_sell_rules", 1), ("bot_enabled", 0)]
+)
+async def test_saving_the_cross_sell_rules_rebuilds_the_precomputed_picks(
+    key: str, rebuilds: int
+) -> None:
+    with patch(
+        "src.api.admin.views.rebuild_cross_sell_neighbors", new_callable=AsyncMock
+    ) as rebuild:
+        await SystemConfigAdmin.after_model_change(
+            MagicMock(), {}, SimpleNamespace(key=key), False, MagicMock()
+        )
+
+    assert rebuild.await_count == rebuilds
@@ -11,6 +11,7 @@ from src.core.config import settings
 from src.main import app
 from src.services.public_media import (
     build_signed_product_image_url,
+    cache_product_image,
     sign_product_image_token,
     verify_signed_product_image_token,
 )
@@ -146,3 +147,40 @@ async def test_public_media_route_rejects_missing_image(
         app.dependency_overrides.pop(get_inventory_client, None)
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_public_media_route_serves_a_prefetched_image_without_zoho(
+    public_media_client: AsyncClient,
+    restore_public_media_settings: None,
+) -> None:
+    from src.api.deps import get_redis
+    from src.api.v1.public_media import get_inventory_client
+
+    settings.app_secret_key = "test-secret"
+    token = sign_product_image_token("ZOHO-1")
+    inventory = SimpleNamespace(get_item_image=AsyncMock(return_value=None))
+    redis = AsyncMock()
+    await cache_product_image(redis, "ZOHO-1", b"cached-bytes", "image/png")
+    redis.get.return_value = redis.set.await_args.args[1]
+
+    async def _override_inventory_client() -> AsyncGenerator[object, None]:
+        yield inventory
+
+    async def _override_redis() -> AsyncGenerator[object, None]:
+        yield redis
+
+    app.dependency_overrides[get_inventory_client] = _override_inventory_client
+    app.dependency_overrides[get_redis] = _override_redis
+    try:
+        response = await public_media_client.get(
+            f"/api/v1/public-media/products/ZOHO-1?token={token}"
+        )
+    finally:
+        app.dependency_overrides.pop(get_inventory_client, None)
+        app.dependency_overrides.pop(get_redis, None)
+
+    assert response.status_code == 200
+    assert response.content == b"cached-bytes"
+    redis.get.assert_awaited_once_with("public_media:product_image:ZOHO-1")
+    inventory.get_item_image.assert_not_awaited()
@@ -1435,7 +1435,7 @@ async def test_api_returns_502_on_unexpected_model_behavior() -> None:
     with (
         patch("src.api.v1.quality.conversation_already_reviewed", return_value=False),
         patch(
-            "src.api.v1.quality.evaluate_conversation",
+            "src.quality.evaluator.evaluate_conversation",
             side_effect=UnexpectedModelBehavior("Max retries exceeded"),
         ),
     ):
@@ -1462,7 +1462,7 @@ async def test_api_returns_504_on_timeout() -> None:
     with (
         patch("src.api.v1.quality.conversation_already_reviewed", return_value=False),
         patch(
-            "src.api.v1.quality.evaluate_conversation",
+            "src.quality.evaluator.evaluate_conversation",
             side_effect=TimeoutError(),
         ),
     ):
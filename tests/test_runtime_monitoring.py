@@ -8,8 +8,13 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.core.minute_counters import _READ_HASHES_SCRIPT
 from src.services.runtime_monitoring import (
+    _DURABLE_KEY_PROBE_SCRIPT,
     ZOHO_OAUTH_FAILURES_KEY,
+    JobMetrics,
+    PhaseLatencyMetrics,
+    RedisPoolMetrics,
     RuntimeSnapshot,
     RuntimeThresholds,
     claim_signal_delivery,
@@ -137,16 +142,17 @@ async def test_collect_runtime_snapshot_reads_real_sources_without_payloads(
 ) -> None:
     redis = AsyncMock()
     redis.ping.return_value = True
-    redis.all_job_results.return_value = [
-        SimpleNamespace(
-            success=False,
-            finish_time=datetime(2026, 7, 23, 11, 30, tzinfo=UTC),
-        ),
-        SimpleNamespace(
-            success=False,
-            finish_time=datetime(2026, 7, 23, 10, 30, tzinfo=UTC),
-        ),
-    ]
+
+    async def eval_script(script: str, numkeys: int, *keys_and_args: object) -> object:
+        del keys_and_args
+        if script != _READ_HASHES_SCRIPT:
+            return []
+        # One failed run in the lookback, then 59 empty minutes.
+        return [
+            [b"run_daily_summary:failed", b"1", b"run_daily_summary:duration_ms", b"40"]
+        ] + [[] for _ in range(numkeys - 1)]
+
+    redis.eval.side_effect = eval_script
     redis.queued_jobs.return_value = [
         SimpleNamespace(
             function="process_incoming_batch",
@@ -190,6 +196,9 @@ async def test_collect_runtime_snapshot_reads_real_sources_without_payloads(
     )
 
     assert snapshot.failed_jobs_last_hour == 1
+    assert [(job.function, job.failed) for job in snapshot.jobs] == [
+        ("run_daily_summary", 1)
+    ]
     assert snapshot.oauth_failures_last_hour == 1
     assert snapshot.queue_depth == 1
     assert snapshot.oldest_queue_age_seconds == 180
@@ -215,7 +224,6 @@ async def test_collect_runtime_snapshot_sees_orphaned_durable_inbound_batch(
 ) -> None:
     redis = AsyncMock()
     redis.ping.return_value = True
-    redis.all_job_results.return_value = []
     redis.queued_jobs.return_value = []
     redis.lrange.return_value = []
 
@@ -225,14 +233,12 @@ async def test_collect_runtime_snapshot_sees_orphaned_durable_inbound_batch(
         return 0, [durable_key] if durable_key.startswith(prefix) else []
 
     redis.scan.side_effect = scan_result
-    redis.object.return_value = 300
 
-    async def llen_and_touch_key(key: bytes) -> int:
-        del key
-        redis.object.return_value = 0
-        return 1
+    async def eval_script(script: str, numkeys: int, *keys_and_args: object) -> object:
+        del numkeys, keys_and_args
+        return [300, 1] if script == _DURABLE_KEY_PROBE_SCRIPT else []
 
-    redis.llen.side_effect = llen_and_touch_key
+    redis.eval.side_effect = eval_script
 
     db = AsyncMock()
     db.execute.side_effect = [SimpleNamespace(), _ScalarResult(0)]
@@ -251,8 +257,14 @@ async def test_collect_runtime_snapshot_sees_orphaned_durable_inbound_batch(
 
     assert snapshot.queue_depth == 1
     assert snapshot.oldest_queue_age_seconds == 300
-    redis.llen.assert_awaited_once()
-    redis.object.assert_awaited_once()
+    probes = [
+        call.args
+        for call in redis.eval.await_args_list
+        if call.args[0] == _DURABLE_KEY_PROBE_SCRIPT
+    ]
+    assert probes == [(_DURABLE_KEY_PROBE_SCRIPT, 1, durable_key)]
+    redis.llen.assert_not_awaited()
+    redis.object.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -493,3 +505,167 @@ def test_production_worker_can_read_host_maintenance_heartbeat() -> None:
     )[0]
 
     assert "./logs/maintenance:/opt/noor/logs/maintenance:ro" in worker_section
+
+
+@pytest.mark.asyncio
+async def test_collect_runtime_snapshot_reports_per_queue_depth_and_wait(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.core.queues.settings.arq_split_queues", True)
+    now_ms = int(NOW.timestamp() * 1000)
+    queues = {
+        "arq:queue:realtime": [("job-a", now_ms - 4_000), ("job-b", now_ms + 5_000)],
+        "arq:queue:interactive": [],
+        "arq:queue": [("job-c", now_ms - 1_200_000)],
+    }
+    redis = AsyncMock()
+    redis.ping.return_value = True
+    redis.queued_jobs.return_value = []
+    redis.lrange.return_value = []
+    redis.scan.side_effect = [(0, []), (0, [])]
+    redis.zcard.side_effect = lambda name: len(queues[name])
+    redis.zcount.side_effect = lambda name, low, high: sum(
+        1 for _job, score in queues[name] if score <= high
+    )
+
+    def oldest_due(
+        name: str, low: str, high: int, *, start: int, num: int, withscores: bool
+    ) -> list[tuple[str, float]]:
+        del low, withscores
+        due = sorted(
+            (item for item in queues[name] if item[1] <= high), key=lambda i: i[1]
+        )
+        return [(job, float(score)) for job, score in due[start : start + num]]
+
+    redis.zrangebyscore.side_effect = oldest_due
+    db = AsyncMock()
+    db.execute.side_effect = [SimpleNamespace(), _ScalarResult(0)]
+    heartbeat = tmp_path / "maintenance.status"
+    heartbeat.write_text(
+        '{"status":"success","finished_at_epoch":1784806200}\n',
+        encoding="utf-8",
+    )
+
+    snapshot = await collect_runtime_snapshot(
+        redis,
+        db,
+        observed_at=NOW,
+        maintenance_status_path=heartbeat,
+    )
+
+    by_class = {queue.job_class: queue for queue in snapshot.queues}
+    assert by_class["realtime"].depth == 2
+    assert by_class["realtime"].ready == 1
+    assert by_class["realtime"].oldest_wait_seconds == 4
+    assert by_class["interactive"].depth == 0
+    assert by_class["interactive"].oldest_wait_seconds is None
+    assert by_class["batch"].oldest_wait_seconds == 1200
+    assert snapshot.queue_depth == 2
+    assert snapshot.oldest_queue_age_seconds == 4
+    redis.queued_jobs.assert_not_awaited()
+
+    signals = evaluate_runtime_snapshot(snapshot, RuntimeThresholds())
+    assert [signal.code for signal in signals] == ["arq_queue_waiting_batch"]
+
+
+def test_job_failure_rate_raises_a_signal_once_the_job_has_enough_runs() -> None:
+    snapshot = RuntimeSnapshot(
+        observed_at=NOW,
+        failed_jobs_last_hour=5,
+        oauth_failures_last_hour=0,
+        queue_depth=0,
+        stale_pending_escalations=0,
+        health_dependency_failures=0,
+        jobs=[
+            JobMetrics(
+                function="sync_products",
+                succeeded=1,
+                failed=3,
+                retried=0,
+                failure_rate=0.75,
+            ),
+            JobMetrics(
+                function="run_daily_summary",
+                succeeded=0,
+                failed=2,
+                retried=0,
+                failure_rate=1.0,
+            ),
+        ],
+    )
+
+    signals = evaluate_runtime_snapshot(snapshot, RuntimeThresholds())
+
+    assert [signal.code for signal in signals] == [
+        "arq_jobs_failed",
+        "arq_job_failure_rate_sync_products",
+    ]
+    assert signals[1].value == 0.75
+
+
+def test_redis_pool_checkout_timeouts_raise_a_signal() -> None:
+    snapshot = RuntimeSnapshot(
+        observed_at=NOW,
+        failed_jobs_last_hour=0,
+        oauth_failures_last_hour=0,
+        queue_depth=0,
+        stale_pending_escalations=0,
+        health_dependency_failures=0,
+        redis_pool=RedisPoolMetrics(
+            max_connections=20,
+            in_use=20,
+            acquisitions=500,
+            waits=12,
+            wait_seconds_total=31.5,
+            wait_seconds_max=5.0,
+            timeouts=2,
+        ),
+    )
+
+    signals = evaluate_runtime_snapshot(snapshot, RuntimeThresholds())
+
+    assert [signal.code for signal in signals] == ["redis_pool_exhausted"]
+    assert signals[0].value == 2
+
+
+def test_chat_latency_p95_over_slo_raises_a_signal_per_phase() -> None:
+    snapshot = RuntimeSnapshot(
+        observed_at=NOW,
+        failed_jobs_last_hour=0,
+        oauth_failures_last_hour=0,
+        queue_depth=0,
+        stale_pending_escalations=0,
+        health_dependency_failures=0,
+        chat_latency=[
+            PhaseLatencyMetrics(
+                phase="queue_wait", count=40, p50_ms=900, p95_ms=4000, p99_ms=9000
+            ),
+            PhaseLatencyMetrics(
+                phase="to_text_delivery",
+                count=40,
+                p50_ms=9000,
+                p95_ms=31000,
+                p99_ms=48000,
+            ),
+            # Too few turns to trust the percentile.
+            PhaseLatencyMetrics(
+                phase="total", count=2, p50_ms=90000, p95_ms=90000, p99_ms=90000
+            ),
+        ],
+    )
+
+    signals = evaluate_runtime_snapshot(
+        snapshot,
+        RuntimeThresholds(
+            chat_latency_p95_ms={
+                "queue_wait": 30000,
+                "to_text_delivery": 25000,
+                "total": 60000,
+            }
+        ),
+    )
+
+    assert [signal.code for signal in signals] == ["chat_latency_p95_to_text_delivery"]
+    assert signals[0].value == 31000
+    assert signals[0].threshold == 25000
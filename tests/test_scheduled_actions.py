@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import datetime
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.models.conversation import Conversation
+from src.services.followup import payment_reminder_due_at
+from src.services.proposal_followup import (
+    proposal_followup_due_at,
+    record_customer_reply,
+    record_followup_step_sent,
+    record_proposal_sent,
+)
+from src.services.scheduled_actions import (
+    RETRY_DELAY,
+    ScheduledActionKind,
+    claim_due_actions,
+    reschedule_claimed_action,
+    schedule_action_statement,
+)
+from src.services.turn_state import TurnStateBuffer
+
+
+def _dt(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _proposal_conversation() -> Conversation:
+    conv = Conversation(
+        id=uuid.uuid4(),
+        phone="+971501234567",
+        status="active",
+        deal_status="pending",
+        metadata_={},
+    )
+    record_proposal_sent(conv, sent_at=_dt("2026-05-04T08:00:00Z"), kp_message_id="kp")
+    return conv
+
+
+def test_proposal_due_time_follows_steps_pause_final_and_reply() -> None:
+    conv = _proposal_conversation()
+    assert proposal_followup_due_at(conv) == _dt("2026-05-05T07:00:00Z")
+
+    record_customer_reply(
+        conv,
+        text="Out of office auto-reply",
+        received_at=_dt("2026-05-04T09:00:00Z"),
+    )
+    assert proposal_followup_due_at(conv) == _dt("2026-05-07T09:00:00Z")
+
+    record_followup_step_sent(conv, step=3, sent_at=_dt("2026-05-11T08:00:00Z"))
+    assert proposal_followup_due_at(conv) == _dt("2026-05-12T08:00:00Z")
+
+    record_customer_reply(
+        conv, text="Thanks, we will check", received_at=_dt("2026-05-11T10:00:00Z")
+    )
+    assert proposal_followup_due_at(conv) is None
+
+
+def test_payment_due_time_is_the_approval_until_a_reminder_is_sent() -> None:
+    decided_at = datetime.datetime(2026, 5, 4, 8, 0)
+    conv = Conversation(
+        id=uuid.uuid4(),
+        phone="+971501234567",
+        status="active",
+        deal_status="pending",
+        metadata_={
+            "quotation_decision_status": "approved",
+            "quotation_decision": {
+                "status": "approved",
+                "decided_at": decided_at.isoformat(),
+            },
+            "zoho_sale_order_id": "so-1",
+        },
+    )
+    assert payment_reminder_due_at(conv) == decided_at
+
+    conv.metadata_ = {
+        **(conv.metadata_ or {}),
+        "payment_reminders": {"so-1": {"approved-24h": {"status": "blocked"}}},
+    }
+    assert payment_reminder_due_at(conv) == decided_at
+
+    conv.metadata_ = {
+        **conv.metadata_,
+        "payment_reminders": {"so-1": {"approved-24h": {"status": "sent"}}},
+    }
+    assert payment_reminder_due_at(conv) is None
+
+
+def test_schedule_statement_upserts_or_closes_the_row() -> None:
+    conversation_id = uuid.uuid4()
+
+    upsert = _sql(
+        schedule_action_statement(
+            conversation_id,
+            ScheduledActionKind.PAYMENT_REMINDER,
+            datetime.datetime(2026, 5, 4, 8, 0),
+        )
+    )
+    close = _sql(
+        schedule_action_statement(
+            conversation_id, ScheduledActionKind.PAYMENT_REMINDER, None
+        )
+    )
+
+    assert "ON CONFLICT ON CONSTRAINT uq_scheduled_actions_conversation_id_kind" in (
+        upsert
+    )
+    assert "DO UPDATE SET due_at = excluded.due_at" in upsert
+    assert close.startswith("UPDATE scheduled_actions SET state=")
+    assert "scheduled_actions.state IN" in close
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_locked_rows_and_commits_before_sending() -> None:
+    claimed = [uuid.uuid4()]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = claimed
+    db = AsyncMock()
+    db.execute.return_value = result
+
+    conversation_ids = await claim_due_actions(
+        db,
+        ScheduledActionKind.PROPOSAL_FOLLOWUP,
+        now=datetime.datetime(2026, 5, 4, 8, 0),
+        limit=10,
+    )
+
+    sql = _sql(db.execute.await_args.args[0])
+    assert conversation_ids == claimed
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "ORDER BY scheduled_actions.due_at" in sql
+    assert "RETURNING scheduled_actions.conversation_id" in sql
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reschedule_pushes_a_still_due_row_past_this_run() -> None:
+    db = AsyncMock()
+    now = datetime.datetime(2026, 5, 4, 8, 0, tzinfo=datetime.UTC)
+
+    await reschedule_claimed_action(
+        db,
+        uuid.uuid4(),
+        ScheduledActionKind.PROPOSAL_FOLLOWUP,
+        now - datetime.timedelta(days=1),
+        now=now,
+    )
+
+    params = db.execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+    assert params["due_at"] == now + RETRY_DELAY
+
+
+def test_turn_commit_closes_the_followup_row_on_customer_reply(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = Session(bind=create_engine("sqlite://"))
+    statements: list[Any] = []
+    monkeypatch.setattr(
+        session, "execute", lambda statement: statements.append(statement)
+    )
+    conversation = _proposal_conversation()
+    make_transient_to_detached(conversation)
+    session.add(conversation)
+    buffer = TurnStateBuffer(session)
+    buffer.open()
+    buffer.track(conversation)
+
+    record_customer_reply(
+        conversation,
+        text="Can you do a better price?",
+        received_at=_dt("2026-05-04T12:00:00Z"),
+    )
+    session.commit()
+    buffer.close()
+
+    metadata_update, close = (_sql(statement) for statement in statements)
+    assert metadata_update.startswith("UPDATE conversations SET metadata=")
+    assert close.startswith("UPDATE scheduled_actions SET state=")
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+REPLAY_MODULE_PATH = REPO_ROOT / "scripts" / "replay_load_test.py"
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location(
+        "scripts.replay_load_test",
+        REPLAY_MODULE_PATH,
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _completion_body(*messages: dict[str, object], **extra: object) -> dict:
+    return {"model": "fake/model", "messages": list(messages), **extra}
+
+
+def test_replay_conversations_put_earlier_customer_turns_first() -> None:
+    replay = _load_module()
+    from scripts.model_battle_cases import CORE_HARD_CASES, SALES_CASES
+
+    conversations = replay.replay_conversations()
+    hard = next(c for c in conversations if c.case_id == CORE_HARD_CASES[0].case_id)
+
+    assert len(conversations) == len(SALES_CASES) + len(CORE_HARD_CASES)
+    assert hard.turns[0] == CORE_HARD_CASES[0].conversation[0]["content"]
+    assert hard.turns[-1] == CORE_HARD_CASES[0].user_prompt
+    assert [c.case_id for c in replay.replay_conversations(["sales-01"])] == [
+        "sales-01"
+    ]
+
+
+def test_replay_config_refuses_unbounded_runs_and_unknown_cases() -> None:
+    replay = _load_module()
+
+    with pytest.raises(ValueError, match="concurrency"):
+        replay.validate_config(
+            replay.ReplayConfig(concurrency=replay.MAX_CONCURRENCY + 1)
+        )
+    with pytest.raises(ValueError, match="unknown cases: nope"):
+        replay.validate_config(replay.ReplayConfig(cases=("nope",)))
+
+
+def test_fake_completion_returns_the_recorded_steps_of_the_matching_case() -> None:
+    replay = _load_module()
+    conversations = replay.replay_conversations()
+    prompt = conversations[0].turns[-1]
+    replies = {
+        conversations[0].case_id: [
+            {"tool": "search_products", "arguments": {"query": "chair"}},
+            "Recorded answer.",
+        ]
+    }
+
+    first = replay.fake_chat_completion(
+        _completion_body({"role": "user", "content": f"Customer: {prompt}"}),
+        conversations,
+        replies,
+    )
+    second = replay.fake_chat_completion(
+        _completion_body(
+            {"role": "user", "content": [{"type": "text", "text": prompt}]},
+            {"role": "assistant", "content": None},
+            {"role": "tool", "content": "[]"},
+        ),
+        conversations,
+        replies,
+    )
+
+    call = first["choices"][0]["message"]["tool_calls"][0]["function"]
+    assert first["choices"][0]["finish_reason"] == "tool_calls"
+    assert call["name"] == "search_products"
+    assert json.loads(call["arguments"]) == {"query": "chair"}
+    assert second["choices"][0]["message"]["content"] == "Recorded answer."
+
+
+def test_fake_completion_answers_structured_output_agents_with_their_schema() -> None:
+    replay = _load_module()
+    schema = {
+        "type": "object",
+        "properties": {
+            "verdict": {"enum": ["correct", "wrong"]},
+            "facts": {"$ref": "#/$defs/Facts"},
+        },
+        "required": ["verdict", "facts"],
+        "$defs": {
+            "Facts": {
+                "type": "object",
+                "properties": {"count": {"type": ["integer", "null"]}},
+                "required": ["count"],
+            }
+        },
+    }
+    body = _completion_body(
+        {"role": "user", "content": "unrelated"},
+        tools=[
+            {
+                "type": "function",
+                "function": {"name": "final_result", "parameters": schema},
+            }
+        ],
+    )
+
+    completion = replay.fake_chat_completion(body, (), {})
+
+    call = completion["choices"][0]["message"]["tool_calls"][0]["function"]
+    assert json.loads(call["arguments"]) == {
+        "verdict": "correct",
+        "facts": {"count": 0},
+    }
+    plain = replay.fake_chat_completion(_completion_body(), (), {})
+    assert plain["choices"][0]["message"]["content"] == replay.DEFAULT_REPLY
+
+
+@pytest.mark.asyncio
+async def test_fake_providers_serve_every_upstream_and_count_calls() -> None:
+    replay = _load_module()
+    app = replay.build_fake_provider_app(
+        replay.replay_conversations(),
+        {},
+        llm_latency_ms=0,
+        provider_latency_ms=0,
+    )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://fake"
+    ) as client:
+        channels = (await client.get("/wazzup/channels")).json()
+        sent = (await client.post("/wazzup/message", json={"text": "hi"})).json()
+        items = (await client.get("/zoho-inventory/items")).json()
+        completion = (
+            await client.post(
+                "/openrouter/chat/completions",
+                json=_completion_body({"role": "user", "content": "hello"}),
+            )
+        ).json()
+        stats = (await client.get("/stats")).json()
+
+    assert channels == [
+        {"channelId": replay.FAKE_CHANNEL_ID, "plainId": replay.FAKE_CHANNEL_PHONE}
+    ]
+    assert sent["messageId"]
+    assert items["items"] == []
+    assert completion["usage"]["total_tokens"] > 0
+    assert stats == {"openrouter": 1, "wazzup": 2, "zoho_inventory": 1}
@@ -267,5 +267,5 @@ async def test_wazzup_allowlist_blocks_disallowed_origin_without_queueing() -> N
 
     assert response.status_code == 403
     assert response.json() == {"error": "forbidden"}
-    app.state.redis.rpush.assert_not_awaited()
+    app.state.redis.eval.assert_not_awaited()
     app.state.arq_pool.enqueue_job.assert_not_awaited()
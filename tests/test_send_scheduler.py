@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.integrations.messaging.send_scheduler import (
+    acquire_send_slot,
+    pause_channel,
+    send_channel,
+)
+from src.integrations.messaging.wazzup import WazzupProvider
+
+
+@pytest.fixture(autouse=True)
+def _scheduler_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "wazzup_send_burst", 10)
+    monkeypatch.setattr(settings, "wazzup_send_live_reserve", 4)
+    monkeypatch.setattr(settings, "wazzup_send_live_max_wait_seconds", 1.0)
+    monkeypatch.setattr(settings, "wazzup_channel_id", "channel-1")
+
+
+@pytest.mark.asyncio
+@patch(
+    "src.integrations.messaging.send_scheduler.asyncio.sleep", new_callable=AsyncMock
+)
+async def test_bulk_keeps_the_live_reserve_and_waits_for_tokens(
+    mock_sleep: AsyncMock,
+) -> None:
+    redis = AsyncMock()
+    redis.eval.side_effect = [2000, 1500, 0]
+
+    waited = await acquire_send_slot(redis, "channel-1", "bulk")
+
+    assert waited == 3.5
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [2.0, 1.5]
+    keys_and_args = redis.eval.await_args.args[1:]
+    assert keys_and_args[:3] == (
+        2,
+        "wazzup:outbound:channel-1:bucket",
+        "wazzup:outbound:channel-1:paused_until",
+    )
+    assert keys_and_args[-2:] == (10, 4)
+
+
+@pytest.mark.asyncio
+@patch(
+    "src.integrations.messaging.send_scheduler.asyncio.sleep", new_callable=AsyncMock
+)
+async def test_live_takes_any_token_and_stops_waiting_at_its_cap(
+    mock_sleep: AsyncMock,
+) -> None:
+    redis = AsyncMock()
+    redis.eval.return_value = 5000
+
+    waited = await acquire_send_slot(redis, "channel-1", "live")
+
+    assert waited == 1.0
+    mock_sleep.assert_awaited_once_with(1.0)
+    assert redis.eval.await_args.args[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_unavailable_redis_lets_the_send_through() -> None:
+    redis = AsyncMock()
+    redis.eval.side_effect = ConnectionError("redis down")
+
+    assert await acquire_send_slot(redis, "channel-1", "bulk") == 0.0
+    await pause_channel(redis, "channel-1", 5)
+
+
+def test_send_channel_defaults_to_the_configured_channel() -> None:
+    assert send_channel("channel-2") == "channel-2"
+    assert send_channel(None) == "channel-1"
+
+
+@pytest.mark.asyncio
+@patch("src.integrations.messaging.wazzup.asyncio.sleep", new_callable=AsyncMock)
+@patch("src.integrations.messaging.wazzup.pause_channel", new_callable=AsyncMock)
+@patch("src.integrations.messaging.wazzup.acquire_send_slot", new_callable=AsyncMock)
+@patch(
+    "src.integrations.messaging.wazzup.httpx.AsyncClient.request",
+    new_callable=AsyncMock,
+)
+async def test_provider_paces_sends_and_pauses_the_channel_on_429(
+    mock_request: AsyncMock,
+    mock_acquire: AsyncMock,
+    mock_pause: AsyncMock,
+    mock_sleep: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "wazzup_send_scheduler_enabled", True)
+    limited = MagicMock()
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "7"}
+    limited.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Too Many Requests", request=MagicMock(), response=limited
+    )
+    sent = MagicMock()
+    sent.json.return_value = {"messageId": "msg-1"}
+    mock_request.side_effect = [limited, sent]
+    provider = WazzupProvider(priority="bulk")
+
+    assert await provider.send_text("971500000000", "Reminder") == "msg-1"
+
+    assert [call.args[1:] for call in mock_acquire.await_args_list] == [
+        ("channel-1", "bulk"),
+        ("channel-1", "bulk"),
+    ]
+    assert mock_pause.await_args.args[1:] == ("channel-1", 7.0)
+    mock_sleep.assert_awaited_once_with(7.0)
+    await provider.close()
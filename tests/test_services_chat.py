@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Callable
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -8,6 +9,7 @@ import pytest
 
 from src.models.message import Message
 from src.services.chat import (
+    _CLAIM_INBOUND_MESSAGES_SCRIPT,
     INBOUND_EXECUTION_STARTED,
     InboundBatchTerminalError,
     _AudioProcessingResult,
@@ -135,12 +137,23 @@ def test_format_for_whatsapp_tables() -> None:
     assert _format_for_whatsapp(no_table) == no_table
 
 
+def _inbound_eval(claimed: list[str]) -> Callable[..., object]:
+    """Fake `redis.eval`: the first claim returns ``claimed``, later ones nothing."""
+    claims = [claimed]
+
+    def fake_eval(script: str, *args: object) -> object:
+        del args
+        if script == _CLAIM_INBOUND_MESSAGES_SCRIPT:
+            return claims.pop() if claims else []
+        return 0
+
+    return fake_eval
+
+
 def _seed_inbound_redis(redis: AsyncMock, raw_messages: list[str]) -> None:
     redis.set.return_value = True
     redis.get.return_value = None
-    redis.lrange.return_value = []
-    redis.lmove.side_effect = [*raw_messages, None]
-    redis.eval.return_value = 0
+    redis.eval.side_effect = _inbound_eval(raw_messages)
 
 
 @pytest.fixture
@@ -276,8 +289,13 @@ async def test_process_incoming_batch_empty_redis(chat_context: dict[str, Any])
     await process_incoming_batch(chat_context, "79991234567")
 
     # Should not call anything else
-    mock_redis.lrange.assert_awaited_once()
-    mock_redis.lmove.assert_awaited_once()
+    claims = [
+        call
+        for call in mock_redis.eval.await_args_list
+        if call.args[0] == _CLAIM_INBOUND_MESSAGES_SCRIPT
+    ]
+    assert len(claims) == 1
+    mock_redis.lmove.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -358,8 +376,7 @@ async def test_audio_transcription_is_not_replayed_after_late_failure(
     redis.set.reset_mock()
     redis.set.return_value = True
     redis.get.return_value = INBOUND_EXECUTION_STARTED
-    redis.lrange.return_value = [raw_message]
-    redis.lmove.reset_mock(side_effect=True)
+    redis.eval.side_effect = _inbound_eval([raw_message])
     inner = AsyncMock()
 
     with (
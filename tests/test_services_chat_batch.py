@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,6 +13,7 @@ from arq import Retry
 from src.integrations.zoho_oauth import ZohoOAuthError
 from src.schemas.webhook import WazzupIncomingMessage
 from src.services.chat import (
+    _CLAIM_INBOUND_MESSAGES_SCRIPT,
     INBOUND_EXECUTION_COMPLETED,
     INBOUND_EXECUTION_STARTED,
     InboundBatchTerminalError,
@@ -21,8 +23,11 @@ from src.services.chat import (
     process_incoming_batch,
 )
 from src.services.inbound_batch import (
+    decode_inbound_message,
+    encode_inbound_message,
     inbound_chat_reference,
     inbound_execution_key,
+    inbound_message_text,
     inbound_processing_key,
 )
 from src.services.proposal_followup import record_proposal_sent
@@ -53,12 +58,23 @@ class MockResult:
         return [self.val] if self.val is not None else []
 
 
+def _inbound_eval(claimed: list[str]) -> Callable[..., object]:
+    """Fake `redis.eval`: the first claim returns ``claimed``, later ones nothing."""
+    claims = [claimed]
+
+    def fake_eval(script: str, *args: object) -> object:
+        del args
+        if script == _CLAIM_INBOUND_MESSAGES_SCRIPT:
+            return claims.pop() if claims else []
+        return 0
+
+    return fake_eval
+
+
 def _seed_inbound_redis(redis: AsyncMock, raw_messages: list[str]) -> None:
     redis.set.return_value = True
     redis.get.return_value = None
-    redis.lrange.return_value = []
-    redis.lmove.side_effect = [*raw_messages, None]
-    redis.eval.return_value = 0
+    redis.eval.side_effect = _inbound_eval(raw_messages)
 
 
 def _assert_bot_reply_sent(
@@ -209,9 +225,7 @@ async def test_process_incoming_batch_recovers_durable_processing_batch_after_cr
             "type": "text",
         }
     )
-    redis.lrange.return_value = [raw_message]
-    redis.lmove.return_value = None
-    redis.eval.return_value = 0
+    redis.eval.side_effect = _inbound_eval([raw_message])
     inner = AsyncMock()
 
     with patch("src.services.chat._process_batch_inner", inner):
@@ -220,7 +234,7 @@ async def test_process_incoming_batch_recovers_durable_processing_batch_after_cr
             batch_ref=batch_ref,
         )
 
-    inner.assert_awaited_once_with(redis, batch_ref, [raw_message])
+    inner.assert_awaited_once_with(redis, batch_ref, [raw_message.encode()])
     redis.lpop.assert_not_awaited()
     redis.lmove.assert_not_awaited()
     assert len(_processing_finalization_calls(redis, batch_ref)) == 1
@@ -242,9 +256,7 @@ async def test_process_incoming_batch_keeps_processing_batch_on_retryable_failur
             "type": "text",
         }
     )
-    redis.lrange.return_value = []
-    redis.lmove.side_effect = [raw_message, None]
-    redis.eval.return_value = 0
+    redis.eval.side_effect = _inbound_eval([raw_message])
 
     with (
         patch(
@@ -305,8 +317,7 @@ async def test_process_incoming_batch_lock_contention_does_not_consume_queue() -
             batch_ref=batch_ref,
         )
 
-    redis.lmove.assert_not_awaited()
-    redis.lrange.assert_not_awaited()
+    redis.eval.assert_not_awaited()
     redis.lpop.assert_not_awaited()
 
 
@@ -800,7 +811,7 @@ async def test_process_incoming_batch_keeps_batch_successful_when_bot_reply_send
 @patch("src.services.chat.ZohoCRMClient")
 @patch("src.services.chat.ZohoInventoryClient")
 @patch("src.services.chat.EmbeddingEngine")
-async def test_process_incoming_batch_sends_deferred_product_media_after_bot_reply(
+async def test_process_incoming_batch_sends_deferred_media_inline_without_queue(
     mock_embedding_cls: MagicMock,
     mock_zoho_inv_cls: MagicMock,
     mock_zoho_crm_cls: MagicMock,
@@ -865,6 +876,7 @@ async def test_process_incoming_batch_sends_deferred_product_media_after_bot_rep
     mock_wazzup.resolve_channel_phone = AsyncMock(return_value="+971551220665")
 
     mock_redis = AsyncMock()
+    mock_redis.enqueue_job.side_effect = ConnectionError("redis down")
     msg = WazzupIncomingMessage(
         messageId="msg-1",
         chatId="1234567890",
@@ -906,6 +918,227 @@ async def test_process_incoming_batch_sends_deferred_product_media_after_bot_rep
     }
 
 
+@pytest.mark.asyncio
+@patch("src.services.chat.async_session_factory")
+@patch("src.services.chat.process_message")
+@patch("src.services.chat.WazzupProvider")
+@patch("src.services.chat.ZohoCRMClient")
+@patch("src.services.chat.ZohoInventoryClient")
+@patch("src.services.chat.EmbeddingEngine")
+async def test_process_incoming_batch_enqueues_deferred_product_media(
+    mock_embedding_cls: MagicMock,
+    mock_zoho_inv_cls: MagicMock,
+    mock_zoho_crm_cls: MagicMock,
+    mock_wazzup_cls: MagicMock,
+    mock_process_message: AsyncMock,
+    mock_session_factory: MagicMock,
+) -> None:
+    from src.llm import LLMResponse
+    from src.llm.engine import ProductMediaPayload
+
+    mock_session = AsyncMock()
+    mock_session_factory.return_value.__aenter__.return_value = mock_session
+    mock_session.add = MagicMock()
+
+    existing_conv = MagicMock()
+    existing_conv.id = "conv-deferred-media"
+    existing_conv.phone = "1234567890"
+    existing_conv.escalation_status = "none"
+    existing_conv.metadata_ = {}
+
+    mock_session.execute.side_effect = [
+        MockResult(None),  # bot_enabled
+        MockResult(existing_conv),  # conversation lookup
+        MockResult([]),  # msg dedup check
+        MockResult(None),  # bot_reply audit idempotency lookup
+        MockResult(2),  # total messages after assistant commit
+        MockResult(None),  # no existing summary
+    ]
+
+    mock_process_message.return_value = LLMResponse(
+        text="Hello, here are table options.",
+        tokens_in=10,
+        tokens_out=20,
+        cost=0.05,
+        model="test-model",
+        deferred_product_media=(
+            ProductMediaPayload(
+                url="https://example.com/table.jpg",
+                caption="Operative table — 179.00 AED",
+                product_key="table-1",
+                zoho_item_id=None,
+            ),
+        ),
+    )
+    mock_embedding_cls.return_value = MagicMock()
+
+    mock_zoho_inv = AsyncMock()
+    mock_zoho_inv_cls.return_value.__aenter__ = AsyncMock(return_value=mock_zoho_inv)
+    mock_zoho_inv_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    mock_zoho_crm = AsyncMock()
+    mock_zoho_crm_cls.return_value.__aenter__ = AsyncMock(return_value=mock_zoho_crm)
+    mock_zoho_crm_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    mock_wazzup = AsyncMock()
+    mock_wazzup_cls.return_value.__aenter__ = AsyncMock(return_value=mock_wazzup)
+    mock_wazzup_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    mock_wazzup.send_text.return_value = "msg-text"
+    mock_wazzup.resolve_channel_phone = AsyncMock(return_value="+971551220665")
+
+    mock_redis = AsyncMock()
+    msg = WazzupIncomingMessage(
+        messageId="msg-1",
+        chatId="1234567890",
+        chatType="whatsapp",
+        type="text",
+        text="Hi! I need 15 table",
+        channelId="chan-1",
+        timestamp=1704067200,
+    )
+    _seed_inbound_redis(mock_redis, [msg.model_dump_json()])
+
+    with patch("src.services.chat.settings.wazzup_channel_id", "chan-1"):
+        await process_incoming_batch({"redis": mock_redis}, "1234567890")
+
+    mock_wazzup.send_text.assert_awaited_once()
+    mock_wazzup.send_media.assert_not_awaited()
+    media_jobs = [
+        call
+        for call in mock_redis.enqueue_job.await_args_list
+        if call.args[0] == "deliver_product_media"
+    ]
+    assert len(media_jobs) == 1
+    job = media_jobs[0]
+    assert job.args[1:] == ("conv-deferred-media", "1234567890")
+    assert job.kwargs["channel_id"] == "chan-1"
+    assert job.kwargs["source_message_id"] == "msg-1"
+    assert job.kwargs["media_items"] == [
+        {
+            "url": "https://example.com/table.jpg",
+            "caption": "Operative table — 179.00 AED",
+            "product_key": "table-1",
+            "zoho_item_id": None,
+            "reference_tokens": [],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+@patch("src.services.chat.cache_product_image", new_callable=AsyncMock)
+@patch(
+    "src.services.chat.build_signed_product_image_url",
+    side_effect=lambda item_id: f"https://noor.test/media/{item_id}",
+)
+@patch("src.services.chat.async_session_factory")
+@patch("src.services.chat.WazzupProvider")
+@patch("src.services.chat.ZohoInventoryClient")
+async def test_deliver_product_media_prefetches_then_sends_in_order(
+    mock_zoho_inv_cls: MagicMock,
+    mock_wazzup_cls: MagicMock,
+    mock_session_factory: MagicMock,
+    _mock_sign: MagicMock,
+    mock_cache_image: AsyncMock,
+) -> None:
+    from src.services.chat import deliver_product_media
+
+    mock_session = AsyncMock()
+    mock_session.add = MagicMock()
+    mock_session.execute.return_value = MockResult(None)
+    mock_session_factory.return_value.__aenter__.return_value = mock_session
+
+    mock_zoho_inv = AsyncMock()
+    mock_zoho_inv.get_item_image.return_value = (b"img", "image/jpeg")
+    mock_zoho_inv_cls.return_value.__aenter__ = AsyncMock(return_value=mock_zoho_inv)
+    mock_zoho_inv_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    mock_wazzup = AsyncMock()
+    mock_wazzup.send_media.side_effect = ["msg-1", "msg-2", "msg-3"]
+    mock_wazzup_cls.return_value.__aenter__ = AsyncMock(return_value=mock_wazzup)
+    mock_wazzup_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    conversation_id = "6f1c2f8e-8a51-4f0e-9d7c-5b2b7f6f3a10"
+    await deliver_product_media(
+        {"redis": AsyncMock()},
+        conversation_id,
+        "1234567890",
+        channel_id="chan-1",
+        source_message_id="msg-in",
+        follow_up_suppressed=False,
+        media_items=[
+            {
+                "url": "https://inventory.zoho.com/chair.jpg",
+                "caption": "Chair",
+                "product_key": "chair",
+                "zoho_item_id": "Z-1",
+                "reference_tokens": [],
+            },
+            {
+                "url": "https://example.com/desk.jpg",
+                "caption": "Desk",
+                "product_key": "desk",
+                "zoho_item_id": None,
+            },
+            {
+                "url": "https://inventory.zoho.com/sofa.jpg",
+                "caption": "Sofa",
+                "product_key": "sofa",
+                "zoho_item_id": "Z-3",
+            },
+        ],
+    )
+
+    assert sorted(
+        call.args[0] for call in mock_zoho_inv.get_item_image.await_args_list
+    ) == ["Z-1", "Z-3"]
+    assert sorted(call.args[1] for call in mock_cache_image.await_args_list) == [
+        "Z-1",
+        "Z-3",
+    ]
+    mock_wazzup_cls.assert_called_once_with(channel_id="chan-1")
+    assert [call.kwargs["url"] for call in mock_wazzup.send_media.await_args_list] == [
+        "https://noor.test/media/Z-1",
+        "https://example.com/desk.jpg",
+        "https://noor.test/media/Z-3",
+    ]
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("src.services.chat.send_wazzup_media_with_audit", new_callable=AsyncMock)
+async def test_deferred_product_media_audit_failure_rolls_back_only_its_image(
+    mock_send: AsyncMock,
+) -> None:
+    from src.services.chat import ProductMediaPayload, _send_deferred_product_media
+
+    savepoints = [AsyncMock(), AsyncMock(), AsyncMock()]
+    db = AsyncMock()
+    db.begin_nested.side_effect = savepoints
+    db.in_nested_transaction = MagicMock(return_value=True)
+    mock_send.side_effect = [None, RuntimeError("audit flush failed"), None]
+
+    await _send_deferred_product_media(
+        db,
+        provider=AsyncMock(),
+        conversation_id="6f1c2f8e-8a51-4f0e-9d7c-5b2b7f6f3a10",
+        chat_id="1234567890",
+        source_message_id="msg-in",
+        follow_up_suppressed=False,
+        media_items=[
+            ProductMediaPayload(
+                url=f"https://example.com/{key}.jpg", caption=key, product_key=key
+            )
+            for key in ("chair", "desk", "sofa")
+        ],
+    )
+
+    assert mock_send.await_count == 3
+    assert [sp.commit.await_count for sp in savepoints] == [1, 0, 1]
+    assert [sp.rollback.await_count for sp in savepoints] == [0, 1, 0]
+    db.rollback.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 @patch("src.services.chat.async_session_factory")
 @patch("src.services.chat.process_message")
@@ -1407,6 +1640,7 @@ async def test_process_incoming_batch_prefers_non_empty_conversation_when_duplic
     mock_redis.enqueue_job.assert_awaited_once_with(
         "refresh_conversation_summary",
         "conv-live",
+        _queue_name="arq:queue",
     )
 
 
@@ -1731,3 +1965,82 @@ async def test_process_incoming_batch_persists_stable_created_at_for_batched_mes
     ]
     assert all(isinstance(message.created_at, datetime) for message in inbound_messages)
     assert inbound_messages[0].created_at < inbound_messages[1].created_at
+
+
+def test_compact_inbound_envelope_keeps_only_the_fields_the_worker_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    message = WazzupIncomingMessage.model_validate(
+        {
+            "messageId": "msg-voice",
+            "chatId": "+971500001250",
+            "chatType": "whatsapp",
+            "channelId": "channel-1",
+            "type": "audio",
+            "status": "inbound",
+            "dateTime": "2026-10-19T09:30:00.000",
+            "authorType": "client",
+            "isEcho": False,
+            "media": {"url": "https://media/1.ogg", "mimeType": "audio/ogg"},
+            "contact": {"name": "Private Customer", "avatarUri": "https://a/b"},
+        }
+    )
+    monkeypatch.setattr(
+        "src.services.inbound_batch.settings.compact_queue_payloads", False
+    )
+    legacy = encode_inbound_message(message)
+    monkeypatch.setattr(
+        "src.services.inbound_batch.settings.compact_queue_payloads", True
+    )
+    compact = encode_inbound_message(message)
+
+    assert legacy.startswith(b"{")
+    assert compact.startswith(b"\x01")
+    assert len(compact) < len(legacy) / 2
+    decoded = decode_inbound_message(compact)
+    assert decoded.model_dump(
+        include={"messageId", "chatId", "channelId", "type", "dateTime", "authorType"}
+    ) == message.model_dump(
+        include={"messageId", "chatId", "channelId", "type", "dateTime", "authorType"}
+    )
+    assert decoded.media is not None
+    assert (decoded.media.url, decoded.media.mimeType) == (
+        "https://media/1.ogg",
+        "audio/ogg",
+    )
+    assert decoded.model_extra == {}
+    assert decode_inbound_message(legacy) == message
+    assert inbound_message_text(legacy) == legacy.decode()
+    assert inbound_message_text(compact).startswith("msgpack-v1:")
+
+
+@pytest.mark.asyncio
+async def test_malformed_compact_envelope_is_an_invalid_payload() -> None:
+    from src.services.chat import _process_batch_inner
+
+    with pytest.raises(InboundBatchTerminalError, match="invalid_payload"):
+        await _process_batch_inner(AsyncMock(), "ib1_ref", [b"\x01\x92\x01\x02"])
+
+
+@pytest.mark.asyncio
+async def test_claim_inbound_messages_moves_whole_queue_in_one_script_call() -> None:
+    from src.services.chat import _claim_inbound_messages
+
+    redis = AsyncMock()
+    redis.eval.return_value = [b"first", "second"]
+
+    claimed = await _claim_inbound_messages(
+        redis,
+        queue_key="wazzup_msgs:ib1_ref",
+        processing_key="wazzup:inbound:processing:ib1_ref",
+    )
+
+    assert claimed == [b"first", b"second"]
+    redis.eval.assert_awaited_once_with(
+        _CLAIM_INBOUND_MESSAGES_SCRIPT,
+        2,
+        "wazzup_msgs:ib1_ref",
+        "wazzup:inbound:processing:ib1_ref",
+    )
+    redis.lmove.assert_not_awaited()
+    redis.lrange.assert_not_awaited()
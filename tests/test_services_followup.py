@@ -180,48 +180,42 @@ def test_payment_reminder_candidate_excludes_stop_conditions(
     assert candidate is None
 
 
+class _CountResult:
+    def scalar(self) -> int:
+        return 0
+
+
 @pytest.mark.asyncio
-async def test_run_payment_reminders_scans_past_first_page_non_candidates() -> None:
-    """Scheduled reminders must not miss valid orders behind active non-orders."""
+async def test_run_payment_reminders_claims_past_due_non_candidates() -> None:
+    """Claimed rows that cannot be sent yet are released to their next due time."""
     now = _naive_utc_now()
-    non_candidates = [
-        Conversation(
-            id=uuid.uuid4(),
-            phone=f"+971500000{i:03d}",
-            status="active",
-            deal_status="pending",
-            updated_at=now - datetime.timedelta(hours=30),
-            escalation_status=EscalationStatus.NONE.value,
-            metadata_={},
-        )
-        for i in range(50)
-    ]
+    not_yet_due = _approved_conversation(
+        escalation_status=EscalationStatus.PENDING.value
+    )
     eligible = _approved_conversation()
-
-    class _CountResult:
-        def scalar(self) -> int:
-            return 0
-
-    class _RowsResult:
-        def __init__(self, rows: list[tuple[Conversation, datetime.datetime]]) -> None:
-            self._rows = rows
-
-        def all(self) -> list[tuple[Conversation, datetime.datetime]]:
-            return self._rows
-
+    claimed_batches = [[not_yet_due.id], [eligible.id]]
+    rows = {
+        not_yet_due.id: (not_yet_due, now - datetime.timedelta(hours=25)),
+        eligible.id: (eligible, now - datetime.timedelta(hours=25)),
+    }
     mock_db = AsyncMock()
-    mock_db.execute.side_effect = [
-        _CountResult(),
-        _RowsResult(
-            [(conv, now - datetime.timedelta(hours=25)) for conv in non_candidates]
-        ),
-        _RowsResult([(eligible, now - datetime.timedelta(hours=25))]),
-    ]
+    mock_db.execute.return_value = _CountResult()
 
-    with patch(
-        "src.services.followup._process_payment_reminder_for_conversation",
-        new=AsyncMock(return_value=MagicMock(sent=True)),
-    ) as mock_process:
+    with (
+        patch(
+            "src.services.followup.claim_due_actions",
+            new=AsyncMock(side_effect=lambda *a, **kw: claimed_batches.pop(0)),
+        ) as mock_claim,
+        patch(
+            "src.services.followup.load_claimed_conversations",
+            new=AsyncMock(side_effect=lambda _db, ids: [rows[i] for i in ids]),
+        ),
+        patch("src.services.followup.reschedule_claimed_action") as mock_reschedule,
+        patch(
+            "src.services.followup._process_payment_reminder_for_conversation",
+            new=AsyncMock(return_value=MagicMock(sent=True)),
+        ) as mock_process,
+    ):
         await _run_payment_reminders_with_db(
             mock_db,
             controls=PaymentReminderControlsConfig(
@@ -234,8 +228,13 @@ async def test_run_payment_reminders_scans_past_first_page_non_candidates() -> N
             trigger="scheduled",
         )
 
+    assert [call.kwargs["limit"] for call in mock_claim.await_args_list] == [1, 1]
     mock_process.assert_awaited_once()
     assert mock_process.await_args.args[1].id == eligible.id
+    released = [call.args[1] for call in mock_reschedule.await_args_list]
+    assert released == [not_yet_due.id, eligible.id]
+    # Escalated, so still due: back after the approval delay or the retry.
+    assert mock_reschedule.await_args_list[0].args[3] is not None
 
 
 @pytest.mark.asyncio
@@ -243,49 +242,23 @@ async def test_run_payment_reminders_stops_at_scan_hard_cap_and_logs_warning(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     now = _naive_utc_now()
-    non_candidates = [
-        Conversation(
-            id=uuid.uuid4(),
-            phone=f"+971501111{i:03d}",
-            status="active",
-            deal_status="pending",
-            updated_at=now - datetime.timedelta(hours=30),
-            escalation_status=EscalationStatus.NONE.value,
-            metadata_={},
-        )
-        for i in range(500)
-    ]
-    eligible_after_cap = _approved_conversation()
-
-    class _CountResult:
-        def scalar(self) -> int:
-            return 0
-
-    class _RowsResult:
-        def __init__(self, rows: list[tuple[Conversation, datetime.datetime]]) -> None:
-            self._rows = rows
-
-        def all(self) -> list[tuple[Conversation, datetime.datetime]]:
-            return self._rows
-
-    page_rows = [
-        _RowsResult(
-            [
-                (conv, now - datetime.timedelta(hours=25))
-                for conv in non_candidates[start : start + 50]
-            ]
-        )
-        for start in range(0, 500, 50)
-    ]
+    escalated = _approved_conversation(escalation_status=EscalationStatus.PENDING.value)
     mock_db = AsyncMock()
-    mock_db.execute.side_effect = [
-        _CountResult(),
-        *page_rows,
-        _RowsResult([(eligible_after_cap, now - datetime.timedelta(hours=25))]),
-    ]
+    mock_db.execute.return_value = _CountResult()
 
     with (
         caplog.at_level(logging.WARNING, logger="src.services.followup"),
+        patch(
+            "src.services.followup.claim_due_actions",
+            new=AsyncMock(return_value=[escalated.id]),
+        ) as mock_claim,
+        patch(
+            "src.services.followup.load_claimed_conversations",
+            new=AsyncMock(
+                return_value=[(escalated, now - datetime.timedelta(hours=25))]
+            ),
+        ),
+        patch("src.services.followup.reschedule_claimed_action"),
         patch(
             "src.services.followup._process_payment_reminder_for_conversation",
             new=AsyncMock(return_value=MagicMock(sent=True)),
@@ -304,6 +277,7 @@ async def test_run_payment_reminders_stops_at_scan_hard_cap_and_logs_warning(
         )
 
     mock_process.assert_not_awaited()
+    assert mock_claim.await_count == 500
     warning = next(
         record
         for record in caplog.records
@@ -321,10 +295,6 @@ async def test_run_payment_reminders_reuses_one_provider_for_run() -> None:
     eligible_one = _approved_conversation()
     eligible_two = _approved_conversation()
 
-    class _CountResult:
-        def scalar(self) -> int:
-            return 0
-
     mock_db = AsyncMock()
     mock_db.execute.return_value = _CountResult()
     provider_cm = AsyncMock()
@@ -202,6 +202,7 @@ async def test_telegram_webhook_accepts_valid_secret(client: AsyncMock) -> None:
     from src.integrations.notifications.telegram_webhook import (
         expected_telegram_webhook_secret,
     )
+    from src.main import app
 
     payload = {
         "callback_query": {
@@ -214,20 +215,36 @@ async def test_telegram_webhook_accepts_valid_secret(client: AsyncMock) -> None:
         }
     }
 
-    with patch(
-        "src.api.telegram_webhook._handle_callback_query", new=AsyncMock()
-    ) as mock_handle:
-        response = await client.post(
-            "/api/v1/webhook/telegram",
-            json=payload,
-            headers={
-                "X-Telegram-Bot-Api-Secret-Token": expected_telegram_webhook_secret(),
-            },
-        )
+    pool = AsyncMock()
+    app.state.arq_pool = pool
+    try:
+        with patch(
+            "src.api.telegram_webhook._handle_callback_query", new=AsyncMock()
+        ) as mock_handle:
+            response = await client.post(
+                "/api/v1/webhook/telegram",
+                json=payload,
+                headers={
+                    "X-Telegram-Bot-Api-Secret-Token": (
+                        expected_telegram_webhook_secret()
+                    ),
+                },
+            )
+    finally:
+        del app.state.arq_pool
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
-    mock_handle.assert_awaited_once_with(payload["callback_query"])
+    # The button is handled by the ARQ job, not inside the webhook request.
+    mock_handle.assert_not_awaited()
+    pool.enqueue_job.assert_awaited_once()
+    args = pool.enqueue_job.await_args
+    assert args.args == (
+        "run_telegram_action",
+        "callback_query",
+        payload["callback_query"],
+    )
+    assert args.kwargs["_job_id"] == "telegram_action:callback:cb-1"
 
 
 # =============================================================================
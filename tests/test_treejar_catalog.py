@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
-from src.integrations.catalog.treejar_catalog import TreejarCatalogClient
+from src.integrations.catalog.treejar_catalog import CatalogPage, TreejarCatalogClient
 
 
 def _response(payload: dict[str, object]) -> httpx.Response:
@@ -178,3 +179,70 @@ async def test_iter_all_products_handles_categories_pagination_and_hydration() -
     ]
     assert client.get_category_products.await_count == 3
     assert client.get_product.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_iter_category_pages_pages_categories_concurrently() -> None:
+    client = TreejarCatalogClient(max_concurrency=2, requests_per_second=0)
+    listings = {
+        ("chairs", 0): {
+            "products": [{"slug": "chair-1", "sku": "SKU-1"}],
+            "hasMore": True,
+        },
+        ("chairs", 1): {
+            "products": [{"slug": "dup", "sku": "SKU-2"}],
+            "hasMore": False,
+        },
+        ("desks", 0): {
+            "products": [{"slug": "dup-again", "sku": "sku-2"}],
+            "hasMore": False,
+        },
+    }
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def category_products(
+        slug: str, *, limit: int, offset: int = 0
+    ) -> dict[str, object]:
+        nonlocal in_flight, peak_in_flight
+        del limit
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return listings[(slug, offset)]
+
+    client.get_category_products = AsyncMock(side_effect=category_products)
+    client.get_product = AsyncMock(
+        side_effect=lambda slug: {"slug": slug, "description": f"{slug} details"}
+    )
+
+    pages = [
+        page async for page in client.iter_category_pages(["chairs", "desks"], limit=1)
+    ]
+
+    assert peak_in_flight == 2
+    by_slug: dict[str, list[CatalogPage]] = {}
+    for page in pages:
+        by_slug.setdefault(page.slug, []).append(page)
+    assert [page.offset for page in by_slug["chairs"]] == [0, 1]
+    assert [page.is_last for page in by_slug["chairs"]] == [False, True]
+    assert by_slug["desks"][0].is_last is True
+    products = [product for page in pages for product in page.products]
+    assert sorted(product["sku"].lower() for product in products) == [
+        "sku-1",
+        "sku-2",
+    ]
+    assert all(product["description"].endswith("details") for product in products)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_category_pages_surfaces_fetch_errors() -> None:
+    client = TreejarCatalogClient(requests_per_second=0)
+    client.get_category_products = AsyncMock(side_effect=RuntimeError("catalog down"))
+
+    with pytest.raises(RuntimeError, match="catalog down"):
+        async for _page in client.iter_category_pages(["chairs"], limit=10):
+            pass
+    await client.close()
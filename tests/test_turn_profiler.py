@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services import turn_profiler
+from src.services.turn_profiler import (
+    IDLE_STACK,
+    TurnProfile,
+    merge_folded_stacks,
+    sample_turn_profile,
+    summarize_turn_profiles,
+    write_turn_profile,
+)
+
+
+@pytest.fixture
+def profile_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    settings = turn_profiler.settings
+    monkeypatch.setattr(settings, "worker_profile_sample_rate", 1.0)
+    monkeypatch.setattr(settings, "worker_profile_interval_ms", 1.0)
+    monkeypatch.setattr(settings, "worker_profile_block_threshold_ms", 50.0)
+    monkeypatch.setattr(settings, "worker_profile_dir", str(tmp_path))
+    return tmp_path
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_unsampled_turns_are_not_profiled(profile_settings: Path) -> None:
+    turn_profiler.settings.worker_profile_sample_rate = 0.0
+
+    with sample_turn_profile() as profile:
+        await asyncio.sleep(0)
+
+    assert profile is None
+    assert list(profile_settings.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_sampled_turn_records_loop_blocking_and_executor_stacks(
+    profile_settings: Path,
+) -> None:
+    with sample_turn_profile() as profile:
+        await asyncio.sleep(0.02)
+        _busy(0.15)
+        await asyncio.to_thread(_busy, 0.05)
+
+    assert profile is not None
+    [path] = profile_settings.glob("turn-*.json")
+    artefact = json.loads(path.read_text())
+    stacks = artefact["stacks"]
+    assert artefact["samples"] > 0
+    assert artefact["wall_ms"] >= 200
+    assert any(
+        stack.startswith("loop;") and stack.endswith("test_turn_profiler.py:_busy")
+        for stack in stacks
+    )
+    assert any(stack.startswith("executor;") for stack in stacks)
+    assert f"loop;{IDLE_STACK}" in stacks
+    [blocked] = [b for b in artefact["blocking"] if b["duration_ms"] >= 100]
+    assert blocked["stack"].endswith("test_turn_profiler.py:_busy")
+
+
+def test_summary_splits_self_and_total_time_per_function() -> None:
+    profile = {
+        "schema_version": 1,
+        "wall_ms": 100.0,
+        "cpu_ms": 40.0,
+        "stacks": {
+            f"loop;{IDLE_STACK}": 6,
+            "loop;chat.py:turn;engine.py:guard": 3,
+            "loop;chat.py:turn": 1,
+            "executor;generator.py:_render": 2,
+        },
+        "blocking": [{"offset_ms": 5, "duration_ms": 120.4, "stack": "loop;a:b"}],
+    }
+
+    summary = summarize_turn_profiles([profile, {"schema_version": 99}])
+
+    assert summary["profiles"] == 1
+    assert summary["loop_idle_share"] == 0.6
+    assert summary["functions"]["loop"]["self"] == [
+        {"function": "engine.py:guard", "samples": 3},
+        {"function": "chat.py:turn", "samples": 1},
+    ]
+    assert summary["functions"]["loop"]["total"][0] == {
+        "function": "chat.py:turn",
+        "samples": 4,
+    }
+    assert summary["blocking"] == {
+        "intervals": 1,
+        "max_ms": 120.4,
+        "by_function_ms": {"a:b": 120},
+    }
+    assert merge_folded_stacks([profile, profile])[0] == (
+        "executor;generator.py:_render 4"
+    )
+
+
+def test_profile_directory_keeps_only_the_newest_files(tmp_path: Path) -> None:
+    for _ in range(4):
+        write_turn_profile(
+            TurnProfile(interval_ms=5, block_threshold_ms=100), tmp_path, 2
+        )
+
+    assert len(list(tmp_path.glob("turn-*.json"))) == 2
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import get_history
+
+from src.models.conversation import Conversation
+from src.services.turn_state import (
+    TurnStateBuffer,
+    metadata_diff,
+    metadata_diff_update,
+)
+
+
+def _persistent_conversation(
+    session: Session, metadata: dict[str, Any]
+) -> Conversation:
+    conversation = Conversation(id=uuid.uuid4(), phone="971500000000")
+    conversation.metadata_ = metadata
+    make_transient_to_detached(conversation)
+    session.add(conversation)
+    return conversation
+
+
+def test_metadata_diff_keeps_only_changed_and_removed_keys() -> None:
+    written = {"frame": '{"id":1}', "memory": '["a"]', "stale": "true"}
+
+    diff = metadata_diff(written, {"frame": {"id": 1}, "memory": ["a", "b"], "new": 2})
+
+    assert diff.changed == {"memory": ["a", "b"], "new": 2}
+    assert diff.removed == ("stale",)
+    assert not metadata_diff(
+        written, {"frame": {"id": 1}, "memory": ["a"], "stale": True}
+    )
+
+
+def test_diff_update_merges_keys_with_jsonb_operators() -> None:
+    diff = metadata_diff({"stale": "1"}, {"memory": ["a"]})
+
+    sql = str(
+        metadata_diff_update(uuid.uuid4(), diff).compile(dialect=postgresql.dialect())
+    )
+
+    assert "SET metadata=((coalesce(conversations.metadata," in sql
+    assert "|| %(param_2)s::JSONB) - %(param_3)s::TEXT[])" in sql
+
+
+def test_turn_writes_one_diff_instead_of_a_blob_per_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # No statement reaches the engine: flushes find nothing left to write.
+    session = Session(bind=create_engine("sqlite://"))
+    statements: list[Any] = []
+    monkeypatch.setattr(
+        session, "execute", lambda statement: statements.append(statement)
+    )
+    trace = [{"tool": "search_products", "result": "x" * 200} for _ in range(20)]
+    conversation = _persistent_conversation(
+        session, {"tool_traces": trace, "sales_memory": {"budget": None}}
+    )
+    buffer = TurnStateBuffer(session)
+    buffer.open()
+    buffer.track(conversation)
+
+    for key, value in [
+        ("quote_frame", {"lines": [{"sku": "CH-1", "quantity": 4}]}),
+        ("pending_quote_selection", {"sku": "CH-1"}),
+        ("customer_facts_trace", ["quantity"]),
+        ("sales_memory", {"budget": 1200}),
+        ("pending_quote_selection", None),
+    ]:
+        conversation.metadata_ = {**(conversation.metadata_ or {}), key: value}
+        session.flush()
+        assert not get_history(conversation, "metadata_").has_changes()
+    session.commit()
+    buffer.close()
+
+    [statement] = statements
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params["param_2"] == {
+        "quote_frame": {"lines": [{"sku": "CH-1", "quantity": 4}]},
+        "pending_quote_selection": None,
+        "customer_facts_trace": ["quantity"],
+        "sales_memory": {"budget": 1200},
+    }
+    stats = buffer.stats
+    assert (stats.diff_writes, stats.deferred_flushes) == (1, 5)
+    # Five whole-blob rewrites of a ~5 KB blob against one ~150-byte diff.
+    assert stats.whole_blob_bytes > 20 * stats.diff_bytes
+
+
+def test_savepoint_rollback_keeps_flushed_metadata_for_the_commit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = Session(bind=create_engine("sqlite://"))
+    statements: list[Any] = []
+    monkeypatch.setattr(
+        session, "execute", lambda statement: statements.append(statement)
+    )
+    conversation = _persistent_conversation(session, {"sales_memory": {}})
+    buffer = TurnStateBuffer(session)
+    buffer.open()
+    buffer.track(conversation)
+
+    conversation.metadata_ = {"quote_frame": {"lines": [{"sku": "CH-1"}]}}
+    session.flush()
+    # An optional memory write failing inside its savepoint.
+    session.begin_nested().rollback()
+    session.commit()
+    buffer.close()
+
+    [statement] = statements
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params["param_2"] == {"quote_frame": {"lines": [{"sku": "CH-1"}]}}
+    assert params["param_3"] == ["sales_memory"]
+
+
+def test_buffer_ignores_sessions_it_cannot_hook() -> None:
+    buffer = TurnStateBuffer(object())  # type: ignore[arg-type]
+
+    buffer.open()
+    buffer.track(object())  # type: ignore[arg-type]
+    buffer.close()
+
+    assert buffer.stats.diff_writes == 0
@@ -10,10 +10,12 @@ import httpx
 import pytest
 
 from src.integrations.voice import voxtral
+from src.integrations.voice.audio import compact_audio_segments
 from src.integrations.voice.voxtral import (
     MAX_AUDIO_SIZE,
     transcribe_audio,
     transcribe_audio_with_metadata,
+    transcribe_voice_note,
 )
 
 
@@ -218,3 +220,74 @@ def test_normalizes_mapping_and_object_usage_values() -> None:
 
     assert _usage_number({"input_tokens": 7}, "input_tokens") == 7
     assert _usage_number(SimpleNamespace(cost=0.001), "cost") == 0.001
+
+
+class TestVoiceNotePipeline:
+    async def test_replays_a_cached_transcription_without_a_provider_call(
+        self,
+    ) -> None:
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post.return_value = _response(
+            {"text": "I need ten desks", "usage": {"cost": 0.0004}}
+        )
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        first = await transcribe_voice_note(
+            b"OggS\x00\x02note", audio_format="ogg", redis=redis, client=client
+        )
+        redis.get.return_value = redis.set.await_args.args[1]
+        second = await transcribe_voice_note(
+            b"OggS\x00\x02note", audio_format="ogg", redis=redis, client=client
+        )
+
+        client.post.assert_awaited_once()
+        assert redis.set.await_args.args[0].startswith("voice_transcription:")
+        assert first.cost == 0.0004
+        assert second.text == "I need ten desks"
+        assert second.cost is None
+
+    async def test_transcribes_re_encoded_segments_and_stitches_them_in_order(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(voxtral.settings, "voice_transcode_min_bytes", 4)
+        compact = AsyncMock(return_value=[b"OggS-part-1", b"OggS-part-2"])
+        transcribe = AsyncMock(
+            side_effect=[
+                voxtral.VoiceTranscriptionResult(
+                    text="first half", model="stt", tokens_in=3, cost=0.1
+                ),
+                voxtral.VoiceTranscriptionResult(
+                    text="second half", model="stt", tokens_in=4, cost=0.2
+                ),
+            ]
+        )
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        with (
+            patch.object(voxtral, "compact_audio_segments", compact),
+            patch.object(voxtral, "transcribe_audio_with_metadata", transcribe),
+        ):
+            result = await transcribe_voice_note(
+                b"RIFF-long-wav-note",
+                audio_format="wav",
+                redis=redis,
+                client=AsyncMock(spec=httpx.AsyncClient),
+            )
+
+        assert [call.args[0] for call in transcribe.await_args_list] == [
+            b"OggS-part-1",
+            b"OggS-part-2",
+        ]
+        assert {call.kwargs["audio_format"] for call in transcribe.await_args_list} == {
+            "ogg"
+        }
+        assert result.text == "first half second half"
+        assert result.tokens_in == 7
+        assert result.cost == pytest.approx(0.3)
+
+    async def test_keeps_the_original_audio_without_ffmpeg(self) -> None:
+        with patch("src.integrations.voice.audio.shutil.which", return_value=None):
+            assert await compact_audio_segments(b"audio", segment_seconds=60) is None
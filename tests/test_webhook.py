@@ -1,14 +1,20 @@
+import asyncio
 import datetime
 import logging
 import uuid
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
+from src.api.v1.webhook import persist_wazzup_statuses
 from src.main import app
 from src.models.conversation import Conversation
-from src.services.inbound_batch import inbound_chat_reference, inbound_queue_key
+from src.services.inbound_batch import (
+    decode_inbound_message,
+    inbound_chat_reference,
+    inbound_queue_key,
+)
 from src.services.proposal_followup import record_proposal_sent
 
 client = TestClient(app)
@@ -19,6 +25,32 @@ def _dt(value: str) -> datetime.datetime:
     return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
+def _queued_statuses(arq_pool: AsyncMock) -> list[dict[str, object]]:
+    """Statuses of the one `persist_wazzup_statuses` job a request queued."""
+    calls = [
+        call
+        for call in arq_pool.enqueue_job.await_args_list
+        if call.args[0] == "persist_wazzup_statuses"
+    ]
+    assert len(calls) == 1
+    statuses: list[dict[str, object]] = calls[0].args[1]
+    return statuses
+
+
+def _pushed_batches(redis: AsyncMock) -> dict[str, list[bytes]]:
+    """Queue key -> pushed messages of the one inbound push script call."""
+    redis.eval.assert_awaited_once()
+    _script, key_count, *rest = redis.eval.await_args.args
+    keys, args = rest[:key_count], rest[key_count:]
+    batches: dict[str, list[bytes]] = {}
+    index = 0
+    for key in keys:
+        count = args[index]
+        batches[key] = list(args[index + 1 : index + 1 + count])
+        index += count + 1
+    return batches
+
+
 class _ScalarResult:
     def __init__(self, value: object | None) -> None:
         self._value = value
@@ -69,7 +101,6 @@ def test_wazzup_webhook_endpoint(mock_networks: Any) -> None:
     assert response.status_code == 200
     assert response.json() == {"ok": True}
 
-    app.state.redis.rpush.assert_called_once()
     # job_id now includes a time window suffix
     call_args = app.state.arq_pool.enqueue_job.call_args
     assert call_args.args[0] == "process_incoming_batch"
@@ -78,7 +109,51 @@ def test_wazzup_webhook_endpoint(mock_networks: Any) -> None:
     assert "chat_id" not in call_args.kwargs
     assert call_args.kwargs["_job_id"].startswith(f"wazzup_batch_{batch_ref}_")
     assert call_args.kwargs["_defer_by"] == 5
-    assert app.state.redis.rpush.await_args.args[0] == inbound_queue_key(batch_ref)
+    batches = _pushed_batches(app.state.redis)
+    assert list(batches) == [inbound_queue_key(batch_ref)]
+    assert len(batches[inbound_queue_key(batch_ref)]) == 1
+
+
+@patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
+def test_wazzup_webhook_pushes_once_and_enqueues_once_per_chat(
+    mock_networks: Any,
+) -> None:
+    app.state.redis = AsyncMock()
+    app.state.arq_pool = AsyncMock()
+    chats = ["79990000001", "79990000002", "79990000001", "79990000001"]
+    payload = {
+        "messages": [
+            {
+                "messageId": f"burst-{index}",
+                "chatId": chat_id,
+                "chatType": "whatsapp",
+                "text": f"Message {index}",
+                "type": "text",
+                "channelId": EXPECTED_CHANNEL_ID,
+                "timestamp": 1234567890 + index,
+            }
+            for index, chat_id in enumerate(chats)
+        ]
+    }
+
+    with patch("src.api.v1.webhook.settings.wazzup_channel_id", EXPECTED_CHANNEL_ID):
+        response = client.post("/api/v1/webhook/wazzup", json=payload)
+
+    assert response.status_code == 200
+    first = inbound_chat_reference("79990000001")
+    second = inbound_chat_reference("79990000002")
+    batches = _pushed_batches(app.state.redis)
+    assert list(batches) == [inbound_queue_key(first), inbound_queue_key(second)]
+    assert [
+        decode_inbound_message(message).messageId
+        for message in batches[inbound_queue_key(first)]
+    ] == ["burst-0", "burst-2", "burst-3"]
+    assert len(batches[inbound_queue_key(second)]) == 1
+    app.state.redis.rpush.assert_not_called()
+    enqueued = app.state.arq_pool.enqueue_job.await_args_list
+    assert sorted(call.kwargs["batch_ref"] for call in enqueued) == sorted(
+        [first, second]
+    )
 
 
 @patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
@@ -148,41 +223,71 @@ def test_wazzup_webhook_status_only(mock_networks: Any) -> None:
 
 @patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
 def test_wazzup_webhook_status_only_updates_outbound_audit(mock_networks: Any) -> None:
+    app.state.arq_pool = AsyncMock()
     status_updater = AsyncMock(return_value=1)
     db = AsyncMock()
     db_cm = AsyncMock()
     db_cm.__aenter__.return_value = db
     db_cm.__aexit__.return_value = False
+    session_factory = MagicMock(return_value=db_cm)
+    expected = [
+        {
+            "messageId": "provider-msg-1",
+            "timestamp": "2026-04-26T12:00:00.000Z",
+            "status": "delivered",
+        }
+    ]
 
     with (
-        patch("src.api.v1.webhook.async_session_factory", return_value=db_cm),
+        patch("src.api.v1.webhook.async_session_factory", session_factory),
         patch("src.api.v1.webhook.update_wazzup_statuses", status_updater),
     ):
         response = client.post(
             "/api/v1/webhook/wazzup",
-            json={
-                "statuses": [
-                    {
-                        "messageId": "provider-msg-1",
-                        "timestamp": "2026-04-26T12:00:00.000Z",
-                        "status": "delivered",
-                    }
-                ]
-            },
+            json={"statuses": expected},
         )
+        session_factory.assert_not_called()
+        queued = _queued_statuses(app.state.arq_pool)
+        asyncio.run(persist_wazzup_statuses({}, queued))
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    status_updater.assert_awaited_once_with(
-        db,
-        [
-            {
-                "messageId": "provider-msg-1",
-                "timestamp": "2026-04-26T12:00:00.000Z",
-                "status": "delivered",
-            }
-        ],
-    )
+    assert queued == expected
+    status_updater.assert_awaited_once_with(db, expected)
+    db.commit.assert_awaited_once()
+
+
+@patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
+def test_wazzup_webhook_writes_statuses_inline_when_queueing_fails(
+    mock_networks: Any,
+) -> None:
+    app.state.arq_pool = AsyncMock()
+    app.state.arq_pool.enqueue_job.side_effect = ConnectionError("redis down")
+    status_updater = AsyncMock(return_value=1)
+    proposal_updater = AsyncMock(return_value=0)
+    db = AsyncMock()
+    db_cm = AsyncMock()
+    db_cm.__aenter__.return_value = db
+    db_cm.__aexit__.return_value = False
+    status = {
+        "messageId": "provider-msg-1",
+        "timestamp": "2026-04-26T12:00:00.000Z",
+        "status": "read",
+    }
+
+    with (
+        patch("src.api.v1.webhook.async_session_factory", return_value=db_cm),
+        patch("src.api.v1.webhook.update_wazzup_statuses", status_updater),
+        patch(
+            "src.api.v1.webhook.apply_proposal_read_statuses",
+            proposal_updater,
+        ),
+    ):
+        response = client.post("/api/v1/webhook/wazzup", json={"statuses": [status]})
+
+    assert response.status_code == 200
+    status_updater.assert_awaited_once_with(db, [status])
+    proposal_updater.assert_awaited_once_with(db, [status])
     db.commit.assert_awaited_once()
 
 
@@ -225,6 +330,7 @@ def test_wazzup_webhook_outbound_message_updates_delivery_audit(
                 ]
             },
         )
+        asyncio.run(persist_wazzup_statuses({}, _queued_statuses(app.state.arq_pool)))
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
@@ -244,6 +350,7 @@ def test_wazzup_webhook_outbound_message_updates_delivery_audit(
 def test_wazzup_webhook_ignores_malformed_message_status(
     mock_networks: Any,
 ) -> None:
+    app.state.arq_pool = AsyncMock()
     status_updater = AsyncMock(return_value=0)
     with patch("src.api.v1.webhook.update_wazzup_statuses", status_updater):
         response = client.post(
@@ -261,6 +368,7 @@ def test_wazzup_webhook_ignores_malformed_message_status(
     assert response.status_code == 200
     assert response.json() == {"ok": True}
     status_updater.assert_not_awaited()
+    app.state.arq_pool.enqueue_job.assert_not_awaited()
 
 
 @patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
@@ -307,18 +415,22 @@ def test_wazzup_webhook_mixed_envelope_preserves_inbound_message(
                 ]
             },
         )
+        asyncio.run(persist_wazzup_statuses({}, _queued_statuses(app.state.arq_pool)))
 
     assert response.status_code == 200
     status_updater.assert_awaited_once()
     proposal_updater.assert_awaited_once()
-    app.state.redis.rpush.assert_awaited_once()
-    app.state.arq_pool.enqueue_job.assert_awaited_once()
+    assert len(_pushed_batches(app.state.redis)) == 1
+    assert [
+        call.args[0] for call in app.state.arq_pool.enqueue_job.await_args_list
+    ] == ["persist_wazzup_statuses", "process_incoming_batch"]
 
 
 @patch("src.api.v1.webhook._parse_allowed_networks", return_value=[])
 def test_wazzup_webhook_deduplicates_identical_status_envelopes(
     mock_networks: Any,
 ) -> None:
+    app.state.arq_pool = AsyncMock()
     status_updater = AsyncMock(return_value=1)
     proposal_updater = AsyncMock(return_value=0)
     db = AsyncMock()
@@ -352,6 +464,7 @@ def test_wazzup_webhook_deduplicates_identical_status_envelopes(
                 ],
             },
         )
+        asyncio.run(persist_wazzup_statuses({}, _queued_statuses(app.state.arq_pool)))
 
     assert response.status_code == 200
     status_updater.assert_awaited_once_with(db, [status])
@@ -362,6 +475,7 @@ def test_wazzup_webhook_deduplicates_identical_status_envelopes(
 def test_wazzup_webhook_invalid_read_timestamp_does_not_mark_proposal_read(
     mock_networks: Any,
 ) -> None:
+    app.state.arq_pool = AsyncMock()
     conv = Conversation(
         id=uuid.uuid4(),
         phone="+971501234567",
@@ -404,6 +518,7 @@ def test_wazzup_webhook_invalid_read_timestamp_does_not_mark_proposal_read(
         )
 
     assert response.status_code == 200
+    app.state.arq_pool.enqueue_job.assert_not_awaited()
     state = conv.metadata_["proposal_followup"]
     assert state["kp_read"] is False
     assert state["kp_read_at"] is None
@@ -413,6 +528,7 @@ def test_wazzup_webhook_invalid_read_timestamp_does_not_mark_proposal_read(
 def test_wazzup_webhook_normalizes_numeric_message_timestamp(
     mock_networks: Any,
 ) -> None:
+    app.state.arq_pool = AsyncMock()
     status_updater = AsyncMock(return_value=1)
     proposal_updater = AsyncMock(return_value=1)
     db = AsyncMock()
@@ -440,6 +556,7 @@ def test_wazzup_webhook_normalizes_numeric_message_timestamp(
                 ]
             },
         )
+        asyncio.run(persist_wazzup_statuses({}, _queued_statuses(app.state.arq_pool)))
 
     expected = [
         {
@@ -457,6 +574,7 @@ def test_wazzup_webhook_normalizes_numeric_message_timestamp(
 def test_wazzup_webhook_read_status_records_proposal_read_without_reschedule(
     mock_networks: Any,
 ) -> None:
+    app.state.arq_pool = AsyncMock()
     conv = Conversation(
         id=uuid.uuid4(),
         phone="+971501234567",
@@ -495,6 +613,7 @@ def test_wazzup_webhook_read_status_records_proposal_read_without_reschedule(
                 ]
             },
         )
+        asyncio.run(persist_wazzup_statuses({}, _queued_statuses(app.state.arq_pool)))
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
@@ -569,4 +688,4 @@ def test_a_refused_channel_is_logged_with_both_ids(
     assert response.status_code == 200
     assert other_channel in caplog.text
     assert EXPECTED_CHANNEL_ID in caplog.text
-    app.state.redis.rpush.assert_not_called()
+    app.state.redis.eval.assert_not_called()
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.core.config import Settings, settings
-from src.integrations.messaging.wazzup import WazzupProvider
+from src.integrations.messaging.wazzup import MediaTooLargeError, WazzupProvider
 from src.models.message import Message
 from src.schemas.webhook import WazzupIncomingMessage, WazzupMedia
 
@@ -149,6 +150,23 @@ class TestWazzupDownloadMedia:
 
         assert result == b"fake_audio_data"
 
+    async def test_download_media_abandons_a_body_over_its_cap(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"x" * 2048)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            provider = WazzupProvider()
+            with pytest.raises(MediaTooLargeError):
+                await provider.download_media(
+                    "https://cdn.wazzup24.com/long.ogg", client=client, max_bytes=1024
+                )
+            assert (
+                await provider.download_media(
+                    "https://cdn.wazzup24.com/long.ogg", client=client, max_bytes=4096
+                )
+                == b"x" * 2048
+            )
+
 
 class TestAudioWebhookSchema:
     def test_audio_message_schema_parsed(self) -> None:
@@ -55,7 +55,7 @@ def test_client_message_processed() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_called_once()
+    mock_redis.eval.assert_awaited_once()
     mock_arq.enqueue_job.assert_called_once()
 
 
@@ -86,7 +86,7 @@ def test_manager_message_processed() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_called_once()
+    mock_redis.eval.assert_awaited_once()
     mock_arq.enqueue_job.assert_called_once()
 
 
@@ -115,7 +115,7 @@ def test_bot_message_skipped() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_not_called()
+    mock_redis.eval.assert_not_called()
     mock_arq.enqueue_job.assert_not_called()
 
 
@@ -141,7 +141,7 @@ def test_missing_author_type_treated_as_client() -> None:
         response = client.post("/api/v1/webhook/wazzup", json=payload)
 
     assert response.status_code == 200
-    mock_redis.rpush.assert_called_once()
+    mock_redis.eval.assert_awaited_once()
     mock_arq.enqueue_job.assert_called_once()
 
 
@@ -179,7 +179,8 @@ def test_mixed_batch_routes_correctly() -> None:
 
     assert response.status_code == 200
     # Only 1 message pushed (client), bot skipped
-    assert mock_redis.rpush.call_count == 1
+    assert mock_redis.eval.await_count == 1
+    assert mock_redis.eval.await_args.args[3] == 1
     assert mock_arq.enqueue_job.call_count == 1
 
 
@@ -207,7 +208,7 @@ def test_unexpected_channel_skipped() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_not_called()
+    mock_redis.eval.assert_not_called()
     mock_arq.enqueue_job.assert_not_called()
 
 
@@ -235,7 +236,7 @@ def test_missing_expected_channel_skips_all_messages() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_not_called()
+    mock_redis.eval.assert_not_called()
     mock_arq.enqueue_job.assert_not_called()
 
 
@@ -262,7 +263,7 @@ def test_missing_message_channel_id_skipped() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"ok": True}
-    mock_redis.rpush.assert_not_called()
+    mock_redis.eval.assert_not_called()
     mock_arq.enqueue_job.assert_not_called()
 
 
@@ -270,7 +271,7 @@ def test_missing_message_channel_id_skipped() -> None:
 async def test_private_manager_reply_uses_one_adapter_call_without_kb_candidate() -> (
     None
 ):
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _process_manager_reply
 
     conv_id = str(uuid.uuid4())
     redis = AsyncMock()
@@ -303,7 +304,10 @@ async def test_private_manager_reply_uses_one_adapter_call_without_kb_candidate(
             new=AsyncMock(side_effect=AssertionError("unexpected FAQ review")),
         ) as mock_review,
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            json.loads(redis.get.return_value),
+        )
 
     mock_adapter.assert_awaited_once_with(
         "When can you deliver?",
@@ -312,14 +316,13 @@ async def test_private_manager_reply_uses_one_adapter_call_without_kb_candidate(
     )
     mock_combined.assert_not_awaited()
     mock_review.assert_not_awaited()
-    redis.delete.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_private_manager_reply_persists_message_after_successful_wazzup_send() -> (
     None
 ):
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _process_manager_reply
     from src.models.message import Message
 
     conv_uuid = uuid.uuid4()
@@ -363,7 +366,10 @@ async def test_private_manager_reply_persists_message_after_successful_wazzup_se
             new=AsyncMock(return_value="Delivery takes 3-5 business days."),
         ),
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            json.loads(redis.get.return_value),
+        )
 
     wazzup.send_text.assert_awaited_once()
     assert wazzup.send_text.await_args.args == (
@@ -392,7 +398,7 @@ async def test_private_manager_reply_persists_message_after_successful_wazzup_se
 
 @pytest.mark.asyncio
 async def test_private_manager_reply_send_failure_does_not_persist_or_resolve() -> None:
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _process_manager_reply
     from src.models.message import Message
 
     conv_uuid = uuid.uuid4()
@@ -435,7 +441,10 @@ async def test_private_manager_reply_send_failure_does_not_persist_or_resolve()
             new=AsyncMock(return_value="Delivery takes 3-5 business days."),
         ),
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            json.loads(redis.get.return_value),
+        )
 
     wazzup.send_text.assert_awaited_once()
     wazzup.close.assert_awaited_once()
@@ -450,7 +459,7 @@ async def test_private_manager_reply_send_failure_does_not_persist_or_resolve()
 
 @pytest.mark.asyncio
 async def test_faq_manager_reply_uses_combined_call_and_requires_confirmation() -> None:
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _process_manager_reply
     from src.llm.response_adapter import ManagerReplyWithAutoFAQResult
 
     conv_id = str(uuid.uuid4())
@@ -506,7 +515,10 @@ async def test_faq_manager_reply_uses_combined_call_and_requires_confirmation()
             ),
         ) as mock_review,
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            json.loads(redis.get.return_value),
+        )
 
     mock_adapter.assert_not_awaited()
     mock_combined.assert_awaited_once_with(
@@ -527,7 +539,7 @@ async def test_faq_manager_reply_uses_combined_call_and_requires_confirmation()
 async def test_faq_manager_reply_falls_back_to_private_reply_when_candidate_llm_fails() -> (
     None
 ):
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _process_manager_reply
 
     conv_id = str(uuid.uuid4())
     redis = AsyncMock()
@@ -562,7 +574,10 @@ async def test_faq_manager_reply_falls_back_to_private_reply_when_candidate_llm_
             new=AsyncMock(side_effect=AssertionError("unexpected FAQ review")),
         ) as mock_review,
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            json.loads(redis.get.return_value),
+        )
 
     mock_combined.assert_awaited_once_with(
         "When can you deliver?",
@@ -589,19 +604,21 @@ async def test_a_late_manager_reply_is_not_swallowed() -> None:
     bare `return`: the customer got no answer and the manager got no warning,
     so from the outside the feature looked intermittently broken.
     """
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _accept_manager_reply
 
     redis = AsyncMock()
     # No pending draft, but this chat was prompted for one at some point.
     redis.get.side_effect = [None, "1"]
     telegram = AsyncMock()
+    pool = AsyncMock()
 
     with (
         patch("src.api.telegram_webhook.redis_client", redis),
         patch("src.api.telegram_webhook._get_telegram_client", return_value=telegram),
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "3-5 days"})
+        await _accept_manager_reply({"chat": {"id": 42}, "text": "3-5 days"}, pool)
 
+    pool.enqueue_job.assert_not_awaited()
     telegram.send_message.assert_awaited_once()
     sent = telegram.send_message.await_args[0][0]
     assert "was not sent" in sent
@@ -611,22 +628,139 @@ async def test_a_late_manager_reply_is_not_swallowed() -> None:
 @pytest.mark.asyncio
 async def test_ordinary_group_chatter_gets_no_reply() -> None:
     """The warning must not fire on every message in the managers' group."""
-    from src.api.telegram_webhook import _handle_manager_reply
+    from src.api.telegram_webhook import _accept_manager_reply
 
     redis = AsyncMock()
     # No pending draft and this chat was never prompted for one.
     redis.get.side_effect = [None, None]
     telegram = AsyncMock()
+    pool = AsyncMock()
 
     with (
         patch("src.api.telegram_webhook.redis_client", redis),
         patch("src.api.telegram_webhook._get_telegram_client", return_value=telegram),
     ):
-        await _handle_manager_reply({"chat": {"id": 42}, "text": "lunch at 14?"})
+        await _accept_manager_reply({"chat": {"id": 42}, "text": "lunch at 14?"}, pool)
 
     telegram.send_message.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_manager_reply_is_queued_before_its_draft_context_is_released() -> None:
+    from src.api.telegram_webhook import _accept_manager_reply
+
+    pending = {"conversation_id": str(uuid.uuid4()), "mode": "faq_private"}
+    redis = AsyncMock()
+    redis.get.return_value = json.dumps(pending)
+    pool = AsyncMock()
+    calls: list[str] = []
+    pool.enqueue_job.side_effect = lambda *args, **kwargs: calls.append("enqueue")
+    redis.delete.side_effect = lambda *keys: calls.append("delete")
+    message = {"chat": {"id": 42}, "message_id": 7, "text": "3-5 days"}
+
+    with patch("src.api.telegram_webhook.redis_client", redis):
+        await _accept_manager_reply(message, pool)
+
+    assert calls == ["enqueue", "delete"]
+    args = pool.enqueue_job.await_args
+    assert args.args == (
+        "run_telegram_action",
+        "manager_reply",
+        {"message": message, "pending": pending},
+    )
+    assert args.kwargs["_job_id"] == "telegram_action:reply:42:7"
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_keeps_the_draft_for_telegram_redelivery() -> None:
+    from src.api.telegram_webhook import _accept_manager_reply
+
+    redis = AsyncMock()
+    redis.get.return_value = json.dumps({"conversation_id": str(uuid.uuid4())})
+    pool = AsyncMock()
+    pool.enqueue_job.side_effect = ConnectionError("redis down")
+
+    with (
+        patch("src.api.telegram_webhook.redis_client", redis),
+        pytest.raises(ConnectionError),
+    ):
+        await _accept_manager_reply({"chat": {"id": 42}, "text": "3-5 days"}, pool)
+
+    redis.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rerun_manager_reply_job_does_not_store_a_second_message() -> None:
+    from src.api.telegram_webhook import _process_manager_reply
+    from src.services.outbound_audit import AuditedSendResult
+
+    telegram = AsyncMock()
+    db = AsyncMock()
+    db.add = MagicMock()
+    db_cm = AsyncMock()
+    db_cm.__aenter__.return_value = db
+    db_cm.__aexit__.return_value = False
+
+    with (
+        patch("src.api.telegram_webhook.redis_client", AsyncMock()),
+        patch("src.api.telegram_webhook._get_telegram_client", return_value=telegram),
+        patch(
+            "src.api.telegram_webhook._get_conversation_phone_and_lang",
+            new=AsyncMock(return_value=("+971501234567", "en")),
+        ),
+        patch(
+            "src.api.telegram_webhook.async_session_factory",
+            MagicMock(return_value=db_cm),
+        ),
+        patch(
+            "src.api.telegram_webhook.send_wazzup_text_with_audit",
+            new=AsyncMock(
+                return_value=AuditedSendResult(
+                    audit=MagicMock(), provider_message_id="wz-1", skipped=True
+                )
+            ),
+        ),
+        patch("src.integrations.messaging.wazzup.WazzupProvider"),
+        patch(
+            "src.llm.response_adapter.adapt_manager_response",
+            new=AsyncMock(return_value="Delivery takes 3-5 business days."),
+        ),
+    ):
+        await _process_manager_reply(
+            {"chat": {"id": 42}, "text": "3-5 days"},
+            {
+                "conversation_id": str(uuid.uuid4()),
+                "mode": "faq_private",
+                "question": "When can you deliver?",
+            },
+        )
+
+    db.add.assert_not_called()
+    db.commit.assert_not_awaited()
+    sent_texts = [call.args[0] for call in telegram.send_message.await_args_list]
+    assert any("already sent" in text for text in sent_texts)
+
+
+@pytest.mark.asyncio
+async def test_telegram_action_job_reports_failures_to_the_chat() -> None:
+    from src.api.telegram_webhook import run_telegram_action
+
+    telegram = AsyncMock()
+    callback = {"id": "cb-1", "data": "x", "message": {"chat": {"id": 42}}}
+
+    with (
+        patch("src.api.telegram_webhook._get_telegram_client", return_value=telegram),
+        patch(
+            "src.api.telegram_webhook._handle_callback_query",
+            new=AsyncMock(side_effect=RuntimeError("db down")),
+        ),
+    ):
+        assert await run_telegram_action({}, "callback_query", callback) == "failed"
+
+    telegram.send_message.assert_awaited_once()
+    assert telegram.send_message.await_args.kwargs["chat_id"] == "42"
+
+
 def test_the_draft_window_outlives_a_coffee_break() -> None:
     from src.api import telegram_webhook
 
@@ -24,6 +24,7 @@ def test_arq_worker_settings_configured() -> None:
     assert "refresh_conversation_summary" in function_names
     assert "sync_products_from_treejar_catalog" in function_names
     assert "sync_products_from_zoho" in function_names
+    assert "refresh_product_neighbors" in function_names
     assert "evaluate_realtime_red_flags" in function_names
     assert "evaluate_mature_conversations_quality" in function_names
     assert "evaluate_recent_conversations_quality" in function_names
@@ -97,3 +98,48 @@ async def test_worker_shutdown_runs() -> None:
     """Verify shutdown doesn't crash."""
     ctx = {"redis": None}
     await WorkerSettings.on_shutdown(ctx)
+
+
+def test_split_workers_serve_their_own_queue_with_routed_functions() -> None:
+    from src.core.queues import (
+        INTERACTIVE_QUEUE,
+        REALTIME_QUEUE,
+        JobClass,
+        job_class_for,
+    )
+    from src.worker import InteractiveWorkerSettings, RealtimeWorkerSettings
+
+    assert RealtimeWorkerSettings.queue_name == REALTIME_QUEUE
+    assert InteractiveWorkerSettings.queue_name == INTERACTIVE_QUEUE
+    assert WorkerSettings.queue_name == "arq:queue"
+    assert [_function_name(f) for f in RealtimeWorkerSettings.functions] == [
+        "process_incoming_batch"
+    ]
+    assert all(
+        job_class_for(_function_name(f)) is JobClass.INTERACTIVE
+        for f in InteractiveWorkerSettings.functions
+    )
+    assert "cron_jobs" not in vars(RealtimeWorkerSettings)
+    assert "cron_jobs" not in vars(InteractiveWorkerSettings)
+    assert RealtimeWorkerSettings.job_timeout < INBOUND_BATCH_LOCK_TTL_SECONDS
+
+
+def test_every_worker_reads_compact_and_legacy_job_payloads() -> None:
+    from src.core.queues import deserialize_job_payload, serialize_job_payload
+    from src.worker import InteractiveWorkerSettings, RealtimeWorkerSettings
+
+    # ARQ reads options from each class's own __dict__, not inherited ones.
+    for worker_settings in (
+        WorkerSettings,
+        RealtimeWorkerSettings,
+        InteractiveWorkerSettings,
+    ):
+        options = vars(worker_settings)
+        assert options["job_serializer"] is serialize_job_payload
+        assert options["job_deserializer"] is deserialize_job_payload
+
+
+def test_catalog_sync_budget_leaves_room_before_job_timeout() -> None:
+    from src.core.config import settings
+
+    assert settings.catalog_sync_time_budget_seconds < WorkerSettings.job_timeout